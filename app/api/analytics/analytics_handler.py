@@ -6,7 +6,8 @@ from app.database.services.analytics.analysis_service import (
     calculate_generic_engagement_metrics,
     calculate_feature_engagement_metrics,
     get_analysis_by_code,
-    get_analysis_code
+    get_analysis_code,
+    get_query_plans_by_analysis_code
 )
 from app.database.services.analytics.common import get_storage_key_path
 from app.domain_types.miscellaneous.exceptions import HTTPError
@@ -22,8 +23,12 @@ from app.telemetry.tracing import trace_span
 
 ###############################################################################
 
-async def calculate_(analysis_code:str, filters: AnalyticsFilters|None) -> EngagementMetrics|None:
-    return await calculate(analysis_code, filters)
+async def calculate_(
+        analysis_code:str,
+        filters: AnalyticsFilters|None,
+        explain: bool = False,
+        explain_analyze: bool = False) -> EngagementMetrics|None:
+    return await calculate(analysis_code, filters, explain, explain_analyze)
 
 async def calculate_basic_statistics_(filters: AnalyticsFilters|None) -> BasicAnalyticsStatistics|None:
     return await calculate_basic_stats(filters)
@@ -61,6 +66,10 @@ def get_metrics_(analysis_code:str):
     except Exception as e:
         print_exception(e)
 
+@trace_span("handler: get_query_plans")
+async def get_query_plans_(analysis_code:str) -> list:
+    return await get_query_plans_by_analysis_code(analysis_code)
+
 ###############################################################################
 
 async def get_analysis_code_(suffix: str | None = None) -> str:
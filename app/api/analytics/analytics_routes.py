@@ -1,6 +1,6 @@
 import json
 import os
-from fastapi import APIRouter, status, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Query, status, HTTPException, BackgroundTasks
 from fastapi.responses import StreamingResponse
 from app.api.analytics.analytics_handler import (
     calculate_,
@@ -9,7 +9,8 @@ from app.api.analytics.analytics_handler import (
     calculate_generic_engagement_metrics_,
     download_metrics_,
     get_metrics_,
-    get_analysis_code_
+    get_analysis_code_,
+    get_query_plans_
 )
 from app.common.utils import generate_random_code
 from app.database.services.analytics.analysis_service import check_filter_params, get_tenant_by_id
@@ -69,7 +70,9 @@ async def calculate_feature_engagement_metrics(feature: str, filters: AnalyticsF
             response_model=ResponseModel[CalculateMetricsResponse|None])
 async def calculate_metrics(
         background_tasks: BackgroundTasks,
-        filters: AnalyticsFilters):
+        filters: AnalyticsFilters,
+        explain: bool = Query(False, alias="Explain"),
+        explain_analyze: bool = Query(False, alias="ExplainAnalyze")):
 
     base_url = os.getenv("BASE_URL")
     filters_updated = check_filter_params(filters)
@@ -81,7 +84,7 @@ async def calculate_metrics(
             suffix = tenant["TenantCode"]
     analysis_code = await get_analysis_code_(suffix)
     
-    background_tasks.add_task(calculate_, analysis_code, filters_updated)
+    background_tasks.add_task(calculate_, analysis_code, filters_updated, explain, explain_analyze)
 
     res_model = CalculateMetricsResponse(
         TenantId     = filters_updated.TenantId,
@@ -110,6 +113,15 @@ async def get_metrics(analysis_code: str):
     resp = ResponseModel[EngagementMetrics](Message=message, Data=metrics)
     return resp
 
+@router.get("/metrics/{analysis_code}/query-plans",
+            status_code=status.HTTP_200_OK,
+            response_model=ResponseModel[list|None])
+async def get_query_plans(analysis_code: str):
+    plans = await get_query_plans_(analysis_code)
+    message = "Query plans retrieved successfully."
+    resp = ResponseModel[list](Message=message, Data=plans)
+    return resp
+
 @router.get("/download/{analysis_code}/formats/{file_format}",
             status_code=status.HTTP_200_OK)
 async def download_user_engagement_metrics(analysis_code: str, file_format: str):
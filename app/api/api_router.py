@@ -8,6 +8,7 @@ from .user_milestone.user_milestone_routes import router as user_milestone_route
 from .tenant_milestone.tenant_milestone_routes import router as tenant_milestone_router
 from .sync.sync_routes import router as sync_router
 from .analytics.analytics_routes import router as analytics_router
+from .diagnostics.diagnostics_routes import router as diagnostics_router
 
 router = APIRouter(prefix=API_PREFIX)
 
@@ -20,6 +21,7 @@ def add_routes():
     router.include_router(tenant_milestone_router)
     router.include_router(sync_router)
     router.include_router(analytics_router)
+    router.include_router(diagnostics_router)
 
     # Add other routes here
 
@@ -0,0 +1,61 @@
+from app.database.db_connector import DatabaseConnector
+from app.database.query_cache import analytics_query_cache
+from app.database.query_stats import QueryStats
+from app.domain_types.miscellaneous.response_model import ResponseModel
+from app.modules.data_sync.connectors import (
+    get_analytics_replica_db_connector,
+    get_reancare_db_connector,
+)
+from app.modules.data_sync.data_synchronizer import DataSynchronizer
+from app.telemetry.tracing import trace_span
+
+###############################################################################
+
+@trace_span("handler: get_query_stats")
+def get_query_stats_(top: int, order_by: str):
+    stats = {
+        "Summary": QueryStats.summary(),
+        "Queries": QueryStats.top(top, order_by),
+    }
+    message = "Query statistics retrieved successfully."
+    return ResponseModel[dict](Message=message, Data=stats)
+
+@trace_span("handler: reset_query_stats")
+def reset_query_stats_():
+    QueryStats.reset()
+    message = "Query statistics reset successfully."
+    return ResponseModel[bool](Message=message, Data=True)
+
+@trace_span("handler: get_connection_stats")
+def get_connection_stats_():
+    stats = {
+        "Pools": DatabaseConnector.get_pool_stats(),
+        "Replicas": {
+            "Analytics": get_analytics_replica_db_connector().get_replica_stats(),
+            "ReanCare" : get_reancare_db_connector().get_replica_stats(),
+        },
+    }
+    message = "Connection statistics retrieved successfully."
+    return ResponseModel[dict](Message=message, Data=stats)
+
+@trace_span("handler: get_query_cache_stats")
+def get_query_cache_stats_():
+    message = "Query cache statistics retrieved successfully."
+    return ResponseModel[dict](Message=message, Data=analytics_query_cache.stats())
+
+@trace_span("handler: clear_query_cache")
+def clear_query_cache_():
+    analytics_query_cache.clear()
+    message = "Query cache cleared successfully."
+    return ResponseModel[bool](Message=message, Data=True)
+
+@trace_span("handler: get_lookup_cache_stats")
+def get_lookup_cache_stats_():
+    message = "Lookup cache statistics retrieved successfully."
+    return ResponseModel[dict](Message=message, Data=DataSynchronizer.get_lookup_cache_stats())
+
+@trace_span("handler: clear_lookup_cache")
+def clear_lookup_cache_():
+    DataSynchronizer.clear_lookup_caches()
+    message = "Lookup cache cleared successfully."
+    return ResponseModel[bool](Message=message, Data=True)
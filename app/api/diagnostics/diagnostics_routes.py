@@ -0,0 +1,50 @@
+from fastapi import APIRouter, Query, status
+from app.api.diagnostics.diagnostics_handler import (
+    clear_lookup_cache_,
+    clear_query_cache_,
+    get_connection_stats_,
+    get_lookup_cache_stats_,
+    get_query_cache_stats_,
+    get_query_stats_,
+    reset_query_stats_,
+)
+from app.domain_types.miscellaneous.response_model import ResponseModel
+
+###############################################################################
+
+router = APIRouter(
+    prefix="/diagnostics",
+    tags=["diagnostics"],
+    dependencies=[],
+    responses={404: {"description": "Not found"}},
+)
+
+@router.get("/queries", status_code=status.HTTP_200_OK, response_model=ResponseModel[dict|None])
+async def get_query_stats(
+        top: int = Query(20, alias="Top", ge=1, le=500),
+        order_by: str = Query("TotalMs", alias="OrderBy")):
+    return get_query_stats_(top, order_by)
+
+@router.delete("/queries", status_code=status.HTTP_200_OK, response_model=ResponseModel[bool|None])
+async def reset_query_stats():
+    return reset_query_stats_()
+
+@router.get("/connections", status_code=status.HTTP_200_OK, response_model=ResponseModel[dict|None])
+async def get_connection_stats():
+    return get_connection_stats_()
+
+@router.get("/query-cache", status_code=status.HTTP_200_OK, response_model=ResponseModel[dict|None])
+async def get_query_cache_stats():
+    return get_query_cache_stats_()
+
+@router.delete("/query-cache", status_code=status.HTTP_200_OK, response_model=ResponseModel[bool|None])
+async def clear_query_cache():
+    return clear_query_cache_()
+
+@router.get("/lookup-cache", status_code=status.HTTP_200_OK, response_model=ResponseModel[dict|None])
+async def get_lookup_cache_stats():
+    return get_lookup_cache_stats_()
+
+@router.delete("/lookup-cache", status_code=status.HTTP_200_OK, response_model=ResponseModel[bool|None])
+async def clear_lookup_cache():
+    return clear_lookup_cache_()
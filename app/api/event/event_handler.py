@@ -1,14 +1,28 @@
 import tracemalloc
+from pydantic import ValidationError as PydanticValidationError
+from app.common.json_stream import JsonStreamError, JsonStreamTooLarge, iter_json_array_items, iter_ndjson_items
 from app.common.validators import validate_uuid4
+from app.config.config import get_settings
 from app.database.services import event_service
+from app.domain_types.miscellaneous.exceptions import InvalidUsage, PayloadTooLarge
 from app.domain_types.miscellaneous.response_model import ResponseModel
 from app.domain_types.schemas.base_types import SuccessResponseModel
-from app.domain_types.schemas.event import EventResponseModel, EventSearchResults
+from app.domain_types.schemas.event import (
+    EventBatchItemResult,
+    EventBatchResults,
+    EventCreateModel,
+    EventResponseModel,
+    EventSearchResults,
+)
 from app.telemetry.tracing import trace_span
 from app.common.logger import logger
 
 ###############################################################################
 
+settings = get_settings()
+
+###############################################################################
+
 @trace_span("handler: create_event")
 async def create_event_(model):
     tracemalloc.start()
@@ -25,6 +39,92 @@ async def create_event_(model):
     finally:
         tracemalloc.stop()
 
+@trace_span("handler: create_events_batch")
+async def create_events_batch_(chunks, content_type: str, client_name: str | None, content_length: int | None = None):
+    """
+    Validates the events of a JSON array or NDJSON body while it streams in
+    and writes the valid ones in chunks of EVENT_INGESTION_BATCH_SIZE, one
+    transaction per chunk, reporting the outcome of every event. Once a chunk
+    fails to be written, the events left are reported as failed with it.
+    """
+    max_body_bytes = settings.EVENT_BATCH_MAX_BODY_BYTES
+    if max_body_bytes > 0 and content_length is not None and content_length > max_body_bytes:
+        raise PayloadTooLarge(f"The body is larger than {max_body_bytes} bytes.")
+
+    results = []
+    pending = []
+    write_error = None
+
+    async def flush():
+        nonlocal write_error
+        if len(pending) == 0:
+            return
+        models = [model for _, model in pending]
+        if write_error is None:
+            try:
+                errors = await event_service.create_events(models)
+            except Exception as e:
+                logger.error(f"Failed to write a chunk of the event batch: {str(e)}")
+                write_error = f"Failed to write the event: {str(e)}"
+        if write_error is not None:
+            errors = [write_error] * len(models)
+        for (index, _), error in zip(pending, errors):
+            results.append(EventBatchItemResult(Index=index, Accepted=error is None, Error=error))
+        pending.clear()
+
+    max_item_bytes = settings.EVENT_BATCH_MAX_ITEM_BYTES
+    if "ndjson" in content_type:
+        items = iter_ndjson_items(chunks, max_item_bytes, max_body_bytes)
+    else:
+        items = ((item, None) async for item in iter_json_array_items(chunks, max_item_bytes, max_body_bytes))
+
+    count = 0
+    try:
+        async for value, error in items:
+            index = count
+            count += 1
+            if error is None:
+                model, error = validate_event(value, client_name)
+            if error is not None:
+                results.append(EventBatchItemResult(Index=index, Accepted=False, Error=error))
+                continue
+            pending.append((index, model))
+            if len(pending) >= max(1, settings.EVENT_INGESTION_BATCH_SIZE):
+                await flush()
+    except JsonStreamError as e:
+        if count == 0:
+            if isinstance(e, JsonStreamTooLarge):
+                raise PayloadTooLarge(str(e))
+            raise InvalidUsage(str(e))
+        # Events before the malformed or oversized part are still processed
+        results.append(EventBatchItemResult(Index=count, Accepted=False, Error=str(e)))
+        count += 1
+    await flush()
+
+    results.sort(key=lambda result: result.Index)
+    accepted = sum(1 for result in results if result.Accepted)
+    batch = EventBatchResults(
+        TotalCount=count,
+        AcceptedCount=accepted,
+        RejectedCount=count - accepted,
+        Items=results,
+    )
+    logger.info(f"Event batch processed: Total={count}, Accepted={accepted}, Rejected={count - accepted}")
+    message = "Event batch processed successfully"
+    return ResponseModel[EventBatchResults](Message=message, Data=batch)
+
+def validate_event(value, client_name: str | None):
+    try:
+        model = EventCreateModel.model_validate(value)
+    except PydanticValidationError as e:
+        errors = "; ".join(
+            f"{'.'.join(str(loc) for loc in error['loc']) or 'event'}: {error['msg']}"
+            for error in e.errors())
+        return None, errors
+    model.SourceName = model.SourceName if model.SourceName is not None else client_name
+    model.ResourceType = model.ResourceType if model.ResourceType is not None else "Unknown"
+    return model, None
+
 @trace_span("handler: get_event_by_id")
 def get_event_by_id_(id, db_session):
     try:
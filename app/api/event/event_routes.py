@@ -2,6 +2,7 @@ from typing import Any
 from fastapi import APIRouter, Depends, Request, status
 from app.api.event.event_handler import (
     create_event_,
+    create_events_batch_,
     get_event_by_id_,
     update_event_,
     delete_event_,
@@ -10,7 +11,7 @@ from app.api.event.event_handler import (
 from app.database.database_accessor import get_db_session
 from app.domain_types.miscellaneous.response_model import ResponseModel
 from app.domain_types.schemas.base_types import SuccessResponseModel
-from app.domain_types.schemas.event import EventCreateModel, EventResponseModel, EventUpdateModel, EventSearchFilter, EventSearchResults
+from app.domain_types.schemas.event import EventBatchResults, EventCreateModel, EventResponseModel, EventUpdateModel, EventSearchFilter, EventSearchResults
 
 ###############################################################################
 
@@ -28,6 +29,14 @@ async def create_event(model: EventCreateModel, request: Request):
     resp = await create_event_(model)
     return resp
 
+@router.post("/batch", status_code=status.HTTP_200_OK, response_model=ResponseModel[EventBatchResults])
+async def create_events_batch(request: Request):
+    # The body (a JSON array or NDJSON) is parsed while it streams in
+    content_type = request.headers.get("content-type", "")
+    content_length = request.headers.get("content-length")
+    content_length = int(content_length) if content_length is not None and content_length.isdigit() else None
+    return await create_events_batch_(request.stream(), content_type, request.state.client_name, content_length)
+
 @router.get("/search", status_code=status.HTTP_200_OK, response_model=ResponseModel[EventSearchResults|None])
 async def search_event(
         query_params: EventSearchFilter = Depends(),
@@ -1,4 +1,6 @@
 from app.common.utils import print_exception
+from app.domain_types.miscellaneous.exceptions import NotFound
+from app.domain_types.miscellaneous.response_model import ResponseModel
 from app.domain_types.schemas.data_sync import DataSyncSearchFilter
 from app.modules.data_sync.assessments.assessment_events_synchronizer import AssessmentEventsSynchronizer
 from app.modules.data_sync.careplans.careplan_events_synchronizer import CareplanEventsSynchronizer
@@ -21,7 +23,12 @@ from app.modules.data_sync.vitals.blood_pressure_events_synchronizer import Bloo
 from app.modules.data_sync.vitals.body_height_events_synchronizer import BodyHeightEventsSynchronizer
 from app.modules.data_sync.vitals.body_temperature_events_synchronizer import BodyTemperatureEventsSynchronizer
 from app.modules.data_sync.vitals.body_weight_events_synchronizer import BodyWeightEventsSynchronizer
+from app.modules.data_sync.backfill import BackfillStore, BackfillSynchronizer
 from app.modules.data_sync.data_synchronizer import DataSynchronizer
+from app.modules.data_sync.incremental_sync import IncrementalSynchronizer
+from app.modules.data_sync.sync_orchestrator import SyncOrchestrator, record_sync_task
+from app.modules.data_sync.sync_runs import SyncRunStore
+from app.modules.data_sync.sync_state import SyncStateStore
 from app.modules.data_sync.login_events_synchonizer import LoginEventsSynchronizer
 from app.modules.data_sync.medications.medication_events_synchronizer import MedicationEventsSynchronizer
 from app.modules.data_sync.vitals.pulse_events_synchronizer import PulseEventsSynchronizer
@@ -36,35 +43,35 @@ def sync_users_():
         # Please note that there are users with patient role
         # but there is no corresponding entry in the patients table
         # So such users are not synched.
-        DataSynchronizer.sync_users()
+        record_sync_task(DataSynchronizer.sync_users, None)
     except Exception as e:
         print_exception(e)
 
 @trace_span("handler: sync_users_account_events")
 def sync_user_account_events_(filters: DataSyncSearchFilter):
     try:
-        UserAccountEventSynchronizer.sync_user_create_events(filters)
-        UserAccountEventSynchronizer.sync_user_delete_events(filters)
-        UserAccountEventSynchronizer.sync_user_password_reset_code_events(filters)
+        record_sync_task(UserAccountEventSynchronizer.sync_user_create_events, filters)
+        record_sync_task(UserAccountEventSynchronizer.sync_user_delete_events, filters)
+        record_sync_task(UserAccountEventSynchronizer.sync_user_password_reset_code_events, filters)
     except Exception as e:
         print_exception(e)
 
 @trace_span("handler: sync_user_login_session_events")
 def sync_user_login_session_events_(filters: DataSyncSearchFilter):
     try:
-        LoginEventsSynchronizer.sync_user_login_events()
-        LoginEventsSynchronizer.sync_generate_otp_events(filters)
-        LoginEventsSynchronizer.sync_user_logout_events(filters)
+        record_sync_task(LoginEventsSynchronizer.sync_user_login_events, None)
+        record_sync_task(LoginEventsSynchronizer.sync_generate_otp_events, filters)
+        record_sync_task(LoginEventsSynchronizer.sync_user_logout_events, filters)
     except Exception as e:
         print_exception(e)
 
 @trace_span("handler: sync_medication_events")
 def sync_medication_events_(filters: DataSyncSearchFilter):
     try:
-        MedicationEventsSynchronizer.sync_medication_create_events(filters)
-        MedicationEventsSynchronizer.sync_medication_delete_events(filters)
-        MedicationEventsSynchronizer.sync_medication_schedule_taken_events(filters)
-        MedicationEventsSynchronizer.sync_medication_schedule_missed_events(filters)
+        record_sync_task(MedicationEventsSynchronizer.sync_medication_create_events, filters)
+        record_sync_task(MedicationEventsSynchronizer.sync_medication_delete_events, filters)
+        record_sync_task(MedicationEventsSynchronizer.sync_medication_schedule_taken_events, filters)
+        record_sync_task(MedicationEventsSynchronizer.sync_medication_schedule_missed_events, filters)
         # MedicationEventsSynchronizer.sync_medication_consumption_create_events(filters)
         # MedicationEventsSynchronizer.sync_medication_consumption_delete_events(filters)
     except Exception as e:
@@ -74,9 +81,9 @@ def sync_medication_events_(filters: DataSyncSearchFilter):
 def sync_symptom_events_(filters: DataSyncSearchFilter):
     try:
         print("Starting symptom events synchronization...")
-        SymptomEventsSynchronizer.sync_symptom_create_events(filters)
+        record_sync_task(SymptomEventsSynchronizer.sync_symptom_create_events, filters)
         # SymptomEventsSynchronizer.sync_symptom_update_events(filters)
-        SymptomEventsSynchronizer.sync_symptom_delete_events(filters)
+        record_sync_task(SymptomEventsSynchronizer.sync_symptom_delete_events, filters)
 
         print("Symptom events synchronization completed.")
     except Exception as e:
@@ -86,8 +93,8 @@ def sync_symptom_events_(filters: DataSyncSearchFilter):
 def sync_lab_record_events_(filters: DataSyncSearchFilter):
     try:
         print("Starting lab record events synchronization...")
-        LabRecordEventsSynchronizer.sync_lab_record_create_events(filters),
-        LabRecordEventsSynchronizer.sync_lab_record_delete_events(filters)
+        record_sync_task(LabRecordEventsSynchronizer.sync_lab_record_create_events, filters)
+        record_sync_task(LabRecordEventsSynchronizer.sync_lab_record_delete_events, filters)
         print("Lab record events synchronization completed.")
     except Exception as e:
         print_exception(e)
@@ -96,22 +103,22 @@ def sync_lab_record_events_(filters: DataSyncSearchFilter):
 def sync_biometric_events_(filters: DataSyncSearchFilter):
     try:
         print("Starting biometric events synchronization...")
-        PulseEventsSynchronizer.sync_pulse_create_events(filters)
-        PulseEventsSynchronizer.sync_pulse_delete_events(filters)
-        BodyWeightEventsSynchronizer.sync_body_weight_create_events(filters)
-        BodyWeightEventsSynchronizer.sync_body_weight_delete_events(filters)
-        BodyTemperatureEventsSynchronizer.sync_body_temperature_create_events(filters)
-        BodyTemperatureEventsSynchronizer.sync_body_temperature_delete_events(filters)
-        BodyHeightEventsSynchronizer.sync_body_height_create_events(filters)
-        BodyHeightEventsSynchronizer.sync_body_height_delete_events(filters)
-        BloodPressureEventsSynchronizer.sync_blood_pressure_create_events(filters)
-        BloodPressureEventsSynchronizer.sync_blood_pressure_delete_events(filters)
-        OxygenSaturationEventsSynchronizer.sync_oxygen_saturation_create_events(filters)
-        OxygenSaturationEventsSynchronizer.sync_oxygen_saturation_delete_events(filters)
-        BloodGlucoseEventsSynchronizer.sync_blood_glucose_create_events(filters)
-        BloodGlucoseEventsSynchronizer.sync_blood_glucose_delete_events(filters)
-        CholesterolEventsSynchronizer.sync_cholesterol_create_events(filters)
-        CholesterolEventsSynchronizer.sync_cholesterol_delete_events(filters)
+        record_sync_task(PulseEventsSynchronizer.sync_pulse_create_events, filters)
+        record_sync_task(PulseEventsSynchronizer.sync_pulse_delete_events, filters)
+        record_sync_task(BodyWeightEventsSynchronizer.sync_body_weight_create_events, filters)
+        record_sync_task(BodyWeightEventsSynchronizer.sync_body_weight_delete_events, filters)
+        record_sync_task(BodyTemperatureEventsSynchronizer.sync_body_temperature_create_events, filters)
+        record_sync_task(BodyTemperatureEventsSynchronizer.sync_body_temperature_delete_events, filters)
+        record_sync_task(BodyHeightEventsSynchronizer.sync_body_height_create_events, filters)
+        record_sync_task(BodyHeightEventsSynchronizer.sync_body_height_delete_events, filters)
+        record_sync_task(BloodPressureEventsSynchronizer.sync_blood_pressure_create_events, filters)
+        record_sync_task(BloodPressureEventsSynchronizer.sync_blood_pressure_delete_events, filters)
+        record_sync_task(OxygenSaturationEventsSynchronizer.sync_oxygen_saturation_create_events, filters)
+        record_sync_task(OxygenSaturationEventsSynchronizer.sync_oxygen_saturation_delete_events, filters)
+        record_sync_task(BloodGlucoseEventsSynchronizer.sync_blood_glucose_create_events, filters)
+        record_sync_task(BloodGlucoseEventsSynchronizer.sync_blood_glucose_delete_events, filters)
+        record_sync_task(CholesterolEventsSynchronizer.sync_cholesterol_create_events, filters)
+        record_sync_task(CholesterolEventsSynchronizer.sync_cholesterol_delete_events, filters)
         print("Biometric events synchronization completed.")
     except Exception as e:
         print_exception(e)
@@ -121,10 +128,10 @@ def sync_assessment_events_(filters: DataSyncSearchFilter):
     try:
         print("Starting assessment events synchronization...")
         # AssessmentEventsSynchronizer.sync_assessment_create_events(filters)
-        AssessmentEventsSynchronizer.sync_assessment_delete_events(filters)
-        AssessmentEventsSynchronizer.sync_assessment_start_events(filters)
-        AssessmentEventsSynchronizer.sync_assessment_complete_events(filters)
-        AssessmentEventsSynchronizer.sync_assessment_question_answered_events(filters)
+        record_sync_task(AssessmentEventsSynchronizer.sync_assessment_delete_events, filters)
+        record_sync_task(AssessmentEventsSynchronizer.sync_assessment_start_events, filters)
+        record_sync_task(AssessmentEventsSynchronizer.sync_assessment_complete_events, filters)
+        record_sync_task(AssessmentEventsSynchronizer.sync_assessment_question_answered_events, filters)
         print("Assessment events synchronization completed.")
     except Exception as e:
         print_exception(e)
@@ -133,13 +140,13 @@ def sync_assessment_events_(filters: DataSyncSearchFilter):
 def sync_careplan_events_(filters: DataSyncSearchFilter):
     try:
         print("Starting careplan events synchronization...")
-        CareplanEventsSynchronizer.sync_careplan_enroll_events(filters)
+        record_sync_task(CareplanEventsSynchronizer.sync_careplan_enroll_events, filters)
         # CareplanEventsSynchronizer.sync_careplan_start_events(filters)
         # CareplanEventsSynchronizer.sync_careplan_stop_events(filters)
         # CareplanEventsSynchronizer.sync_careplan_complete_events(filters)
         # CareplanEventsSynchronizer.sync_careplan_task_start_events(filters)
         # CareplanEventsSynchronizer.sync_careplan_task_complete_events(filters)
-        CareplanEventsSynchronizer.sync_careplan_stop_events(filters)
+        record_sync_task(CareplanEventsSynchronizer.sync_careplan_stop_events, filters)
         print("Careplan events synchronization completed.")
     except Exception as e:
         print_exception(e)
@@ -148,9 +155,9 @@ def sync_careplan_events_(filters: DataSyncSearchFilter):
 def sync_user_task_events_(filters: DataSyncSearchFilter):
     try:
         print("Starting user task events synchronization...")
-        UserTaskEventsSynchronizer.sync_user_task_start_events(filters)
-        UserTaskEventsSynchronizer.sync_user_task_complete_events(filters)
-        UserTaskEventsSynchronizer.sync_user_task_cancel_events(filters)
+        record_sync_task(UserTaskEventsSynchronizer.sync_user_task_start_events, filters)
+        record_sync_task(UserTaskEventsSynchronizer.sync_user_task_complete_events, filters)
+        record_sync_task(UserTaskEventsSynchronizer.sync_user_task_cancel_events, filters)
         print("User task events synchronization completed.")
     except Exception as e:
         print_exception(e)
@@ -159,7 +166,7 @@ def sync_user_task_events_(filters: DataSyncSearchFilter):
 def sync_step_events_(filters: DataSyncSearchFilter):
     try:
         print("Starting step events synchronization...")
-        StepEventsSynchronizer.sync_step_create_events(filters),
+        record_sync_task(StepEventsSynchronizer.sync_step_create_events, filters)
         print("Step events synchronization completed.")
     except Exception as e:
         print_exception(e)
@@ -168,7 +175,7 @@ def sync_step_events_(filters: DataSyncSearchFilter):
 def sync_sleep_events_(filters: DataSyncSearchFilter):
     try:
         print("Starting sleep events synchronization...")
-        SleepEventsSynchronizer.sync_sleep_create_events(filters),
+        record_sync_task(SleepEventsSynchronizer.sync_sleep_create_events, filters)
         print("Step events synchronization completed.")
     except Exception as e:
         print_exception(e)
@@ -177,13 +184,13 @@ def sync_sleep_events_(filters: DataSyncSearchFilter):
 def sync_nutrition_events_(filters: DataSyncSearchFilter):
     try:
         print("Starting nutrition events synchronization...")
-        NutritionEventsSynchronizer.sync_nutrition_start_events(filters)
+        record_sync_task(NutritionEventsSynchronizer.sync_nutrition_start_events, filters)
         # NutritionEventsSynchronizer.sync_nutrition_update_events(filters)
-        NutritionEventsSynchronizer.sync_nutrition_complete_events(filters)
-        NutritionEventsSynchronizer.sync_nutrition_cancel_events(filters)
-        NutritionEventsSynchronizer.sync_water_intake_create_events(filters)
+        record_sync_task(NutritionEventsSynchronizer.sync_nutrition_complete_events, filters)
+        record_sync_task(NutritionEventsSynchronizer.sync_nutrition_cancel_events, filters)
+        record_sync_task(NutritionEventsSynchronizer.sync_water_intake_create_events, filters)
         # NutritionEventsSynchronizer.sync_water_intake_update_events(filters)
-        NutritionEventsSynchronizer.sync_water_intake_delete_events(filters)
+        record_sync_task(NutritionEventsSynchronizer.sync_water_intake_delete_events, filters)
         print("Nutrition events synchronization completed.")
     except Exception as e:
         print_exception(e)
@@ -192,7 +199,7 @@ def sync_nutrition_events_(filters: DataSyncSearchFilter):
 def sync_stand_events_(filters: DataSyncSearchFilter):
     try:
         print("Starting stand events synchronization...")
-        StandEventsSynchronizer.sync_stand_create_events(filters),
+        record_sync_task(StandEventsSynchronizer.sync_stand_create_events, filters)
         print("Stand events synchronization completed.")
     except Exception as e:
         print_exception(e)
@@ -201,9 +208,9 @@ def sync_stand_events_(filters: DataSyncSearchFilter):
 def sync_mood_events_(filters: DataSyncSearchFilter):
     try:
         print("Starting mood events synchronization...")
-        MoodEventsSynchronizer.sync_mood_create_events(filters)
+        record_sync_task(MoodEventsSynchronizer.sync_mood_create_events, filters)
         # MoodEventsSynchronizer.sync_mood_update_events(filters)
-        MoodEventsSynchronizer.sync_mood_delete_events(filters)
+        record_sync_task(MoodEventsSynchronizer.sync_mood_delete_events, filters)
         print("Mood events synchronization completed.")
     except Exception as e:
         print_exception(e)
@@ -212,8 +219,8 @@ def sync_mood_events_(filters: DataSyncSearchFilter):
 def sync_meditation_events_(filters: DataSyncSearchFilter):
     try:
         print("Starting meditation events synchronization...")
-        MeditationEventsSynchronizer.sync_meditation_start_events(filters),
-        MeditationEventsSynchronizer.sync_meditation_complete_events(filters),
+        record_sync_task(MeditationEventsSynchronizer.sync_meditation_start_events, filters)
+        record_sync_task(MeditationEventsSynchronizer.sync_meditation_complete_events, filters)
         print("Meditation events synchronization completed.")
     except Exception as e:
         print_exception(e)
@@ -222,11 +229,11 @@ def sync_meditation_events_(filters: DataSyncSearchFilter):
 def sync_goal_events_(filters: DataSyncSearchFilter):
     try:
         print("Starting goal events synchronization...")
-        GoalEventsSynchronizer.sync_goal_create_events(filters),
-        GoalEventsSynchronizer.sync_goal_start_events(filters),
+        record_sync_task(GoalEventsSynchronizer.sync_goal_create_events, filters)
+        record_sync_task(GoalEventsSynchronizer.sync_goal_start_events, filters)
         # GoalEventsSynchronizer.sync_goal_update_events(filters),
-        GoalEventsSynchronizer.sync_goal_complete_events(filters),
-        GoalEventsSynchronizer.sync_goal_cancel_events(filters),
+        record_sync_task(GoalEventsSynchronizer.sync_goal_complete_events, filters)
+        record_sync_task(GoalEventsSynchronizer.sync_goal_cancel_events, filters)
         print("Goal events synchronization completed.")
     except Exception as e:
         print_exception(e)
@@ -235,10 +242,67 @@ def sync_goal_events_(filters: DataSyncSearchFilter):
 def sync_exercise_events_(filters: DataSyncSearchFilter):
     try:
         print("Starting exercise events synchronization...")
-        ExerciseEventsSynchronizer.sync_exercise_start_events(filters),
+        record_sync_task(ExerciseEventsSynchronizer.sync_exercise_start_events, filters)
         # ExerciseEventsSynchronizer.sync_exercise_update_events(filters),
-        ExerciseEventsSynchronizer.sync_exercise_complete_events(filters),
-        ExerciseEventsSynchronizer.sync_exercise_cancel_events(filters),
+        record_sync_task(ExerciseEventsSynchronizer.sync_exercise_complete_events, filters)
+        record_sync_task(ExerciseEventsSynchronizer.sync_exercise_cancel_events, filters)
         print("Exercise events synchronization completed.")
     except Exception as e:
         print_exception(e)
+
+@trace_span("handler: sync_all")
+def sync_all_(filters: DataSyncSearchFilter | None = None):
+    try:
+        SyncOrchestrator.sync_all(filters)
+    except Exception as e:
+        print_exception(e)
+
+def get_sync_all_summary_():
+    summary = SyncOrchestrator.last_summary
+    message = "Sync summary retrieved successfully." if summary is not None else "No full sync has completed yet."
+    return ResponseModel[dict|None](Message=message, Data=summary)
+
+def create_backfill_(filters: DataSyncSearchFilter, slices: int | None = None):
+    backfill_id = BackfillSynchronizer.create(filters, slices)
+    if backfill_id is None:
+        raise Exception("Unable to create the backfill.")
+    return backfill_id
+
+@trace_span("handler: run_backfill")
+def run_backfill_(backfill_id: str):
+    try:
+        BackfillSynchronizer.run(backfill_id)
+    except Exception as e:
+        print_exception(e)
+
+def get_backfill_slices_(backfill_id: str):
+    slices = BackfillStore.get_slices(backfill_id)
+    message = "Backfill slices retrieved successfully."
+    return ResponseModel[list|None](Message=message, Data=slices)
+
+@trace_span("handler: sync_incremental")
+def sync_incremental_():
+    try:
+        IncrementalSynchronizer.sync_all()
+    except Exception as e:
+        print_exception(e)
+
+@trace_span("handler: get_sync_states")
+def get_sync_states_():
+    states = SyncStateStore.get_states()
+    message = "Sync states retrieved successfully."
+    return ResponseModel[list|None](Message=message, Data=states)
+
+@trace_span("handler: get_sync_runs")
+def get_sync_runs_(sync_key: str | None, run_status: str | None, limit: int):
+    runs = SyncRunStore.get_runs(sync_key, run_status, limit)
+    message = "Sync runs retrieved successfully."
+    return ResponseModel[list|None](Message=message, Data=runs)
+
+@trace_span("handler: get_sync_run")
+def get_sync_run_(run_id: str):
+    run = SyncRunStore.get_run(run_id)
+    if run is None:
+        raise NotFound(f"Sync run with id {run_id} not found")
+    message = "Sync run retrieved successfully."
+    return ResponseModel[dict](Message=message, Data=run)
@@ -1,11 +1,20 @@
 from typing import Optional
-from fastapi import APIRouter, Query, status, BackgroundTasks
+from fastapi import APIRouter, Query, status, HTTPException, BackgroundTasks
 from app.api.sync.sync_handler import (
+    create_backfill_,
+    get_backfill_slices_,
+    get_sync_all_summary_,
+    get_sync_run_,
+    get_sync_runs_,
+    get_sync_states_,
+    run_backfill_,
+    sync_all_,
     sync_assessment_events_,
     sync_biometric_events_,
     sync_careplan_events_,
     sync_exercise_events_,
     sync_goal_events_,
+    sync_incremental_,
     sync_lab_record_events_,
     sync_medication_events_,
     sync_meditation_events_,
@@ -39,6 +48,67 @@ async def sync_users(background_tasks: BackgroundTasks):
     resp = ResponseModel[bool](Message=message, Data=True)
     return resp
 
+@router.post("/all", status_code=status.HTTP_200_OK, response_model=ResponseModel[bool|None])
+async def sync_all(background_tasks: BackgroundTasks,
+                                start_date: Optional[str]  = Query(None, alias="StartDate"),
+                                end_date: Optional[str]  = Query(None, alias="EndDate")):
+    filters = validate_data_sync_search_filter(start_date, end_date)
+    background_tasks.add_task(sync_all_, filters)
+    message = "Synchronization of all domains has started."
+    resp = ResponseModel[bool](Message=message, Data=True)
+    return resp
+
+@router.get("/all", status_code=status.HTTP_200_OK, response_model=ResponseModel[dict|None])
+async def get_sync_all_summary():
+    return get_sync_all_summary_()
+
+@router.post("/backfill", status_code=status.HTTP_200_OK, response_model=ResponseModel[str|None])
+async def create_backfill(background_tasks: BackgroundTasks,
+                                start_date: str  = Query(..., alias="StartDate"),
+                                end_date: str  = Query(..., alias="EndDate"),
+                                slices: Optional[int]  = Query(None, alias="Slices", ge=1)):
+    filters = validate_data_sync_search_filter(start_date, end_date)
+    if filters is None or filters.StartDate > filters.EndDate:
+        raise HTTPException(status_code=400, detail="StartDate must not be after EndDate.")
+    backfill_id = create_backfill_(filters, slices)
+    background_tasks.add_task(run_backfill_, backfill_id)
+    message = "Backfill has started."
+    resp = ResponseModel[str](Message=message, Data=backfill_id)
+    return resp
+
+@router.post("/backfill/{backfill_id}/resume", status_code=status.HTTP_200_OK, response_model=ResponseModel[bool|None])
+async def resume_backfill(backfill_id: str, background_tasks: BackgroundTasks):
+    background_tasks.add_task(run_backfill_, backfill_id)
+    message = "Backfill has resumed."
+    resp = ResponseModel[bool](Message=message, Data=True)
+    return resp
+
+@router.get("/backfill/{backfill_id}", status_code=status.HTTP_200_OK, response_model=ResponseModel[list|None])
+async def get_backfill_slices(backfill_id: str):
+    return get_backfill_slices_(backfill_id)
+
+@router.post("/incremental", status_code=status.HTTP_200_OK, response_model=ResponseModel[bool|None])
+async def sync_incremental(background_tasks: BackgroundTasks):
+    background_tasks.add_task(sync_incremental_)
+    message = "Incremental synchronization has started."
+    resp = ResponseModel[bool](Message=message, Data=True)
+    return resp
+
+@router.get("/state", status_code=status.HTTP_200_OK, response_model=ResponseModel[list|None])
+async def get_sync_states():
+    return get_sync_states_()
+
+@router.get("/runs", status_code=status.HTTP_200_OK, response_model=ResponseModel[list|None])
+async def get_sync_runs(
+        sync_key: Optional[str] = Query(None, alias="SyncKey"),
+        run_status: Optional[str] = Query(None, alias="Status"),
+        limit: int = Query(100, alias="Limit", ge=1, le=1000)):
+    return get_sync_runs_(sync_key, run_status, limit)
+
+@router.get("/runs/{run_id}", status_code=status.HTTP_200_OK, response_model=ResponseModel[dict|None])
+async def get_sync_run(run_id: str):
+    return get_sync_run_(run_id)
+
 @router.post("/events/user-accounts", status_code=status.HTTP_200_OK, response_model=ResponseModel[bool|None])
 async def sync_user_account_events(background_tasks: BackgroundTasks,
                                 start_date: Optional[str]  = Query(None, alias="StartDate"),
@@ -0,0 +1,61 @@
+import hashlib
+import math
+import threading
+
+###############################################################################
+
+class BloomFilter:
+    """
+    Fixed-size set membership test with no false negatives and a false
+    positive rate of about `error_rate` up to `capacity` items.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        capacity = max(1, capacity)
+        self.bit_count = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.bit_count / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.bit_count + 7) // 8)
+
+    def add(self, key: str):
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def _positions(self, key: str):
+        # Double hashing over one 128-bit digest
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.bit_count for i in range(self.hash_count)]
+
+class RotatingBloomFilter:
+    """
+    Thread-safe Bloom filter over the most recent keys: once the current
+    generation holds `capacity` keys it becomes the previous one and a new
+    generation starts, so the error rate stays bounded however many keys are
+    added. Keys are remembered for at least `capacity` additions.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self._current = BloomFilter(self.capacity, error_rate)
+        self._previous = None
+        self._lock = threading.Lock()
+        self.rotations = 0
+
+    def add(self, key: str):
+        with self._lock:
+            if self._current.count >= self.capacity:
+                self._previous = self._current
+                self._current = BloomFilter(self.capacity, self.error_rate)
+                self.rotations += 1
+            self._current.add(key)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._current or (self._previous is not None and key in self._previous)
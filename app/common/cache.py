@@ -1,4 +1,8 @@
+import asyncio
+import functools
+import threading
 import time
+from collections import OrderedDict
 
 class LocalMemoryCache:
     def __init__(self):
@@ -26,7 +30,7 @@ class LocalMemoryCache:
                 return item['value']
             else:
                 # TTL has expired, remove the item from the cache
-                self.cache.pop(key)
+                self.cache.pop(key, None)
         return None
 
     def delete(self, key):
@@ -60,6 +64,176 @@ class LocalMemoryCache:
     def __repr__(self):
         return f"LocalMemoryCache({self.cache})"
 
+class LruTtlCache:
+    """
+    Thread-safe, size-bounded cache with per-entry TTLs and tags.
+
+    The least recently used entry is evicted once `max_entries` is reached;
+    expired entries are dropped lazily. Entries can be tagged on `set` and
+    dropped together with `invalidate_tags`.
+    """
+
+    def __init__(self, max_entries=1024, default_ttl=None):
+        self.max_entries = max(1, int(max_entries))
+        self.default_ttl = default_ttl
+        self._entries = OrderedDict()
+        self._tags = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        """
+        Retrieve a value and mark it as recently used.
+        :param key: The key for the cache entry.
+        :return: The cached value or None if missing or expired.
+        """
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            value, expiration, _ = item
+            if expiration is not None and expiration <= time.time():
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl=None, tags=()):
+        """
+        Add or replace an entry.
+        :param key: The key for the cache entry.
+        :param value: The value to be cached.
+        :param ttl: Time-to-live in seconds, `default_ttl` when omitted.
+        :param tags: Tags the entry can later be invalidated by.
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        expiration = time.time() + ttl if ttl else None
+        tags = tuple(tags)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, expiration, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def peek(self, key):
+        """
+        Like `get`, but leaves the recency order and the hit/miss counts as
+        they are (e.g. to find which keys a bulk load still has to fetch).
+        """
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            value, expiration, _ = item
+            if expiration is not None and expiration <= time.time():
+                return None
+            return value
+
+    def delete(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def invalidate_tags(self, tags) -> int:
+        """
+        Drop every entry carrying any of the given tags.
+        :return: The number of entries removed.
+        """
+        removed = 0
+        with self._lock:
+            for tag in tags:
+                for key in list(self._tags.get(tag, ())):
+                    if key in self._entries:
+                        self._remove(key)
+                        removed += 1
+            self.invalidations += removed
+        return removed
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "Entries"      : len(self._entries),
+                "MaxEntries"   : self.max_entries,
+                "Hits"         : self.hits,
+                "Misses"       : self.misses,
+                "HitRate"      : round(self.hits / lookups, 4) if lookups else 0.0,
+                "Evictions"    : self.evictions,
+                "Invalidations": self.invalidations,
+            }
+
+    def _remove(self, key):
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if len(keys) == 0:
+                    del self._tags[tag]
+
+class AsyncBatchLoader:
+    """
+    Resolves keys for asyncio code: from a cache first, then with one bulk
+    load for all the misses of a call, run in a worker thread so the event
+    loop is not blocked. Concurrent calls missing the same key share the
+    load already in flight instead of starting another.
+
+    `get_cached(key)` returns (True, value) for a cached key, else
+    (False, None); `load(keys)` returns a dict of the values (and is
+    expected to cache them).
+    """
+
+    def __init__(self, get_cached, load):
+        self.get_cached = get_cached
+        self.load = load
+        self._in_flight = {}
+
+    async def get_many(self, keys) -> dict:
+        values = {}
+        pending = {}
+        to_load = []
+        for key in dict.fromkeys(keys):
+            cached, value = self.get_cached(key)
+            if cached:
+                values[key] = value
+            elif key in self._in_flight:
+                pending[key] = self._in_flight[key]
+            else:
+                to_load.append(key)
+        if len(to_load) > 0:
+            task = asyncio.ensure_future(asyncio.to_thread(self.load, to_load))
+            for key in to_load:
+                self._in_flight[key] = task
+                pending[key] = task
+            task.add_done_callback(functools.partial(self._forget, to_load))
+        for key, load in pending.items():
+            # Shared with the other callers waiting on it, so cancelling this
+            # call must not cancel the load
+            loaded = await asyncio.shield(load)
+            values[key] = loaded.get(key)
+        return values
+
+    def _forget(self, keys, task):
+        for key in keys:
+            if self._in_flight.get(key) is task:
+                del self._in_flight[key]
+
 # # Example usage:
 # cache = LocalMemoryCache()
 # cache.set("user_id", 12345, ttl=10)  # Set with TTL of 10 seconds
@@ -0,0 +1,162 @@
+import codecs
+import json
+
+###############################################################################
+
+_decoder = json.JSONDecoder()
+
+_WHITESPACE = " \t\r\n"
+
+# Characters a JSON value can start with
+_VALUE_START = set('{["-0123456789tfn')
+
+_NUMBER = set("-+0123456789.eE")
+
+class JsonStreamError(Exception):
+    pass
+
+class JsonStreamTooLarge(JsonStreamError):
+    pass
+
+###############################################################################
+
+async def _limit_body(chunks, max_body_bytes: int):
+    received = 0
+    async for chunk in chunks:
+        received += len(chunk)
+        if max_body_bytes > 0 and received > max_body_bytes:
+            raise JsonStreamTooLarge(f"The body is larger than {max_body_bytes} bytes.")
+        yield chunk
+
+async def iter_ndjson_items(chunks, max_item_bytes: int = 0, max_body_bytes: int = 0):
+    """
+    Yields the lines of a newline-delimited JSON body as they arrive, as
+    (text, None) pairs; a line that is not valid JSON comes as (text, error)
+    so the caller can reject it and carry on. Blank lines are skipped.
+    Raises JsonStreamTooLarge once a line is longer than max_item_bytes or
+    the body larger than max_body_bytes (0 for no limit).
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    async for chunk in _limit_body(chunks, max_body_bytes):
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            _check_item_size(len(line), max_item_bytes)
+            item = _parse_line(line)
+            if item is not None:
+                yield item
+        _check_item_size(len(buffer), max_item_bytes)
+    buffer += decoder.decode(b"", final=True)
+    item = _parse_line(buffer)
+    if item is not None:
+        yield item
+
+def _parse_line(line: str):
+    line = line.strip()
+    if len(line) == 0:
+        return None
+    try:
+        return json.loads(line), None
+    except json.JSONDecodeError as error:
+        return None, str(error)
+
+def _check_item_size(length: int, max_item_bytes: int):
+    # Counted on the decoded text, so multi-byte characters count once
+    if max_item_bytes > 0 and length > max_item_bytes:
+        raise JsonStreamTooLarge(f"An item of the body is larger than {max_item_bytes} bytes.")
+
+async def iter_json_array_items(chunks, max_item_bytes: int = 0, max_body_bytes: int = 0):
+    """
+    Yields the items of a JSON array body one by one as they arrive, without
+    reading the whole body first. Raises JsonStreamError if the body is not
+    a well-formed array, and JsonStreamTooLarge once an item is larger than
+    max_item_bytes or the body larger than max_body_bytes (0 for no limit);
+    items yielded before that stay valid.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    parser = _JsonArrayParser(max_item_bytes)
+    async for chunk in _limit_body(chunks, max_body_bytes):
+        for item in parser.feed(decoder.decode(chunk)):
+            yield item
+    for item in parser.feed(decoder.decode(b"", final=True), final=True):
+        yield item
+
+class _JsonArrayParser:
+
+    def __init__(self, max_item_bytes: int):
+        self.max_item_bytes = max_item_bytes
+        self.buffer = ""
+        self.started = False
+        self.expect_item = True
+        self.finished = False
+        # Length of the pending item when it last failed to decode; it is
+        # tried again once it has doubled, so a large item arriving in many
+        # small chunks is not decoded over and over
+        self.failed_length = 0
+
+    def _too_large(self, length: int) -> bool:
+        return self.max_item_bytes > 0 and length > self.max_item_bytes
+
+    def feed(self, text: str, final: bool = False):
+        self.buffer += text
+        position = 0
+        while not self.finished:
+            position = _skip_whitespace(self.buffer, position)
+            if position >= len(self.buffer):
+                break
+            current = self.buffer[position]
+            if not self.started:
+                if current != "[":
+                    raise JsonStreamError("The body must be a JSON array.")
+                self.started = True
+                position += 1
+                continue
+            if current == "]":
+                self.finished = True
+                position += 1
+                break
+            if not self.expect_item:
+                if current != ",":
+                    raise JsonStreamError("Expected ',' or ']' after an item of the JSON array.")
+                self.expect_item = True
+                position += 1
+                continue
+            if current not in _VALUE_START:
+                raise JsonStreamError(f"Malformed JSON item: unexpected '{current}'.")
+            pending = len(self.buffer) - position
+            if not final and pending < 2 * self.failed_length and not self._too_large(pending):
+                break
+            try:
+                item, end = _decoder.raw_decode(self.buffer, position)
+            except json.JSONDecodeError as error:
+                if final:
+                    raise JsonStreamError(f"Malformed JSON item: {error}")
+                # The item may not have fully arrived yet
+                _check_item_size(pending, self.max_item_bytes)
+                self.failed_length = pending
+                break
+            if not final and current in _NUMBER and _skip(self.buffer, end, _NUMBER) == len(self.buffer):
+                # A number may go on in the next chunk
+                break
+            _check_item_size(end - position, self.max_item_bytes)
+            self.failed_length = 0
+            yield item
+            self.expect_item = False
+            position = end
+        # Drop what has been consumed so the buffer holds at most one item
+        self.buffer = self.buffer[position:]
+        if self.finished:
+            if len(self.buffer.strip(_WHITESPACE)) > 0:
+                raise JsonStreamError("Unexpected content after the JSON array.")
+            self.buffer = ""
+        elif final:
+            raise JsonStreamError("The JSON array is not terminated.")
+
+def _skip_whitespace(text: str, position: int) -> int:
+    return _skip(text, position, _WHITESPACE)
+
+def _skip(text: str, position: int, characters) -> int:
+    while position < len(text) and text[position] in characters:
+        position += 1
+    return position
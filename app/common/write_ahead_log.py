@@ -0,0 +1,153 @@
+import os
+import re
+import threading
+import time
+
+###############################################################################
+
+class WalFsyncPolicy:
+    Always   = "always"    # fsync every append before it returns
+    Interval = "interval"  # fsync at most once per interval
+    Never    = "never"     # leave it to the OS
+
+class WriteAheadLogFull(Exception):
+    pass
+
+class WriteAheadLogClosed(Exception):
+    pass
+
+###############################################################################
+
+class WriteAheadLog:
+    """
+    Append-only log of text records (one per line) split into numbered
+    segment files. Records are appended to the active segment, which is
+    sealed once it reaches `segment_max_bytes` (or by `seal`); sealed
+    segments are read back in order by a consumer that removes each one once
+    its records are stored elsewhere. Segments left over by a previous
+    process are sealed segments too, so they are replayed the same way.
+
+    A crash can leave the last record of a segment half-written; it has no
+    line end and is skipped on read. Appends fail with WriteAheadLogFull
+    while the log holds more than `max_bytes`, and with WriteAheadLogClosed
+    once the log is closed.
+    """
+
+    def __init__(
+            self,
+            directory: str,
+            name: str,
+            segment_max_bytes: int,
+            fsync_policy: str = WalFsyncPolicy.Always,
+            fsync_interval_ms: int = 100,
+            max_bytes: int = 0):
+        self.directory = directory
+        self.name = name
+        self.segment_max_bytes = max(1, segment_max_bytes)
+        self.fsync_policy = fsync_policy
+        self.fsync_interval = fsync_interval_ms / 1000
+        self.max_bytes = max_bytes
+        self._segment_re = re.compile(rf"^{re.escape(name)}-(\d+)\.wal$")
+        self._lock = threading.Lock()
+        self._file = None
+        self._file_path = None
+        self._file_bytes = 0
+        self._last_fsync = 0.0
+        self._closed = False
+        os.makedirs(directory, exist_ok=True)
+        segments = self._list_segments()
+        self._next_sequence = segments[-1][0] + 1 if len(segments) > 0 else 1
+        self._size_bytes = sum(os.path.getsize(path) for _, path in segments)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def append(self, record: str):
+        data = (record.replace("\n", " ") + "\n").encode("utf-8")
+        with self._lock:
+            if self._closed:
+                raise WriteAheadLogClosed(f"The {self.name} log is closed.")
+            if self.max_bytes > 0 and self._size_bytes + len(data) > self.max_bytes:
+                raise WriteAheadLogFull(f"The {self.name} log is full.")
+            if self._file is None:
+                self._open_segment()
+            self._file.write(data)
+            self._file.flush()
+            self._file_bytes += len(data)
+            self._size_bytes += len(data)
+            self._sync()
+            if self._file_bytes >= self.segment_max_bytes:
+                self._close_segment()
+
+    def seal(self):
+        """
+        Seals the active segment, if it has records, so it can be consumed.
+        """
+        with self._lock:
+            if self._file is not None and self._file_bytes > 0:
+                self._close_segment()
+
+    def sealed_segments(self) -> list:
+        with self._lock:
+            active = self._file_path
+            return [path for _, path in self._list_segments() if path != active]
+
+    def remove(self, path: str):
+        size = os.path.getsize(path)
+        os.remove(path)
+        with self._lock:
+            self._size_bytes -= size
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            if self._file is not None:
+                self._close_segment()
+
+    @staticmethod
+    def read_segment(path: str) -> list:
+        with open(path, "rb") as file:
+            data = file.read()
+        lines = data.split(b"\n")
+        # The last element is empty, or a record torn by a crash
+        return [line.decode("utf-8") for line in lines[:-1] if len(line.strip()) > 0]
+
+    def _list_segments(self) -> list:
+        segments = []
+        for file_name in os.listdir(self.directory):
+            match = self._segment_re.match(file_name)
+            if match is not None:
+                segments.append((int(match.group(1)), os.path.join(self.directory, file_name)))
+        segments.sort()
+        return segments
+
+    def _open_segment(self):
+        self._file_path = os.path.join(self.directory, f"{self.name}-{self._next_sequence:012d}.wal")
+        self._next_sequence += 1
+        self._file = open(self._file_path, "ab")
+        self._file_bytes = 0
+        if self.fsync_policy != WalFsyncPolicy.Never:
+            # Make the new file's directory entry durable as well
+            directory = os.open(self.directory, os.O_RDONLY)
+            try:
+                os.fsync(directory)
+            finally:
+                os.close(directory)
+
+    def _close_segment(self):
+        if self.fsync_policy != WalFsyncPolicy.Never:
+            os.fsync(self._file.fileno())
+        self._file.close()
+        self._file = None
+        self._file_path = None
+        self._file_bytes = 0
+
+    def _sync(self):
+        if self.fsync_policy == WalFsyncPolicy.Always:
+            os.fsync(self._file.fileno())
+        elif self.fsync_policy == WalFsyncPolicy.Interval:
+            now = time.monotonic()
+            if now - self._last_fsync >= self.fsync_interval:
+                os.fsync(self._file.fileno())
+                self._last_fsync = now
@@ -34,6 +34,32 @@ class Settings(BaseSettings):
     DB_DRIVER       : str = "psycopg2"
     DB_CONNECTION_STRING: str = ""
 
+    # Raw connector pools (DatabaseConnector), shared per target database
+    DB_CONNECTOR_POOL_MIN_SIZE             : int = 1
+    DB_CONNECTOR_POOL_MAX_SIZE             : int = 10
+    DB_CONNECTOR_POOL_RECYCLE              : int = 1800
+    DB_CONNECTOR_POOL_TIMEOUT              : int = 30
+    DB_CONNECTOR_POOL_HEALTH_CHECK_INTERVAL: int = 30
+
+    # Read replicas: comma-separated "host[:port]" lists, empty to read from the primary
+    DB_REPLICA_HOSTS                : str = ""
+    REANCARE_DB_REPLICA_HOSTS       : str = ""
+    DB_REPLICA_MAX_LAG_SECONDS      : int = 30
+    DB_REPLICA_HEALTH_CHECK_INTERVAL: int = 15
+
+    # Query instrumentation (DatabaseConnector); a threshold of 0 disables the slow-query log
+    DB_QUERY_STATS_ENABLED    : bool = True
+    DB_SLOW_QUERY_THRESHOLD_MS: int  = 1000
+
+    # Analytics report query result cache (TTLs in seconds)
+    ANALYTICS_QUERY_CACHE_ENABLED    : bool = True
+    ANALYTICS_QUERY_CACHE_MAX_ENTRIES: int  = 2048
+    ANALYTICS_QUERY_CACHE_TTL        : int  = 900
+    REANCARE_QUERY_CACHE_TTL         : int  = 300
+
+    # Allow EXPLAIN ANALYZE (which executes the query a second time) in analytics diagnostics runs
+    ANALYTICS_EXPLAIN_ANALYZE_ALLOWED: bool = False
+
     @model_validator(mode="after")
     def _normalize_connection_string(self):
 
@@ -58,6 +84,41 @@ class Settings(BaseSettings):
     REANCARE_DB_DRIVER       : str = "pymysql"
     REANCARE_DB_PORT         : int | None = None
 
+    # Data sync
+    SYNC_BATCH_SIZE                  : int  = 1000
+    SYNC_EXTRACT_PAGE_SIZE           : int  = 5000
+    SYNC_MAX_WORKERS                 : int  = 4
+    SYNC_REANCARE_DB_MAX_CONNECTIONS : int  = 4
+    SYNC_ANALYTICS_DB_MAX_CONNECTIONS: int  = 4
+    SYNC_BACKFILL_SLICES             : int  = 12
+    SYNC_BACKFILL_PROCESSES          : int  = 2
+    SYNC_LOOKUP_CACHE_MAX_ENTRIES    : int  = 100000
+    SYNC_LOOKUP_CACHE_TTL            : int  = 3600
+    SYNC_LOOKUP_CACHE_NEGATIVE_TTL   : int  = 60
+    SYNC_INCREMENTAL_ENABLED         : bool = True
+    SYNC_INCREMENTAL_INTERVAL_MINUTES: int  = 15
+    SYNC_INCREMENTAL_LAG_SECONDS     : int  = 120
+
+    # Event ingestion (POST /events)
+    EVENT_INGESTION_WORKERS       : int  = 4
+    EVENT_INGESTION_QUEUE_SIZE    : int  = 10000
+    EVENT_INGESTION_BATCH_SIZE    : int  = 500
+    EVENT_INGESTION_MAX_LATENCY_MS: int  = 200
+    EVENT_BATCH_MAX_ITEM_BYTES    : int  = 65536
+    EVENT_BATCH_MAX_BODY_BYTES    : int  = 67108864
+    EVENT_WAL_ENABLED             : bool = False
+    EVENT_WAL_PATH                : str  = "./../event-wal"
+    EVENT_WAL_SEGMENT_MAX_BYTES   : int  = 16777216
+    EVENT_WAL_MAX_BYTES           : int  = 1073741824
+    EVENT_WAL_FSYNC               : str  = "always"
+    EVENT_WAL_FSYNC_INTERVAL_MS   : int  = 100
+    EVENT_WAL_FLUSH_INTERVAL_MS   : int  = 1000
+
+    EVENT_IDEMPOTENCY_FILTER_CAPACITY     : int   = 1000000
+    EVENT_IDEMPOTENCY_FALSE_POSITIVE_RATE : float = 0.001
+    EVENT_IDEMPOTENCY_LRU_SIZE            : int   = 10000
+    EVENT_IDEMPOTENCY_COLD_START_SECONDS  : int   = 3600
+
     # Open-telemetry
     TRACING_ENABLED           : bool = False
     TRACING_EXPORTER_TYPE     : str  = 'NoExporter'
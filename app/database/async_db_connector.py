@@ -0,0 +1,79 @@
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from app.common.cache import LruTtlCache
+from app.database.db_connector import DatabaseConnector
+from app.database.query_cache import cache_key, cache_tags, copy_rows, current_generation
+from app.database.query_plans import current_plan_capture
+
+###############################################################################
+
+class AsyncDatabaseConnector:
+    """
+    Awaitable front for a `DatabaseConnector`.
+
+    The drivers in use (mysql.connector, psycopg2) are blocking, so each call
+    runs on a worker thread that borrows a connection from the connector's
+    pool. The executor is sized to the pool, which makes it the async pool: at
+    most `pool_max_size` queries are in flight per database and further awaits
+    simply queue without tying up the event loop. Context variables (the
+    current trace span, etc.) are carried over to the worker thread.
+
+    With a `result_cache`, read results are cached by normalised SQL and
+    parameters for `cache_ttl` seconds (overridable per call; 0 bypasses the
+    cache). Plan capture runs always go to the database.
+    """
+
+    def __init__(
+            self,
+            connector: DatabaseConnector,
+            result_cache: LruTtlCache | None = None,
+            cache_ttl: int | None = None):
+        self.connector = connector
+        self.result_cache = result_cache
+        self.cache_ttl = cache_ttl
+        self._executor = ThreadPoolExecutor(
+            max_workers=connector.pool_max_size,
+            thread_name_prefix=f"db-{connector.database}")
+
+    @property
+    def is_postgres(self):
+        return self.connector.is_postgres
+
+    @property
+    def database(self):
+        return self.connector.database
+
+    async def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, func, *args, **kwargs)
+        return await loop.run_in_executor(self._executor, call)
+
+    async def _run_cached(self, func, query, params, cache_ttl):
+        ttl = self.cache_ttl if cache_ttl is None else cache_ttl
+        if self.result_cache is None or ttl == 0 or current_plan_capture() is not None:
+            return await self._run(func, query, params)
+        key = cache_key(f"{self.connector.host}/{self.connector.database}", query, params)
+        rows = self.result_cache.get(key)
+        if rows is not None:
+            return copy_rows(rows)
+        generation = current_generation()
+        rows = await self._run(func, query, params)
+        if rows is not None and generation == current_generation():
+            self.result_cache.set(key, copy_rows(rows), ttl=ttl, tags=cache_tags(params))
+        return rows
+
+    async def execute_read_query(self, query, params=None, cache_ttl=None):
+        return await self._run_cached(self.connector.execute_read_query, query, params, cache_ttl)
+
+    async def execute_prepared_read_query(self, query, params=None, cache_ttl=None):
+        return await self._run_cached(self.connector.execute_prepared_read_query, query, params, cache_ttl)
+
+    async def execute_write_query(self, query, params=None):
+        return await self._run(self.connector.execute_write_query, query, params)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,67 @@
+import contextvars
+import threading
+
+###############################################################################
+
+_current_budget = contextvars.ContextVar("connection_budget", default=None)
+
+###############################################################################
+
+class ConnectionBudget:
+    """
+    Caps the connections that the workers of one job (e.g. the synchronizers
+    of a /sync/all run) hold at the same time on each database, below the
+    process-wide pool limit, so a parallel job cannot starve the API of
+    connections or overload the source database. Limits are keyed by
+    database name, so a database's read replicas share its budget; databases
+    without a limit are not capped.
+
+    DatabaseConnector takes a slot in `connect` and gives it back when the
+    connection is released. A worker holds one connection at a time, so
+    waiting for a slot cannot deadlock.
+    """
+
+    def __init__(self, limits: dict):
+        self._slots = {
+            database: threading.BoundedSemaphore(limit)
+            for database, limit in limits.items() if limit and limit > 0
+        }
+        self._held = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, database) -> bool:
+        slots = self._slots.get(database)
+        if slots is None:
+            return False
+        slots.acquire()
+        return True
+
+    def release(self, database):
+        slots = self._slots.get(database)
+        if slots is not None:
+            slots.release()
+
+    def hold(self, connection, database):
+        with self._lock:
+            self._held[id(connection)] = database
+
+    def unhold(self, connection):
+        with self._lock:
+            database = self._held.pop(id(connection), None)
+        if database is not None:
+            self.release(database)
+
+def start_connection_budget(limits: dict) -> ConnectionBudget:
+    """
+    Starts a budget in the current context. Worker threads inherit it when
+    they run in a copy of this context (see SyncOrchestrator).
+    """
+    budget = ConnectionBudget(limits)
+    _current_budget.set(budget)
+    return budget
+
+def stop_connection_budget():
+    _current_budget.set(None)
+
+def current_connection_budget() -> ConnectionBudget | None:
+    return _current_budget.get()
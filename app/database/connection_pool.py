@@ -0,0 +1,231 @@
+import threading
+import time
+from collections import deque
+
+###############################################################################
+
+class PoolTimeoutError(Exception):
+    pass
+
+class _PooledConnection:
+
+    __slots__ = ("connection", "created_at", "last_used_at", "state")
+
+    def __init__(self, connection):
+        now = time.monotonic()
+        self.connection = connection
+        self.created_at = now
+        self.last_used_at = now
+        self.state = {}
+
+###############################################################################
+
+class ConnectionPool:
+    """
+    Thread-safe pool of raw DB-API connections.
+
+    The pool is driver agnostic: `factory` opens a new connection, `is_alive`
+    checks a connection that has been idle for longer than
+    `health_check_interval` seconds, and `reset` is called when a connection is
+    handed back (a rollback, so no transaction leaks into the next borrower).
+    Connections older than `recycle_seconds` are closed instead of being reused.
+    Callers block for up to `timeout_seconds` when all `max_size` connections
+    are checked out.
+    """
+
+    def __init__(
+            self,
+            name,
+            factory,
+            is_alive,
+            reset=None,
+            min_size=1,
+            max_size=10,
+            recycle_seconds=1800,
+            timeout_seconds=30,
+            health_check_interval=30):
+        self.name = name
+        self.min_size = max(0, int(min_size))
+        self.max_size = max(1, int(max_size), self.min_size)
+        self.recycle_seconds = recycle_seconds
+        self.timeout_seconds = timeout_seconds
+        self.health_check_interval = health_check_interval
+
+        self._factory = factory
+        self._is_alive = is_alive
+        self._reset = reset
+
+        self._condition = threading.Condition()
+        self._idle = deque()
+        self._in_use = {}
+        self._size = 0
+
+        # Metrics
+        self._acquired_count = 0
+        self._created_count = 0
+        self._discarded_count = 0
+        self._timeout_count = 0
+        self._wait_total_seconds = 0.0
+        self._wait_max_seconds = 0.0
+
+    # region Public API
+
+    def prefill(self):
+        while True:
+            with self._condition:
+                if self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                entry = self._create()
+            except Exception:
+                self._release_slot()
+                raise
+            with self._condition:
+                self._idle.append(entry)
+                self._condition.notify()
+
+    def acquire(self):
+        started = time.monotonic()
+        deadline = started + self.timeout_seconds
+        while True:
+            entry, must_create = self._checkout(deadline)
+            if entry is None and not must_create:
+                with self._condition:
+                    self._timeout_count += 1
+                raise PoolTimeoutError(
+                    f"Timed out after {self.timeout_seconds}s waiting for a connection from pool '{self.name}'")
+            if must_create:
+                try:
+                    entry = self._create()
+                except Exception:
+                    self._release_slot()
+                    raise
+            elif not self._validate(entry):
+                self._discard(entry)
+                continue
+
+            waited = time.monotonic() - started
+            with self._condition:
+                self._in_use[id(entry.connection)] = entry
+                self._acquired_count += 1
+                self._wait_total_seconds += waited
+                if waited > self._wait_max_seconds:
+                    self._wait_max_seconds = waited
+            return entry.connection
+
+    def release(self, connection, discard=False):
+        with self._condition:
+            entry = self._in_use.pop(id(connection), None)
+        if entry is None:
+            # Not one of ours (e.g. a one-off connection to another database)
+            self._close(connection)
+            return
+
+        if not discard and self._reset is not None:
+            try:
+                self._reset(connection)
+            except Exception:
+                discard = True
+
+        now = time.monotonic()
+        if discard or now - entry.created_at > self.recycle_seconds:
+            self._discard(entry)
+            return
+
+        entry.last_used_at = now
+        with self._condition:
+            self._idle.append(entry)
+            self._condition.notify()
+
+    def connection_state(self, connection) -> dict:
+        """
+        Scratch space that lives exactly as long as a pooled connection (e.g. the
+        statements prepared on it). Only valid while the connection is checked
+        out; returns a throwaway dict for connections the pool does not own.
+        """
+        with self._condition:
+            entry = self._in_use.get(id(connection))
+        return entry.state if entry is not None else {}
+
+    def close(self):
+        with self._condition:
+            idle = list(self._idle)
+            self._idle.clear()
+        for entry in idle:
+            self._discard(entry)
+
+    def stats(self) -> dict:
+        with self._condition:
+            acquired = self._acquired_count
+            return {
+                "Name"         : self.name,
+                "MinSize"      : self.min_size,
+                "MaxSize"      : self.max_size,
+                "Size"         : self._size,
+                "Idle"         : len(self._idle),
+                "InUse"        : len(self._in_use),
+                "Acquired"     : acquired,
+                "Created"      : self._created_count,
+                "Discarded"    : self._discarded_count,
+                "Timeouts"     : self._timeout_count,
+                "AverageWaitMs": round(self._wait_total_seconds * 1000 / acquired, 3) if acquired else 0.0,
+                "MaxWaitMs"    : round(self._wait_max_seconds * 1000, 3),
+            }
+
+    # endregion
+
+    # region Internals
+
+    def _checkout(self, deadline):
+        with self._condition:
+            while True:
+                if self._idle:
+                    # LIFO, so the most recently used (warm) connection is reused first
+                    return self._idle.pop(), False
+                if self._size < self.max_size:
+                    self._size += 1
+                    return None, True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None, False
+                self._condition.wait(remaining)
+
+    def _create(self):
+        connection = self._factory()
+        if connection is None:
+            raise ConnectionError(f"Unable to open a new connection for pool '{self.name}'")
+        with self._condition:
+            self._created_count += 1
+        return _PooledConnection(connection)
+
+    def _validate(self, entry):
+        now = time.monotonic()
+        if now - entry.created_at > self.recycle_seconds:
+            return False
+        if now - entry.last_used_at > self.health_check_interval:
+            try:
+                return bool(self._is_alive(entry.connection))
+            except Exception:
+                return False
+        return True
+
+    def _discard(self, entry):
+        self._close(entry.connection)
+        with self._condition:
+            self._discarded_count += 1
+        self._release_slot()
+
+    def _release_slot(self):
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    @staticmethod
+    def _close(connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    # endregion
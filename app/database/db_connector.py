@@ -1,15 +1,41 @@
+import functools
+import hashlib
 import re
+import threading
+import time
+import uuid
+from collections.abc import Mapping
 
 import mysql.connector
 
+from app.database.connection_budget import current_connection_budget
+from app.database.connection_pool import ConnectionPool
+from app.database.query_plans import current_plan_capture, find_plan_issues, parse_plan
+from app.database.query_stats import QueryStats, query_id
+from app.database.replica_set import ReplicaSet
+
 try:
     import psycopg2
+    import psycopg2.extras
 except ImportError:  # psycopg2 is only required when using PostgreSQL
     psycopg2 = None
 
 _STRING_LITERAL_RE = re.compile(r"('(?:[^']|'')*')")
 _IDENTIFIER_RE = re.compile(r'(?<![\w"])([A-Za-z_][A-Za-z0-9_]*)(?![\w"])')
 _PG_RESERVED = {"user"}
+_VALUES_PLACEHOLDERS_RE = re.compile(r"VALUES\s*\(\s*%s(?:\s*,\s*%s)*\s*\)", re.IGNORECASE)
+_NAMED_PARAM_RE = re.compile(r"%\((\w+)\)s")
+
+_LEADING_COMMENTS_RE = re.compile(r"^(?:\s+|--[^\n]*(?:\n|$)|#[^\n]*(?:\n|$)|/\*.*?\*/)*", re.DOTALL)
+_LEADING_READ_RE = re.compile(r"^\(*\s*(SELECT|WITH)\b", re.IGNORECASE)
+# Makes a SELECT or WITH write or lock rows: a data-modifying CTE,
+# SELECT ... INTO, or a locking read
+_WRITING_READ_RE = re.compile(
+    r"\b(?:INSERT|UPDATE|DELETE|MERGE|INTO|FOR\s+(?:NO\s+KEY\s+)?UPDATE|FOR\s+(?:KEY\s+)?SHARE|LOCK\s+IN\s+SHARE\s+MODE)\b",
+    re.IGNORECASE)
+
+# Upper bound on the statements kept prepared on a single pooled connection
+MAX_PREPARED_STATEMENTS_PER_CONNECTION = 256
 
 
 def _needs_quoting(word):
@@ -18,6 +44,7 @@ def _needs_quoting(word):
     return any(c.isupper() for c in word) and any(c.islower() for c in word)
 
 
+@functools.lru_cache(maxsize=1024)
 def quote_pg_identifiers(query):
     """
     Double-quote PascalCase identifiers (and the reserved word `user`) so the raw
@@ -33,9 +60,144 @@ def quote_pg_identifiers(query):
         )
     return "".join(parts)
 
+
+@functools.lru_cache(maxsize=1024)
+def is_replica_safe_query(query):
+    """
+    Whether a query may be served by a read replica: it starts with SELECT or
+    WITH (after comments) and neither writes nor locks rows. Stricter than
+    `DatabaseConnector.is_read_only_query`, which also matches e.g.
+    INSERT ... SELECT; anything in doubt stays on the primary.
+    """
+    text = _LEADING_COMMENTS_RE.sub("", query, count=1)
+    if _LEADING_READ_RE.match(text) is None:
+        return False
+    outside_literals = _STRING_LITERAL_RE.split(text)[::2]
+    return not any(_WRITING_READ_RE.search(part) for part in outside_literals)
+
+
+class PreparedQuery:
+    """
+    A read query with ``%(name)s`` bind parameters, compiled once for a dialect:
+    PascalCase identifiers quoted for PostgreSQL and the named parameters turned
+    into positional placeholders (``$1``.. for PostgreSQL ``PREPARE``, ``?`` for
+    MySQL prepared cursors). `name` is derived from the compiled text, so the
+    same template maps to the same server-side statement on every connection.
+    """
+
+    __slots__ = ("name", "text", "param_names")
+
+    def __init__(self, name, text, param_names):
+        self.name = name
+        self.text = text
+        self.param_names = param_names
+
+    def bind(self, params):
+        params = params or {}
+        return tuple(params[name] for name in self.param_names)
+
+
+@functools.lru_cache(maxsize=512)
+def compile_prepared_query(query, is_postgres) -> PreparedQuery:
+    query = query.strip().rstrip(";").rstrip()
+    if is_postgres:
+        query = quote_pg_identifiers(query)
+    names = []
+
+    def placeholder(match):
+        name = match.group(1)
+        if not is_postgres:
+            names.append(name)
+            return "?"
+        if name not in names:
+            names.append(name)
+        return f"${names.index(name) + 1}"
+
+    parts = _STRING_LITERAL_RE.split(query)
+    for i in range(0, len(parts), 2):  # even indices are outside string literals
+        parts[i] = _NAMED_PARAM_RE.sub(placeholder, parts[i])
+    text = "".join(parts)
+    name = "stmt_" + hashlib.sha1(text.encode("utf-8")).hexdigest()[:20]
+    return PreparedQuery(name, text, tuple(names))
+
 # endregion
 
 
+class ResultColumns:
+    """
+    Column-name -> position map for one result set, built once and shared by
+    every row of that result. Besides the names exactly as the driver returned
+    them it holds their lowercased aliases, so ``row['TenantName']`` resolves
+    in O(1) on PostgreSQL, which returns ``tenantname``.
+    """
+
+    __slots__ = ("names", "index")
+
+    def __init__(self, names):
+        self.names = tuple(names)
+        index = {}
+        for position, name in enumerate(self.names):
+            if isinstance(name, str):
+                index.setdefault(name.lower(), position)
+        for position, name in enumerate(self.names):
+            index[name] = position
+        self.index = index
+
+    @classmethod
+    def from_cursor(cls, cursor):
+        return cls([i[0] for i in cursor.description])
+
+    def position(self, key):
+        position = self.index.get(key)
+        if position is None and isinstance(key, str):
+            position = self.index.get(key.lower())
+        return position
+
+
+class Row(Mapping):
+    """
+    Compact, read-only result row.
+
+    Values are kept in a tuple and the column map is shared with the other
+    rows of the same result set (see ResultColumns), so a row costs little
+    more than the tuple the driver returned. Supports ``row['X']`` (case
+    insensitive, O(1)), ``in``, ``get`` and the rest of the Mapping API.
+    """
+
+    __slots__ = ("_columns", "_values")
+
+    def __init__(self, columns: ResultColumns, values):
+        self._columns = columns
+        self._values = values
+
+    def __getitem__(self, key):
+        position = self._columns.position(key)
+        if position is None:
+            raise KeyError(key)
+        return self._values[position]
+
+    def __contains__(self, key):
+        return self._columns.position(key) is not None
+
+    def get(self, key, default=None):
+        position = self._columns.position(key)
+        if position is None:
+            return default
+        return self._values[position]
+
+    def __iter__(self):
+        return iter(self._columns.names)
+
+    def __len__(self):
+        return len(self._columns.names)
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+    def to_dict(self):
+        return dict(zip(self._columns.names, self._values))
+
+
 class RowDict(dict):
     """
     Result row with case-insensitive key lookup.
@@ -45,11 +207,23 @@ class RowDict(dict):
     ``TenantName`` on MySQL but ``tenantname`` on PostgreSQL. This dict keeps the
     keys exactly as the driver returned them (serialisation is unchanged) but
     resolves lookups, ``in`` and ``get`` case-insensitively, so existing code can
-    read ``row['TenantName']`` on either engine.
+    read ``row['TenantName']`` on either engine. Case-mismatched keys are
+    resolved through the ResultColumns map shared by the whole result set;
+    keys added to the row later fall back to a scan.
     """
 
+    __slots__ = ("_columns",)
+
+    def __init__(self, *args, columns: ResultColumns | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._columns = columns
+
     def _actual_key(self, key):
         if isinstance(key, str) and not super().__contains__(key):
+            if self._columns is not None:
+                position = self._columns.position(key)
+                if position is not None:
+                    return self._columns.names[position]
             lowered = key.lower()
             for existing in self.keys():
                 if isinstance(existing, str) and existing.lower() == lowered:
@@ -66,6 +240,13 @@ class RowDict(dict):
         return super().get(self._actual_key(key), default)
 
 
+def to_rows(cursor, rows, compact=False):
+    columns = ResultColumns.from_cursor(cursor)
+    if compact:
+        return [Row(columns, row) for row in rows]
+    return [RowDict(zip(columns.names, row), columns=columns) for row in rows]
+
+
 class DatabaseConnector:
     """
     Dialect-aware raw database connector.
@@ -75,7 +256,26 @@ class DatabaseConnector:
     connects to the right engine without code changes.
     """
 
-    def __init__(self, host, user, password, database, port=None, dialect="mysql", driver=None):
+    _pools = {}
+    _pools_lock = threading.Lock()
+
+    def __init__(
+            self,
+            host,
+            user,
+            password,
+            database,
+            port=None,
+            dialect="mysql",
+            driver=None,
+            pool_min_size=1,
+            pool_max_size=10,
+            pool_recycle=1800,
+            pool_timeout=30,
+            pool_health_check_interval=30,
+            replica_hosts=None,
+            replica_max_lag_seconds=30,
+            replica_health_check_interval=15):
         self.host = host
         self.user = user
         self.password = password
@@ -86,6 +286,34 @@ class DatabaseConnector:
             self.port = int(port)
         else:
             self.port = 5432 if self.is_postgres else 3306
+        self.pool_min_size = pool_min_size
+        self.pool_max_size = pool_max_size
+        self.pool_recycle = pool_recycle
+        self.pool_timeout = pool_timeout
+        self.pool_health_check_interval = pool_health_check_interval
+
+        # Read-only queries are routed to these (host, port) replicas when healthy
+        self.replicas = None
+        if replica_hosts:
+            self.replicas = ReplicaSet(
+                [
+                    DatabaseConnector(
+                        replica_host,
+                        user,
+                        password,
+                        database,
+                        port=replica_port or self.port,
+                        dialect=dialect,
+                        driver=driver,
+                        pool_min_size=pool_min_size,
+                        pool_max_size=pool_max_size,
+                        pool_recycle=pool_recycle,
+                        pool_timeout=pool_timeout,
+                        pool_health_check_interval=pool_health_check_interval)
+                    for replica_host, replica_port in replica_hosts
+                ],
+                max_lag_seconds=replica_max_lag_seconds,
+                health_check_interval=replica_health_check_interval)
 
     @property
     def is_postgres(self):
@@ -93,58 +321,194 @@ class DatabaseConnector:
 
     # region Connection management
 
-    def connect(self, database=None):
-        target_db = database if database is not None else self.database
-        try:
-            if self.is_postgres:
-                if psycopg2 is None:
-                    raise ImportError(
-                        "psycopg2 is required for PostgreSQL. Install it with "
-                        "`pip install psycopg2-binary`."
-                    )
-                return psycopg2.connect(
-                    host=self.host,
-                    port=self.port,
-                    dbname=target_db,
-                    user=self.user,
-                    password=self.password,
+    def _open_connection(self, database):
+        if self.is_postgres:
+            if psycopg2 is None:
+                raise ImportError(
+                    "psycopg2 is required for PostgreSQL. Install it with "
+                    "`pip install psycopg2-binary`."
                 )
-            return mysql.connector.connect(
+            return psycopg2.connect(
                 host=self.host,
                 port=self.port,
-                database=target_db,
+                dbname=database,
                 user=self.user,
                 password=self.password,
             )
+        return mysql.connector.connect(
+            host=self.host,
+            port=self.port,
+            database=database,
+            user=self.user,
+            password=self.password,
+        )
+
+    def _is_connection_alive(self, connection):
+        if self.is_postgres:
+            if connection.closed != 0:
+                return False
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+            connection.rollback()
+            return True
+        return connection.is_connected()
+
+    @staticmethod
+    def _reset_connection(connection):
+        connection.rollback()
+
+    def get_pool(self) -> ConnectionPool:
+        """
+        Process-wide pool for this connector's target. Pools are keyed by
+        dialect/host/port/database/user, so every connector instance pointing at
+        the same database (all synchronizers, analytics queries, ...) shares one.
+        """
+        key = (self.dialect, self.host, self.port, self.database, self.user)
+        pool = DatabaseConnector._pools.get(key)
+        if pool is not None:
+            return pool
+        created = False
+        with DatabaseConnector._pools_lock:
+            pool = DatabaseConnector._pools.get(key)
+            if pool is None:
+                pool = ConnectionPool(
+                    name=f"{self.dialect}://{self.host}:{self.port}/{self.database}",
+                    factory=lambda: self._open_connection(self.database),
+                    is_alive=self._is_connection_alive,
+                    reset=self._reset_connection,
+                    min_size=self.pool_min_size,
+                    max_size=self.pool_max_size,
+                    recycle_seconds=self.pool_recycle,
+                    timeout_seconds=self.pool_timeout,
+                    health_check_interval=self.pool_health_check_interval,
+                )
+                DatabaseConnector._pools[key] = pool
+                created = True
+        if created:
+            # Best effort: a database that is down now is retried on acquire
+            try:
+                pool.prefill()
+            except Exception as error:
+                self._print_connection_error(self.database, error)
+        return pool
+
+    @staticmethod
+    def get_pool_stats():
+        return [pool.stats() for pool in list(DatabaseConnector._pools.values())]
+
+    def get_replica_stats(self) -> list:
+        return self.replicas.stats() if self.replicas is not None else []
+
+    def get_replication_lag(self):
+        """
+        Seconds this server is behind its primary: 0 when it is not a replica
+        (or is fully caught up), None when unknown or replication is stopped.
+        """
+        connection = self.connect()
+        if connection is None:
+            return None
+        try:
+            with self._new_cursor(connection) as cursor:
+                if self.is_postgres:
+                    cursor.execute("""
+                        SELECT CASE
+                            WHEN NOT pg_is_in_recovery() THEN 0
+                            WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+                            ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+                        END AS lag
+                        """)
+                    lag_column = "lag"
+                else:
+                    try:
+                        cursor.execute("SHOW REPLICA STATUS")
+                        lag_column = "Seconds_Behind_Source"
+                    except mysql.connector.Error:  # MySQL < 8.0.22
+                        cursor.execute("SHOW SLAVE STATUS")
+                        lag_column = "Seconds_Behind_Master"
+                rows = to_rows(cursor, cursor.fetchall())
+            self.close_connection(connection)
         except Exception as error:
-            print(
-                f"Error connecting to the database "
-                f"[dialect={self.dialect} driver={self.driver} host={self.host} "
-                f"port={self.port} db={target_db} user={self.user}]:",
-                error,
-            )
+            print(f"Error reading the replication lag of {self.host}:", error)
+            self.close_connection(connection, discard=True)
+            return None
+        if len(rows) == 0:
+            return 0.0  # Not configured as a replica
+        lag = rows[0].get(lag_column)
+        return float(lag) if lag is not None else None
+
+    def connect(self):
+        budget = current_connection_budget()
+        budgeted = budget is not None and budget.acquire(self.database)
+        try:
+            connection = self.get_pool().acquire()
+        except Exception as error:
+            if budgeted:
+                budget.release(self.database)
+            self._print_connection_error(self.database, error)
             return None
+        if budgeted:
+            budget.hold(connection, self.database)
+        return connection
+
+    def connect_direct(self, database=None):
+        """
+        Opens a one-off, unpooled connection (e.g. to the server's maintenance
+        database while creating the analytics database). Close it directly.
+        """
+        try:
+            return self._open_connection(database)
+        except Exception as error:
+            self._print_connection_error(database, error)
+            return None
+
+    def _print_connection_error(self, database, error):
+        print(
+            f"Error connecting to the database "
+            f"[dialect={self.dialect} driver={self.driver} host={self.host} "
+            f"port={self.port} db={database} user={self.user}]:",
+            error,
+        )
 
     def _new_cursor(self, connection):
         if self.is_postgres:
             return connection.cursor()
         return connection.cursor(buffered=True)
 
-    def close_connection(self, connection):
+    def _close_failed_connection(self, connection):
+        """
+        Rolls back the failed transaction of a connection and hands it back,
+        or discards it if the rollback fails too (e.g. the connection is lost).
+        """
+        discard = False
+        if connection is not None:
+            try:
+                connection.rollback()
+            except Exception:
+                discard = True
+        self.close_connection(connection, discard=discard)
+
+    def close_connection(self, connection, discard=False):
+        """
+        Hands a connection obtained from `connect()` back to the pool. Pass
+        `discard=True` when the connection is known to be unusable.
+        """
         if connection is None:
             return
+        budget = current_connection_budget()
+        if budget is not None:
+            budget.unhold(connection)
         try:
-            if self.is_postgres:
-                if connection.closed == 0:
-                    connection.close()
-            else:
-                if connection.is_connected():
-                    connection.close()
+            self.get_pool().release(connection, discard=discard)
         except Exception:
             pass
 
     # endregion
 
+    def _record_query(self, query, started, rows=None, failed=False):
+        QueryStats.record(
+            query, self.dialect, self.database, time.monotonic() - started, rows=rows, failed=failed)
+
     def create_db(self):
         if self.is_postgres:
             self._create_postgres_db()
@@ -152,7 +516,7 @@ class DatabaseConnector:
             self._create_mysql_db()
 
     def _create_mysql_db(self):
-        connection = self.connect(database=None)
+        connection = self.connect_direct(database=None)
         if connection is None:
             return
         cursor = connection.cursor()
@@ -163,7 +527,7 @@ class DatabaseConnector:
         connection.close()
 
     def _create_postgres_db(self):
-        connection = self.connect(database="postgres")
+        connection = self.connect_direct(database="postgres")
         if connection is None:
             return
         connection.autocommit = True
@@ -180,53 +544,257 @@ class DatabaseConnector:
 
     def execute_query(self, query, params=None):
         read_only_query = self.is_read_only_query(query)
+        if self.replicas is not None and is_replica_safe_query(query):
+            served, result = self.replicas.execute(lambda replica: replica.execute_query(query, params))
+            if served:
+                return result
         if self.is_postgres:
             query = quote_pg_identifiers(query)
         connection = None
+        started = time.monotonic()
         try:
             connection = self.connect()
             with self._new_cursor(connection) as cursor:
                 cursor.execute(query, params)
                 if read_only_query:
                     rows = cursor.fetchall()
-                    column_names = [i[0] for i in cursor.description]
-                    result = [RowDict(zip(column_names, row)) for row in rows]
+                    result = to_rows(cursor, rows)
                     self.close_connection(connection)
+                    self._record_query(query, started, rows=len(result))
                     return result
                 else:
                     connection.commit()
                     rowcount = cursor.rowcount
                     self.close_connection(connection)
+                    self._record_query(query, started, rows=rowcount)
                     return rowcount
         except Exception as error:
             print("Error executing the query:", error)
-            if not read_only_query and connection is not None:
-                connection.rollback()
-            self.close_connection(connection)
+            self._record_query(query, started, failed=True)
+            if read_only_query:
+                self.close_connection(connection)
+            else:
+                self._close_failed_connection(connection)
             return None
 
-    def execute_read_query(self, query, params=None):
+    def execute_read_query(self, query, params=None, compact=False):
+        """
+        Runs a read query and returns all rows as RowDicts. Pass `compact=True`
+        to get read-only, tuple-backed Rows instead; only for callers that never
+        mutate or serialise the rows (e.g. the sync extraction queries).
+        """
         read_only_query = self.is_read_only_query(query)
         if not read_only_query:
             print("This method is only for read-only queries.")
             return None
+        if self.replicas is not None and is_replica_safe_query(query):
+            served, result = self.replicas.execute(
+                lambda replica: replica.execute_read_query(query, params, compact=compact))
+            if served:
+                return result
         if self.is_postgres:
             query = quote_pg_identifiers(query)
         connection = None
+        started = time.monotonic()
         try:
             connection = self.connect()
             with self._new_cursor(connection) as cursor:
                 cursor.execute(query, params)
                 rows = cursor.fetchall()
-                column_names = [i[0] for i in cursor.description]
-                result = [RowDict(zip(column_names, row)) for row in rows]
-                self.close_connection(connection)
-                return result
+                result = to_rows(cursor, rows, compact=compact)
+            self._capture_plan(connection, query, params, started)
+            self.close_connection(connection)
+            self._record_query(query, started, rows=len(result))
+            return result
         except Exception as error:
             print("Error executing the read query:", error)
+            self._record_query(query, started, failed=True)
+            self.close_connection(connection)
+            return None
+
+    def execute_prepared_read_query(self, query, params=None, compact=False):
+        """
+        Runs a read query written with ``%(name)s`` bind parameters as a
+        server-side prepared statement, returning rows like `execute_read_query`.
+
+        The dialect rewrite is compiled once per query text (see
+        `compile_prepared_query`) and the statement is prepared once per pooled
+        connection, so repeated runs with other values skip parsing and
+        planning. Keep the query text free of interpolated values, or every call
+        becomes a new statement.
+        """
+        read_only_query = self.is_read_only_query(query)
+        if not read_only_query:
+            print("This method is only for read-only queries.")
+            return None
+        if self.replicas is not None and is_replica_safe_query(query):
+            served, result = self.replicas.execute(
+                lambda replica: replica.execute_prepared_read_query(query, params, compact=compact))
+            if served:
+                return result
+        connection = None
+        started = time.monotonic()
+        try:
+            prepared = compile_prepared_query(query, self.is_postgres)
+            values = prepared.bind(params)
+            connection = self.connect()
+            statements = self.get_pool().connection_state(connection).setdefault("prepared", {})
+            if self.is_postgres:
+                with connection.cursor() as cursor:
+                    self._prepare_pg_statement(cursor, statements, prepared)
+                    if values:
+                        placeholders = ", ".join(["%s"] * len(values))
+                        cursor.execute(f"EXECUTE {prepared.name} ({placeholders})", values)
+                    else:
+                        cursor.execute(f"EXECUTE {prepared.name}")
+                    rows = cursor.fetchall()
+                    result = to_rows(cursor, rows, compact=compact)
+            else:
+                cursor = self._get_mysql_prepared_cursor(connection, statements, prepared)
+                cursor.execute(prepared.text, values)
+                rows = cursor.fetchall()
+                result = to_rows(cursor, rows, compact=compact)
+            self._capture_plan(connection, query, params, started, prepared=prepared, values=values)
             self.close_connection(connection)
+            self._record_query(query, started, rows=len(result))
+            return result
+        except Exception as error:
+            print("Error executing the prepared read query:", error)
+            self._record_query(query, started, failed=True)
+            # The connection may hold a half-prepared or aborted statement
+            self.close_connection(connection, discard=True)
             return None
 
+    @staticmethod
+    def _prepare_pg_statement(cursor, statements, prepared: PreparedQuery):
+        if prepared.name in statements:
+            return
+        if len(statements) >= MAX_PREPARED_STATEMENTS_PER_CONNECTION:
+            oldest = next(iter(statements))
+            cursor.execute(f"DEALLOCATE {oldest}")
+            del statements[oldest]
+        cursor.execute(f"PREPARE {prepared.name} AS {prepared.text}")
+        statements[prepared.name] = True
+
+    @staticmethod
+    def _get_mysql_prepared_cursor(connection, statements, prepared: PreparedQuery):
+        cursor = statements.get(prepared.name)
+        if cursor is not None:
+            return cursor
+        if len(statements) >= MAX_PREPARED_STATEMENTS_PER_CONNECTION:
+            oldest = next(iter(statements))
+            statements.pop(oldest).close()
+        # A prepared cursor keeps its statement prepared on the server for as
+        # long as it stays open and executes the same operation text.
+        cursor = connection.cursor(prepared=True)
+        statements[prepared.name] = cursor
+        return cursor
+
+    def _capture_plan(self, connection, query, params, started, prepared=None, values=None):
+        """
+        EXPLAINs a query that just ran on `connection` when a plan capture is
+        active (see app/database/query_plans.py). Prepared statements are
+        explained through `EXPLAIN EXECUTE` on PostgreSQL, so the plan is the
+        one actually used for the bound values.
+        """
+        capture = current_plan_capture()
+        if capture is None or not capture.should_capture(query_id(query), self.database):
+            return
+        elapsed_ms = (time.monotonic() - started) * 1000
+        analyze = capture.analyze and self.is_postgres
+        try:
+            with self._new_cursor(connection) as cursor:
+                if self.is_postgres:
+                    options = "ANALYZE, BUFFERS, FORMAT JSON" if analyze else "FORMAT JSON"
+                    if prepared is not None:
+                        arguments = f" ({', '.join(['%s'] * len(values))})" if values else ""
+                        cursor.execute(f"EXPLAIN ({options}) EXECUTE {prepared.name}{arguments}", values or None)
+                    else:
+                        cursor.execute(f"EXPLAIN ({options}) {query}", params)
+                else:
+                    cursor.execute(f"EXPLAIN FORMAT=JSON {query}", params)
+                rows = cursor.fetchall()
+            plan = parse_plan(rows[0][0]) if rows else None
+            capture.add({
+                "QueryId"     : query_id(query),
+                "DatabaseName": self.database,
+                "Dialect"     : self.dialect,
+                "Analyzed"    : analyze,
+                "DurationMs"  : round(elapsed_ms, 3),
+                "Query"       : query,
+                "Params"      : params,
+                "Plan"        : plan,
+                "Flags"       : find_plan_issues(plan, query, self.is_postgres),
+            })
+        except Exception as error:
+            print("Error capturing the query plan:", error)
+
+    def iter_read_query(self, query, params=None, chunk_size=1000):
+        """
+        Streams the result of a read query instead of loading it into memory.
+
+        Rows are fetched `chunk_size` at a time through a server-side cursor (a
+        named cursor on PostgreSQL, an unbuffered cursor on MySQL) and yielded
+        one by one as compact Rows, so arbitrarily large results are processed in
+        constant memory. The pooled connection is held until the generator is
+        exhausted or closed; one abandoned half-way is discarded rather than
+        returned to the pool. Errors, including a failed connect, are printed
+        and raised.
+        """
+        read_only_query = self.is_read_only_query(query)
+        if not read_only_query:
+            raise ValueError("iter_read_query is only for read-only queries.")
+        replica = None
+        if self.replicas is not None and is_replica_safe_query(query):
+            replica = self.replicas.choose()
+        if replica is not None:
+            # A stream can't fall back half-way, so the replica serves it outright
+            yield from replica.iter_read_query(query, params, chunk_size=chunk_size)
+            return
+        if self.is_postgres:
+            query = quote_pg_identifiers(query)
+        connection = self.connect()
+        if connection is None:
+            # Unlike an empty result, so the caller must not carry on
+            self._record_query(query, time.monotonic(), failed=True)
+            raise ConnectionError(f"Unable to connect to {self.database} to stream a read query.")
+        cursor = None
+        exhausted = False
+        failed = False
+        row_count = 0
+        started = time.monotonic()
+        try:
+            if self.is_postgres:
+                cursor = connection.cursor(name=f"iter_{uuid.uuid4().hex}")
+                cursor.itersize = chunk_size
+            else:
+                cursor = connection.cursor(buffered=False)
+            cursor.execute(query, params)
+            columns = None
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                if columns is None:
+                    columns = ResultColumns.from_cursor(cursor)
+                row_count += len(rows)
+                for row in rows:
+                    yield Row(columns, row)
+            exhausted = True
+        except Exception as error:
+            print("Error executing the streaming read query:", error)
+            failed = True
+            raise
+        finally:
+            if cursor is not None:
+                try:
+                    cursor.close()
+                except Exception:
+                    exhausted = False
+            self.close_connection(connection, discard=not exhausted)
+            # Includes the time the consumer spent between chunks
+            self._record_query(query, started, rows=row_count, failed=failed)
+
     def execute_write_query(self, query, params=None):
         read_only_query = self.is_read_only_query(query)
         if read_only_query:
@@ -235,6 +803,7 @@ class DatabaseConnector:
         if self.is_postgres:
             query = quote_pg_identifiers(query)
         connection = None
+        started = time.monotonic()
         try:
             connection = self.connect()
             with self._new_cursor(connection) as cursor:
@@ -242,10 +811,62 @@ class DatabaseConnector:
                 connection.commit()
                 rowcount = cursor.rowcount
                 self.close_connection(connection)
+                self._record_query(query, started, rows=rowcount)
                 return rowcount
         except Exception as error:
             print("Error executing the write query:", error)
-            if connection is not None:
-                connection.rollback()
+            self._record_query(query, started, failed=True)
+            self._close_failed_connection(connection)
+            return None
+
+    def execute_batch_write(self, query, rows, batch_size=1000):
+        """
+        Writes many rows with a single-row INSERT statement such as
+        ``INSERT INTO t (a, b) VALUES (%s, %s)``, one transaction per batch.
+
+        On PostgreSQL each batch is sent as one multi-row INSERT through
+        ``psycopg2.extras.execute_values``; on MySQL ``executemany`` does the
+        same rewrite. Returns the rowcount of every batch, in order, with None
+        for a batch that failed (and was rolled back).
+        """
+        read_only_query = self.is_read_only_query(query)
+        if read_only_query:
+            print("This method is only for write queries.")
+            return None
+        rows = list(rows)
+        if len(rows) == 0:
+            return []
+        if self.is_postgres:
+            query = quote_pg_identifiers(query)
+            query = _VALUES_PLACEHOLDERS_RE.sub("VALUES %s", query, count=1)
+        batch_size = max(1, int(batch_size))
+        rowcounts = []
+        connection = None
+        try:
+            connection = self.connect()
+            if connection is None:
+                return None
+            for start in range(0, len(rows), batch_size):
+                batch = rows[start:start + batch_size]
+                started = time.monotonic()
+                try:
+                    with self._new_cursor(connection) as cursor:
+                        if self.is_postgres:
+                            psycopg2.extras.execute_values(cursor, query, batch, page_size=len(batch))
+                        else:
+                            cursor.executemany(query, batch)
+                        connection.commit()
+                        rowcounts.append(cursor.rowcount)
+                    self._record_query(query, started, rows=rowcounts[-1])
+                except Exception as error:
+                    print(f"Error executing the batch write query (rows {start}-{start + len(batch) - 1}):", error)
+                    connection.rollback()
+                    rowcounts.append(None)
+                    self._record_query(query, started, failed=True)
             self.close_connection(connection)
+            return rowcounts
+        except Exception as error:
+            print("Error executing the batch write query:", error)
+            # Reached when a rollback failed, so the connection is unusable
+            self.close_connection(connection, discard=True)
             return None
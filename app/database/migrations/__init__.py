@@ -0,0 +1,19 @@
+import asyncio
+from app.modules.data_sync.connectors import get_analytics_db_connector
+from .event_idempotency import ensure_event_idempotency_key
+from .event_keys import ensure_event_key_index
+
+###############################################################################
+
+def run_migrations():
+    """
+    Brings the tables created by `create_all` up to date. Runs through the
+    shared analytics connector, so its pool gets the DB_CONNECTOR_POOL_*
+    settings.
+    """
+    connector = get_analytics_db_connector()
+    ensure_event_key_index(connector)
+    ensure_event_idempotency_key(connector)
+
+async def run_migrations_on_startup():
+    await asyncio.to_thread(run_migrations)
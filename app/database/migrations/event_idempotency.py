@@ -0,0 +1,77 @@
+from app.database.db_connector import DatabaseConnector
+
+###############################################################################
+
+IDEMPOTENCY_KEY_INDEX_NAME = "uq_events_idempotency_key"
+
+# Keys are scoped to the user, so clients only need them unique per user.
+# Events without a key are NULL and never conflict.
+_PG_CREATE_INDEX = f"""
+    CREATE UNIQUE INDEX IF NOT EXISTS {IDEMPOTENCY_KEY_INDEX_NAME}
+    ON events (UserId, IdempotencyKey)
+"""
+
+_MYSQL_CREATE_INDEX = f"""
+    CREATE UNIQUE INDEX {IDEMPOTENCY_KEY_INDEX_NAME}
+    ON events (UserId, IdempotencyKey)
+"""
+
+_ADD_COLUMN = """
+    ALTER TABLE events ADD COLUMN IdempotencyKey VARCHAR(128) NULL
+"""
+
+_PG_COLUMN_EXISTS = """
+    SELECT 1 FROM information_schema.columns
+    WHERE table_name = 'events' AND column_name = %s
+"""
+
+_MYSQL_COLUMN_EXISTS = """
+    SELECT 1 FROM information_schema.columns
+    WHERE table_schema = DATABASE() AND table_name = 'events' AND column_name = %s
+"""
+
+_PG_INDEX_EXISTS = """
+    SELECT 1 FROM pg_indexes WHERE tablename = 'events' AND indexname = %s
+"""
+
+_MYSQL_INDEX_EXISTS = """
+    SELECT 1 FROM information_schema.statistics
+    WHERE table_schema = DATABASE() AND table_name = 'events' AND index_name = %s
+"""
+
+###############################################################################
+
+def ensure_event_idempotency_key(connector: DatabaseConnector) -> bool:
+    """
+    Idempotently adds the IdempotencyKey column to an events table created
+    before it existed, and its unique (UserId, IdempotencyKey) index. New
+    databases get both from the model. Returns True when the index exists
+    afterwards.
+    """
+    try:
+        column_query = _PG_COLUMN_EXISTS if connector.is_postgres else _MYSQL_COLUMN_EXISTS
+        rows = connector.execute_read_query(column_query, ("IdempotencyKey",))
+        if rows is None:
+            return False
+        if len(rows) == 0:
+            if connector.execute_write_query(_ADD_COLUMN) is None:
+                print("Failed to add the IdempotencyKey column to events.")
+                return False
+            print("Added the IdempotencyKey column to events.")
+
+        index_query = _PG_INDEX_EXISTS if connector.is_postgres else _MYSQL_INDEX_EXISTS
+        rows = connector.execute_read_query(index_query, (IDEMPOTENCY_KEY_INDEX_NAME,))
+        if rows is None:
+            return False
+        if len(rows) > 0:
+            return True
+
+        create_query = _PG_CREATE_INDEX if connector.is_postgres else _MYSQL_CREATE_INDEX
+        if connector.execute_write_query(create_query) is None:
+            print("Failed to create the event idempotency key index.")
+            return False
+        print(f"Created the {IDEMPOTENCY_KEY_INDEX_NAME} index on events.")
+        return True
+    except Exception as error:
+        print("Error ensuring the event idempotency key:", error)
+        return False
@@ -0,0 +1,101 @@
+from app.database.db_connector import DatabaseConnector
+
+###############################################################################
+
+EVENT_KEY_INDEX_NAME = "uq_events_reancare_key"
+
+# Only ReanCare-synced events are keyed; API-ingested events may legitimately
+# repeat (UserId, ResourceId, EventName). PostgreSQL gets a partial index,
+# MySQL a functional key part that is NULL (and so never conflicts) for every
+# other source.
+_PG_CREATE_INDEX = f"""
+    CREATE UNIQUE INDEX IF NOT EXISTS {EVENT_KEY_INDEX_NAME}
+    ON events (UserId, ResourceId, EventName)
+    WHERE SourceName = 'ReanCare'
+"""
+
+_MYSQL_CREATE_INDEX = f"""
+    CREATE UNIQUE INDEX {EVENT_KEY_INDEX_NAME}
+    ON events (UserId, ResourceId, EventName, ((CASE WHEN SourceName = 'ReanCare' THEN 1 END)))
+"""
+
+_PG_INDEX_EXISTS = """
+    SELECT 1 FROM pg_indexes WHERE tablename = 'events' AND indexname = %s
+"""
+
+_MYSQL_INDEX_EXISTS = """
+    SELECT 1 FROM information_schema.statistics
+    WHERE table_schema = DATABASE() AND table_name = 'events' AND index_name = %s
+"""
+
+# Ids of duplicated ReanCare events, all but the lowest id of each key; read
+# and deleted a batch at a time so no single statement runs over the whole table
+_SELECT_DUPLICATE_IDS = """
+    SELECT a.id FROM events a
+    JOIN events b ON
+        a.UserId = b.UserId
+        AND a.ResourceId = b.ResourceId
+        AND a.EventName = b.EventName
+        AND a.id > b.id
+    WHERE a.SourceName = 'ReanCare' AND b.SourceName = 'ReanCare'
+    LIMIT %s
+"""
+
+_DELETE_EVENTS = "DELETE FROM events WHERE id IN ({placeholders})"
+
+###############################################################################
+
+def ensure_event_key_index(connector: DatabaseConnector, batch_size: int = 1000) -> bool:
+    """
+    Idempotently adds the unique (UserId, ResourceId, EventName) key on
+    ReanCare events that the sync upserts rely on. Duplicates left behind by
+    earlier overlapping syncs are removed first, since the index cannot be
+    built over them. Returns True when the index exists afterwards.
+    """
+    try:
+        exists_query = _PG_INDEX_EXISTS if connector.is_postgres else _MYSQL_INDEX_EXISTS
+        rows = connector.execute_read_query(exists_query, (EVENT_KEY_INDEX_NAME,))
+        if rows is None:
+            return False
+        if len(rows) > 0:
+            return True
+
+        deleted = delete_duplicate_events(connector, batch_size)
+        if deleted is None:
+            print("Failed to remove duplicate ReanCare events; event key index not created.")
+            return False
+        if deleted > 0:
+            print(f"Removed {deleted} duplicate ReanCare events.")
+
+        create_query = _PG_CREATE_INDEX if connector.is_postgres else _MYSQL_CREATE_INDEX
+        if connector.execute_write_query(create_query) is None:
+            print("Failed to create the event key index.")
+            return False
+        print(f"Created the {EVENT_KEY_INDEX_NAME} index on events.")
+        return True
+    except Exception as error:
+        print("Error ensuring the event key index:", error)
+        return False
+
+def delete_duplicate_events(connector: DatabaseConnector, batch_size: int) -> int | None:
+    """
+    Deletes duplicated ReanCare events, keeping the lowest id of each, up to
+    `batch_size` rows per statement. Returns the number of rows deleted, or
+    None if a query failed.
+    """
+    batch_size = max(1, batch_size)
+    deleted = 0
+    while True:
+        rows = connector.execute_read_query(_SELECT_DUPLICATE_IDS, (batch_size,))
+        if rows is None:
+            return None
+        if len(rows) == 0:
+            return deleted
+        ids = list({row['id'] for row in rows})
+        query = _DELETE_EVENTS.format(placeholders=", ".join(["%s"] * len(ids)))
+        count = connector.execute_write_query(query, tuple(ids))
+        if count is None:
+            return None
+        deleted += count
+        if count == 0 or len(rows) < batch_size:
+            return deleted
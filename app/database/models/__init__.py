@@ -8,3 +8,7 @@ from .user_milestone import UserMilestone
 from .tenant_milestone import TenantMilestone
 from .user_metadata import UserMetadata
 from .analysis import Analysis
+from .analysis_query_plan import AnalysisQueryPlan
+from .sync_state import SyncState
+from .sync_backfill_slice import SyncBackfillSlice
+from .sync_run import SyncRun
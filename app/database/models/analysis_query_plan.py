@@ -0,0 +1,28 @@
+import json
+from sqlalchemy import Boolean, Column, Float, String, DateTime, Text, func
+from sqlalchemy.dialects.mysql import MEDIUMTEXT
+from app.common.utils import generate_uuid4
+from app.database.base import Base
+
+###############################################################################
+
+class AnalysisQueryPlan(Base):
+
+    __tablename__ = "analysis_query_plans"
+
+    id           = Column(String(36), primary_key=True, index=True, default=generate_uuid4)
+    AnalysisCode = Column(String(36), default=None, index=True, nullable=False)
+    QueryId      = Column(String(32), default=None, nullable=False)
+    DatabaseName = Column(String(128), default=None, nullable=False)
+    Dialect      = Column(String(32), default=None, nullable=False)
+    Analyzed     = Column(Boolean, default=False, nullable=False)
+    DurationMs   = Column(Float, default=None, nullable=True)
+    Query        = Column(Text, default=None, nullable=False)
+    Params       = Column(Text, default=None, nullable=True)
+    Plan         = Column(Text().with_variant(MEDIUMTEXT, "mysql"), default=None, nullable=True)
+    Flags        = Column(Text, default=None, nullable=True)
+    CreatedAt    = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        jsonStr = json.dumps(self.__dict__)
+        return jsonStr
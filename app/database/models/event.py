@@ -1,5 +1,5 @@
 import json
-from sqlalchemy import Column, ForeignKey, Enum, Integer, String, DateTime, Text, func, JSON
+from sqlalchemy import Column, ForeignKey, Enum, Index, Integer, String, DateTime, Text, func, JSON
 from app.common.utils import generate_uuid4
 from app.database.base import Base
 from app.domain_types.enums.types import EventActionType
@@ -9,6 +9,9 @@ from app.domain_types.enums.types import EventActionType
 class Event(Base):
 
     __tablename__ = "events"
+    __table_args__ = (
+        Index("uq_events_idempotency_key", "UserId", "IdempotencyKey", unique=True),
+    )
 
     id                          = Column(String(36), primary_key=True, index=True, default=generate_uuid4)
     UserId                      = Column(String(36), default=None, index=True, nullable=False)
@@ -27,6 +30,7 @@ class Event(Base):
     Timestamp                   = Column(DateTime(timezone=True), server_default=func.now())
     DaysSinceRegistration       = Column(Integer, nullable=False)
     TimeOffsetSinceRegistration = Column(Integer, nullable=False)
+    IdempotencyKey              = Column(String(128), default=None, nullable=True)
     CreatedAt                   = Column(DateTime(timezone=True), server_default=func.now())
     UpdatedAt                   = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -0,0 +1,27 @@
+import json
+from sqlalchemy import Column, Integer, String, Date, DateTime, Text, func
+from app.common.utils import generate_uuid4
+from app.database.base import Base
+
+###############################################################################
+
+class SyncBackfillSlice(Base):
+
+    __tablename__ = "sync_backfill_slices"
+
+    id            = Column(String(36), primary_key=True, index=True, default=generate_uuid4)
+    BackfillId    = Column(String(36), index=True, nullable=False)
+    SliceIndex    = Column(Integer, nullable=False)
+    StartDate     = Column(Date, nullable=False)
+    EndDate       = Column(Date, nullable=False)
+    Status        = Column(String(16), default="Pending", nullable=False)
+    Attempts      = Column(Integer, default=0, nullable=False)
+    LastError     = Column(Text, default=None, nullable=True)
+    StartedAt     = Column(DateTime, default=None, nullable=True)
+    CompletedAt   = Column(DateTime, default=None, nullable=True)
+    CreatedAt     = Column(DateTime(timezone=True), server_default=func.now())
+    UpdatedAt     = Column(DateTime(timezone=True), onupdate=func.now())
+
+    def __repr__(self):
+        jsonStr = json.dumps(self.__dict__)
+        return jsonStr
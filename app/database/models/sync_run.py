@@ -0,0 +1,32 @@
+import json
+from sqlalchemy import Column, Float, Integer, String, DateTime, Text, func
+from app.common.utils import generate_uuid4
+from app.database.base import Base
+
+###############################################################################
+
+class SyncRun(Base):
+
+    __tablename__ = "sync_runs"
+
+    id                   = Column(String(36), primary_key=True, index=True, default=generate_uuid4)
+    SyncKey              = Column(String(128), index=True, nullable=False)
+    Mode                 = Column(String(16), nullable=False)
+    Status               = Column(String(16), nullable=False)
+    StartedAt            = Column(DateTime, index=True, nullable=False)
+    CompletedAt          = Column(DateTime, default=None, nullable=True)
+    DurationSeconds      = Column(Float, default=0, nullable=False)
+    RowsExtracted        = Column(Integer, default=0, nullable=False)
+    RowsInserted         = Column(Integer, default=0, nullable=False)
+    RowsSkipped          = Column(Integer, default=0, nullable=False)
+    RowsFailed           = Column(Integer, default=0, nullable=False)
+    ExtractSeconds       = Column(Float, default=0, nullable=False)
+    LoadSeconds          = Column(Float, default=0, nullable=False)
+    ExtractRowsPerSecond = Column(Float, default=None, nullable=True)
+    LoadRowsPerSecond    = Column(Float, default=None, nullable=True)
+    Error                = Column(Text, default=None, nullable=True)
+    CreatedAt            = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        jsonStr = json.dumps(self.__dict__)
+        return jsonStr
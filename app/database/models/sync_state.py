@@ -0,0 +1,26 @@
+import json
+from sqlalchemy import Column, Integer, String, DateTime, Text, func
+from app.common.utils import generate_uuid4
+from app.database.base import Base
+
+###############################################################################
+
+class SyncState(Base):
+
+    __tablename__ = "sync_state"
+
+    id            = Column(String(36), primary_key=True, index=True, default=generate_uuid4)
+    SyncKey       = Column(String(128), unique=True, nullable=False)
+    WatermarkAt   = Column(DateTime, default=None, nullable=True)
+    LastId        = Column(String(64), default=None, nullable=True)
+    LastRunAt     = Column(DateTime, default=None, nullable=True)
+    LastSuccessAt = Column(DateTime, default=None, nullable=True)
+    LastError     = Column(Text, default=None, nullable=True)
+    RunCount      = Column(Integer, default=0, nullable=False)
+    FailureCount  = Column(Integer, default=0, nullable=False)
+    CreatedAt     = Column(DateTime(timezone=True), server_default=func.now())
+    UpdatedAt     = Column(DateTime(timezone=True), onupdate=func.now())
+
+    def __repr__(self):
+        jsonStr = json.dumps(self.__dict__)
+        return jsonStr
@@ -0,0 +1,82 @@
+import itertools
+import re
+from collections.abc import Mapping
+
+from app.common.cache import LruTtlCache
+from app.config.config import get_settings
+from app.database.db_connector import RowDict
+
+###############################################################################
+
+settings = get_settings()
+
+ALL_TENANTS_TAG = "tenant:*"
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Result cache for the analytics report queries (see AsyncDatabaseConnector).
+# Entries are tagged with the tenant they were computed for, or ALL_TENANTS_TAG
+# when unfiltered, and are dropped when that tenant's users/events change.
+analytics_query_cache = LruTtlCache(
+    max_entries=settings.ANALYTICS_QUERY_CACHE_MAX_ENTRIES,
+    default_ttl=settings.ANALYTICS_QUERY_CACHE_TTL)
+
+_generation = itertools.count(1)
+_current_generation = 0
+
+###############################################################################
+
+def _freeze(value):
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, Mapping):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value
+
+def cache_key(database: str, query: str, params) -> tuple:
+    normalized = _WHITESPACE_RE.sub(" ", query).strip()
+    return (database, normalized, _freeze(params))
+
+def tenant_tag(tenant_id) -> str:
+    return f"tenant:{str(tenant_id).lower()}"
+
+def cache_tags(params) -> tuple:
+    tenant_id = params.get("tenant_id") if isinstance(params, Mapping) else None
+    if tenant_id:
+        return (tenant_tag(tenant_id),)
+    return (ALL_TENANTS_TAG,)
+
+def copy_rows(rows):
+    """Callers mutate the rows they get back, so the cache never shares them."""
+    if not isinstance(rows, list):
+        return rows
+    return [RowDict(row, columns=row._columns) if isinstance(row, RowDict) else row for row in rows]
+
+def current_generation() -> int:
+    return _current_generation
+
+def invalidate_tenants(tenant_ids) -> int:
+    """
+    Drops the cached results of the given tenants and every unfiltered
+    (all-tenant) result, since those include the tenants' rows too.
+    """
+    global _current_generation
+    if not settings.ANALYTICS_QUERY_CACHE_ENABLED:
+        return 0
+    tags = {tenant_tag(tenant_id) for tenant_id in tenant_ids if tenant_id}
+    tags.add(ALL_TENANTS_TAG)
+    # Results computed while a write was in flight must not be stored afterwards
+    _current_generation = next(_generation)
+    return analytics_query_cache.invalidate_tags(tags)
+
+def invalidate_all():
+    """
+    Drops every cached result. For writes whose tenants are not known here,
+    such as those of the backfill worker processes: their invalidations only
+    reach their own, process-local cache.
+    """
+    global _current_generation
+    if not settings.ANALYTICS_QUERY_CACHE_ENABLED:
+        return
+    _current_generation = next(_generation)
+    analytics_query_cache.clear()
@@ -0,0 +1,125 @@
+import contextvars
+import json
+import re
+import threading
+
+###############################################################################
+
+# Tables where a full scan is always worth flagging
+WATCHED_TABLES = {"events"}
+
+_TABLE_ALIAS_RE = re.compile(
+    r'\b(?:FROM|JOIN)\s+"?(\w+)"?(?:\s+(?:AS\s+)?"?(?!(?:ON|WHERE|JOIN|LEFT|RIGHT|INNER|GROUP|ORDER|LIMIT|USING)\b)(\w+)"?)?',
+    re.IGNORECASE)
+
+_current_capture = contextvars.ContextVar("query_plan_capture", default=None)
+
+###############################################################################
+
+class QueryPlanCapture:
+    """
+    Collects the execution plans of the read queries issued while it is
+    active. DatabaseConnector runs `EXPLAIN` (or `EXPLAIN ANALYZE` on
+    PostgreSQL when `analyze` is set) right after each distinct query and
+    hands the plan to `add`; plans are kept once per query fingerprint and
+    database.
+    """
+
+    def __init__(self, analysis_code: str, analyze: bool = False):
+        self.analysis_code = analysis_code
+        self.analyze = analyze
+        self.plans = []
+        self._seen = set()
+        self._lock = threading.Lock()
+
+    def should_capture(self, query_id, database) -> bool:
+        with self._lock:
+            key = (query_id, database)
+            if key in self._seen:
+                return False
+            self._seen.add(key)
+            return True
+
+    def add(self, plan: dict):
+        with self._lock:
+            self.plans.append(plan)
+
+def start_plan_capture(analysis_code: str, analyze: bool = False) -> QueryPlanCapture:
+    """
+    Starts capturing plans in the current context. Tasks and executor calls
+    spawned afterwards (asyncio.gather, AsyncDatabaseConnector) inherit it.
+    """
+    capture = QueryPlanCapture(analysis_code, analyze)
+    _current_capture.set(capture)
+    return capture
+
+def stop_plan_capture():
+    _current_capture.set(None)
+
+def current_plan_capture() -> QueryPlanCapture | None:
+    return _current_capture.get()
+
+###############################################################################
+
+def table_aliases(query: str) -> dict:
+    """Alias (and table name) -> table name for the FROM/JOIN clauses of a query."""
+    aliases = {}
+    for match in _TABLE_ALIAS_RE.finditer(query):
+        table = match.group(1)
+        aliases[table.lower()] = table.lower()
+        if match.group(2):
+            aliases[match.group(2).lower()] = table.lower()
+    return aliases
+
+def find_plan_issues(plan, query: str, is_postgres: bool) -> list:
+    """
+    Flags full table scans (always on WATCHED_TABLES, and on any table read
+    without an index while filtering) in a JSON plan from EXPLAIN.
+    Returns strings such as "FullScan:events" or "NoIndex:users".
+    """
+    aliases = table_aliases(query)
+    issues = []
+
+    def flag(issue):
+        if issue not in issues:
+            issues.append(issue)
+
+    def visit(node):
+        if isinstance(node, list):
+            for item in node:
+                visit(item)
+            return
+        if not isinstance(node, dict):
+            return
+        if is_postgres:
+            if node.get("Node Type") == "Seq Scan":
+                table = (node.get("Relation Name") or "").lower()
+                if table in WATCHED_TABLES:
+                    flag(f"FullScan:{table}")
+                if node.get("Filter") is not None:
+                    flag(f"NoIndex:{table}")
+        elif "table_name" in node and "access_type" in node:
+            name = str(node.get("table_name")).lower()
+            table = aliases.get(name, name)
+            if node.get("access_type") in ("ALL", "index"):
+                if table in WATCHED_TABLES:
+                    flag(f"FullScan:{table}")
+                if node.get("key") is None:
+                    flag(f"NoIndex:{table}")
+        for value in node.values():
+            if isinstance(value, (dict, list)):
+                visit(value)
+
+    visit(plan)
+    return issues
+
+def parse_plan(raw):
+    """EXPLAIN ... FORMAT JSON output as Python objects (MySQL returns a string)."""
+    if isinstance(raw, (bytes, bytearray)):
+        raw = raw.decode("utf-8")
+    if isinstance(raw, str):
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return raw
+    return raw
@@ -0,0 +1,181 @@
+import contextvars
+import functools
+import hashlib
+import re
+import threading
+import time
+
+from app.config.config import get_settings
+
+###############################################################################
+
+settings = get_settings()
+
+_db_query_duration_histogram = None
+_db_query_rows_histogram = None
+if settings.METRICS_ENABLED:
+    from app.telemetry.metrics import db_query_duration_histogram as _db_query_duration_histogram
+    from app.telemetry.metrics import db_query_rows_histogram as _db_query_rows_histogram
+
+_COMMENT_RE = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER_RE = re.compile(r"%\(\w+\)s|%s|\$\d+|\?")
+_NUMBER_RE = re.compile(r"(?<![\w.])\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_failure_counter = contextvars.ContextVar("query_failure_counter", default=None)
+
+###############################################################################
+
+@functools.lru_cache(maxsize=2048)
+def fingerprint(query: str) -> str:
+    """
+    Normalised shape of a query: comments dropped, string and numeric literals
+    and bind placeholders replaced by `?`, value lists collapsed and whitespace
+    squeezed. Queries that only differ in their values share a fingerprint.
+    """
+    text = _COMMENT_RE.sub(" ", query)
+    text = _LITERAL_RE.sub("?", text)
+    text = _PLACEHOLDER_RE.sub("?", text)
+    text = _NUMBER_RE.sub("?", text)
+    text = _IN_LIST_RE.sub("(?+)", text)
+    text = _WHITESPACE_RE.sub(" ", text).strip().rstrip(";").strip()
+    return text
+
+@functools.lru_cache(maxsize=2048)
+def query_id(query: str) -> str:
+    return hashlib.sha1(fingerprint(query).encode("utf-8")).hexdigest()[:12]
+
+###############################################################################
+
+class QueryFailureCounter:
+    """
+    Counts the queries that failed in the current context while it is active.
+    DatabaseConnector reports failures by returning None, so callers that must
+    not act on partial results (e.g. advancing a sync watermark) check this.
+    """
+
+    def __init__(self):
+        self.failures = 0
+
+def start_failure_counter() -> QueryFailureCounter:
+    counter = QueryFailureCounter()
+    _failure_counter.set(counter)
+    return counter
+
+def stop_failure_counter():
+    _failure_counter.set(None)
+
+###############################################################################
+
+class QueryStats:
+    """
+    Process-wide aggregates of the raw SQL executed through DatabaseConnector,
+    one entry per (query fingerprint, dialect, database). Every execution is
+    also fed to the OpenTelemetry histograms when METRICS_ENABLED is set, and
+    executions slower than DB_SLOW_QUERY_THRESHOLD_MS are logged.
+    """
+
+    _lock = threading.Lock()
+    _entries = {}
+    _started_at = time.time()
+
+    @staticmethod
+    def record(query, dialect, database, elapsed_seconds, rows=None, failed=False):
+        counter = _failure_counter.get()
+        if failed and counter is not None:
+            counter.failures += 1
+        if not settings.DB_QUERY_STATS_ENABLED:
+            return
+        try:
+            qid = query_id(query)
+            elapsed_ms = elapsed_seconds * 1000
+            operation = QueryStats._operation(query)
+            key = (qid, dialect, database)
+            with QueryStats._lock:
+                entry = QueryStats._entries.get(key)
+                if entry is None:
+                    entry = {
+                        "QueryId"    : qid,
+                        "Operation"  : operation,
+                        "Dialect"    : dialect,
+                        "Database"   : database,
+                        "Fingerprint": fingerprint(query),
+                        "Calls"      : 0,
+                        "Errors"     : 0,
+                        "Rows"       : 0,
+                        "TotalMs"    : 0.0,
+                        "MaxMs"      : 0.0,
+                        "SlowCalls"  : 0,
+                    }
+                    QueryStats._entries[key] = entry
+                entry["Calls"] += 1
+                entry["TotalMs"] += elapsed_ms
+                if elapsed_ms > entry["MaxMs"]:
+                    entry["MaxMs"] = elapsed_ms
+                if failed:
+                    entry["Errors"] += 1
+                if rows is not None and rows > 0:
+                    entry["Rows"] += rows
+                threshold = settings.DB_SLOW_QUERY_THRESHOLD_MS
+                slow = threshold > 0 and elapsed_ms >= threshold
+                if slow:
+                    entry["SlowCalls"] += 1
+
+            if _db_query_duration_histogram is not None:
+                attributes = {
+                    "db.system"   : dialect,
+                    "db.name"     : database,
+                    "db.operation": operation,
+                    "db.query.id" : qid,
+                    "error"       : failed,
+                }
+                _db_query_duration_histogram.record(elapsed_ms, attributes)
+                if rows is not None and rows >= 0:
+                    _db_query_rows_histogram.record(rows, attributes)
+
+            if slow:
+                print(
+                    f"[slow-query] {elapsed_ms:.1f} ms db={database} dialect={dialect} "
+                    f"rows={rows} id={qid} :: {fingerprint(query)[:1000]}")
+        except Exception as error:
+            print("Error recording query stats:", error)
+
+    @staticmethod
+    def top(count=20, order_by="TotalMs") -> list:
+        with QueryStats._lock:
+            entries = [dict(entry) for entry in QueryStats._entries.values()]
+        for entry in entries:
+            entry["AverageMs"] = round(entry["TotalMs"] / entry["Calls"], 3) if entry["Calls"] else 0.0
+            entry["TotalMs"] = round(entry["TotalMs"], 3)
+            entry["MaxMs"] = round(entry["MaxMs"], 3)
+        if len(entries) > 0 and order_by not in entries[0]:
+            order_by = "TotalMs"
+        entries.sort(key=lambda entry: entry[order_by], reverse=True)
+        return entries[:max(0, count)]
+
+    @staticmethod
+    def summary() -> dict:
+        with QueryStats._lock:
+            entries = list(QueryStats._entries.values())
+            return {
+                "Since"               : QueryStats._started_at,
+                "DistinctQueries"     : len(entries),
+                "Calls"               : sum(entry["Calls"] for entry in entries),
+                "Errors"              : sum(entry["Errors"] for entry in entries),
+                "SlowCalls"           : sum(entry["SlowCalls"] for entry in entries),
+                "TotalMs"             : round(sum(entry["TotalMs"] for entry in entries), 3),
+                "SlowQueryThresholdMs": settings.DB_SLOW_QUERY_THRESHOLD_MS,
+            }
+
+    @staticmethod
+    def reset():
+        with QueryStats._lock:
+            QueryStats._entries.clear()
+            QueryStats._started_at = time.time()
+
+    @staticmethod
+    def _operation(query):
+        text = _COMMENT_RE.sub(" ", query).lstrip()
+        return text.split(None, 1)[0].upper() if text else ""
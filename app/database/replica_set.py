@@ -0,0 +1,142 @@
+import threading
+import time
+
+###############################################################################
+
+class _Replica:
+
+    __slots__ = (
+        "connector", "healthy", "lag_seconds", "next_check_at", "last_checked_at",
+        "query_count", "error_count", "latency_total_seconds", "latency_max_seconds")
+
+    def __init__(self, connector):
+        self.connector = connector
+        self.healthy = True
+        self.lag_seconds = None
+        self.next_check_at = 0.0
+        self.last_checked_at = None
+        self.query_count = 0
+        self.error_count = 0
+        self.latency_total_seconds = 0.0
+        self.latency_max_seconds = 0.0
+
+###############################################################################
+
+class ReplicaSet:
+    """
+    Round-robin routing of read-only queries over a primary's read replicas.
+
+    A replica is used only while it is healthy: its replication lag is
+    re-checked every `health_check_interval` seconds (by whichever reader first
+    finds the check due) and a replica that is unreachable, has replication
+    stopped, or lags by more than `max_lag_seconds` is skipped until a later
+    check clears it. A query that fails on a replica marks it unhealthy and is
+    reported as not served, so the caller falls back to the primary.
+
+    `connectors` are plain `DatabaseConnector`s (without replicas of their own)
+    exposing `get_replication_lag()`.
+    """
+
+    def __init__(self, connectors, max_lag_seconds=30, health_check_interval=15):
+        self.max_lag_seconds = max_lag_seconds
+        self.health_check_interval = health_check_interval
+        self._replicas = [_Replica(connector) for connector in connectors]
+        self._lock = threading.Lock()
+        self._next = 0
+
+    def __len__(self):
+        return len(self._replicas)
+
+    # region Public API
+
+    def execute(self, call):
+        """
+        Runs `call(connector)` on the next healthy replica. Returns
+        `(True, result)` when a replica served it and `(False, None)` when there
+        is no healthy replica or the call failed (a None result).
+        """
+        replica = self._choose()
+        if replica is None:
+            return False, None
+        started = time.monotonic()
+        result = call(replica.connector)
+        elapsed = time.monotonic() - started
+        with self._lock:
+            replica.query_count += 1
+            replica.latency_total_seconds += elapsed
+            if elapsed > replica.latency_max_seconds:
+                replica.latency_max_seconds = elapsed
+            if result is None:
+                replica.error_count += 1
+                replica.healthy = False
+                replica.next_check_at = time.monotonic() + self.health_check_interval
+        if result is None:
+            return False, None
+        return True, result
+
+    def choose(self):
+        """The connector of the next healthy replica, or None to use the primary."""
+        replica = self._choose()
+        return replica.connector if replica is not None else None
+
+    def stats(self) -> list:
+        with self._lock:
+            return [
+                {
+                    "Host"            : replica.connector.host,
+                    "Port"            : replica.connector.port,
+                    "Database"        : replica.connector.database,
+                    "Healthy"         : replica.healthy,
+                    "LagSeconds"      : replica.lag_seconds,
+                    "LastCheckedAt"   : replica.last_checked_at,
+                    "Queries"         : replica.query_count,
+                    "Errors"          : replica.error_count,
+                    "AverageLatencyMs": round(replica.latency_total_seconds * 1000 / replica.query_count, 3)
+                                        if replica.query_count else 0.0,
+                    "MaxLatencyMs"    : round(replica.latency_max_seconds * 1000, 3),
+                }
+                for replica in self._replicas
+            ]
+
+    # endregion
+
+    # region Internals
+
+    def _choose(self):
+        if len(self._replicas) == 0:
+            return None
+        now = time.monotonic()
+        due = []
+        with self._lock:
+            for replica in self._replicas:
+                if replica.next_check_at <= now:
+                    # Claim the check so concurrent readers don't repeat it
+                    replica.next_check_at = now + self.health_check_interval
+                    due.append(replica)
+        for replica in due:
+            self._check(replica)
+
+        with self._lock:
+            count = len(self._replicas)
+            for offset in range(count):
+                replica = self._replicas[(self._next + offset) % count]
+                if replica.healthy:
+                    self._next = (self._next + offset + 1) % count
+                    return replica
+        return None
+
+    def _check(self, replica):
+        try:
+            lag = replica.connector.get_replication_lag()
+        except Exception as error:
+            print(f"Error checking replica {replica.connector.host}:", error)
+            lag = None
+        healthy = lag is not None and lag <= self.max_lag_seconds
+        with self._lock:
+            if replica.healthy and not healthy:
+                print(f"Replica {replica.connector.host} taken out of rotation (lag={lag})")
+            replica.lag_seconds = lag
+            replica.healthy = healthy
+            replica.last_checked_at = time.time()
+
+    # endregion
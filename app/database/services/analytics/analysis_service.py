@@ -1,13 +1,17 @@
 from datetime import date, timedelta
 import asyncio
+import json
 import os
 import ast
 
 from pydantic import UUID4
 
 from app.common.utils import print_exception
+from app.config.config import get_settings
 from app.database.database_accessor import get_db_session
 from app.database.models.analysis import Analysis
+from app.database.models.analysis_query_plan import AnalysisQueryPlan
+from app.database.query_plans import QueryPlanCapture, start_plan_capture, stop_plan_capture
 from app.database.models.tenant import Tenant
 from app.database.services.analytics.basic_statistics import (
     get_active_users_count_at_end_of_every_month,
@@ -85,25 +89,29 @@ from app.domain_types.schemas.analytics import (
     HealthJourneyEngagementMetrics,
     PatientTaskEngagementMetrics
 )
-from app.modules.data_sync.connectors import get_analytics_db_connector
+from app.modules.data_sync.connectors import get_async_analytics_db_connector
 from app.modules.data_sync.data_synchronizer import DataSynchronizer
 
 ###############################################################################
 PAST_DAYS_TO_CONSIDER = 180
+settings = get_settings()
 ###############################################################################
 
 async def calculate(
-        analysis_code: str, filters: AnalyticsFilters|None) -> EngagementMetrics|None:
+        analysis_code: str,
+        filters: AnalyticsFilters|None,
+        explain: bool = False,
+        explain_analyze: bool = False) -> EngagementMetrics|None:
 
     print(f"Analysis started -> {analysis_code} -> filters -> {str(filters)}")
 
-    try:
-        basic_stats = await calculate_basic_stats(filters)
-        print("Calculated basic stats")
-
-        generic_metrics = await calculate_generic_engagement_metrics(filters)
-        print("Calculated generic metrics")
+    # Diagnostics mode: EXPLAIN every query of this run and keep the plans
+    capture = None
+    if explain:
+        analyze = explain_analyze and settings.ANALYTICS_EXPLAIN_ANALYZE_ALLOWED
+        capture = start_plan_capture(analysis_code, analyze=analyze)
 
+    try:
         features = [
             EventCategory.LoginSession,
             EventCategory.Medication,
@@ -112,26 +120,29 @@ async def calculate(
             EventCategory.Careplan,
             EventCategory.UserTask,
         ]
-        metrics_by_feature = []
-        for feature in features:
-            engament = await calculate_feature_engagement_metrics(feature, filters)
-            print(f"Calculated metrics for {feature}")
-            metrics_by_feature.append(engament)
-
-        medication_management_matrix = await calculate_medication_management_matrix(filters)
-        print("Calculated medication management matrix")
 
-        health_journey_matrix = await calculate_health_journey_task_matrix(filters)
-        print("Calculated health journey task matrix")
-
-        patient_task_matrix = await calculate_patient_task_matrix(filters)
-        print("Calculated patient task matrix")
-
-        vital_matrix = await calculate_vital_matrix(filters)
-        print("Calculated vital metrics")
+        # The metric groups are independent, so their queries are interleaved;
+        # the connector's pool bounds how many run at once.
+        results = await asyncio.gather(
+            calculate_basic_stats(filters),
+            calculate_generic_engagement_metrics(filters),
+            calculate_medication_management_matrix(filters),
+            calculate_health_journey_task_matrix(filters),
+            calculate_patient_task_matrix(filters),
+            calculate_vital_matrix(filters),
+            calculate_assessment_matrix(filters),
+            *[calculate_feature_engagement_metrics(feature, filters) for feature in features],
+        )
 
-        assessment_matrix = await calculate_assessment_matrix(filters)
-        print("Calculated assessment metrics")
+        basic_stats                  = results[0]
+        generic_metrics              = results[1]
+        medication_management_matrix = results[2]
+        health_journey_matrix        = results[3]
+        patient_task_matrix          = results[4]
+        vital_matrix                 = results[5]
+        assessment_matrix            = results[6]
+        metrics_by_feature           = list(results[7:])
+        print("Calculated all metrics")
 
         metrics = EngagementMetrics(
             TenantId        = filters.TenantId,
@@ -154,10 +165,17 @@ async def calculate(
         await generate_reports(analysis_code, metrics)
         print(f"Generated reports -> {analysis_code}")
 
+        if capture is not None:
+            await save_query_plans(capture)
+            print(f"Saved query plans -> {analysis_code}")
+
         return metrics
 
     except Exception as e:
         print_exception(e)
+    finally:
+        if capture is not None:
+            stop_plan_capture()
 
 ###############################################################################
 
@@ -580,11 +598,11 @@ async def get_tenant_by_id(tenantId: UUID4 | None):
         print_exception(e)
  
 async def get_all_tenants():
-    analytics_db_connector = get_analytics_db_connector()
+    analytics_db_connector = get_async_analytics_db_connector()
     query = f"""
     SELECT * from tenants
     """
-    rows = analytics_db_connector.execute_read_query(query)
+    rows = await analytics_db_connector.execute_read_query(query)
     return rows
 ###############################################################################
 
@@ -624,6 +642,60 @@ async def save_analytics(analysis_code: str, metrics: EngagementMetrics)-> dict:
     finally:
         session.close()
 
+async def save_query_plans(capture: QueryPlanCapture) -> int:
+
+    session = get_db_session()
+    try:
+        for plan in capture.plans:
+            if len(plan["Flags"]) > 0:
+                print(f"Query plan issues -> {capture.analysis_code} -> {plan['QueryId']} -> {', '.join(plan['Flags'])}")
+            db_model = AnalysisQueryPlan(
+                AnalysisCode = capture.analysis_code,
+                QueryId      = plan["QueryId"],
+                DatabaseName = plan["DatabaseName"],
+                Dialect      = plan["Dialect"],
+                Analyzed     = plan["Analyzed"],
+                DurationMs   = plan["DurationMs"],
+                Query        = plan["Query"],
+                Params       = json.dumps(plan["Params"], default=str) if plan["Params"] is not None else None,
+                Plan         = json.dumps(plan["Plan"], default=str),
+                Flags        = json.dumps(plan["Flags"]),
+            )
+            session.add(db_model)
+        session.commit()
+        return len(capture.plans)
+
+    except Exception as e:
+        session.rollback()
+        session.close()
+        raise e
+    finally:
+        session.close()
+
+async def get_query_plans_by_analysis_code(analysis_code: str) -> list:
+    try:
+        session = get_db_session()
+        plans = session.query(AnalysisQueryPlan).filter(
+            AnalysisQueryPlan.AnalysisCode == analysis_code).all()
+        session.close()
+        return [
+            {
+                "QueryId"     : plan.QueryId,
+                "DatabaseName": plan.DatabaseName,
+                "Dialect"     : plan.Dialect,
+                "Analyzed"    : plan.Analyzed,
+                "DurationMs"  : plan.DurationMs,
+                "Flags"       : json.loads(plan.Flags) if plan.Flags else [],
+                "Query"       : plan.Query,
+                "Params"      : json.loads(plan.Params) if plan.Params else None,
+                "Plan"        : json.loads(plan.Plan) if plan.Plan else None,
+            }
+            for plan in plans
+        ]
+    except Exception as e:
+        print_exception(e)
+        return []
+
 ###############################################################################
 
 async def get_analysis_by_code(analysis_code: str)-> dict:
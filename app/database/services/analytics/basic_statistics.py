@@ -1,10 +1,10 @@
 from app.common.utils import print_exception
-from app.database.services.analytics.common import add_common_checks
+from app.database.services.analytics.common import add_common_checks, query_params
 from app.database.services.analytics.sql_dialect import (
     current_date, datediff_days, day_str, field_order, last_day, month_str,
 )
 from app.domain_types.schemas.analytics import AnalyticsFilters
-from app.modules.data_sync.connectors import get_analytics_db_connector
+from app.modules.data_sync.connectors import get_async_analytics_db_connector
 from app.modules.data_sync.data_synchronizer import DataSynchronizer
 from app.telemetry.tracing import trace_span
 
@@ -18,14 +18,14 @@ async def get_all_registered_users(filters: AnalyticsFilters) -> int:
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
 
         query = f"""
             SELECT
                 COUNT(*) as user_count
             FROM users u
             WHERE
-                RegistrationDate BETWEEN '{start_date}' AND '{end_date}'
+                RegistrationDate BETWEEN %(start_date)s AND %(end_date)s
                 __CHECKS__
             """
         checks_str = add_common_checks(tenant_id, role_id=None)
@@ -33,7 +33,8 @@ async def get_all_registered_users(filters: AnalyticsFilters) -> int:
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
         total_users = result[0]['user_count']
         return total_users
 
@@ -50,14 +51,14 @@ async def get_all_registered_patients(filters: AnalyticsFilters) -> int:
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
 
         query = f"""
             SELECT
                 COUNT(*) as user_count
             FROM users u
             WHERE
-                RegistrationDate BETWEEN '{start_date}' AND '{end_date}'
+                RegistrationDate BETWEEN %(start_date)s AND %(end_date)s
                 __CHECKS__
             """
         checks_str = add_common_checks(tenant_id, role_id)
@@ -65,7 +66,8 @@ async def get_all_registered_patients(filters: AnalyticsFilters) -> int:
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
         total_patients = result[0]['user_count']
         return total_patients
 
@@ -83,13 +85,13 @@ async def get_current_active_patients(filters: AnalyticsFilters) -> int:
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
         query = f"""
             SELECT
                 COUNT(*) as user_count
             FROM users u
             WHERE
-                RegistrationDate BETWEEN '{start_date}' AND '{end_date}'
+                RegistrationDate BETWEEN %(start_date)s AND %(end_date)s
                 AND
                 DeletedAt IS NULL
                 __CHECKS__
@@ -100,7 +102,8 @@ async def get_current_active_patients(filters: AnalyticsFilters) -> int:
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
         active_patients = result[0]['user_count']
 
         return active_patients
@@ -118,7 +121,7 @@ async def get_patient_registration_hisory_by_months(filters: AnalyticsFilters) -
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
 
         is_postgres = connector.is_postgres
         month_expr = month_str('RegistrationDate', is_postgres)
@@ -128,7 +131,7 @@ async def get_patient_registration_hisory_by_months(filters: AnalyticsFilters) -
                 COUNT(*) as user_count
             FROM users u
             WHERE
-                RegistrationDate BETWEEN '{start_date}' AND '{end_date}'
+                RegistrationDate BETWEEN %(start_date)s AND %(end_date)s
                 __CHECKS__
             GROUP BY month
             ORDER BY month
@@ -139,7 +142,8 @@ async def get_patient_registration_hisory_by_months(filters: AnalyticsFilters) -
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
 
         return result
 
@@ -156,7 +160,7 @@ async def get_patient_deregistration_history_by_months(filters: AnalyticsFilters
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
 
         is_postgres = connector.is_postgres
         month_expr = month_str('DeletedAt', is_postgres)
@@ -166,7 +170,7 @@ async def get_patient_deregistration_history_by_months(filters: AnalyticsFilters
                 COUNT(*) as user_count
             FROM users u
             WHERE
-                DeletedAt BETWEEN '{start_date}' AND '{end_date}'
+                DeletedAt BETWEEN %(start_date)s AND %(end_date)s
                 __CHECKS__
             GROUP BY month
             ORDER BY month
@@ -177,7 +181,8 @@ async def get_patient_deregistration_history_by_months(filters: AnalyticsFilters
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
 
         return result
 
@@ -194,7 +199,7 @@ async def get_patient_age_demographics(filters: AnalyticsFilters) -> list:
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
         is_postgres = connector.is_postgres
         age_years = f"FLOOR({datediff_days(current_date(is_postgres), 'BirthDate', is_postgres)} / 365)"
         age_buckets = ['0-18', '19-30', '31-45', '46-60', '61-75', '76-90', '91-105', '106-120', 'Unknown']
@@ -217,7 +222,7 @@ async def get_patient_age_demographics(filters: AnalyticsFilters) -> list:
                 FROM user_metadata
                 INNER JOIN users u ON user_metadata.UserId = u.id
                 WHERE
-                    u.RegistrationDate BETWEEN '{start_date}' AND '{end_date}'
+                    u.RegistrationDate BETWEEN %(start_date)s AND %(end_date)s
                     __CHECKS__
             ) AS age_data
             GROUP BY age_group
@@ -229,7 +234,8 @@ async def get_patient_age_demographics(filters: AnalyticsFilters) -> list:
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
 
         return result
 
@@ -246,7 +252,7 @@ async def get_patient_gender_demographics(filters: AnalyticsFilters) -> list:
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
 
         query = f"""
             SELECT CASE
@@ -257,7 +263,7 @@ async def get_patient_gender_demographics(filters: AnalyticsFilters) -> list:
             FROM user_metadata
             INNER JOIN users u ON user_metadata.UserId = u.id
             WHERE
-                u.RegistrationDate BETWEEN '{start_date}' AND '{end_date}'
+                u.RegistrationDate BETWEEN %(start_date)s AND %(end_date)s
                 __CHECKS__
             GROUP BY gender;
             """
@@ -267,7 +273,8 @@ async def get_patient_gender_demographics(filters: AnalyticsFilters) -> list:
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
 
         return result
 
@@ -284,7 +291,7 @@ async def get_patient_ethnicity_demographics(filters: AnalyticsFilters) -> list:
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
         query = f"""
             SELECT CASE
                 WHEN Ethnicity IS NULL THEN 'Unknown'
@@ -294,7 +301,7 @@ async def get_patient_ethnicity_demographics(filters: AnalyticsFilters) -> list:
             FROM user_metadata
             INNER JOIN users u ON user_metadata.UserId = u.id
             WHERE
-                u.RegistrationDate BETWEEN '{start_date}' AND '{end_date}'
+                u.RegistrationDate BETWEEN %(start_date)s AND %(end_date)s
                 __CHECKS__
             GROUP BY ethnicity;
             """
@@ -304,7 +311,8 @@ async def get_patient_ethnicity_demographics(filters: AnalyticsFilters) -> list:
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
         return result
 
     except Exception as e:
@@ -320,7 +328,7 @@ async def get_patient_race_demographics(filters: AnalyticsFilters) -> list:
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
         query = f"""
             SELECT CASE
                     WHEN Race IS NULL THEN 'Unknown'
@@ -330,7 +338,7 @@ async def get_patient_race_demographics(filters: AnalyticsFilters) -> list:
             FROM user_metadata
             INNER JOIN users u ON user_metadata.UserId = u.id
             WHERE
-                u.RegistrationDate BETWEEN '{start_date}' AND '{end_date}'
+                u.RegistrationDate BETWEEN %(start_date)s AND %(end_date)s
                 __CHECKS__
             GROUP BY race;
             """
@@ -340,7 +348,8 @@ async def get_patient_race_demographics(filters: AnalyticsFilters) -> list:
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
 
         return result
 
@@ -357,7 +366,7 @@ async def get_patient_healthsystem_distribution(filters: AnalyticsFilters) -> li
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
         query = f"""
             SELECT CASE
                     WHEN HealthSystem IS NULL THEN 'Unknown'
@@ -367,7 +376,7 @@ async def get_patient_healthsystem_distribution(filters: AnalyticsFilters) -> li
             FROM user_metadata
             INNER JOIN users u ON user_metadata.UserId = u.id
             WHERE
-                u.RegistrationDate BETWEEN '{start_date}' AND '{end_date}'
+                u.RegistrationDate BETWEEN %(start_date)s AND %(end_date)s
                 __CHECKS__
             GROUP BY health_system;
             """
@@ -377,7 +386,8 @@ async def get_patient_healthsystem_distribution(filters: AnalyticsFilters) -> li
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
 
         return result
 
@@ -394,7 +404,7 @@ async def get_patient_hospital_distribution(filters: AnalyticsFilters) -> list:
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
         query = f"""
                 SELECT CASE
                         WHEN Hospital IS NULL THEN 'Unknown'
@@ -404,7 +414,7 @@ async def get_patient_hospital_distribution(filters: AnalyticsFilters) -> list:
                 FROM user_metadata
                 INNER JOIN users u ON user_metadata.UserId = u.id
                 WHERE
-                    u.RegistrationDate BETWEEN '{start_date}' AND '{end_date}'
+                    u.RegistrationDate BETWEEN %(start_date)s AND %(end_date)s
                     __CHECKS__
                 GROUP BY hospital;
             """
@@ -414,7 +424,8 @@ async def get_patient_hospital_distribution(filters: AnalyticsFilters) -> list:
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
 
         return result
 
@@ -431,7 +442,7 @@ async def get_patient_survivor_or_caregiver_distribution(filters: AnalyticsFilte
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
         query = f"""
                 SELECT CASE
                         WHEN IsCareGiver IS NULL THEN 'Unknown'
@@ -443,7 +454,7 @@ async def get_patient_survivor_or_caregiver_distribution(filters: AnalyticsFilte
                 FROM user_metadata
                 INNER JOIN users u ON user_metadata.UserId = u.id
                 WHERE
-                    u.RegistrationDate BETWEEN '{start_date}' AND '{end_date}'
+                    u.RegistrationDate BETWEEN %(start_date)s AND %(end_date)s
                     __CHECKS__
                 GROUP BY caregiver_status;
             """
@@ -453,7 +464,8 @@ async def get_patient_survivor_or_caregiver_distribution(filters: AnalyticsFilte
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
 
         return result
 
@@ -469,7 +481,7 @@ async def get_users_distribution_by_role(filters: AnalyticsFilters) -> list:
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
         query = f"""
                 SELECT 
                     RoleId,
@@ -477,7 +489,7 @@ async def get_users_distribution_by_role(filters: AnalyticsFilters) -> list:
                 FROM 
                     users u
                 WHERE
-                    RegistrationDate BETWEEN '{start_date}' AND '{end_date}'
+                    RegistrationDate BETWEEN %(start_date)s AND %(end_date)s
                     __CHECKS__
                 GROUP BY 
                     RoleId
@@ -489,7 +501,8 @@ async def get_users_distribution_by_role(filters: AnalyticsFilters) -> list:
         if len(checks_str) > 0:
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
         return map_role_id_to_role_name(result)
 
     except Exception as e:
@@ -504,7 +517,7 @@ async def get_active_users_count_at_end_of_every_month(filters: AnalyticsFilters
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
         is_postgres = connector.is_postgres
         query = f"""
                 SELECT
@@ -516,17 +529,17 @@ async def get_active_users_count_at_end_of_every_month(filters: AnalyticsFilters
                     WHERE
                         u2.RegistrationDate <= months.month_end
                         AND
-                        u2.RegistrationDate BETWEEN '{start_date}' AND '{end_date}'
+                        u2.RegistrationDate BETWEEN %(start_date)s AND %(end_date)s
                         AND
                         u2.DeletedAt IS NULL
-                        {f'AND u2.RoleId = {role_id}' if role_id else '' }
-                        {f"AND u2.TenantId = '{tenant_id}'" if tenant_id else '' }
+                        {'AND u2.RoleId = %(role_id)s' if role_id else '' }
+                        {'AND u2.TenantId = %(tenant_id)s' if tenant_id else '' }
                         ) AS active_user_count
                 FROM (
                     SELECT DISTINCT {last_day('u.RegistrationDate', is_postgres)} AS month_end
                     FROM users u
                     WHERE
-                        u.RegistrationDate BETWEEN '{start_date}' AND '{end_date}'
+                        u.RegistrationDate BETWEEN %(start_date)s AND %(end_date)s
                         AND
                         u.DeletedAt IS NULL
                         __CHECKS__
@@ -539,7 +552,8 @@ async def get_active_users_count_at_end_of_every_month(filters: AnalyticsFilters
         if len(checks_str) > 0:
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
 
         return result
 
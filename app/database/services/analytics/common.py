@@ -8,22 +8,25 @@ from app.modules.data_sync.data_synchronizer import DataSynchronizer
 
 REPORTS_DIR = "analytics_reports"
 
+# Result cache TTL (seconds) for queries relative to the current date/time
+NOW_RELATIVE_CACHE_TTL = 300
+
 ###############################################################################
 
 def tenant_check(tenant_id: UUID4|None) -> str:
     if tenant_id is None:
         return ""
-    return f"u.TenantId = '{tenant_id}'"
+    return "u.TenantId = %(tenant_id)s"
 
 def role_check(role_id: int|None) -> str:
     if role_id is None:
         return ""
-    return f"u.RoleId = {role_id}"
+    return "u.RoleId = %(role_id)s"
 
 def event_source_check(event_source: str|None) -> str:
     if event_source is None:
         return ""
-    return f"e.SourceName = '{event_source}'"
+    return "e.SourceName = %(event_source)s"
 
 def add_common_checks(
         tenant_id: UUID4|None,
@@ -49,6 +52,21 @@ def add_common_checks(
     return checks_str
 
 
+def query_params(filters, **kwargs) -> dict:
+    """
+    Bind values for the analytics queries. The checks above only emit the
+    placeholders, so the query text stays the same across tenants and dates.
+    """
+    params = {
+        "tenant_id"   : str(filters.TenantId) if filters.TenantId is not None else None,
+        "role_id"     : filters.RoleId,
+        "start_date"  : filters.StartDate,
+        "end_date"    : filters.EndDate,
+        "event_source": filters.Source,
+    }
+    params.update(kwargs)
+    return params
+
 def get_role_id(role_name: str = "Patient") -> int|None:
     role_id = None
     role = DataSynchronizer.get_role_by_name(role_name)
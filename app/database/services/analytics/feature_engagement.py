@@ -1,10 +1,10 @@
 from app.common.utils import print_exception
-from app.database.services.analytics.common import add_common_checks
+from app.database.services.analytics.common import add_common_checks, query_params
 from app.database.services.analytics.sql_dialect import (
     add_days, cast_int, cast_text, diff_minutes, month_str, ratio_pct,
 )
 from app.domain_types.schemas.analytics import AnalyticsFilters
-from app.modules.data_sync.connectors import get_analytics_db_connector, get_reancare_db_connector
+from app.modules.data_sync.connectors import get_async_analytics_db_connector, get_async_reancare_db_connector
 from app.telemetry.tracing import trace_span
 
 ###############################################################################
@@ -20,7 +20,7 @@ async def get_feature_access_frequency(feature: str, filters: AnalyticsFilters):
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
 
         is_postgres = connector.is_postgres
         month_expr = month_str('e.Timestamp', is_postgres)
@@ -31,8 +31,8 @@ async def get_feature_access_frequency(feature: str, filters: AnalyticsFilters):
             FROM events e
             JOIN users u ON e.UserId = u.id
             WHERE
-                e.EventCategory = '{feature}'
-                AND e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                e.EventCategory = %(feature)s
+                AND e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                 __CHECKS__
             GROUP BY {month_expr}
             ORDER BY month ASC;
@@ -43,7 +43,8 @@ async def get_feature_access_frequency(feature: str, filters: AnalyticsFilters):
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters, feature=feature)
+        result = await connector.execute_prepared_read_query(query, params)
 
         return result
 
@@ -62,7 +63,7 @@ async def get_feature_engagement_rate(feature: str, filters: AnalyticsFilters):
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
 
         is_postgres = connector.is_postgres
         month_expr = month_str('e.Timestamp', is_postgres)
@@ -76,7 +77,7 @@ async def get_feature_engagement_rate(feature: str, filters: AnalyticsFilters):
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                         __CHECKS__
                     GROUP BY {month_expr}
                 ),
@@ -90,8 +91,8 @@ async def get_feature_engagement_rate(feature: str, filters: AnalyticsFilters):
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.EventCategory = '{feature}'
-                        AND e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                        e.EventCategory = %(feature)s
+                        AND e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                         __CHECKS__
                     GROUP BY {month_expr}, e.EventCategory
                 )
@@ -111,7 +112,8 @@ async def get_feature_engagement_rate(feature: str, filters: AnalyticsFilters):
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters, feature=feature)
+        result = await connector.execute_prepared_read_query(query, params)
 
         return result
 
@@ -130,7 +132,7 @@ async def get_feature_retention_rate_on_specific_days(feature: str, filters: Ana
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
         is_postgres = connector.is_postgres
         reg = "DATE(u.RegistrationDate)"
         d = {n: add_days(reg, n, is_postgres) for n in (1, 3, 7, 10, 15, 20, 25, 30)}
@@ -148,8 +150,8 @@ async def get_feature_retention_rate_on_specific_days(feature: str, filters: Ana
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
-                        AND e.EventCategory = '{feature}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
+                        AND e.EventCategory = %(feature)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) = {d[1]}
                 ),
@@ -159,8 +161,8 @@ async def get_feature_retention_rate_on_specific_days(feature: str, filters: Ana
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
-                        AND e.EventCategory = '{feature}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
+                        AND e.EventCategory = %(feature)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) = {d[3]}
                 ),
@@ -170,8 +172,8 @@ async def get_feature_retention_rate_on_specific_days(feature: str, filters: Ana
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
-                        AND e.EventCategory = '{feature}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
+                        AND e.EventCategory = %(feature)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) = {d[7]}
                 ),
@@ -181,8 +183,8 @@ async def get_feature_retention_rate_on_specific_days(feature: str, filters: Ana
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
-                        AND e.EventCategory = '{feature}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
+                        AND e.EventCategory = %(feature)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) = {d[10]}
                 ),
@@ -192,8 +194,8 @@ async def get_feature_retention_rate_on_specific_days(feature: str, filters: Ana
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
-                        AND e.EventCategory = '{feature}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
+                        AND e.EventCategory = %(feature)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) = {d[15]}
                 ),
@@ -203,8 +205,8 @@ async def get_feature_retention_rate_on_specific_days(feature: str, filters: Ana
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
-                        AND e.EventCategory = '{feature}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
+                        AND e.EventCategory = %(feature)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) = {d[20]}
                 ),
@@ -214,8 +216,8 @@ async def get_feature_retention_rate_on_specific_days(feature: str, filters: Ana
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
-                        AND e.EventCategory = '{feature}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
+                        AND e.EventCategory = %(feature)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) = {d[25]}
                 ),
@@ -225,8 +227,8 @@ async def get_feature_retention_rate_on_specific_days(feature: str, filters: Ana
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
-                        AND e.EventCategory = '{feature}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
+                        AND e.EventCategory = %(feature)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) = {d[30]}
                 )
@@ -264,7 +266,8 @@ async def get_feature_retention_rate_on_specific_days(feature: str, filters: Ana
             checks_str = "WHERE " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters, feature=feature)
+        result = await connector.execute_prepared_read_query(query, params)
 
         row = result[0]
         result_ = {
@@ -331,7 +334,7 @@ async def get_feature_retention_rate_in_specific_intervals(feature: str, filters
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
 
         is_postgres = connector.is_postgres
         reg = "DATE(u.RegistrationDate)"
@@ -350,8 +353,8 @@ async def get_feature_retention_rate_in_specific_intervals(feature: str, filters
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
-                        AND e.EventCategory = '{feature}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
+                        AND e.EventCategory = %(feature)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) < {d[1]}
                         AND DATE(e.Timestamp) >= {reg}
@@ -362,8 +365,8 @@ async def get_feature_retention_rate_in_specific_intervals(feature: str, filters
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
-                        AND e.EventCategory = '{feature}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
+                        AND e.EventCategory = %(feature)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) < {d[3]}
                         AND DATE(e.Timestamp) >= {d[1]}
@@ -374,8 +377,8 @@ async def get_feature_retention_rate_in_specific_intervals(feature: str, filters
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
-                        AND e.EventCategory = '{feature}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
+                        AND e.EventCategory = %(feature)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) < {d[7]}
                         AND DATE(e.Timestamp) >= {d[3]}
@@ -386,8 +389,8 @@ async def get_feature_retention_rate_in_specific_intervals(feature: str, filters
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
-                        AND e.EventCategory = '{feature}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
+                        AND e.EventCategory = %(feature)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) < {d[10]}
                         AND DATE(e.Timestamp) >= {d[7]}
@@ -398,8 +401,8 @@ async def get_feature_retention_rate_in_specific_intervals(feature: str, filters
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
-                        AND e.EventCategory = '{feature}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
+                        AND e.EventCategory = %(feature)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) < {d[15]}
                         AND DATE(e.Timestamp) >= {d[10]}
@@ -410,8 +413,8 @@ async def get_feature_retention_rate_in_specific_intervals(feature: str, filters
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
-                        AND e.EventCategory = '{feature}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
+                        AND e.EventCategory = %(feature)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) < {d[20]}
                         AND DATE(e.Timestamp) >= {d[15]}
@@ -422,8 +425,8 @@ async def get_feature_retention_rate_in_specific_intervals(feature: str, filters
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
-                        AND e.EventCategory = '{feature}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
+                        AND e.EventCategory = %(feature)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) < {d[25]}
                         AND DATE(e.Timestamp) >= {d[20]}
@@ -434,8 +437,8 @@ async def get_feature_retention_rate_in_specific_intervals(feature: str, filters
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
-                        AND e.EventCategory = '{feature}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
+                        AND e.EventCategory = %(feature)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) < {d[30]}
                         AND DATE(e.Timestamp) >= {d[25]}
@@ -474,7 +477,8 @@ async def get_feature_retention_rate_in_specific_intervals(feature: str, filters
             checks_str = "WHERE " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters, feature=feature)
+        result = await connector.execute_prepared_read_query(query, params)
 
         row = result[0]
         result_ = {
@@ -542,7 +546,7 @@ async def get_feature_average_usage_duration_minutes(feature: str, filters: Anal
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
 
         # Please note that we do not use user's login session Id to track this.
         # We simply track the first and last event times for each feature session per u.
@@ -560,8 +564,8 @@ async def get_feature_average_usage_duration_minutes(feature: str, filters: Anal
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.EventCategory = '{feature}'
-                        AND e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                        e.EventCategory = %(feature)s
+                        AND e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                         __CHECKS__
                     GROUP BY e.UserId, e.EventCategory  -- Group by user, and feature
                 ),
@@ -591,7 +595,8 @@ async def get_feature_average_usage_duration_minutes(feature: str, filters: Anal
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters, feature=feature)
+        result = await connector.execute_prepared_read_query(query, params)
         if len(result) == 0:
             return 0
         row = result[0]
@@ -612,7 +617,7 @@ async def get_feature_drop_off_points(feature: str, filters: AnalyticsFilters):
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
 
         # We are identifying a feature by event category. For example, 'Medication' feature
 
@@ -629,8 +634,8 @@ async def get_feature_drop_off_points(feature: str, filters: AnalyticsFilters):
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.EventCategory = '{feature}'           -- Filter for a specific feature/event category
-                        AND e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                        e.EventCategory = %(feature)s           -- Filter for a specific feature/event category
+                        AND e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                         __CHECKS__
                     ORDER BY e.UserId, e.Timestamp -- Order by user, and time
                 ),
@@ -669,7 +674,8 @@ async def get_feature_drop_off_points(feature: str, filters: AnalyticsFilters):
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters, feature=feature)
+        result = await connector.execute_prepared_read_query(query, params)
 
         return result
 
@@ -685,7 +691,7 @@ async def get_medication_management_matrix(filters: AnalyticsFilters):
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_reancare_db_connector()
+        connector = get_async_reancare_db_connector()
 
         query = f"""
                 SELECT 
@@ -735,7 +741,7 @@ async def get_medication_management_matrix(filters: AnalyticsFilters):
                 WHERE
                     u.IsTestUser = FALSE
                     AND
-                    medication_consumption.CreatedAt BETWEEN '{start_date}' AND '{end_date}'
+                    medication_consumption.CreatedAt BETWEEN %(start_date)s AND %(end_date)s
                     __CHECKS__
                 """
 
@@ -744,7 +750,8 @@ async def get_medication_management_matrix(filters: AnalyticsFilters):
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
 
         return result
 
@@ -760,7 +767,7 @@ async def get_health_journey_completed_task_count(filters: AnalyticsFilters):
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_reancare_db_connector()
+        connector = get_async_reancare_db_connector()
 
         query = f"""
             SELECT count(*) as health_journey_completed_task_count
@@ -776,14 +783,15 @@ async def get_health_journey_completed_task_count(filters: AnalyticsFilters):
                 AND
                 u.IsTestUser = FALSE
                 AND
-                u.RoleId = '{role_id}'
+                u.RoleId = %(role_id)s
                 AND
-                userTask.CreatedAt BETWEEN '{start_date}' AND '{end_date}'
+                userTask.CreatedAt BETWEEN %(start_date)s AND %(end_date)s
                 AND
-                userTask.ScheduledEndTime BETWEEN '{start_date}' and now();
+                userTask.ScheduledEndTime BETWEEN %(start_date)s and now();
             """
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
         return result
     
     except Exception as e:  
@@ -798,7 +806,7 @@ async def get_patient_completed_task_count(filters: AnalyticsFilters):
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_reancare_db_connector()
+        connector = get_async_reancare_db_connector()
 
         query = f"""
         SELECT count(*) as patient_completed_task_count
@@ -811,16 +819,17 @@ async def get_patient_completed_task_count(filters: AnalyticsFilters):
             AND
             u.IsTestUser = FALSE
             AND
-            u.RoleId = '{role_id}'
+            u.RoleId = %(role_id)s
             AND
             userTask.DeletedAt IS NULL
             AND
-            userTask.CreatedAt BETWEEN '{start_date}' AND '{end_date}'
+            userTask.CreatedAt BETWEEN %(start_date)s AND %(end_date)s
             AND
-            userTask.ScheduledEndTime BETWEEN '{start_date}' and now();
+            userTask.ScheduledEndTime BETWEEN %(start_date)s and now();
         """
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
         return result
     
     except Exception as e:  
@@ -835,7 +844,7 @@ async def get_category_wise_patient_completed_task_count(filters: AnalyticsFilte
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_reancare_db_connector()
+        connector = get_async_reancare_db_connector()
 
         query = f"""
         SELECT userTask.Category AS task_category, count(*) as patient_completed_task_count
@@ -848,18 +857,19 @@ async def get_category_wise_patient_completed_task_count(filters: AnalyticsFilte
             AND
             u.IsTestUser = FALSE
             AND
-            u.RoleId = '{role_id}'
+            u.RoleId = %(role_id)s
             AND
             userTask.DeletedAt IS NULL
             AND
-            userTask.CreatedAt BETWEEN '{start_date}' AND '{end_date}'
+            userTask.CreatedAt BETWEEN %(start_date)s AND %(end_date)s
             AND
-            userTask.ScheduledEndTime BETWEEN '{start_date}' and now()
+            userTask.ScheduledEndTime BETWEEN %(start_date)s and now()
         GROUP BY
             userTask.Category;
         """
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
         return result
     
     except Exception as e:  
@@ -874,7 +884,7 @@ async def get_health_journey_specific_completed_task_count(filters: AnalyticsFil
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_reancare_db_connector()
+        connector = get_async_reancare_db_connector()
 
         query = f"""
         SELECT 
@@ -892,16 +902,17 @@ async def get_health_journey_specific_completed_task_count(filters: AnalyticsFil
             AND
             u.IsTestUser = FALSE
             AND
-            u.RoleId = '{role_id}'
+            u.RoleId = %(role_id)s
             AND
-            userTask.CreatedAt BETWEEN '{start_date}' AND '{end_date}'
+            userTask.CreatedAt BETWEEN %(start_date)s AND %(end_date)s
             AND
-            userTask.ScheduledEndTime BETWEEN '{start_date}' and now()
+            userTask.ScheduledEndTime BETWEEN %(start_date)s and now()
         GROUP BY
             careplanActivity.PlanCode;
         """
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
         return result
     
     except Exception as e:  
@@ -916,7 +927,7 @@ async def get_health_journey_specific_completed_task_count(filters: AnalyticsFil
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_reancare_db_connector()
+        connector = get_async_reancare_db_connector()
 
         query = f"""
         SELECT 
@@ -934,16 +945,17 @@ async def get_health_journey_specific_completed_task_count(filters: AnalyticsFil
             AND
             u.IsTestUser = FALSE
             AND
-            u.RoleId = '{role_id}'
+            u.RoleId = %(role_id)s
             AND
-            userTask.CreatedAt BETWEEN '{start_date}' AND '{end_date}'
+            userTask.CreatedAt BETWEEN %(start_date)s AND %(end_date)s
             AND
-            userTask.ScheduledEndTime BETWEEN '{start_date}' and now()
+            userTask.ScheduledEndTime BETWEEN %(start_date)s and now()
         GROUP BY
             careplanActivity.PlanCode;
         """
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
         return result
     
     except Exception as e:  
@@ -958,7 +970,7 @@ async def get_user_wise_health_journey_completed_task_count(filters: AnalyticsFi
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_reancare_db_connector()
+        connector = get_async_reancare_db_connector()
 
         query = f"""
         SELECT careplanActivity.PatientUserId, userTask.Category, careplanActivity.PlanCode AS careplan_code, count(*) as careplan_completed_task_count
@@ -974,18 +986,19 @@ async def get_user_wise_health_journey_completed_task_count(filters: AnalyticsFi
             AND
             u.IsTestUser = FALSE
             AND
-            u.RoleId = '{role_id}'
+            u.RoleId = %(role_id)s
             AND
-            userTask.CreatedAt BETWEEN '{start_date}' AND '{end_date}'
+            userTask.CreatedAt BETWEEN %(start_date)s AND %(end_date)s
             AND
-            userTask.ScheduledEndTime BETWEEN '{start_date}' and now()
+            userTask.ScheduledEndTime BETWEEN %(start_date)s and now()
         GROUP BY
             careplanActivity.PatientUserId,
             userTask.Category,
             careplanActivity.PlanCode;
         """
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
         return result
     
     except Exception as e:  
@@ -1000,7 +1013,7 @@ async def get_category_wise_health_journey_task_count(filters: AnalyticsFilters)
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_reancare_db_connector()
+        connector = get_async_reancare_db_connector()
 
         query = f"""
         SELECT careplanActivity.PatientUserId ,careplanActivity.Category, careplanActivity.PlanCode, count(*) as careplan_task_count
@@ -1012,18 +1025,19 @@ async def get_category_wise_health_journey_task_count(filters: AnalyticsFilters)
             AND
             u.IsTestUser = FALSE
             AND
-            u.RoleId = '{role_id}'
+            u.RoleId = %(role_id)s
             AND
-            userTask.CreatedAt BETWEEN '{start_date}' AND '{end_date}'
+            userTask.CreatedAt BETWEEN %(start_date)s AND %(end_date)s
             AND
-            userTask.ScheduledEndTime BETWEEN '{start_date}' and now()
+            userTask.ScheduledEndTime BETWEEN %(start_date)s and now()
         GROUP BY
             careplanActivity.PatientUserId,
             careplanActivity.Category,
             careplanActivity.PlanCode
         """
         
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
         return result
     
     except Exception as e:  
@@ -1038,7 +1052,7 @@ async def get_health_journey_custom_assessment_completed_task_count(filters: Ana
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_reancare_db_connector()
+        connector = get_async_reancare_db_connector()
 
         query = f"""
         SELECT count(*) as custom_assessment_careplan_completed_task_count
@@ -1056,14 +1070,15 @@ async def get_health_journey_custom_assessment_completed_task_count(filters: Ana
             AND
             u.IsTestUser = FALSE
             AND
-            u.RoleId = '{role_id}'
+            u.RoleId = %(role_id)s
             AND
-            userTask.CreatedAt BETWEEN '{start_date}' AND '{end_date}'
+            userTask.CreatedAt BETWEEN %(start_date)s AND %(end_date)s
             AND
-            userTask.ScheduledEndTime BETWEEN '{start_date}' and now();
+            userTask.ScheduledEndTime BETWEEN %(start_date)s and now();
         """
         
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
         return result
 
     except Exception as e:  
@@ -1077,7 +1092,7 @@ async def get_health_journey_task_count(filters: AnalyticsFilters):
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_reancare_db_connector()
+        connector = get_async_reancare_db_connector()
 
         query = f"""
         SELECT count(*) as careplan_task_count
@@ -1089,14 +1104,15 @@ async def get_health_journey_task_count(filters: AnalyticsFilters):
             AND
             u.IsTestUser = FALSE
             AND
-            u.RoleId = '{role_id}'
+            u.RoleId = %(role_id)s
             AND
-            userTask.CreatedAt BETWEEN '{start_date}' AND '{end_date}'
+            userTask.CreatedAt BETWEEN %(start_date)s AND %(end_date)s
             AND
-            userTask.ScheduledEndTime BETWEEN '{start_date}' and now();
+            userTask.ScheduledEndTime BETWEEN %(start_date)s and now();
         """
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
         return result
 
     except Exception as e:
@@ -1110,7 +1126,7 @@ async def get_patient_task_count(filters: AnalyticsFilters):
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_reancare_db_connector()
+        connector = get_async_reancare_db_connector()
 
         query = f"""
         SELECT count(*) as patient_task_count
@@ -1119,16 +1135,17 @@ async def get_patient_task_count(filters: AnalyticsFilters):
         WHERE 
             u.IsTestUser = FALSE
             AND
-            u.RoleId = '{role_id}'
+            u.RoleId = %(role_id)s
             AND
 			userTask.DeletedAt IS NULL
             AND
-            userTask.CreatedAt BETWEEN '{start_date}' AND '{end_date}'
+            userTask.CreatedAt BETWEEN %(start_date)s AND %(end_date)s
             AND
-            userTask.ScheduledEndTime BETWEEN '{start_date}' and now();
+            userTask.ScheduledEndTime BETWEEN %(start_date)s and now();
         """
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
         return result
 
     except Exception as e:
@@ -1142,7 +1159,7 @@ async def get_category_wise_patient_task_count(filters: AnalyticsFilters):
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_reancare_db_connector()
+        connector = get_async_reancare_db_connector()
 
         query = f"""
         SELECT userTask.Category AS task_category, count(*) as user_task_count
@@ -1151,18 +1168,19 @@ async def get_category_wise_patient_task_count(filters: AnalyticsFilters):
         WHERE 
             u.IsTestUser = FALSE
             AND
-            u.RoleId = '{role_id}'
+            u.RoleId = %(role_id)s
             AND
             userTask.DeletedAt IS NULL
             AND
-            userTask.CreatedAt BETWEEN '{start_date}' AND '{end_date}'
+            userTask.CreatedAt BETWEEN %(start_date)s AND %(end_date)s
             AND
-            userTask.ScheduledEndTime BETWEEN '{start_date}' and now()
+            userTask.ScheduledEndTime BETWEEN %(start_date)s and now()
         GROUP BY
             userTask.Category
         """
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
         return result
 
     except Exception as e:
@@ -1176,7 +1194,7 @@ async def get_health_journey_specific_task_count(filters: AnalyticsFilters):
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_reancare_db_connector()
+        connector = get_async_reancare_db_connector()
 
         query = f"""
         SELECT careplanActivity.PlanCode, count(*) as careplan_task_count
@@ -1188,16 +1206,17 @@ async def get_health_journey_specific_task_count(filters: AnalyticsFilters):
             AND
             u.IsTestUser = FALSE
             AND
-            u.RoleId = '{role_id}'
+            u.RoleId = %(role_id)s
             AND
-            userTask.CreatedAt BETWEEN '{start_date}' AND '{end_date}'
+            userTask.CreatedAt BETWEEN %(start_date)s AND %(end_date)s
             AND
-            userTask.ScheduledEndTime BETWEEN '{start_date}' and now()
+            userTask.ScheduledEndTime BETWEEN %(start_date)s and now()
         GROUP BY
             careplanActivity.PlanCode
         """
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
         return result
 
     except Exception as e:
@@ -1212,7 +1231,7 @@ async def get_health_journey_custom_assessment_task_count(filters: AnalyticsFilt
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_reancare_db_connector()
+        connector = get_async_reancare_db_connector()
 
         query = f"""
         SELECT count(*) as custom_assessment_careplan_task_count
@@ -1224,13 +1243,14 @@ async def get_health_journey_custom_assessment_task_count(filters: AnalyticsFilt
             AND
             u.IsTestUser = FALSE
             AND
-            u.RoleId = '{role_id}'
+            u.RoleId = %(role_id)s
             AND
-            userTask.CreatedAt BETWEEN '{start_date}' AND '{end_date}'
+            userTask.CreatedAt BETWEEN %(start_date)s AND %(end_date)s
             AND
-            userTask.ScheduledEndTime BETWEEN '{start_date}' and now();
+            userTask.ScheduledEndTime BETWEEN %(start_date)s and now();
         """
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
         return result
 
     except Exception as e:
@@ -1245,7 +1265,7 @@ async def get_vitals_manual_and_device_add_entry_count(filters: AnalyticsFilters
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
 
         query = f"""
         SELECT 
@@ -1255,13 +1275,13 @@ async def get_vitals_manual_and_device_add_entry_count(filters: AnalyticsFilters
         FROM events e
         JOIN users u ON e.UserId = u.id
         WHERE
-            e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+            e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
             __CHECKS__
             AND
             ResourceType = 'biometric'
             AND EventName = 'vitals-add'
             AND EventCategory = 'vitals'
-            AND EventSubject = 'vitals-{vital_name}';
+            AND EventSubject = %(event_subject)s;
         """
 
         checks_str = add_common_checks(tenant_id, role_id)
@@ -1269,7 +1289,8 @@ async def get_vitals_manual_and_device_add_entry_count(filters: AnalyticsFilters
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
         
-        result = connector.execute_read_query(query)
+        params = query_params(filters, event_subject=f"vitals-{vital_name}")
+        result = await connector.execute_prepared_read_query(query, params)
         if result is not None or len(result) > 0:
             features = {
                 'vital_name': vital_name,
@@ -1290,7 +1311,7 @@ async def get_vitals_manual_add_entry_count(filters: AnalyticsFilters, vital_nam
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
 
         query = f"""
         SELECT 
@@ -1298,13 +1319,13 @@ async def get_vitals_manual_add_entry_count(filters: AnalyticsFilters, vital_nam
         FROM events e
         JOIN users u ON e.UserId = u.id
         WHERE
-            e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+            e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
             __CHECKS__
             AND
             ResourceType = 'biometric'
             AND EventName = 'vitals-add'
             AND EventCategory = 'vitals'
-            AND EventSubject = 'vitals-{vital_name}';
+            AND EventSubject = %(event_subject)s;
         """
 
         checks_str = add_common_checks(tenant_id, role_id)
@@ -1312,7 +1333,8 @@ async def get_vitals_manual_add_entry_count(filters: AnalyticsFilters, vital_nam
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
         
-        result = connector.execute_read_query(query)
+        params = query_params(filters, event_subject=f"vitals-{vital_name}")
+        result = await connector.execute_prepared_read_query(query, params)
         if result is not None or len(result) > 0:
             features = {
                 'vital_name': vital_name,
@@ -1335,7 +1357,7 @@ async def get_custom_assessment_completion_count(filters: AnalyticsFilters):
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_reancare_db_connector()
+        connector = get_async_reancare_db_connector()
 
         query = f"""
         SELECT 
@@ -1357,9 +1379,9 @@ async def get_custom_assessment_completion_count(filters: AnalyticsFilters):
             AND
             userTask.DeletedAt IS NULL
             AND
-            userTask.CreatedAt BETWEEN '{start_date}' AND '{end_date}'
+            userTask.CreatedAt BETWEEN %(start_date)s AND %(end_date)s
             AND
-            userTask.ScheduledEndTime BETWEEN '{start_date}' and now()
+            userTask.ScheduledEndTime BETWEEN %(start_date)s and now()
         __CHECKS__
         GROUP BY 
             userTask.ActionType;
@@ -1370,7 +1392,8 @@ async def get_custom_assessment_completion_count(filters: AnalyticsFilters):
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
         return result
 
     except Exception as e:
@@ -1385,7 +1408,7 @@ async def get_care_plan_wise_assessment_completion_count(filters: AnalyticsFilte
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_reancare_db_connector()
+        connector = get_async_reancare_db_connector()
 
         query = f"""
        SELECT 
@@ -1409,9 +1432,9 @@ async def get_care_plan_wise_assessment_completion_count(filters: AnalyticsFilte
             AND
             userTask.DeletedAt IS NULL
             AND
-            userTask.CreatedAt BETWEEN '{start_date}' AND '{end_date}'
+            userTask.CreatedAt BETWEEN %(start_date)s AND %(end_date)s
             AND
-            userTask.ScheduledEndTime BETWEEN '{start_date}' and now()
+            userTask.ScheduledEndTime BETWEEN %(start_date)s and now()
         __CHECKS__
         GROUP BY 
             userTask.ActionType,
@@ -1423,7 +1446,8 @@ async def get_care_plan_wise_assessment_completion_count(filters: AnalyticsFilte
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
         return result
 
     except Exception as e:
@@ -1438,7 +1462,7 @@ async def get_assessment_query_response_details(filters: AnalyticsFilters):
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_reancare_db_connector()
+        connector = get_async_reancare_db_connector()
         is_postgres = connector.is_postgres
 
         query = f"""
@@ -1489,7 +1513,8 @@ async def get_assessment_query_response_details(filters: AnalyticsFilters):
                     response_count DESC;
                 """
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
         return result
 
     except Exception as e:
@@ -1504,7 +1529,7 @@ async def get_multiple_choice_response_option_text(filters: AnalyticsFilters):
         end_date   = filters.EndDate    
         role_id    = filters.RoleId
 
-        connector = get_reancare_db_connector()
+        connector = get_async_reancare_db_connector()
 
         query = f"""
                 SELECT
@@ -1531,7 +1556,8 @@ async def get_multiple_choice_response_option_text(filters: AnalyticsFilters):
                     aqo.Sequence;
                 """
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
         return result
 
     except Exception as e:
@@ -1545,7 +1571,7 @@ async def get_quarter_wise_task_completion_metrics(filters: AnalyticsFilters):
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_reancare_db_connector()
+        connector = get_async_reancare_db_connector()
         pct = ratio_pct("SUM(CASE WHEN Finished = TRUE THEN 1 ELSE 0 END)", "COUNT(*)")
 
         query = f"""
@@ -1558,14 +1584,15 @@ async def get_quarter_wise_task_completion_metrics(filters: AnalyticsFilters):
                     users u ON u.id = userTask.UserId
                 WHERE 
                     u.IsTestUser = FALSE
-                    AND u.RoleId = '{role_id}'
+                    AND u.RoleId = %(role_id)s
                     AND userTask.DeletedAt IS NULL
-                    AND userTask.CreatedAt BETWEEN '{start_date}' AND '{end_date}'
-                    AND userTask.ScheduledEndTime BETWEEN '{start_date}' AND NOW()
+                    AND userTask.CreatedAt BETWEEN %(start_date)s AND %(end_date)s
+                    AND userTask.ScheduledEndTime BETWEEN %(start_date)s AND NOW()
                 GROUP BY 
                     userTask.UserId;
                 """
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
         ranges = {'0-25%': 0, '25-50%': 0, '50-75%': 0, '75-100%': 0}
         for row in result:
             percentage = row['task_completion_percentage']
@@ -1,5 +1,7 @@
 from app.common.utils import print_exception
-from app.database.services.analytics.common import add_common_checks, find_matching_first_chars
+from app.database.services.analytics.common import (
+    NOW_RELATIVE_CACHE_TTL, add_common_checks, find_matching_first_chars, query_params,
+)
 from app.database.services.analytics.sql_dialect import (
     add_days, current_date, day_str, diff_seconds, month_str, ratio_pct,
     week_end, week_start, yearweek,
@@ -7,7 +9,7 @@ from app.database.services.analytics.sql_dialect import (
 from app.domain_types.enums.event_categories import EventCategory
 from app.domain_types.enums.event_types import EventType
 from app.domain_types.schemas.analytics import AnalyticsFilters
-from app.modules.data_sync.connectors import get_analytics_db_connector
+from app.modules.data_sync.connectors import get_async_analytics_db_connector
 from app.telemetry.tracing import trace_span
 
 ###############################################################################
@@ -21,7 +23,7 @@ async def get_daily_active_patients(filters: AnalyticsFilters):
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
 
         query = f"""
             SELECT
@@ -29,7 +31,7 @@ async def get_daily_active_patients(filters: AnalyticsFilters):
             FROM events e
             JOIN users u ON e.UserId = u.id
             WHERE
-                e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                 __CHECKS__
             GROUP BY DATE(e.Timestamp)
             ORDER BY activity_date;
@@ -40,7 +42,8 @@ async def get_daily_active_patients(filters: AnalyticsFilters):
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
 
         result_ = []
         for row in result:
@@ -63,7 +66,7 @@ async def get_weekly_active_patients(filters: AnalyticsFilters):
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
 
         # query_week_number = f"""
         #     SELECT
@@ -71,7 +74,7 @@ async def get_weekly_active_patients(filters: AnalyticsFilters):
         #     FROM events e
         #     JOIN users u ON e.UserId = u.id
         #     WHERE
-        #         e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+        #         e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
         #         __CHECKS__
         #     GROUP BY YEARWEEK(e.Timestamp, 1)
         #     ORDER BY activity_week;
@@ -88,7 +91,7 @@ async def get_weekly_active_patients(filters: AnalyticsFilters):
             FROM events e
             JOIN users u ON e.UserId = u.id
             WHERE
-                e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                 __CHECKS__
             GROUP BY {week_start_str},
                     {week_end_str}
@@ -100,7 +103,8 @@ async def get_weekly_active_patients(filters: AnalyticsFilters):
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
 
         return result
 
@@ -117,7 +121,7 @@ async def get_monthly_active_patients(filters: AnalyticsFilters):
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
 
         is_postgres = connector.is_postgres
         month_expr = month_str('e.Timestamp', is_postgres)
@@ -126,7 +130,7 @@ async def get_monthly_active_patients(filters: AnalyticsFilters):
             FROM events e
             JOIN users u ON e.UserId = u.id
             WHERE
-                e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                 __CHECKS__
             GROUP BY {month_expr}
             ORDER BY activity_month;
@@ -137,7 +141,8 @@ async def get_monthly_active_patients(filters: AnalyticsFilters):
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
 
         return result
 
@@ -155,7 +160,7 @@ async def get_patients_active_dau_wau_mau(filters: AnalyticsFilters):
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
 
         is_postgres = connector.is_postgres
         yw_ts = yearweek('e.Timestamp', is_postgres)
@@ -173,7 +178,7 @@ async def get_patients_active_dau_wau_mau(filters: AnalyticsFilters):
                 FROM events e
                 JOIN users u ON e.UserId = u.id
                 WHERE
-                    e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                    e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                     __CHECKS__
                 GROUP BY DATE(e.Timestamp), {yw_ts}, {month_ts}
                 ORDER BY activity_date;
@@ -184,7 +189,8 @@ async def get_patients_active_dau_wau_mau(filters: AnalyticsFilters):
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params, cache_ttl=NOW_RELATIVE_CACHE_TTL)
 
         return result
 
@@ -201,7 +207,7 @@ async def get_patients_average_session_length_in_minutes(filters: AnalyticsFilte
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
         # calculate average session lengths by utilizing the SessionId in the events table.
         # Measure the duration of a session for each SessionId based on the difference between
         # the first and last event timestamps in that session.
@@ -219,7 +225,7 @@ async def get_patients_average_session_length_in_minutes(filters: AnalyticsFilte
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                         WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                         __CHECKS__
                     GROUP BY u.id
                 ) AS session_durations;
@@ -230,7 +236,8 @@ async def get_patients_average_session_length_in_minutes(filters: AnalyticsFilte
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
 
         row = result[0]
         average_session_length = float(row['avg_session_length_seconds']) / 60.0 if row['avg_session_length_seconds'] != None else 0.0
@@ -249,7 +256,7 @@ async def get_patients_login_frequency(filters: AnalyticsFilters):
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
 
         # event_name = find_matching_first_chars(
         #         EventType.UserLoginWithPassword.value,
@@ -265,7 +272,7 @@ async def get_patients_login_frequency(filters: AnalyticsFilters):
                 JOIN users u ON e.UserId = u.id
                 WHERE
                     e.EventName LIKE 'user-login%'
-                    AND e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                    AND e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                     __CHECKS__
                 GROUP BY month
                 ORDER BY month ASC;
@@ -276,7 +283,8 @@ async def get_patients_login_frequency(filters: AnalyticsFilters):
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
 
         return result
 
@@ -298,7 +306,7 @@ async def get_patients_retention_rate_on_specific_days(filters: AnalyticsFilters
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
 
         is_postgres = connector.is_postgres
         reg = "DATE(u.RegistrationDate)"
@@ -317,7 +325,7 @@ async def get_patients_retention_rate_on_specific_days(filters: AnalyticsFilters
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) = {d[1]}
                 ),
@@ -327,7 +335,7 @@ async def get_patients_retention_rate_on_specific_days(filters: AnalyticsFilters
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) = {d[3]}
                 ),
@@ -337,7 +345,7 @@ async def get_patients_retention_rate_on_specific_days(filters: AnalyticsFilters
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) = {d[7]}
                 ),
@@ -347,7 +355,7 @@ async def get_patients_retention_rate_on_specific_days(filters: AnalyticsFilters
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) = {d[10]}
                 ),
@@ -357,7 +365,7 @@ async def get_patients_retention_rate_on_specific_days(filters: AnalyticsFilters
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) = {d[15]}
                 ),
@@ -367,7 +375,7 @@ async def get_patients_retention_rate_on_specific_days(filters: AnalyticsFilters
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) = {d[20]}
                 ),
@@ -377,7 +385,7 @@ async def get_patients_retention_rate_on_specific_days(filters: AnalyticsFilters
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) = {d[25]}
                 ),
@@ -387,7 +395,7 @@ async def get_patients_retention_rate_on_specific_days(filters: AnalyticsFilters
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) = {d[30]}
                 )
@@ -425,7 +433,8 @@ async def get_patients_retention_rate_on_specific_days(filters: AnalyticsFilters
             checks_str = "WHERE " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
 
         row = result[0]
         result_ = {
@@ -492,7 +501,7 @@ async def get_patients_retention_rate_in_specific_time_interval(filters: Analyti
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
         is_postgres = connector.is_postgres
         reg = "DATE(u.RegistrationDate)"
         d = {n: add_days(reg, n, is_postgres) for n in (1, 3, 7, 10, 15, 20, 25, 30)}
@@ -510,7 +519,7 @@ async def get_patients_retention_rate_in_specific_time_interval(filters: Analyti
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) < {d[1]}
                         AND DATE(e.Timestamp) >= {reg}
@@ -521,7 +530,7 @@ async def get_patients_retention_rate_in_specific_time_interval(filters: Analyti
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) < {d[3]}
                         AND DATE(e.Timestamp) >= {d[1]}
@@ -532,7 +541,7 @@ async def get_patients_retention_rate_in_specific_time_interval(filters: Analyti
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) < {d[7]}
                         AND DATE(e.Timestamp) >= {d[3]}
@@ -543,7 +552,7 @@ async def get_patients_retention_rate_in_specific_time_interval(filters: Analyti
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) < {d[10]}
                         AND DATE(e.Timestamp) >= {d[7]}
@@ -554,7 +563,7 @@ async def get_patients_retention_rate_in_specific_time_interval(filters: Analyti
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) < {d[15]}
                         AND DATE(e.Timestamp) >= {d[10]}
@@ -565,7 +574,7 @@ async def get_patients_retention_rate_in_specific_time_interval(filters: Analyti
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) < {d[20]}
                         AND DATE(e.Timestamp) >= {d[15]}
@@ -576,7 +585,7 @@ async def get_patients_retention_rate_in_specific_time_interval(filters: Analyti
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) < {d[25]}
                         AND DATE(e.Timestamp) >= {d[20]}
@@ -587,7 +596,7 @@ async def get_patients_retention_rate_in_specific_time_interval(filters: Analyti
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                         AND e.UserId IN (SELECT id FROM registered_users)
                         AND DATE(e.Timestamp) < {d[30]}
                         AND DATE(e.Timestamp) >= {d[25]}
@@ -626,7 +635,8 @@ async def get_patients_retention_rate_in_specific_time_interval(filters: Analyti
             checks_str = "WHERE " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
 
         row = result[0]
         result_ = {
@@ -690,7 +700,7 @@ async def get_patient_stickiness_dau_mau(filters: AnalyticsFilters):
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
 
         is_postgres = connector.is_postgres
         day_expr = day_str('e.Timestamp', is_postgres)
@@ -704,7 +714,7 @@ async def get_patient_stickiness_dau_mau(filters: AnalyticsFilters):
                         FROM events e
                         JOIN users u ON e.UserId = u.id
                         WHERE
-                            u.RegistrationDate BETWEEN '{start_date}' AND '{end_date}'
+                            u.RegistrationDate BETWEEN %(start_date)s AND %(end_date)s
                             __CHECKS__
                         GROUP BY event_date, month
                     ),
@@ -715,7 +725,7 @@ async def get_patient_stickiness_dau_mau(filters: AnalyticsFilters):
                         FROM events e
                         JOIN users u ON e.UserId = u.id
                         WHERE
-                            u.RegistrationDate BETWEEN '{start_date}' AND '{end_date}'
+                            u.RegistrationDate BETWEEN %(start_date)s AND %(end_date)s
                             __CHECKS__
                         GROUP BY month
                     )
@@ -735,7 +745,8 @@ async def get_patient_stickiness_dau_mau(filters: AnalyticsFilters):
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
 
         result_ = []
         for row in result:
@@ -763,7 +774,7 @@ async def get_patients_most_commonly_used_features(filters: AnalyticsFilters) ->
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
 
         is_postgres = connector.is_postgres
         month_expr = month_str('e.Timestamp', is_postgres)
@@ -779,7 +790,7 @@ async def get_patients_most_commonly_used_features(filters: AnalyticsFilters) ->
                         JOIN
                         users u ON e.UserId = u.id
                         WHERE
-                            e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                            e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                             __CHECKS__
                         GROUP BY month, feature
                         ORDER BY feature_usage_count DESC
@@ -805,7 +816,8 @@ async def get_patients_most_commonly_used_features(filters: AnalyticsFilters) ->
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
 
         return result
 
@@ -822,7 +834,7 @@ async def get_patients_most_commonly_visited_screens(filters: AnalyticsFilters)
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
 
         top_screens_count = 10
         event_category = EventCategory.AppScreenVisit.value # EventCategory for screen visits
@@ -844,9 +856,9 @@ async def get_patients_most_commonly_visited_screens(filters: AnalyticsFilters)
                     FROM events e
                     JOIN users u ON e.UserId = u.id
                     WHERE
-                        e.EventCategory = '{event_category}'
-                        AND e.EventName = '{event_name}'
-                        AND e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                        e.EventCategory = %(event_category)s
+                        AND e.EventName = %(event_name)s
+                        AND e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                         __CHECKS__
                     GROUP BY month, screen_name
                     ORDER BY screen_visit_count DESC
@@ -861,7 +873,8 @@ async def get_patients_most_commonly_visited_screens(filters: AnalyticsFilters)
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters, event_category=event_category, event_name=event_name)
+        result = await connector.execute_prepared_read_query(query, params)
 
         return result
 
@@ -877,7 +890,7 @@ async def get_most_fired_events(filters: AnalyticsFilters) -> list:
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
 
         query = f"""
                 SELECT 
@@ -888,7 +901,7 @@ async def get_most_fired_events(filters: AnalyticsFilters) -> list:
                 JOIN
                     users u ON e.UserId = u.id
                     WHERE
-                        e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                        e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                         __CHECKS__
                 GROUP BY 
                     EventName
@@ -901,7 +914,8 @@ async def get_most_fired_events(filters: AnalyticsFilters) -> list:
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
 
         return result
 
@@ -917,7 +931,7 @@ async def get_most_fired_events_by_event_category(filters: AnalyticsFilters) ->
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
 
         query = f"""
                 SELECT 
@@ -929,7 +943,7 @@ async def get_most_fired_events_by_event_category(filters: AnalyticsFilters) ->
                 JOIN
                 users u ON e.UserId = u.id
                 WHERE
-                    e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                    e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                     __CHECKS__
                 GROUP BY 
                     EventCategory, 
@@ -944,7 +958,8 @@ async def get_most_fired_events_by_event_category(filters: AnalyticsFilters) ->
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params)
 
         return result
 
@@ -960,7 +975,7 @@ async def get_user_engagement_over_last_8_days(filters) -> list:
         end_date   = filters.EndDate
         role_id    = filters.RoleId
 
-        connector = get_analytics_db_connector()
+        connector = get_async_analytics_db_connector()
         is_postgres = connector.is_postgres
         last_8_days = "NOW() - INTERVAL '8 day'" if is_postgres else "NOW() - INTERVAL 8 DAY"
 
@@ -976,7 +991,7 @@ async def get_user_engagement_over_last_8_days(filters) -> list:
                 WHERE
                     e.Timestamp >= {last_8_days}
                     AND
-                    e.Timestamp BETWEEN '{start_date}' AND '{end_date}'
+                    e.Timestamp BETWEEN %(start_date)s AND %(end_date)s
                     __CHECKS__
                 GROUP BY 
                     EventCategory, 
@@ -991,7 +1006,8 @@ async def get_user_engagement_over_last_8_days(filters) -> list:
             checks_str = "AND " + checks_str
         query = query.replace("__CHECKS__", checks_str)
 
-        result = connector.execute_read_query(query)
+        params = query_params(filters)
+        result = await connector.execute_prepared_read_query(query, params, cache_ttl=NOW_RELATIVE_CACHE_TTL)
 
         return result
 
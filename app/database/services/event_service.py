@@ -2,73 +2,397 @@ import datetime as dt
 import json
 import asyncio
 import logging
+import time
 from app.database.models.event import Event
 from app.database.models.user import User
-from app.domain_types.miscellaneous.exceptions import NotFound
+from app.common.bloom_filter import RotatingBloomFilter
+from app.common.cache import AsyncBatchLoader, LruTtlCache
+from app.common.utils import generate_uuid4
+from app.common.write_ahead_log import WriteAheadLog, WriteAheadLogClosed, WriteAheadLogFull
+from app.config.config import get_settings
+from app.domain_types.miscellaneous.exceptions import NotFound, ServiceUnavailable
 from app.domain_types.schemas.event import EventCreateModel, EventResponseModel, EventUpdateModel, EventSearchFilter, EventSearchResults
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy import Engine, desc, asc
+from sqlalchemy import desc, asc
+from sqlalchemy.exc import IntegrityError, OperationalError
 from app.modules.data_sync.data_synchronizer import DataSynchronizer
 from app.telemetry.tracing import trace_span
 from datetime import timezone
 from app.database.database_accessor import engine
+from app.database.migrations.event_idempotency import IDEMPOTENCY_KEY_INDEX_NAME
+from app.database.query_cache import invalidate_tenants
 
 ###############################################################################
-queue_create_event = asyncio.Queue()
+
+settings = get_settings()
+
+# Events posted to /events wait here for the ingestion workers started with
+# the app (see start_event_ingestion); None while ingestion is not running.
+_event_queue: asyncio.Queue | None = None
+_event_workers = []
+
+# With EVENT_WAL_ENABLED, posted events are appended to this log instead and
+# written to the events table by the WAL flusher.
+_event_wal: WriteAheadLog | None = None
+_event_wal_flusher: asyncio.Task | None = None
+_event_wal_stopping: asyncio.Event | None = None
+
+# Users and tenants of incoming events, from the DataSynchronizer lookup
+# caches; the misses of a batch are looked up together, and concurrent
+# batches missing the same user share one lookup.
+_user_loader = AsyncBatchLoader(DataSynchronizer.get_cached_user, DataSynchronizer.get_users)
+_tenant_loader = AsyncBatchLoader(DataSynchronizer.get_cached_tenant, DataSynchronizer.get_tenants)
+
+# Idempotency keys of the events written by this process. A key the Bloom
+# filter has not seen is new, so most events need no lookup; the exact LRU
+# holds the latest keys, which client retries usually repeat. Only keys the
+# filter may have seen are looked up in the events table, whose unique
+# (UserId, IdempotencyKey) index catches whatever gets past both.
+_idempotency_filter = RotatingBloomFilter(
+    settings.EVENT_IDEMPOTENCY_FILTER_CAPACITY,
+    settings.EVENT_IDEMPOTENCY_FALSE_POSITIVE_RATE)
+_recent_idempotency_keys = LruTtlCache(settings.EVENT_IDEMPOTENCY_LRU_SIZE)
+
+# Both start empty, so until this time every key is looked up: clients
+# retrying events sent before a restart would otherwise get past the filter
+# and fail whole chunks on the unique index.
+_idempotency_cold_until = time.monotonic() + settings.EVENT_IDEMPOTENCY_COLD_START_SECONDS
+
+DUPLICATE_EVENT = "Duplicate of an event already received."
+
 ###############################################################################
 
 @trace_span("service: create_event")
 async def create_event(model: EventCreateModel):
-    asyncio.create_task(worker_create_event(queue_create_event, engine))
-    await queue_create_event.put(model)
+    if _event_wal is not None:
+        return await append_event_to_wal(model)
+    if _event_queue is None:
+        raise ServiceUnavailable("Event ingestion is not running.")
+    try:
+        _event_queue.put_nowait(model)
+    except asyncio.QueueFull:
+        raise ServiceUnavailable("Event ingestion queue is full, please retry later.")
     return True
 
-async def worker_create_event(create_event_queue: asyncio.Queue, engine: Engine):
-    try:
-        session_ = sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=False)()
-        while True:
-            model = await create_event_queue.get()
+async def start_event_ingestion():
+    """
+    Starts EVENT_INGESTION_WORKERS long-lived workers that write the queued
+    events in micro-batches. The queue holds at most
+    EVENT_INGESTION_QUEUE_SIZE events, past which create_event rejects new
+    ones instead of letting the backlog grow without bound.
+    """
+    global _event_queue, _event_wal, _event_wal_flusher, _event_wal_stopping
+    if _event_queue is not None:
+        return
+    _event_queue = asyncio.Queue(maxsize=max(1, settings.EVENT_INGESTION_QUEUE_SIZE))
+    for _ in range(max(1, settings.EVENT_INGESTION_WORKERS)):
+        _event_workers.append(asyncio.create_task(worker_create_events(_event_queue)))
+    if settings.EVENT_WAL_ENABLED:
+        _event_wal = WriteAheadLog(
+            settings.EVENT_WAL_PATH,
+            "events",
+            segment_max_bytes=settings.EVENT_WAL_SEGMENT_MAX_BYTES,
+            fsync_policy=settings.EVENT_WAL_FSYNC,
+            fsync_interval_ms=settings.EVENT_WAL_FSYNC_INTERVAL_MS,
+            max_bytes=settings.EVENT_WAL_MAX_BYTES)
+        # Its first pass replays the segments left by the previous run
+        _event_wal_stopping = asyncio.Event()
+        _event_wal_flusher = asyncio.create_task(flush_event_wal_periodically(_event_wal, _event_wal_stopping))
+
+async def stop_event_ingestion():
+    """
+    Stops accepting events and waits for the workers to write everything
+    already queued.
+    """
+    global _event_queue, _event_wal, _event_wal_flusher, _event_wal_stopping
+    queue = _event_queue
+    if queue is None:
+        return
+    _event_queue = None
+    # A worker that is no longer running would never take its None, and
+    # the put could then wait forever on a full queue
+    for worker in _event_workers:
+        if not worker.done():
+            await queue.put(None)
+    await asyncio.gather(*_event_workers, return_exceptions=True)
+    _event_workers.clear()
+    if _event_wal is not None:
+        wal = _event_wal
+        _event_wal = None
+        # Cancelling would not stop a batch already being written in a
+        # thread, so the flusher is asked to stop after its current pass
+        _event_wal_stopping.set()
+        await asyncio.gather(_event_wal_flusher, return_exceptions=True)
+        _event_wal_flusher = None
+        _event_wal_stopping = None
+        # Whatever cannot be written now stays on disk for the next start
+        try:
+            await flush_event_wal(wal)
+        except Exception as e:
+            logging.error(f"Error flushing the event WAL on shutdown: {e}")
+        wal.close()
+
+async def worker_create_events(queue: asyncio.Queue):
+    """
+    Takes events off the queue until a batch has EVENT_INGESTION_BATCH_SIZE
+    events or its first event has waited EVENT_INGESTION_MAX_LATENCY_MS, then
+    writes it off the event loop. A None entry stops the worker once the
+    batch in hand is written; a batch that fails is logged and dropped.
+    """
+    loop = asyncio.get_running_loop()
+    batch_size = max(1, settings.EVENT_INGESTION_BATCH_SIZE)
+    max_latency = settings.EVENT_INGESTION_MAX_LATENCY_MS / 1000
+    stopping = False
+    while not stopping:
+        model = await queue.get()
+        if model is None:
+            break
+        batch = [model]
+        deadline = loop.time() + max_latency
+        while len(batch) < batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                model = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
             if model is None:
+                stopping = True
                 break
-            add_event_to_db(session_, model)
-    except Exception as e:
-        logging.error(f"Error in worker_create_event: {e}")
-        # raise
+            batch.append(model)
+        try:
+            await create_events(batch)
+        except asyncio.CancelledError:
+            if asyncio.current_task().cancelling() > 0:
+                raise
+            # Not this worker being cancelled, so it keeps going
+            logging.error(f"Error in worker_create_events: a batch of {len(batch)} events was cancelled")
+        except Exception as e:
+            logging.error(f"Error in worker_create_events: {e}")
+
+async def append_event_to_wal(model: EventCreateModel):
+    # The id is fixed here so a segment replayed after a crash cannot
+    # insert its events twice
+    record = json.dumps({"id": generate_uuid4(), "event": model.model_dump(mode="json")})
+    try:
+        await asyncio.to_thread(_event_wal.append, record)
+    except WriteAheadLogFull:
+        raise ServiceUnavailable("Event ingestion log is full, please retry later.")
+    except WriteAheadLogClosed:
+        raise ServiceUnavailable("Event ingestion is not running.")
+    return True
+
+async def flush_event_wal_periodically(wal: WriteAheadLog, stopping: asyncio.Event):
+    while not stopping.is_set():
+        try:
+            await flush_event_wal(wal)
+        except Exception as e:
+            # The database may be down; the segments are retried next time
+            logging.error(f"Error flushing the event WAL: {e}")
+        try:
+            await asyncio.wait_for(stopping.wait(), settings.EVENT_WAL_FLUSH_INTERVAL_MS / 1000)
+        except asyncio.TimeoutError:
+            pass
+
+async def flush_event_wal(wal: WriteAheadLog):
+    """
+    Seals the active WAL segment and writes the sealed segments to the
+    events table in order, in batches of EVENT_INGESTION_BATCH_SIZE. A
+    segment is removed once all of its events are written (or rejected);
+    if writing fails, or a user or tenant cannot be looked up, it is kept
+    and retried from its start, and the events already written are skipped
+    by their ids.
+    """
+    await asyncio.to_thread(wal.seal)
+    batch_size = max(1, settings.EVENT_INGESTION_BATCH_SIZE)
+    for path in wal.sealed_segments():
+        records = await asyncio.to_thread(WriteAheadLog.read_segment, path)
+        models = []
+        event_ids = []
+        for record in records:
+            try:
+                entry = json.loads(record)
+                models.append(EventCreateModel.model_validate(entry["event"]))
+                event_ids.append(entry["id"])
+            except Exception as e:
+                logging.error(f"Skipping an unreadable event WAL record in {path}: {e}")
+        for start in range(0, len(models), batch_size):
+            batch_models = models[start:start + batch_size]
+            batch_event_ids = event_ids[start:start + batch_size]
+            stored = await asyncio.to_thread(get_stored_event_ids, batch_event_ids)
+            if len(stored) > 0:
+                # Written before the previous flush stopped or the process crashed
+                indexes = [index for index, event_id in enumerate(batch_event_ids) if event_id not in stored]
+                batch_models = [batch_models[index] for index in indexes]
+                batch_event_ids = [batch_event_ids[index] for index in indexes]
+            if len(batch_models) > 0:
+                await create_events(batch_models, batch_event_ids)
+        await asyncio.to_thread(wal.remove, path)
+
+async def create_events(models: list, event_ids: list | None = None) -> list:
+    """
+    Drops the events repeating an idempotency key, enriches the rest with
+    their users and tenants, then writes them off the event loop. Returns
+    the error of each event (None for the events created).
+    """
+    errors = await find_duplicate_events(models)
+    indexes = [index for index, error in enumerate(errors) if error is None]
+    if len(indexes) == 0:
+        return errors
+    new_models = [models[index] for index in indexes]
+    new_event_ids = [event_ids[index] for index in indexes] if event_ids is not None else None
+
+    users = await _user_loader.get_many([str(model.UserId) for model in new_models])
+    tenants = await _tenant_loader.get_many([
+        str(model.TenantId) for model in new_models if model.TenantId is not None
+    ])
+    new_errors = await asyncio.to_thread(add_events_to_db, new_models, users, tenants, new_event_ids)
+
+    for index, model, error in zip(indexes, new_models, new_errors):
+        errors[index] = error
+        if model.IdempotencyKey is not None and error in (None, DUPLICATE_EVENT):
+            remember_idempotency_key(get_idempotency_key(model))
+    return errors
 
-def add_event_to_db(session_, model):
+def get_idempotency_key(model: EventCreateModel) -> str:
+    return f"{model.UserId}:{model.IdempotencyKey}"
+
+def remember_idempotency_key(key: str):
+    _idempotency_filter.add(key)
+    _recent_idempotency_keys.set(key, True)
+
+async def find_duplicate_events(models: list) -> list:
+    """
+    Returns DUPLICATE_EVENT for each event whose idempotency key was already
+    written, or repeats that of an earlier event of the batch, and None for
+    the others. The keys the Bloom filter may have seen, but the LRU does
+    not hold, are looked up together in one query; shortly after startup,
+    while the filter is cold, that is every key the LRU does not hold.
+    """
+    errors = [None] * len(models)
+    seen = set()
+    maybe_seen = {}
+    cold = time.monotonic() < _idempotency_cold_until
+    for index, model in enumerate(models):
+        if model.IdempotencyKey is None:
+            continue
+        key = get_idempotency_key(model)
+        if key in seen or _recent_idempotency_keys.get(key) is not None:
+            errors[index] = DUPLICATE_EVENT
+        elif cold or key in _idempotency_filter:
+            maybe_seen[index] = key
+        seen.add(key)
+    if len(maybe_seen) == 0:
+        return errors
+
+    stored = await asyncio.to_thread(get_stored_idempotency_keys, [models[index] for index in maybe_seen])
+    for index, key in maybe_seen.items():
+        if key in stored:
+            errors[index] = DUPLICATE_EVENT
+            _recent_idempotency_keys.set(key, True)
+    return errors
+
+def get_stored_idempotency_keys(models: list) -> set:
+    session_ = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        rows = session_.query(Event.UserId, Event.IdempotencyKey).filter(
+            Event.UserId.in_({str(model.UserId) for model in models}),
+            Event.IdempotencyKey.in_({model.IdempotencyKey for model in models})).all()
+    finally:
+        session_.close()
+    return {f"{user_id}:{idempotency_key}" for user_id, idempotency_key in rows}
+
+def get_stored_event_ids(event_ids: list) -> set:
+    session_ = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
     try:
-        user = DataSynchronizer.get_user(model.UserId)
-        if user is None:
-            raise NotFound(f"User with id {model.UserId} not found")
-
-        if model.TenantId is not None:
-            tenant = DataSynchronizer.get_tenant(model.TenantId)
-            if tenant is None:
-                raise NotFound(f"Tenant with id {model.TenantId} not found")
-
-        registration_date = user['RegistrationDate'].replace(tzinfo=timezone.utc)
-
-        model_dict = model.dict()
-        db_model = Event(**model_dict)
-        db_model.Attributes = json.dumps(model.Attributes)
-        db_model.UpdatedAt = dt.datetime.now()
-        db_model.DaysSinceRegistration = (model.Timestamp - registration_date).days
-        db_model.TimeOffsetSinceRegistration = (model.Timestamp - registration_date).total_seconds()
-        db_model.Attributes = json.dumps(model.Attributes)
-
-        session_.add(db_model)
+        rows = session_.query(Event.id).filter(Event.id.in_(set(event_ids))).all()
+    finally:
+        session_.close()
+    return {str(event_id) for event_id, in rows}
+
+@trace_span("service: add_events_to_db")
+def add_events_to_db(models: list, users: dict, tenants: dict, event_ids: list | None = None) -> list:
+    """
+    Writes a batch of events with one insert and commit, and returns the
+    error of each event. Events of unknown users or tenants are rejected; if
+    the batch fails as a whole, its events are retried one by one so a
+    single bad event does not take the others with it. A database that
+    cannot be reached fails the whole batch (OperationalError).
+    """
+    errors = [None] * len(models)
+    rows = {}
+    for index, model in enumerate(models):
+        try:
+            event_id = event_ids[index] if event_ids is not None else None
+            rows[index] = get_event_row(model, users, tenants, event_id)
+        except Exception as e:
+            errors[index] = str(e)
+            logging.error(f"Event not created: UserId={model.UserId}, EventName={model.EventName}, Error={e}")
+    if len(rows) == 0:
+        return errors
+
+    session_ = sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=False)()
+    try:
+        session_.add_all([Event(**row) for row in rows.values()])
         session_.commit()
-        temp = session_.refresh(db_model)
-        event = db_model
-        event.Attributes = json.loads(event.Attributes)
+    except OperationalError:
+        session_.rollback()
+        raise
     except Exception as e:
-        if session_ is not None:
-            session_.rollback()
-            session_.close()
-        raise e
+        session_.rollback()
+        logging.error(f"Failed to create a batch of {len(rows)} events, retrying one by one: {e}")
+        for index, error in add_event_rows_one_by_one(session_, rows).items():
+            errors[index] = error
     finally:
         session_.close()
-    
+    invalidate_tenants({row['TenantId'] for index, row in rows.items() if errors[index] is None})
+    return errors
+
+def add_event_rows_one_by_one(session_, rows: dict) -> dict:
+    errors = {}
+    for index, row in rows.items():
+        try:
+            session_.add(Event(**row))
+            session_.commit()
+        except OperationalError:
+            session_.rollback()
+            raise
+        except IntegrityError as e:
+            session_.rollback()
+            if row.get('IdempotencyKey') is not None and IDEMPOTENCY_KEY_INDEX_NAME in str(e.orig):
+                # Another batch wrote the same key since it was checked
+                errors[index] = DUPLICATE_EVENT
+                continue
+            errors[index] = "Failed to store the event."
+            logging.error(f"Event not created: UserId={row['UserId']}, EventName={row['EventName']}, Error={e}")
+        except Exception as e:
+            session_.rollback()
+            errors[index] = "Failed to store the event."
+            logging.error(f"Event not created: UserId={row['UserId']}, EventName={row['EventName']}, Error={e}")
+    return errors
+
+def get_event_row(model: EventCreateModel, users: dict, tenants: dict, event_id: str | None = None) -> dict:
+    user = users.get(str(model.UserId))
+    if user is None:
+        raise NotFound(f"User with id {model.UserId} not found")
+
+    if model.TenantId is not None:
+        tenant = tenants.get(str(model.TenantId))
+        if tenant is None:
+            raise NotFound(f"Tenant with id {model.TenantId} not found")
+
+    registration_date = user['RegistrationDate'].replace(tzinfo=timezone.utc)
+
+    row = model.dict()
+    if event_id is not None:
+        row['id'] = event_id
+    row['Attributes'] = json.dumps(model.Attributes)
+    row['UpdatedAt'] = dt.datetime.now()
+    row['DaysSinceRegistration'] = (model.Timestamp - registration_date).days
+    row['TimeOffsetSinceRegistration'] = (model.Timestamp - registration_date).total_seconds()
+    return row
+
 @trace_span("service: get_event_by_id")
 def get_event_by_id(session: Session, event_id: str) -> EventResponseModel:
     event = session.query(Event).filter(Event.id == event_id).first()
@@ -90,6 +414,7 @@ def update_event(session: Session, event_id: str, model: EventUpdateModel) -> Ev
 
     session.commit()
     session.refresh(event)
+    invalidate_tenants([event.TenantId])
 
     event.Attributes = json.loads(event.Attributes)
     return event.__dict__
@@ -99,8 +424,10 @@ def delete_event(session: Session, event_id: str) -> bool:
     event = session.query(Event).filter(Event.id == event_id).first()
     if not event:
         raise NotFound(f"Event with id {event_id} not found")
+    tenant_id = event.TenantId
     session.delete(event)
     session.commit()
+    invalidate_tenants([tenant_id])
     return True
 
 @trace_span("service: search_events")
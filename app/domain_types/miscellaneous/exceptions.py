@@ -61,6 +61,11 @@ class Gone(HTTPError):
         self.status_code = status.HTTP_410_GONE
         self.message = message
 
+class PayloadTooLarge(HTTPError):
+    def __init__(self, message: str):
+        self.status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        self.message = message
+
 class ValidationError(HTTPError):
     def __init__(self, message: str):
         self.status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -1,7 +1,13 @@
-from datetime import date
+from datetime import date, datetime
 from typing import Optional
 from pydantic import UUID4, BaseModel, Field
 
 class DataSyncSearchFilter(BaseModel):
     StartDate  : Optional[date|None]  = Field(description="Start date for events", default=None)
     EndDate    : Optional[date|None]  = Field(description="End date for events", default=None)
+
+class IncrementalSyncFilter(DataSyncSearchFilter):
+    SyncKey     : str                   = Field(description="Synchronizer the window belongs to")
+    WatermarkAt : Optional[datetime]    = Field(description="Rows up to this timestamp are synced", default=None)
+    LastId      : Optional[str]         = Field(description="Last synced id at WatermarkAt", default=None)
+    Cutoff      : datetime              = Field(description="Upper bound of the window")
@@ -19,9 +19,21 @@ class EventCreateModel(BaseModel):
     ActionStatement : str                = Field(min_length=2, max_length=512, description="Action Statement statement of event. Used for history tracking.")
     Timestamp       : datetime           = Field(default=None, description="Timestamp of the Event")
     Attributes      : Optional[Any|None] = Field(default=None, description="Attributes of the Event")
+    IdempotencyKey  : Optional[str]      = Field(default=None, min_length=1, max_length=128, description="Client-generated key, unique per user; events repeating a key are dropped as duplicates")
 
 EventCreateModel.model_rebuild()
 
+class EventBatchItemResult(BaseModel):
+    Index   : int           = Field(description="Position of the event in the batch")
+    Accepted: bool          = Field(description="Whether the event was created")
+    Error   : Optional[str] = Field(default=None, description="Why the event was rejected")
+
+class EventBatchResults(BaseModel):
+    TotalCount   : int                        = Field(description="Events received")
+    AcceptedCount: int                        = Field(description="Events created")
+    RejectedCount: int                        = Field(description="Events rejected")
+    Items        : List[EventBatchItemResult] = []
+
 class EventUpdateModel(BaseModel):
     pass
 
@@ -65,6 +77,7 @@ class EventResponseModel(BaseModel):
     Attributes                  : Optional[Any | None]  = Field(default=None, description="Attributes of the Event")
     DaysSinceRegistration       : Optional[int | None]  = Field(default=None, description="Days since registration")
     TimeOffsetSinceRegistration : Optional[int | None]  = Field(default=None, description="Time offset since registration")
+    IdempotencyKey              : Optional[str]         = Field(default=None, description="Client-generated idempotency key of the Event")
     CreatedAt                   : datetime              = Field(default=None, description="Created At timestamp of the Event")
     UpdatedAt                   : datetime              = Field(default=None, description="Updated At timestamp of the Event")
 
@@ -0,0 +1,209 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, timedelta
+from app.common.utils import generate_uuid4
+from app.config.config import get_settings
+from app.database.query_cache import invalidate_all
+from app.domain_types.schemas.data_sync import DataSyncSearchFilter
+from app.modules.data_sync.connectors import get_analytics_db_connector
+from app.modules.data_sync.sync_orchestrator import SYNC_DOMAINS, SyncOrchestrator, run_sync_task
+from app.modules.data_sync.sync_state import utc_now
+
+############################################################
+
+settings = get_settings()
+
+class BackfillSliceStatus:
+    Pending   = "Pending"
+    Running   = "Running"
+    Completed = "Completed"
+    Failed    = "Failed"
+
+def plan_slices(start_date: date, end_date: date, slice_count: int) -> list:
+    """
+    Splits [start_date, end_date] into at most `slice_count` day-aligned
+    (start, end) windows. Consecutive windows share their boundary day, as
+    the sync filters are inclusive at both ends; the overlap is harmless
+    since event inserts are idempotent.
+    """
+    total_days = (end_date - start_date).days
+    if total_days <= 0:
+        return [(start_date, end_date)]
+    slice_count = max(1, min(slice_count, total_days))
+    bounds = [start_date + timedelta(days=round(i * total_days / slice_count)) for i in range(slice_count + 1)]
+    return [(bounds[i], bounds[i + 1]) for i in range(slice_count)]
+
+############################################################
+
+class BackfillStore:
+    """
+    Slices of a backfill and their completion, in the sync_backfill_slices
+    table.
+    """
+
+    @staticmethod
+    def create_backfill(slices: list) -> str | None:
+        try:
+            analytics_db_connector = get_analytics_db_connector()
+            backfill_id = generate_uuid4()
+            query = """
+            INSERT INTO sync_backfill_slices (
+                id, BackfillId, SliceIndex, StartDate, EndDate, Status, Attempts
+            ) VALUES (
+                %s, %s, %s, %s, %s, %s, 0
+            )
+            """
+            rows = [
+                (generate_uuid4(), backfill_id, index, start_date, end_date, BackfillSliceStatus.Pending)
+                for index, (start_date, end_date) in enumerate(slices)
+            ]
+            rowcounts = analytics_db_connector.execute_batch_write(query, rows)
+            if rowcounts is None or None in rowcounts:
+                print("Failed to record the backfill slices.")
+                return None
+            return backfill_id
+        except Exception as error:
+            print("Error creating backfill:", error)
+            return None
+
+    @staticmethod
+    def get_slices(backfill_id: str):
+        try:
+            analytics_db_connector = get_analytics_db_connector()
+            query = """
+            SELECT * from sync_backfill_slices
+            WHERE
+                BackfillId = %s
+            ORDER BY SliceIndex
+            """
+            return analytics_db_connector.execute_read_query(query, (backfill_id,))
+        except Exception as error:
+            print("Error retrieving backfill slices:", error)
+            return None
+
+    @staticmethod
+    def mark_running(slice_id: str):
+        try:
+            analytics_db_connector = get_analytics_db_connector()
+            query = """
+            UPDATE sync_backfill_slices SET
+                Status = %s,
+                Attempts = Attempts + 1,
+                StartedAt = %s
+            WHERE
+                id = %s
+            """
+            analytics_db_connector.execute_write_query(
+                query, (BackfillSliceStatus.Running, utc_now(), slice_id))
+        except Exception as error:
+            print("Error updating backfill slice:", error)
+
+    @staticmethod
+    def mark_finished(slice_id: str, error: str | None = None):
+        try:
+            analytics_db_connector = get_analytics_db_connector()
+            query = """
+            UPDATE sync_backfill_slices SET
+                Status = %s,
+                LastError = %s,
+                CompletedAt = %s
+            WHERE
+                id = %s
+            """
+            status = BackfillSliceStatus.Completed if error is None else BackfillSliceStatus.Failed
+            completed_at = utc_now() if error is None else None
+            analytics_db_connector.execute_write_query(
+                query, (status, error[:4000] if error else None, completed_at, slice_id))
+        except Exception as error:
+            print("Error updating backfill slice:", error)
+
+############################################################
+
+def run_backfill_slice(slice_id: str, start_date: date, end_date: date) -> bool:
+    """
+    Syncs the event domains over one slice and records its completion. Runs
+    in a worker process, which opens its own connection pools.
+    """
+    BackfillStore.mark_running(slice_id)
+    filters = DataSyncSearchFilter(StartDate=start_date, EndDate=end_date)
+    domains = [domain for domain in SYNC_DOMAINS if not domain.full_sync]
+    try:
+        summary = SyncOrchestrator.run(lambda domain, task: run_sync_task(domain, task, filters), domains)
+        failed = [key for result in summary.values() for key in result["Failed"]]
+        error = f"Failed synchronizers: {', '.join(failed)}" if len(failed) > 0 else None
+    except Exception as e:
+        error = str(e)
+    BackfillStore.mark_finished(slice_id, error)
+    return error is None
+
+class BackfillSynchronizer:
+    """
+    Backfills a long date range as independent time slices synced in
+    parallel worker processes (SYNC_BACKFILL_PROCESSES), so the transformation
+    work is spread over CPUs as well. Each slice records its completion;
+    `run` on an existing backfill (e.g. after a restart) resumes only the
+    slices that did not complete. Slices left Running by a crashed process
+    are unfinished too.
+
+    Every process has its own connection pools and SYNC_*_DB_MAX_CONNECTIONS
+    budget, so a backfill holds up to that many connections per process.
+    """
+
+    _lock = threading.Lock()
+
+    @staticmethod
+    def create(filters: DataSyncSearchFilter, slice_count: int | None = None) -> str | None:
+        slices = plan_slices(filters.StartDate, filters.EndDate, slice_count or settings.SYNC_BACKFILL_SLICES)
+        return BackfillStore.create_backfill(slices)
+
+    @staticmethod
+    def run(backfill_id: str):
+        if not BackfillSynchronizer._lock.acquire(blocking=False):
+            print("A backfill is already running.")
+            return None
+        try:
+            slices = BackfillStore.get_slices(backfill_id)
+            if slices is None or len(slices) == 0:
+                print(f"Backfill {backfill_id} not found.")
+                return None
+            unfinished = [s for s in slices if s['Status'] != BackfillSliceStatus.Completed]
+            if len(unfinished) == 0:
+                print(f"Backfill {backfill_id} is already complete.")
+                return True
+
+            # Users (and tenants) first, once for all slices
+            full_sync_domains = [domain for domain in SYNC_DOMAINS if domain.full_sync]
+            SyncOrchestrator.run(lambda domain, task: run_sync_task(domain, task, None), full_sync_domains)
+
+            print(f"Backfill {backfill_id}: {len(unfinished)} of {len(slices)} slices to sync.")
+            completed = 0
+            # Spawned, not forked: children must not share the parent's pooled connections
+            with ProcessPoolExecutor(
+                    max_workers=max(1, settings.SYNC_BACKFILL_PROCESSES),
+                    mp_context=multiprocessing.get_context("spawn")) as executor:
+                futures = {
+                    executor.submit(run_backfill_slice, s['id'], s['StartDate'], s['EndDate']): s
+                    for s in unfinished
+                }
+                for future in as_completed(futures):
+                    s = futures[future]
+                    try:
+                        succeeded = future.result()
+                    except Exception as error:
+                        # The worker died before recording the outcome; the slice
+                        # stays unfinished and is picked up on resume
+                        print(f"Backfill slice {s['SliceIndex']} failed:", error)
+                        succeeded = False
+                    if succeeded:
+                        completed += 1
+                    print(f"Backfill slice {s['SliceIndex']} ({s['StartDate']} - {s['EndDate']}): "
+                          f"{'completed' if succeeded else 'failed'}.")
+                    # The slice wrote events in another process, whose cache
+                    # invalidations never reach this one
+                    invalidate_all()
+
+            print(f"Backfill {backfill_id}: {completed}/{len(unfinished)} slices completed.")
+            return completed == len(unfinished)
+        finally:
+            BackfillSynchronizer._lock.release()
@@ -4,20 +4,63 @@ from app.domain_types.enums.event_types import EventType
 from app.domain_types.schemas.data_sync import DataSyncSearchFilter
 from app.modules.data_sync.connectors import get_reancare_db_connector
 from app.modules.data_sync.data_synchronizer import DataSynchronizer
+from app.modules.data_sync.sync_engine import EventSyncSpec, SyncEngine
 import mysql.connector
 
-############################################################
-
-class CareplanEventsSynchronizer:
 
-    #region Careplan Enrollment events
+############################################################
 
-    @staticmethod
-    def get_reancare_careplan_enroll_events(filters: DataSyncSearchFilter):
-        try:
-            selection_condition = f"AND careplanEnrollment.CreatedAt between '{filters.StartDate}' AND '{filters.EndDate}'" if filters is not None else ''
-            rean_db_connector = get_reancare_db_connector()
-            query = f"""
+CAREPLAN_ENROLL_EVENTS = EventSyncSpec(
+    name="User Careplan Enrollment Events",
+    query="""
+            SELECT
+                careplanEnrollment.id,
+                careplanEnrollment.PatientUserId as UserId,
+                careplanEnrollment.EnrollmentId,
+                careplanEnrollment.ParticipantId,
+                careplanEnrollment.Provider,
+                careplanEnrollment.PlanCode,
+                careplanEnrollment.PlanName,
+                careplanEnrollment.StartDate,
+                careplanEnrollment.EndDate,
+                careplanEnrollment.IsActive,
+                careplanEnrollment.Name,
+                careplanEnrollment.HasHighRisk,
+                careplanEnrollment.Complication,
+                careplanEnrollment.ParticipantStringId,
+                careplanEnrollment.EnrollmentStringId,
+                careplanEnrollment.CreatedAt,
+                careplanEnrollment.UpdatedAt,
+                careplanEnrollment.DeletedAt,
+                user.id as UserId,
+                user.TenantId as TenantId,
+                user.CreatedAt as UserRegistrationDate
+            from careplan_enrollments as careplanEnrollment
+            JOIN users as user ON careplanEnrollment.PatientUserId = user.id
+            WHERE
+                user.IsTestUser = FALSE
+                {selection_condition}
+            """,
+    timestamp_column="careplanEnrollment.CreatedAt",
+    event_type=EventType.CareplanEnrollment,
+    event_category=EventCategory.Careplan,
+    event_subject=lambda row: EventSubject.CareplanEnrollment.value + '-' + row['PlanCode'],
+    resource_type="Careplan",
+    action_type="User-Action",
+    action_statement="User enrolled to careplan.",
+    attributes={
+        "PatientUserId": "UserId",
+        "Provider": "Provider",
+        "PlanName": "PlanName",
+        "PlanCode": "PlanCode",
+        "StartDate": "StartDate",
+        "EndDate": "EndDate",
+    },
+)
+
+CAREPLAN_COMPLETE_EVENTS = EventSyncSpec(
+    name="User Careplan Complete Events",
+    query="""
             SELECT
                 careplanEnrollment.id,
                 careplanEnrollment.PatientUserId as UserId,
@@ -45,97 +88,87 @@ class CareplanEventsSynchronizer:
             WHERE
                 user.IsTestUser = FALSE
                 {selection_condition}
-            """
-            rows = rean_db_connector.execute_read_query(query)
-            return rows
-        except Exception as error:
-            print("Error retrieving User Careplan Enrollment Events:", error)
-            return None
+            """,
+    timestamp_column="careplanEnrollment.EndDate",
+    event_type=EventType.CareplanComplete,
+    event_category=EventCategory.Careplan,
+    event_subject=EventSubject.CareplanEnrollment,
+    resource_type="careplan-enrollment",
+    action_type="User-Action",
+    action_statement="User completed the careplan.",
+    attributes={
+        "PatientUserId": "UserId",
+        "Provider": "Provider",
+        "PlanName": "PlanName",
+        "PlanCode": "PlanCode",
+        "StartDate": "StartDate",
+        "EndDate": "EndDate",
+        "StoppedAt": "DeletedAt",
+    },
+)
+
+CAREPLAN_STOP_EVENTS = EventSyncSpec(
+    name="User Careplan Stop Events",
+    query="""
+            SELECT
+                careplanEnrollment.id,
+                careplanEnrollment.PatientUserId as UserId,
+                careplanEnrollment.EnrollmentId,
+                careplanEnrollment.ParticipantId,
+                careplanEnrollment.Provider,
+                careplanEnrollment.PlanCode,
+                careplanEnrollment.PlanName,
+                careplanEnrollment.StartDate,
+                careplanEnrollment.EndDate,
+                careplanEnrollment.StoppedAt,
+                careplanEnrollment.IsActive,
+                careplanEnrollment.Name,
+                careplanEnrollment.HasHighRisk,
+                careplanEnrollment.Complication,
+                careplanEnrollment.ParticipantStringId,
+                careplanEnrollment.EnrollmentStringId,
+                careplanEnrollment.CreatedAt,
+                careplanEnrollment.UpdatedAt,
+                careplanEnrollment.DeletedAt,
+                user.id as UserId,
+                user.TenantId as TenantId,
+                user.CreatedAt as UserRegistrationDate
+            from careplan_enrollments as careplanEnrollment
+            JOIN users as user ON careplanEnrollment.PatientUserId = user.id
+            WHERE
+                user.IsTestUser = FALSE
+                AND
+                careplanEnrollment.StoppedAt IS NOT null;
+                {selection_condition}
+            """,
+    timestamp_column="careplanEnrollment.StoppedAt",
+    timestamp_field="CancelledAt",
+    event_type=EventType.CareplanStop,
+    event_category=EventCategory.Careplan,
+    event_subject=lambda row: EventSubject.CareplanStop.value + '-' + row['PlanCode'],
+    resource_type="careplan-stop",
+    action_type="User-Action",
+    action_statement="User stopped careplan.",
+    attributes={
+        "PatientUserId": "UserId",
+        "Provider": "Provider",
+        "PlanName": "PlanName",
+        "PlanCode": "PlanCode",
+        "StartDate": "StartedAt",
+        "EndDate": "EndDate",
+        "StoppedAt": "DeletedAt",
+    },
+)
 
-    @staticmethod
-    def add_analytics_careplan_enroll_event(careplan_enrollment):
-        try:
-            event_name = EventType.CareplanEnrollment.value
-            event_category = EventCategory.Careplan.value
-            event_subject = EventSubject.CareplanEnrollment.value + '-' + careplan_enrollment['PlanCode']
-            # user = DataSynchronizer.get_user(medication['UserId'])
-            # if not user:
-            #     print(f"User not found for the event: {medication}")
-            #     return None
-            attributes = {
-                'PatientUserId' : careplan_enrollment['UserId'],
-                'Provider'      : careplan_enrollment['Provider'],
-                'PlanName'      : careplan_enrollment['PlanName'],
-                'PlanCode'      : careplan_enrollment['PlanCode'],
-                'StartDate'     : careplan_enrollment['StartDate'],
-                'EndDate'       : careplan_enrollment['EndDate']
-                # 'EnrollmentId': careplan_enrollment['EnrollmentId'],
-                # 'ParticipantId': careplan_enrollment['ParticipantId'],
-                # 'Provider': careplan_enrollment['Provider'],
-                # 'PlanCode': careplan_enrollment['PlanCode'],
-                # 'PlanName': careplan_enrollment['PlanName'],
-                # 'StartDate': careplan_enrollment['StartDate'],
-                # 'EndDate': careplan_enrollment['EndDate'],
-                # 'IsActive': careplan_enrollment['IsActive'],
-                # 'Name': careplan_enrollment['Name'],
-                # 'HasHighRisk': careplan_enrollment['HasHighRisk'],
-                # 'Complication': careplan_enrollment['Complication'],
-                # 'ParticipantStringId': careplan_enrollment['ParticipantStringId'],
-                # 'EnrollmentStringId': careplan_enrollment['EnrollmentStringId'],
-            }
-            careplan_enrollment = {
-                'UserId': careplan_enrollment['UserId'],
-                'TenantId': careplan_enrollment['TenantId'],
-                'SessionId': None,
-                'ResourceId': careplan_enrollment['id'],
-                'ResourceType': "Careplan",
-                'SourceName': "ReanCare",
-                'SourceVersion': "Unknown",
-                'EventName': event_name,
-                'EventSubject': event_subject,
-                'EventCategory': event_category,
-                'ActionType': "User-Action",
-                'ActionStatement': "User enrolled to careplan.",
-                'Attributes': str(attributes),
-                'Timestamp': careplan_enrollment['CreatedAt'],
-                'UserRegistrationDate': careplan_enrollment['UserRegistrationDate']
-            }
-            new_event_added = DataSynchronizer.add_event(careplan_enrollment)
-            if not new_event_added:
-                print(f"Not inserted data.")
-                return None
-            else:
-                return new_event_added
-        except mysql.connector.Error as error:
-            print(f"Failed to insert records: {error}")
-            return None
+############################################################
+
+class CareplanEventsSynchronizer:
+
+    #region Careplan Enrollment events
 
     @staticmethod
     def sync_careplan_enroll_events(filters: DataSyncSearchFilter):
-        try:
-            existing_event_count = 0
-            synched_event_count = 0
-            event_not_synched = []
-            careplan_enrollments = CareplanEventsSynchronizer.get_reancare_careplan_enroll_events(filters)
-            if careplan_enrollments:
-                for careplan_enrollment in careplan_enrollments:
-                    existing_event = DataSynchronizer.get_existing_event(
-                        careplan_enrollment['UserId'], careplan_enrollment['id'], EventType.CareplanEnrollment)
-                    if existing_event is not None:
-                        existing_event_count += 1
-                    else:
-                        new_event = CareplanEventsSynchronizer.add_analytics_careplan_enroll_event(careplan_enrollment)
-                        if new_event:
-                            synched_event_count += 1
-                        else:
-                            event_not_synched.append(careplan_enrollment)
-                print(f"Existing Event Count: {existing_event_count}")
-                print(f"Synched Event Count: {synched_event_count}")
-                print(f"Event Not Synched: {event_not_synched}")
-            else:
-                print(f"No User Careplan Enrollment Events found.")
-        except Exception as error:
-            print(f"Error syncing User Careplan Enrollment Events: {error}")
+        return SyncEngine.sync(CAREPLAN_ENROLL_EVENTS, filters)
 
     #endregion
 
@@ -144,7 +177,7 @@ class CareplanEventsSynchronizer:
     # @staticmethod
     # def get_reancare_careplan_start_events(filters: DataSyncSearchFilter):
     #     try:
-    #         selection_condition = f"AND careplanEnrollment.StartDate between '{filters.StartDate}' AND '{filters.EndDate}'" if filters is not None else ''
+    #         selection_condition = DataSynchronizer.get_selection_condition(filters, "careplanEnrollment.StartDate")
     #         rean_db_connector = get_reancare_db_connector()
     #         query = f"""
     #         SELECT
@@ -263,131 +296,9 @@ class CareplanEventsSynchronizer:
     #endregion
     #region Complete Assessment events
 
-    @staticmethod
-    def get_reancare_careplan_complete_events(filters: DataSyncSearchFilter):
-        try:
-            selection_condition = f"AND careplanEnrollment.EndDate between '{filters.StartDate}' AND '{filters.EndDate}'" if filters is not None else ''
-            rean_db_connector = get_reancare_db_connector()
-            query = f"""
-            SELECT
-                careplanEnrollment.id,
-                careplanEnrollment.PatientUserId as UserId,
-                careplanEnrollment.EnrollmentId,
-                careplanEnrollment.ParticipantId,
-                careplanEnrollment.Provider,
-                careplanEnrollment.PlanCode,
-                careplanEnrollment.PlanName,
-                careplanEnrollment.StartDate,
-                careplanEnrollment.EndDate,
-                careplanEnrollment.IsActive,
-                careplanEnrollment.Name,
-                careplanEnrollment.HasHighRisk,
-                careplanEnrollment.Complication,
-                careplanEnrollment.ParticipantStringId,
-                careplanEnrollment.EnrollmentStringId,
-                careplanEnrollment.CreatedAt,
-                careplanEnrollment.UpdatedAt,
-                careplanEnrollment.DeletedAt,
-                user.id as UserId,
-                user.TenantId as TenantId,
-                user.CreatedAt as UserRegistrationDate
-            from careplan_enrollments as careplanEnrollment
-            JOIN users as user ON careplanEnrollment.PatientUserId = user.id
-            WHERE
-                user.IsTestUser = FALSE
-                {selection_condition}
-            """
-            rows = rean_db_connector.execute_read_query(query)
-            return rows
-        except Exception as error:
-            print("Error retrieving User Assessment Complete Events:", error)
-            return None
-
-    @staticmethod
-    def add_analytics_careplan_complete_event(careplan_enrollment):
-        try:
-            event_name = EventType.CareplanComplete.value
-            event_category = EventCategory.Careplan.value
-            event_subject = EventSubject.CareplanEnrollment.value
-            # user = DataSynchronizer.get_user(medication['UserId'])
-            # if not user:
-            #     print(f"User not found for the event: {medication}")
-            #     return None
-            attributes = {
-                'PatientUserId' : careplan_enrollment['UserId'],
-                'Provider'      : careplan_enrollment['Provider'],
-                'PlanName'      : careplan_enrollment['PlanName'],
-                'PlanCode'      : careplan_enrollment['PlanCode'],
-                'StartDate'     : careplan_enrollment['StartDate'],
-                'EndDate'       : careplan_enrollment['EndDate'],
-                'StoppedAt'     : careplan_enrollment['DeletedAt'],
-                # 'EnrollmentId': careplan_enrollment['EnrollmentId'],
-                # 'ParticipantId': careplan_enrollment['ParticipantId'],
-                # 'Provider': careplan_enrollment['Provider'],
-                # 'PlanCode': careplan_enrollment['PlanCode'],
-                # 'PlanName': careplan_enrollment['PlanName'],
-                # 'StartDate': careplan_enrollment['StartDate'],
-                # 'EndDate': careplan_enrollment['EndDate'],
-                # 'IsActive': careplan_enrollment['IsActive'],
-                # 'Name': careplan_enrollment['Name'],
-                # 'HasHighRisk': careplan_enrollment['HasHighRisk'],
-                # 'Complication': careplan_enrollment['Complication'],
-                # 'ParticipantStringId': careplan_enrollment['ParticipantStringId'],
-                # 'EnrollmentStringId': careplan_enrollment['EnrollmentStringId']
-            }
-            careplan_enrollment = {
-                'UserId': careplan_enrollment['UserId'],
-                'TenantId': careplan_enrollment['TenantId'],
-                'SessionId': None,
-                'ResourceId': careplan_enrollment['id'],
-                'ResourceType': "careplan-enrollment",
-                'SourceName': "ReanCare",
-                'SourceVersion': "Unknown",
-                'EventName': event_name,
-                'EventSubject': event_subject,
-                'EventCategory': event_category,
-                'ActionType': "User-Action",
-                'ActionStatement': "User completed the careplan.",
-                'Attributes': str(attributes),
-                'Timestamp': careplan_enrollment['EndDate'],
-                'UserRegistrationDate': careplan_enrollment['UserRegistrationDate']
-            }
-            new_event_added = DataSynchronizer.add_event(careplan_enrollment)
-            if not new_event_added:
-                print(f"Not inserted data.")
-                return None
-            else:
-                return new_event_added
-        except mysql.connector.Error as error:
-            print(f"Failed to insert event: {error}")
-            return None
-
     @staticmethod
     def sync_careplan_complete_events(filters: DataSyncSearchFilter):
-        try:
-            existing_event_count = 0
-            synched_event_count = 0
-            event_not_synched = []
-            careplan_enrollments = CareplanEventsSynchronizer.get_reancare_careplan_complete_events(filters)
-            if careplan_enrollments:
-                for careplan_enrollment in careplan_enrollments:
-                    existing_event = DataSynchronizer.get_existing_event(
-                        careplan_enrollment['UserId'], careplan_enrollment['id'], EventType.CareplanComplete)
-                    if existing_event is not None:
-                        existing_event_count += 1
-                    else:
-                        new_event = CareplanEventsSynchronizer.add_analytics_careplan_complete_event(careplan_enrollment)
-                        if new_event:
-                            synched_event_count += 1
-                        else:
-                            event_not_synched.append(careplan_enrollment)
-                print(f"Existing Event Count: {existing_event_count}")
-                print(f"Synched Event Count: {synched_event_count}")
-                print(f"Event Not Synched: {event_not_synched}")
-            else:
-                print(f"No User Careplan Complete Events found.")
-        except Exception as error:
-            print(f"Error syncing User Careplan Complete Events: {error}")
+        return SyncEngine.sync(CAREPLAN_COMPLETE_EVENTS, filters)
 
     #endregion
 
@@ -396,7 +307,7 @@ class CareplanEventsSynchronizer:
     # @staticmethod
     # def get_reancare_careplan_task_start_events(filters: DataSyncSearchFilter):
     #     try:
-    #         selection_condition = f"AND user_task.StartedAt between '{filters.StartDate}' AND '{filters.EndDate}'" if filters is not None else ''
+    #         selection_condition = DataSynchronizer.get_selection_condition(filters, "user_task.StartedAt")
     #         rean_db_connector = get_reancare_db_connector()
     #         query = f"""
     #         select 
@@ -538,7 +449,7 @@ class CareplanEventsSynchronizer:
     # @staticmethod
     # def get_reancare_careplan_task_complete_events(filters: DataSyncSearchFilter):
     #     try:
-    #         selection_condition = f"AND user_task.FinishedAt between '{filters.StartDate}' AND '{filters.EndDate}'" if filters is not None else ''
+    #         selection_condition = DataSynchronizer.get_selection_condition(filters, "user_task.FinishedAt")
     #         rean_db_connector = get_reancare_db_connector()
     #         query = f"""
     #         select 
@@ -680,7 +591,7 @@ class CareplanEventsSynchronizer:
     # @staticmethod
     # def get_reancare_careplan_task_cancel_events(filters: DataSyncSearchFilter):
     #     try:
-    #         selection_condition = f"AND user_task.CancelledAt between '{filters.StartDate}' AND '{filters.EndDate}'" if filters is not None else ''
+    #         selection_condition = DataSynchronizer.get_selection_condition(filters, "user_task.CancelledAt")
     #         rean_db_connector = get_reancare_db_connector()
     #         query = f"""
     #         select 
@@ -819,141 +730,7 @@ class CareplanEventsSynchronizer:
 
     #endregion
 
-    @staticmethod
-    def get_reancare_careplan_stop_events(filters: DataSyncSearchFilter):
-        try:
-            selection_condition = f"AND careplanEnrollment.StoppedAt between '{filters.StartDate}' AND '{filters.EndDate}'" if filters is not None else ''
-            rean_db_connector = get_reancare_db_connector()
-            query = f"""
-            SELECT
-                careplanEnrollment.id,
-                careplanEnrollment.PatientUserId as UserId,
-                careplanEnrollment.EnrollmentId,
-                careplanEnrollment.ParticipantId,
-                careplanEnrollment.Provider,
-                careplanEnrollment.PlanCode,
-                careplanEnrollment.PlanName,
-                careplanEnrollment.StartDate,
-                careplanEnrollment.EndDate,
-                careplanEnrollment.StoppedAt,
-                careplanEnrollment.IsActive,
-                careplanEnrollment.Name,
-                careplanEnrollment.HasHighRisk,
-                careplanEnrollment.Complication,
-                careplanEnrollment.ParticipantStringId,
-                careplanEnrollment.EnrollmentStringId,
-                careplanEnrollment.CreatedAt,
-                careplanEnrollment.UpdatedAt,
-                careplanEnrollment.DeletedAt,
-                user.id as UserId,
-                user.TenantId as TenantId,
-                user.CreatedAt as UserRegistrationDate
-            from careplan_enrollments as careplanEnrollment
-            JOIN users as user ON careplanEnrollment.PatientUserId = user.id
-            WHERE
-                user.IsTestUser = FALSE
-                AND
-                careplanEnrollment.StoppedAt IS NOT null;
-                {selection_condition}
-            """
-            rows = rean_db_connector.execute_read_query(query)
-            return rows
-        except Exception as error:
-            print("Error retrieving User Careplan Stop Events:", error)
-            return None
-
-    @staticmethod
-    def add_analytics_careplan_stop_event(careplan_enrollment):
-        try:
-            event_name = EventType.CareplanStop.value
-            event_category = EventCategory.Careplan.value
-            event_subject = EventSubject.CareplanStop.value + '-' + careplan_enrollment['PlanCode'],
-            # user = DataSynchronizer.get_user(medication['UserId'])
-            # if not user:
-            #     print(f"User not found for the event: {medication}")
-            #     return None
-            attributes = {
-                'PatientUserId' : careplan_enrollment['UserId'],
-                'Provider'      : careplan_enrollment['Provider'],
-                'PlanName'      : careplan_enrollment['PlanName'],
-                'PlanCode'      : careplan_enrollment['PlanCode'],
-                'StartDate'     : careplan_enrollment['StartedAt'],
-                'EndDate'       : careplan_enrollment['EndDate'],
-                'StoppedAt'     : careplan_enrollment['DeletedAt']
-                # 'UserTaskId': careplan_task['UserTaskId'],
-                # 'ProviderActionId': careplan_task['ProviderActionId'],
-                # 'EnrollmentId': careplan_task['EnrollmentId'],
-                # 'Provider': careplan_task['Provider'],
-                # 'PlanName': careplan_task['PlanName'],
-                # 'PlanCode': careplan_task['PlanCode'],
-                # 'Type': careplan_task['Type'],
-                # 'Category': careplan_task['Category'],
-                #  'Title': careplan_task['Title'],
-                # 'Description': careplan_task['Description'],
-                # 'Transcription': careplan_task['Transcription'],
-                # 'Url': careplan_task['Url'],
-                # 'Language': careplan_task['Language'],
-                # 'ScheduledAt': careplan_task['ScheduledAt'],
-                # 'StartedAt': careplan_task['StartedAt'],
-                # 'FinishedAt': careplan_task['FinishedAt'],
-                # 'CancelledAt': careplan_task['CancelledAt'],
-                # 'Sequence': careplan_task['Sequence'],
-                # 'Frequency': careplan_task['Frequency'],
-                # 'Status': careplan_task['Status'],
-                # 'UserResponse': careplan_task['UserResponse'],
-                # 'RawContent': careplan_task['RawContent'],
-            }
-            careplan_enrollment = {
-                'UserId': careplan_enrollment['UserId'],
-                'TenantId': careplan_enrollment['TenantId'],
-                'SessionId': None,
-                'ResourceId': careplan_enrollment['id'],
-                'ResourceType': "careplan-stop",
-                'SourceName': "ReanCare",
-                'SourceVersion': "Unknown",
-                'EventName': event_name,
-                'EventSubject': event_subject,
-                'EventCategory': event_category,
-                'ActionType': "User-Action",
-                'ActionStatement': "User stopped careplan.",
-                'Attributes': str(attributes),
-                'Timestamp': careplan_enrollment['CancelledAt'],
-                'UserRegistrationDate': careplan_enrollment['UserRegistrationDate']
-            }
-            new_event_added = DataSynchronizer.add_event(careplan_enrollment)
-            if not new_event_added:
-                print(f"Not inserted data.")
-                return None
-            else:
-                return new_event_added
-        except mysql.connector.Error as error:
-            print(f"Failed to insert records: {error}")
-            return None
-        
     @staticmethod
     def sync_careplan_stop_events(filters: DataSyncSearchFilter):
-        try:
-            existing_event_count = 0
-            synched_event_count = 0
-            event_not_synched = []
-            careplan_tasks = CareplanEventsSynchronizer.get_reancare_careplan_stop_events(filters)
-            if careplan_tasks:
-                for careplan_task in careplan_tasks:
-                    existing_event = DataSynchronizer.get_existing_event(
-                        careplan_task['UserId'], careplan_task['id'], EventType.CareplanStop)
-                    if existing_event is not None:
-                        existing_event_count += 1
-                    else:
-                        new_event = CareplanEventsSynchronizer.add_analytics_careplan_stop_event(careplan_task)
-                        if new_event:
-                            synched_event_count += 1
-                        else:
-                            event_not_synched.append(careplan_task)
-                print(f"Existing Event Count: {existing_event_count}")
-                print(f"Synched Event Count: {synched_event_count}")
-                print(f"Event Not Synched: {event_not_synched}")
-            else:
-                print(f"No User Careplan Stop Events found.")
-        except Exception as error:
-            print(f"Error syncing User Careplan Stop Events: {error}")
+        return SyncEngine.sync(CAREPLAN_STOP_EVENTS, filters)
 
@@ -1,5 +1,7 @@
 from app.config.config import get_settings
+from app.database.async_db_connector import AsyncDatabaseConnector
 from app.database.db_connector import DatabaseConnector
+from app.database.query_cache import analytics_query_cache
 
 ############################################################
 
@@ -12,26 +14,111 @@ print(
     f"port={settings.REANCARE_DB_PORT} db={settings.REANCARE_DB_NAME}"
 )
 
+_pool_settings = {
+    "pool_min_size"             : settings.DB_CONNECTOR_POOL_MIN_SIZE,
+    "pool_max_size"             : settings.DB_CONNECTOR_POOL_MAX_SIZE,
+    "pool_recycle"              : settings.DB_CONNECTOR_POOL_RECYCLE,
+    "pool_timeout"              : settings.DB_CONNECTOR_POOL_TIMEOUT,
+    "pool_health_check_interval": settings.DB_CONNECTOR_POOL_HEALTH_CHECK_INTERVAL,
+}
+
+_replica_settings = {
+    "replica_max_lag_seconds"      : settings.DB_REPLICA_MAX_LAG_SECONDS,
+    "replica_health_check_interval": settings.DB_REPLICA_HEALTH_CHECK_INTERVAL,
+}
+
+def parse_replica_hosts(hosts: str) -> list:
+    """Parses a comma-separated "host[:port]" list into (host, port) pairs."""
+    replicas = []
+    for item in (hosts or "").split(","):
+        item = item.strip()
+        if len(item) == 0:
+            continue
+        host, _, port = item.partition(":")
+        replicas.append((host.strip(), int(port) if port.strip() else None))
+    return replicas
+
+# Report queries are cached in front of both databases; ReanCare data changes
+# outside this service, so only a (shorter) TTL bounds its staleness.
+_result_cache = analytics_query_cache if settings.ANALYTICS_QUERY_CACHE_ENABLED else None
+
+# Connectors are stateless apart from their (process-wide) connection pools,
+# so a single instance per database is shared by every caller.
+_reancare_db_connector = None
+_analytics_db_connector = None
+_analytics_replica_db_connector = None
+_async_reancare_db_connector = None
+_async_analytics_db_connector = None
+
 ############################################################
 
 def get_reancare_db_connector():
-    return DatabaseConnector(
-        settings.REANCARE_DB_HOST,
-        settings.REANCARE_DB_USER_NAME,
-        settings.REANCARE_DB_USER_PASSWORD,
-        settings.REANCARE_DB_NAME,
-        port=settings.REANCARE_DB_PORT,
-        dialect=settings.REANCARE_DB_DIALECT,
-        driver=settings.REANCARE_DB_DRIVER)
+    global _reancare_db_connector
+    if _reancare_db_connector is None:
+        _reancare_db_connector = DatabaseConnector(
+            settings.REANCARE_DB_HOST,
+            settings.REANCARE_DB_USER_NAME,
+            settings.REANCARE_DB_USER_PASSWORD,
+            settings.REANCARE_DB_NAME,
+            port=settings.REANCARE_DB_PORT,
+            dialect=settings.REANCARE_DB_DIALECT,
+            driver=settings.REANCARE_DB_DRIVER,
+            replica_hosts=parse_replica_hosts(settings.REANCARE_DB_REPLICA_HOSTS),
+            **_pool_settings,
+            **_replica_settings)
+    return _reancare_db_connector
 
 def get_analytics_db_connector():
-    return DatabaseConnector(
-        settings.DB_HOST,
-        settings.DB_USER_NAME,
-        settings.DB_USER_PASSWORD,
-        settings.DB_NAME,
-        port=settings.DB_PORT,
-        dialect=settings.DB_DIALECT,
-        driver=settings.DB_DRIVER)
+    global _analytics_db_connector
+    if _analytics_db_connector is None:
+        _analytics_db_connector = DatabaseConnector(
+            settings.DB_HOST,
+            settings.DB_USER_NAME,
+            settings.DB_USER_PASSWORD,
+            settings.DB_NAME,
+            port=settings.DB_PORT,
+            dialect=settings.DB_DIALECT,
+            driver=settings.DB_DRIVER,
+            **_pool_settings)
+    return _analytics_db_connector
+
+def get_analytics_replica_db_connector():
+    """
+    Analytics DB connector whose read-only queries go to the read replicas.
+    Only for the analytics reports: sync and ingestion must read their own
+    writes, so they use the primary-only `get_analytics_db_connector`.
+    """
+    global _analytics_replica_db_connector
+    if _analytics_replica_db_connector is None:
+        _analytics_replica_db_connector = DatabaseConnector(
+            settings.DB_HOST,
+            settings.DB_USER_NAME,
+            settings.DB_USER_PASSWORD,
+            settings.DB_NAME,
+            port=settings.DB_PORT,
+            dialect=settings.DB_DIALECT,
+            driver=settings.DB_DRIVER,
+            replica_hosts=parse_replica_hosts(settings.DB_REPLICA_HOSTS),
+            **_pool_settings,
+            **_replica_settings)
+    return _analytics_replica_db_connector
+
+def get_async_reancare_db_connector():
+    global _async_reancare_db_connector
+    if _async_reancare_db_connector is None:
+        _async_reancare_db_connector = AsyncDatabaseConnector(
+            get_reancare_db_connector(),
+            result_cache=_result_cache,
+            cache_ttl=settings.REANCARE_QUERY_CACHE_TTL)
+    return _async_reancare_db_connector
+
+def get_async_analytics_db_connector():
+    global _async_analytics_db_connector
+    if _async_analytics_db_connector is None:
+        _async_analytics_db_connector = AsyncDatabaseConnector(
+            get_analytics_replica_db_connector(),
+            result_cache=_result_cache,
+            cache_ttl=settings.ANALYTICS_QUERY_CACHE_TTL)
+    return _async_analytics_db_connector
 
     #endregion
@@ -1,16 +1,104 @@
 
+import contextvars
 import os
+import time
 import uuid
-from app.common.cache import LocalMemoryCache
+from app.common.cache import LocalMemoryCache, LruTtlCache
 from app.database.db_connector import DatabaseConnector
+from app.database.query_cache import invalidate_tenants
+from app.modules.data_sync.sync_state import (
+    record_sync_error,
+    record_sync_extract,
+    record_sync_load,
+    record_sync_rows,
+)
 import mysql.connector
 
+from app.config.config import get_settings
 from app.domain_types.enums.event_types import EventType
+from app.domain_types.schemas.data_sync import DataSyncSearchFilter, IncrementalSyncFilter
 from app.domain_types.schemas.event import EventCreateModel
 from app.modules.data_sync.connectors import get_analytics_db_connector, get_reancare_db_connector
 
 ############################################################
 
+settings = get_settings()
+
+# Events queued by `add_event` while a keyset page is processed (see
+# DataSynchronizer.start_event_batch); None when events are written directly.
+_event_batch = contextvars.ContextVar("event_batch", default=None)
+
+# Analytics user fields kept in the user lookup cache
+USER_LOOKUP_FIELDS = ('id', 'TenantId', 'RoleId', 'RegistrationDate')
+
+# Cached for a user or tenant that was not found, so an unknown id is not
+# looked up again on every event until the entry expires
+_NOT_FOUND = object()
+
+USER_INSERT_QUERY = """
+    INSERT INTO users (
+        id,
+        TenantId,
+        RoleId,
+        OnboardingSource,
+        RegistrationDate,
+        TimezoneOffsetMin,
+        DeletedAt
+    ) VALUES (
+    %s, %s, %s, %s, %s, %s, %s
+    )
+"""
+
+USER_METADATA_INSERT_QUERY = """
+    INSERT INTO user_metadata (
+        UserId,
+        BirthDate,
+        Gender,
+        LocationLongitude,
+        LocationLatitude,
+        OnboardingSource,
+        Role,
+        Attributes,
+        Ethnicity,
+        Race,
+        HealthSystem,
+        Hospital,
+        IsCareGiver,
+        MajorDiagnosis,
+        Smoker,
+        Alcoholic,
+        SubstanceAbuser
+    ) VALUES (
+    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+    )
+"""
+
+EVENT_INSERT_QUERY = """
+    INSERT INTO events (
+        id,
+        UserId,
+        TenantId,
+        SessionId,
+        ResourceId,
+        ResourceType,
+        SourceName,
+        SourceVersion,
+        EventName,
+        EventSubject,
+        EventCategory,
+        ActionType,
+        ActionStatement,
+        Attributes,
+        Timestamp,
+        DaysSinceRegistration,
+        TimeOffsetSinceRegistration
+    ) VALUES (
+    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+    )
+"""
+
+############################################################
+
 def to_bool(value):
     if value is None:
         return None
@@ -18,12 +106,30 @@ def to_bool(value):
         return value.strip().lower() not in ("", "0", "false")
     return bool(value)
 
+def sum_rowcounts(rowcounts):
+    if rowcounts is None:
+        return 0
+    return sum(count for count in rowcounts if count is not None and count > 0)
+
+def format_sync_timestamp(value) -> str:
+    return value.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+def get_event_insert_query(is_postgres: bool) -> str:
+    """
+    Idempotent EVENT_INSERT_QUERY: a ReanCare event that is already present
+    (see the uq_events_reancare_key index) is skipped instead of duplicated,
+    and does not count in the returned rowcount.
+    """
+    if is_postgres:
+        return EVENT_INSERT_QUERY.rstrip() + "\n    ON CONFLICT DO NOTHING\n"
+    return EVENT_INSERT_QUERY.replace("INSERT INTO", "INSERT IGNORE INTO", 1)
+
 ############################################################
 
 class DataSynchronizer:
 
-    _tenant_cache = LocalMemoryCache()
-    _user_cache = LocalMemoryCache()
+    _tenant_cache = LruTtlCache(settings.SYNC_LOOKUP_CACHE_MAX_ENTRIES, settings.SYNC_LOOKUP_CACHE_TTL)
+    _user_cache = LruTtlCache(settings.SYNC_LOOKUP_CACHE_MAX_ENTRIES, settings.SYNC_LOOKUP_CACHE_TTL)
     _api_keys_cache = LocalMemoryCache()
     _role_type_cache = LocalMemoryCache()
 
@@ -91,6 +197,40 @@ class DataSynchronizer:
             print("Error retrieving API keys:", error)
             return None
 
+    @staticmethod
+    def preload_users(user_ids):
+        """
+        Set-based variant of `get_user` for the analytics side: warms the
+        user lookup cache for the given ids that are not cached yet, with one
+        lookup per SYNC_BATCH_SIZE ids, and returns the ids that are not in
+        the analytics users table. Those are not cached as missing, since
+        `get_user` (or sync_users) may still add them from ReanCare. The
+        databases are separate, so the difference is taken here rather than
+        in SQL.
+        """
+        missing = []
+        uncached_ids = [
+            user_id for user_id in dict.fromkeys(user_ids)
+            if DataSynchronizer._user_cache.peek(user_id) in (None, _NOT_FOUND)
+        ]
+        analytics_db_connector = get_analytics_db_connector()
+        batch_size = max(1, settings.SYNC_BATCH_SIZE)
+        for start in range(0, len(uncached_ids), batch_size):
+            batch = uncached_ids[start:start + batch_size]
+            query = f"""
+            SELECT {', '.join(USER_LOOKUP_FIELDS)} from users
+            WHERE
+                id IN ({', '.join(['%s'] * len(batch))})
+            """
+            rows = analytics_db_connector.execute_read_query(query, tuple(batch), compact=True)
+            if rows is None:
+                raise Exception("Failed to look up existing users.")
+            for row in rows:
+                DataSynchronizer.cache_user(row)
+            existing = {row['id'] for row in rows}
+            missing.extend(user_id for user_id in batch if user_id not in existing)
+        return missing
+
     @staticmethod
     def get_reancare_user_role(user_id):
         try:
@@ -100,7 +240,7 @@ class DataSynchronizer:
             WHERE
                 id = '{user_id}'
             """
-            rows = rean_db_connector.execute_read_query(query)
+            rows = rean_db_connector.execute_read_query(query, compact=True)
             if len(rows) > 0:
                 role_id = rows[0]['RoleId']
                 role = DataSynchronizer._role_type_cache.get(role_id)
@@ -169,7 +309,7 @@ class DataSynchronizer:
                 """
             # KK: Removing 'user.DeletedAt IS null' from where clause to fetch deleted users
 
-            rows = rean_db_connector.execute_read_query(query)
+            rows = rean_db_connector.execute_read_query(query, compact=True)
             if len(rows) > 0:
                 user = rows[0]
             else:
@@ -178,43 +318,107 @@ class DataSynchronizer:
             print(f"Failed to fetch records: {e}")
         return user
 
+    @staticmethod
+    def get_reancare_users(user_ids):
+        """
+        Batched variant of `get_reancare_user`: one query for the patients
+        among `user_ids` (joined with their health profile and patient record;
+        patients without them are left out) and one for the other users.
+        Users whose role is not known are left out as well.
+        """
+        if len(user_ids) == 0:
+            return []
+        roles = DataSynchronizer._role_type_cache.values()
+        if len(roles) == 0:
+            # Not populated in worker processes (see startup)
+            DataSynchronizer.populate_role_type_cache()
+            roles = DataSynchronizer._role_type_cache.values()
+        patient_role_ids = [role['id'] for role in roles if role['RoleName'] == "Patient"]
+        other_role_ids = [role['id'] for role in roles if role['RoleName'] != "Patient"]
+        rean_db_connector = get_reancare_db_connector()
+        user_placeholders = ', '.join(['%s'] * len(user_ids))
+        users = []
+        if len(patient_role_ids) > 0:
+            query = f"""
+            SELECT
+                user.id,
+                user.TenantId,
+                person.BirthDate,
+                person.Gender,
+                user.RoleId,
+                user.CurrentTimeZone,
+                user.CreatedAt,
+                health_profile.Race,
+                health_profile.Ethnicity,
+                health_profile.MajorAilment,
+                health_profile.IsSmoker,
+                health_profile.IsDrinker,
+                health_profile.SubstanceAbuse,
+                health_profile.StrokeSurvivorOrCaregiver,
+                patient.HealthSystem,
+                patient.AssociatedHospital,
+                user.DeletedAt
+            from users as user
+            JOIN persons as person ON user.PersonId = person.id
+            JOIN patient_health_profiles as health_profile ON user.id = health_profile.PatientUserId
+            JOIN patients as patient ON user.id = patient.UserId
+            WHERE
+                user.IsTestUser = FALSE
+                AND
+                user.RoleId IN ({', '.join(['%s'] * len(patient_role_ids))})
+                AND
+                user.id IN ({user_placeholders})
+            """
+            rows = rean_db_connector.execute_read_query(
+                query, tuple(patient_role_ids + list(user_ids)), compact=True)
+            if rows is None:
+                raise Exception("Failed to read patient users.")
+            users.extend(rows)
+        if len(other_role_ids) > 0:
+            query = f"""
+            SELECT
+                user.id,
+                user.TenantId,
+                person.BirthDate,
+                person.Gender,
+                user.RoleId,
+                user.CurrentTimeZone,
+                user.CreatedAt,
+                user.DeletedAt
+            from users as user
+            JOIN persons as person ON user.PersonId = person.id
+            WHERE
+                user.IsTestUser = FALSE
+                AND
+                user.RoleId IN ({', '.join(['%s'] * len(other_role_ids))})
+                AND
+                user.id IN ({user_placeholders})
+            """
+            rows = rean_db_connector.execute_read_query(
+                query, tuple(other_role_ids + list(user_ids)), compact=True)
+            if rows is None:
+                raise Exception("Failed to read users.")
+            users.extend(rows)
+        # A user with several health profiles is joined more than once; like
+        # `get_reancare_user`, keep the first row
+        unique = {}
+        for user in users:
+            unique.setdefault(user['id'], user)
+        return list(unique.values())
+
     @staticmethod
     def add_analytics_user_record(user_id, user):
         try:
             analytics_db_connector = get_analytics_db_connector()
-            insert_query = """
-            INSERT INTO users (
-                id,
-                TenantId,
-                RoleId,
-                OnboardingSource,
-                RegistrationDate,
-                TimezoneOffsetMin,
-                DeletedAt
-            ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s
-            )
-            """
-            timezoneOffsetMin = 0
-            timezone = user['CurrentTimeZone']
-            if timezone is not None:
-                timezoneOffsetMin = int(timezone.split(":")[0]) * 60 + int(timezone.split(":")[1])
-            deleted_at = None if user['DeletedAt'] is None else user['DeletedAt']
-            row = (
-                user['id'],
-                user['TenantId'],
-                user['RoleId'],
-                "ReanCare",
-                user['CreatedAt'],
-                timezoneOffsetMin,
-                deleted_at
-            )
-            result = analytics_db_connector.execute_write_query(insert_query, row)
+            row = DataSynchronizer.get_analytics_user_row(user)
+            result = analytics_db_connector.execute_write_query(USER_INSERT_QUERY, row)
             if result is None:
                 print(f"Not inserted data {row}.")
                 return None
             else:
                 # print(f"Inserted row into the users table.")
+                DataSynchronizer._user_cache.delete(user_id)
+                invalidate_tenants([user['TenantId']])
                 return result
         except mysql.connector.Error as error:
             print(f"Failed to insert records: {error}")
@@ -224,61 +428,58 @@ class DataSynchronizer:
             return None
 
     @staticmethod
-    def add_analytics_user_metadata(user):
+    def add_analytics_user_records(users):
+        """
+        Batched variant of `add_analytics_user_record`. Returns the number of
+        rows inserted.
+        """
         try:
+            if len(users) == 0:
+                return 0
             analytics_db_connector = get_analytics_db_connector()
-            insert_query = """
-            INSERT INTO user_metadata (
-                UserId,
-                BirthDate,
-                Gender,
-                LocationLongitude,
-                LocationLatitude,
-                OnboardingSource,
-                Role,
-                Attributes,
-                Ethnicity,
-                Race,
-                HealthSystem,
-                Hospital,
-                IsCareGiver,
-                MajorDiagnosis,
-                Smoker,
-                Alcoholic,
-                SubstanceAbuser
-            ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-            )
-            """
+            rows = [DataSynchronizer.get_analytics_user_row(user) for user in users]
+            rowcounts = analytics_db_connector.execute_batch_write(
+                USER_INSERT_QUERY, rows, batch_size=settings.SYNC_BATCH_SIZE)
+            inserted = sum_rowcounts(rowcounts)
+            if inserted > 0:
+                for user in users:
+                    DataSynchronizer._user_cache.delete(user['id'])
+                invalidate_tenants({user['TenantId'] for user in users})
+            return inserted
+        except Exception as error:
+            print(f"Failed to insert records: {error}")
+            return 0
+
+    @staticmethod
+    def get_analytics_user_row(user):
+        timezoneOffsetMin = 0
+        timezone = user['CurrentTimeZone']
+        if timezone is not None:
+            timezoneOffsetMin = int(timezone.split(":")[0]) * 60 + int(timezone.split(":")[1])
+        deleted_at = None if user['DeletedAt'] is None else user['DeletedAt']
+        return (
+            user['id'],
+            user['TenantId'],
+            user['RoleId'],
+            "ReanCare",
+            user['CreatedAt'],
+            timezoneOffsetMin,
+            deleted_at
+        )
 
-            role_name = "Patient"
-            role = DataSynchronizer._role_type_cache.get(user["RoleId"])
-            if role is not None:
-                role_name = role['RoleName']
-
-                row = (
-                    user['id'],
-                    user['BirthDate'],
-                    user['Gender'],
-                    0.0,
-                    0.0,
-                    "ReanCare",
-                    role_name,
-                    "{}",
-                    user["Ethnicity"] if user.get('Ethnicity') is not None else None,
-                    user["Race"] if user.get('Race') is not None else None,
-                    user["HealthSystem"] if user.get('HealthSystem') is not None else None,
-                    user["AssociatedHospital"] if user.get('AssociatedHospital') is not None else None,
-                    True if user.get('StrokeSurvivorOrCaregiver') == 'Caregiver' else False,
-                    user["MajorAilment"] if user.get('MajorAilment') is not None else None,
-                    to_bool(user.get('IsSmoker')),
-                    to_bool(user.get('IsDrinker')),
-                    to_bool(user.get('SubstanceAbuse'))
-                )
-            row_count = analytics_db_connector.execute_write_query(insert_query, row)
+    @staticmethod
+    def add_analytics_user_metadata(user):
+        try:
+            analytics_db_connector = get_analytics_db_connector()
+            row = DataSynchronizer.get_analytics_user_metadata_row(user)
+            if row is None:
+                print(f"Role not found for the user {user['id']}, metadata not inserted.")
+                return None
+            row_count = analytics_db_connector.execute_write_query(USER_METADATA_INSERT_QUERY, row)
             if row_count is None:
                 print(f"Not inserted metadata {row}.")
                 return None
+            invalidate_tenants([user.get('TenantId')])
             return row_count
         except mysql.connector.Error as error:
             print(f"Failed to insert records: {error}")
@@ -287,6 +488,57 @@ class DataSynchronizer:
             print(f"Failed to insert records: {error}")
             return None
 
+    @staticmethod
+    def add_analytics_users_metadata(users):
+        """
+        Batched variant of `add_analytics_user_metadata`. Users whose role is
+        not known are skipped. Returns the number of rows inserted.
+        """
+        try:
+            rows = []
+            for user in users:
+                row = DataSynchronizer.get_analytics_user_metadata_row(user)
+                if row is not None:
+                    rows.append(row)
+            if len(rows) == 0:
+                return 0
+            analytics_db_connector = get_analytics_db_connector()
+            rowcounts = analytics_db_connector.execute_batch_write(
+                USER_METADATA_INSERT_QUERY, rows, batch_size=settings.SYNC_BATCH_SIZE)
+            inserted = sum_rowcounts(rowcounts)
+            if inserted > 0:
+                invalidate_tenants({user.get('TenantId') for user in users})
+            return inserted
+        except Exception as error:
+            print(f"Failed to insert records: {error}")
+            return 0
+
+    @staticmethod
+    def get_analytics_user_metadata_row(user):
+        role = DataSynchronizer._role_type_cache.get(user["RoleId"])
+        if role is None:
+            return None
+        role_name = role['RoleName']
+        return (
+            user['id'],
+            user['BirthDate'],
+            user['Gender'],
+            0.0,
+            0.0,
+            "ReanCare",
+            role_name,
+            "{}",
+            user["Ethnicity"] if user.get('Ethnicity') is not None else None,
+            user["Race"] if user.get('Race') is not None else None,
+            user["HealthSystem"] if user.get('HealthSystem') is not None else None,
+            user["AssociatedHospital"] if user.get('AssociatedHospital') is not None else None,
+            True if user.get('StrokeSurvivorOrCaregiver') == 'Caregiver' else False,
+            user["MajorAilment"] if user.get('MajorAilment') is not None else None,
+            to_bool(user.get('IsSmoker')),
+            to_bool(user.get('IsDrinker')),
+            to_bool(user.get('SubstanceAbuse'))
+        )
+
     @staticmethod
     def add_analytics_user(user_id, user):
         added_row_count = DataSynchronizer.add_analytics_user_record(user_id, user)
@@ -295,23 +547,95 @@ class DataSynchronizer:
             return user_metadata
         return None
 
+    @staticmethod
+    def cache_user(user):
+        cached = {field: user[field] for field in USER_LOOKUP_FIELDS}
+        DataSynchronizer._user_cache.set(cached['id'], cached)
+        return cached
+
+    @staticmethod
+    def cache_not_found(cache: LruTtlCache, key):
+        if settings.SYNC_LOOKUP_CACHE_NEGATIVE_TTL > 0:
+            cache.set(key, _NOT_FOUND, ttl=settings.SYNC_LOOKUP_CACHE_NEGATIVE_TTL)
+
     @staticmethod
     def get_user(user_id):
+        """
+        The analytics user (only its USER_LOOKUP_FIELDS), added from ReanCare
+        when it is not synced yet. Unknown users are cached as not found for
+        SYNC_LOOKUP_CACHE_NEGATIVE_TTL seconds.
+        """
         user = DataSynchronizer._user_cache.get(user_id)
+        if user is _NOT_FOUND:
+            return None
         if user is not None:
             return user
-        else:
-            user = DataSynchronizer.get_analytics_user(user_id)
-            if user is not None:
-                DataSynchronizer._user_cache.set(user_id, user)
-                return user
-            else:
-                user_ = DataSynchronizer.get_reancare_user(user_id)
-                if user_ is not None:
-                    updated_row_count = DataSynchronizer.add_analytics_user(user_id, user_)
-                    user = DataSynchronizer.get_analytics_user(user_id) if updated_row_count is not None else None
-                    return user
-        return None
+        user = DataSynchronizer.get_analytics_user(user_id)
+        if user is None:
+            user_ = DataSynchronizer.get_reancare_user(user_id)
+            if user_ is not None:
+                updated_row_count = DataSynchronizer.add_analytics_user(user_id, user_)
+                user = DataSynchronizer.get_analytics_user(user_id) if updated_row_count is not None else None
+        if user is None:
+            DataSynchronizer.cache_not_found(DataSynchronizer._user_cache, user_id)
+            return None
+        return DataSynchronizer.cache_user(user)
+
+    @staticmethod
+    def get_users(user_ids) -> dict:
+        """
+        Set-based variant of `get_user`: the users missing from the cache are
+        looked up in analytics with one query per SYNC_BATCH_SIZE ids, and
+        those not synced yet are added from ReanCare in one batch. Unlike
+        `get_user`, a lookup that fails raises instead of reporting the user
+        as not found, so the caller can retry it.
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        missing = DataSynchronizer.preload_users(user_ids)
+        added_ids = []
+        if len(missing) > 0:
+            reancare_users = DataSynchronizer.get_reancare_users(missing)
+            for user_ in reancare_users:
+                DataSynchronizer.add_analytics_user(user_['id'], user_)
+            # Also finds those another process added first
+            added_ids = [user_['id'] for user_ in reancare_users]
+            not_added = DataSynchronizer.preload_users(added_ids)
+            if len(not_added) > 0:
+                raise Exception(f"Failed to add users {not_added} from ReanCare.")
+        not_found = set(missing) - set(added_ids)
+        users = {}
+        for user_id in user_ids:
+            if user_id in not_found:
+                DataSynchronizer.cache_not_found(DataSynchronizer._user_cache, user_id)
+                users[user_id] = None
+                continue
+            user = DataSynchronizer._user_cache.peek(user_id)
+            # Evicted since it was loaded, on a large batch
+            users[user_id] = user if user not in (None, _NOT_FOUND) else DataSynchronizer.get_user(user_id)
+        return users
+
+    @staticmethod
+    def get_cached_user(user_id):
+        """
+        (True, user) when the user is cached, with None for a user cached as
+        not found; (False, None) when it has to be looked up.
+        """
+        user = DataSynchronizer._user_cache.get(user_id)
+        if user is None:
+            return False, None
+        return True, None if user is _NOT_FOUND else user
+
+    @staticmethod
+    def get_lookup_cache_stats() -> dict:
+        return {
+            "Users"  : DataSynchronizer._user_cache.stats(),
+            "Tenants": DataSynchronizer._tenant_cache.stats(),
+        }
+
+    @staticmethod
+    def clear_lookup_caches():
+        DataSynchronizer._user_cache.clear()
+        DataSynchronizer._tenant_cache.clear()
 
     #endregion
 
@@ -386,7 +710,8 @@ class DataSynchronizer:
                 # print(f"Not inserted data {row}.")
                 return None
             else:
-                DataSynchronizer._tenant_cache.set(tenant_id, result)
+                DataSynchronizer._tenant_cache.delete(tenant_id)
+                invalidate_tenants([tenant['id']])
                 print(f"Inserted row into the tenants table.")
                 return result
         except mysql.connector.Error as error:
@@ -399,19 +724,35 @@ class DataSynchronizer:
     @staticmethod
     def get_tenant(tenant_id):
         tenant = DataSynchronizer._tenant_cache.get(tenant_id)
+        if tenant is _NOT_FOUND:
+            return None
         if tenant is not None:
             return tenant
-        else:
-            tenant = DataSynchronizer.get_analytics_tenant(tenant_id)
-            if tenant is not None:
-                DataSynchronizer._tenant_cache.set(tenant_id, tenant)
-                return tenant
-            else:
-                tenant_ = DataSynchronizer.get_reancare_tenant(tenant_id)
-                if tenant_ is not None:
-                    tenant = DataSynchronizer.add_analytics_tenant(tenant_id, tenant_)
-                    return tenant
-        return None
+        tenant = DataSynchronizer.get_analytics_tenant(tenant_id)
+        if tenant is None:
+            tenant_ = DataSynchronizer.get_reancare_tenant(tenant_id)
+            if tenant_ is not None:
+                added_row_count = DataSynchronizer.add_analytics_tenant(tenant_id, tenant_)
+                tenant = DataSynchronizer.get_analytics_tenant(tenant_id) if added_row_count is not None else None
+        if tenant is None:
+            DataSynchronizer.cache_not_found(DataSynchronizer._tenant_cache, tenant_id)
+            return None
+        DataSynchronizer._tenant_cache.set(tenant_id, tenant)
+        return tenant
+
+    @staticmethod
+    def get_tenants(tenant_ids) -> dict:
+        return {tenant_id: DataSynchronizer.get_tenant(tenant_id) for tenant_id in dict.fromkeys(tenant_ids)}
+
+    @staticmethod
+    def get_cached_tenant(tenant_id):
+        """
+        Like `get_cached_user`, for tenants.
+        """
+        tenant = DataSynchronizer._tenant_cache.get(tenant_id)
+        if tenant is None:
+            return False, None
+        return True, None if tenant is _NOT_FOUND else tenant
 
     @staticmethod
     def get_tenant_by_code(tenant_code):
@@ -471,52 +812,75 @@ class DataSynchronizer:
     #region User-sync
 
     @staticmethod
-    def get_reancare_user_ids():
+    def get_reancare_user_ids(filters: DataSyncSearchFilter | None = None):
         try:
+            selection_condition = DataSynchronizer.get_selection_condition(filters, "user.CreatedAt")
             rean_db_connector = get_reancare_db_connector()
             query = f"""
-            SELECT id from users
+            SELECT user.id from users as user
             WHERE
-                IsTestUser = FALSE
+                user.IsTestUser = FALSE
+                {selection_condition}
             """
-            rows = rean_db_connector.execute_read_query(query)
+            rows = rean_db_connector.execute_read_query(query, compact=True)
             return rows
         except Exception as error:
             print("Error retrieving User Ids:", error)
             return None
 
     @staticmethod
-    def sync_users():
+    def sync_users(filters: DataSyncSearchFilter | None = None):
+        """
+        Bulk user sync: the users missing from analytics are found with one
+        lookup per batch, their profiles read with one query per batch (and
+        role kind) and written with batched users and user_metadata inserts.
+        `get_user` remains the per-user path for users met during event sync.
+        """
         try:
-            existing_user_count = 0
             synched_user_count = 0
             user_not_synched = []
-            ids = DataSynchronizer.get_reancare_user_ids()
+            started = time.monotonic()
+            ids = DataSynchronizer.get_reancare_user_ids(filters)
             if ids is None:
                 print("No users found.")
                 return None
+            loading = time.monotonic()
+            record_sync_extract(len(ids), loading - started)
             user_ids = [user['id'] for user in ids]
-            for user_id in user_ids:
-                if DataSynchronizer._user_cache.get(user_id) is not None:
-                    existing_user_count += 1
+            # Also warms the user lookup cache for the event syncs that follow
+            missing_ids = DataSynchronizer.preload_users(user_ids)
+            existing_user_count = len(user_ids) - len(missing_ids)
+            batch_size = max(1, settings.SYNC_BATCH_SIZE)
+            for start in range(0, len(missing_ids), batch_size):
+                batch = missing_ids[start:start + batch_size]
+                users = DataSynchronizer.get_reancare_users(batch)
+                found = {user['id'] for user in users}
+                for user_id in batch:
+                    if user_id not in found:
+                        user_not_synched.append(user_id)
+                        print(f"User {user_id} not synced.")
+                if len(users) == 0:
                     continue
-                if DataSynchronizer.get_analytics_user(user_id) is not None:
-                    existing_user_count += 1
+                inserted = DataSynchronizer.add_analytics_user_records(users)
+                if inserted == len(users):
+                    DataSynchronizer.add_analytics_users_metadata(users)
+                    synched_user_count += inserted
                     continue
-                user = DataSynchronizer.get_reancare_user(user_id)
-                if user is not None:
-                    DataSynchronizer.add_analytics_user(user_id, user)
-                    synched_user_count += 1
-                else:
-                    user_not_synched.append(user_id)
-                    print(f"User {user_id} not synced.")
+                # The batch was rolled back (e.g. a user was added meanwhile);
+                # add its users one by one so metadata follows only new users
+                for user in users:
+                    if DataSynchronizer.add_analytics_user(user['id'], user) is not None:
+                        synched_user_count += 1
 
+            record_sync_load(time.monotonic() - loading)
+            record_sync_rows(synched_user_count, existing_user_count, len(user_not_synched))
             print(f"Total users: {len(user_ids)}")
             print(f"Existing users: {existing_user_count}")
             print(f"Synched users: {synched_user_count}")
             print(f"Users not synched: {len(user_not_synched)}")
             return user_not_synched
         except Exception as error:
+            record_sync_error(error)
             print("Error syncing users:", error)
             return None
 
@@ -531,14 +895,16 @@ class DataSynchronizer:
             query = f"""
             SELECT id from tenants
             """
-            rows = rean_db_connector.execute_read_query(query)
+            rows = rean_db_connector.execute_read_query(query, compact=True)
             return rows
         except Exception as error:
             print("Error retrieving Tenant Ids:", error)
             return None
 
     @staticmethod
-    def sync_tenants():
+    def sync_tenants(filters: DataSyncSearchFilter | None = None):
+        # Tenants are few; they are always synced in full and `filters` is
+        # accepted only so every synchronizer can be run alike.
         try:
             existing_tenant_count = 0
             synched_tenant_count = 0
@@ -547,27 +913,30 @@ class DataSynchronizer:
             if tenant_ids is None:
                 print("No tenants found.")
                 return None
-            for tenant_id in tenant_ids:
-                if DataSynchronizer._tenant_cache.get(tenant_id) is not None:
+            for row in tenant_ids:
+                tenant_id = row['id']
+                cached = DataSynchronizer._tenant_cache.peek(tenant_id)
+                if cached is not None and cached is not _NOT_FOUND:
                     existing_tenant_count += 1
                     continue
                 if DataSynchronizer.get_analytics_tenant(tenant_id) is not None:
                     existing_tenant_count += 1
                     continue
                 tenant = DataSynchronizer.get_reancare_tenant(tenant_id)
-                if tenant is not None:
-                    DataSynchronizer.add_analytics_tenant(tenant_id, tenant)
+                if tenant is not None and DataSynchronizer.add_analytics_tenant(tenant_id, tenant) is not None:
                     synched_tenant_count += 1
                 else:
                     tenant_not_synched.append(tenant_id)
                     print(f"Tenant {tenant_id} not synced.")
 
+            record_sync_rows(synched_tenant_count, existing_tenant_count, len(tenant_not_synched))
             print(f"Total tenants: {len(tenant_ids)}")
             print(f"Existing tenants: {existing_tenant_count}")
             print(f"Synched tenants: {synched_tenant_count}")
             print(f"Tenants not synched: {len(tenant_not_synched)}")
             return tenant_not_synched
         except Exception as error:
+            record_sync_error(error)
             print("Error syncing tenants:", error)
             return None
 
@@ -575,6 +944,29 @@ class DataSynchronizer:
 
     #region Generic event methods
 
+    @staticmethod
+    def get_selection_condition(filters: DataSyncSearchFilter | None, column: str) -> str:
+        """
+        WHERE fragment limiting an extraction query on `column` (e.g.
+        "pulse.CreatedAt"): the StartDate-EndDate range of an API call or, for
+        an IncrementalSyncFilter, the rows past the watermark up to the cutoff,
+        with ties on the watermark broken by the table's id.
+        """
+        if filters is None:
+            return ''
+        if not isinstance(filters, IncrementalSyncFilter):
+            return f"AND {column} between '{filters.StartDate}' AND '{filters.EndDate}'"
+        condition = f"AND {column} <= '{format_sync_timestamp(filters.Cutoff)}'"
+        if filters.WatermarkAt is None:
+            return condition
+        watermark = format_sync_timestamp(filters.WatermarkAt)
+        if filters.LastId is None:
+            return f"AND {column} > '{watermark}' {condition}"
+        id_column = f"{column.split('.')[0]}.id"
+        last_id = filters.LastId.replace("'", "''")
+        return (f"AND ({column} > '{watermark}' OR ({column} = '{watermark}' AND {id_column} > '{last_id}')) "
+                f"{condition}")
+
     @staticmethod
     def get_existing_event(user_id, resource_id, event_type):
         try:
@@ -601,64 +993,130 @@ class DataSynchronizer:
     @staticmethod
     def add_event(event):
         try:
+            batch = _event_batch.get()
+            if batch is not None:
+                batch.append((DataSynchronizer.get_event_row(event), event['TenantId']))
+                return True
             analytics_db_connector = get_analytics_db_connector()
-            id_ = str(uuid.uuid4())
-            insert_query = """
-                INSERT INTO events (
-                    id,
-                    UserId,
-                    TenantId,
-                    SessionId,
-                    ResourceId,
-                    ResourceType,
-                    SourceName,
-                    SourceVersion,
-                    EventName,
-                    EventSubject,
-                    EventCategory,
-                    ActionType,
-                    ActionStatement,
-                    Attributes,
-                    Timestamp,
-                    DaysSinceRegistration,
-                    TimeOffsetSinceRegistration
-                ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                )
-            """
-            diff = event['Timestamp'] - event['UserRegistrationDate']
-            days_since_registration = diff.days
-            time_offset_since_registration_seconds = int(diff.total_seconds())
-            row = (
-                id_,
-                event['UserId'],
-                event['TenantId'],
-                event['SessionId'],
-                event['ResourceId'],
-                event['ResourceType'],
-                event['SourceName'],
-                event['SourceVersion'],
-                event['EventName'],
-                event['EventSubject'],
-                event['EventCategory'],
-                event['ActionType'],
-                event['ActionStatement'],
-                event['Attributes'],
-                event['Timestamp'],
-                days_since_registration,
-                time_offset_since_registration_seconds,
-            )
+            row = DataSynchronizer.get_event_row(event)
+            insert_query = get_event_insert_query(analytics_db_connector.is_postgres)
             result = analytics_db_connector.execute_write_query(insert_query, row)
             if result is None:
                 print(f"Not inserted data {row}.")
+                record_sync_rows(failed=1)
+                return False
+            elif result == 0:
+                print(f"Skipped event already in the events table.")
+                record_sync_rows(skipped=1)
                 return False
             else:
                 print(f"Inserted row into the events table.")
+                record_sync_rows(inserted=1)
+                invalidate_tenants([event['TenantId']])
                 return result == 1 # True if one row inserted
         except mysql.connector.Error as error:
             print(f"Failed to insert records: {error}")
+            record_sync_rows(failed=1)
             return None
 
-    #endregion
+    @staticmethod
+    def add_events(events):
+        """
+        Batched variant of `add_event`: inserts the events in batches of
+        SYNC_BATCH_SIZE with one commit per batch. Events already present are
+        skipped. Returns the number of rows inserted.
+        """
+        try:
+            if len(events) == 0:
+                return 0
+            rows = [DataSynchronizer.get_event_row(event) for event in events]
+            inserted, _, _ = DataSynchronizer.add_event_rows(rows, {event['TenantId'] for event in events})
+            return inserted
+        except Exception as error:
+            print(f"Failed to insert records: {error}")
+            return 0
+
+    @staticmethod
+    def add_event_rows(rows, tenant_ids):
+        """
+        Writes rows from `get_event_row` for the given tenants and records the
+        outcome in the current sync run. Returns the number of rows inserted,
+        skipped as already in the events table, and failed.
+        """
+        try:
+            analytics_db_connector = get_analytics_db_connector()
+            insert_query = get_event_insert_query(analytics_db_connector.is_postgres)
+            batch_size = settings.SYNC_BATCH_SIZE
+            rowcounts = analytics_db_connector.execute_batch_write(
+                insert_query, rows, batch_size=batch_size)
+            if rowcounts is None:
+                print(f"Failed to insert {len(rows)} events.")
+                record_sync_error(f"Failed to insert {len(rows)} events.")
+                record_sync_rows(failed=len(rows))
+                return 0, 0, len(rows)
+            inserted = sum_rowcounts(rowcounts)
+            batch_size = max(1, int(batch_size))
+            failed = sum(
+                len(rows[index * batch_size:(index + 1) * batch_size])
+                for index, count in enumerate(rowcounts) if count is None)
+            skipped = len(rows) - inserted - failed
+            print(f"Inserted {inserted} rows into the events table, skipped {skipped} existing, {failed} failed.")
+            record_sync_rows(inserted, skipped, failed)
+            if inserted > 0:
+                invalidate_tenants(tenant_ids)
+            return inserted, skipped, failed
+        except Exception as error:
+            print(f"Failed to insert records: {error}")
+            record_sync_error(error)
+            record_sync_rows(failed=len(rows))
+            return 0, 0, len(rows)
 
+    @staticmethod
+    def start_event_batch():
+        """
+        Queues the events passed to `add_event` in the current context until
+        `end_event_batch`, which writes them with `add_event_rows`. `add_event`
+        then reports queued events as added, so the real outcome comes from
+        `end_event_batch` (and is recorded in the sync run).
+        """
+        return _event_batch.set([])
 
+    @staticmethod
+    def end_event_batch(token) -> tuple:
+        batch = _event_batch.get()
+        try:
+            _event_batch.reset(token)
+        except ValueError:
+            # Closed from another context (e.g. an abandoned page generator)
+            _event_batch.set(None)
+        if not batch:
+            return 0, 0, 0
+        rows = [row for row, _ in batch]
+        return DataSynchronizer.add_event_rows(rows, {tenant_id for _, tenant_id in batch})
+
+    @staticmethod
+    def get_event_row(event):
+        diff = event['Timestamp'] - event['UserRegistrationDate']
+        days_since_registration = diff.days
+        time_offset_since_registration_seconds = int(diff.total_seconds())
+        return (
+            str(uuid.uuid4()),
+            event['UserId'],
+            event['TenantId'],
+            event['SessionId'],
+            event['ResourceId'],
+            event['ResourceType'],
+            event['SourceName'],
+            event['SourceVersion'],
+            event['EventName'],
+            event['EventSubject'],
+            event['EventCategory'],
+            event['ActionType'],
+            event['ActionStatement'],
+            event['Attributes'],
+            event['Timestamp'],
+            days_since_registration,
+            time_offset_since_registration_seconds,
+        )
+
+    #endregion
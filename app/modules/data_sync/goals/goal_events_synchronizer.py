@@ -2,22 +2,14 @@ from app.domain_types.enums.event_categories import EventCategory
 from app.domain_types.enums.event_subjects import EventSubject
 from app.domain_types.enums.event_types import EventType
 from app.domain_types.schemas.data_sync import DataSyncSearchFilter
-from app.modules.data_sync.connectors import get_reancare_db_connector
-from app.modules.data_sync.data_synchronizer import DataSynchronizer
-import mysql.connector
+from app.modules.data_sync.sync_engine import EventSyncSpec, SyncEngine
 
-############################################################
-
-class GoalEventsSynchronizer:
 
-    #region Add Symptom events
+############################################################
 
-    @staticmethod
-    def get_reancare_goal_create_events(filters: DataSyncSearchFilter):
-        try:
-            selection_condition = f"AND goal.CreatedAt between '{filters.StartDate}' AND '{filters.EndDate}'" if filters is not None else ''
-            rean_db_connector = get_reancare_db_connector()
-            query = f"""
+GOAL_CREATE_EVENTS = EventSyncSpec(
+    name="User Goal Create Events",
+    query="""
             SELECT
                 goal.id,
                 goal.PatientUserId as UserId,
@@ -45,104 +37,34 @@ class GoalEventsSynchronizer:
             WHERE
                 user.IsTestUser = FALSE
                 {selection_condition}
-            """
-            rows = rean_db_connector.execute_read_query(query)
-            return rows
-        except Exception as error:
-            print("Error retrieving User Goal Create Events:", error)
-            return None
-
-    @staticmethod
-    def add_analytics_goal_create_event(goal):
-        try:
-            event_name = EventType.GoalCreate.value
-            event_category = EventCategory.Goals.value
-            event_subject = EventSubject.Goal.value
-            # user = DataSynchronizer.get_user(medication['UserId'])
-            # if not user:
-            #     print(f"User not found for the event: {medication}")
-            #     return None
-            attributes = {
-                'PatientUserId': goal['UserId'],
-                'GoalAchieved': goal['GoalAchieved'],
-                'GoalAbandoned': goal['GoalAbandoned'],
-                'ProviderEnrollmentId': goal['ProviderEnrollmentId'],
-                'Provider': goal['Provider'],
-                'ProviderCareplanName': goal['ProviderCareplanName'],
-                'ProviderCareplanCode': goal['ProviderCareplanCode'],
-                'ProviderGoalCode': goal['ProviderGoalCode'],
-                'Title': goal['Title'],
-                'Sequence': goal['Sequence'],
-                'HealthPriorityId': goal['HealthPriorityId'],
-                'StartedAt': goal['StartedAt'],
-                'CompletedAt': goal['CompletedAt'],
-                'ScheduledEndDate': goal['ScheduledEndDate']
-             }
-            goal = {
-                'UserId': goal['UserId'],
-                'TenantId': goal['TenantId'],
-                'SessionId': None,
-                'ResourceId': goal['id'],
-                'ResourceType': "goal",
-                'SourceName': "ReanCare",
-                'SourceVersion': "Unknown",
-                'EventName': event_name,
-                'EventSubject': event_subject,
-                'EventCategory': event_category,
-                'ActionType': "user-action",
-                'ActionStatement': "User added a goal.",
-                'Attributes': str(attributes),
-                'Timestamp': goal['CreatedAt'],
-                'UserRegistrationDate': goal['UserRegistrationDate']
-            }
-            new_event_added = DataSynchronizer.add_event(goal)
-            if not new_event_added:
-                print(f"Not inserted data.")
-                return None
-            else:
-                # print(f"Inserted row into the user_medication_create_events table.")
-                return new_event_added
-        except mysql.connector.Error as error:
-            print(f"Failed to insert records: {error}")
-            return None
+            """,
+    timestamp_column="goal.CreatedAt",
+    event_type=EventType.GoalCreate,
+    event_category=EventCategory.Goals,
+    event_subject=EventSubject.Goal,
+    resource_type="goal",
+    action_statement="User added a goal.",
+    attributes={
+        "PatientUserId": "UserId",
+        "GoalAchieved": "GoalAchieved",
+        "GoalAbandoned": "GoalAbandoned",
+        "ProviderEnrollmentId": "ProviderEnrollmentId",
+        "Provider": "Provider",
+        "ProviderCareplanName": "ProviderCareplanName",
+        "ProviderCareplanCode": "ProviderCareplanCode",
+        "ProviderGoalCode": "ProviderGoalCode",
+        "Title": "Title",
+        "Sequence": "Sequence",
+        "HealthPriorityId": "HealthPriorityId",
+        "StartedAt": "StartedAt",
+        "CompletedAt": "CompletedAt",
+        "ScheduledEndDate": "ScheduledEndDate",
+    },
+)
 
-    @staticmethod
-    def sync_goal_create_events(filters: DataSyncSearchFilter):
-        try:
-            existing_event_count = 0
-            synched_event_count = 0
-            event_not_synched = []
-            goals = GoalEventsSynchronizer.get_reancare_goal_create_events(filters)
-            if goals:
-                for goal in goals:
-                    existing_event = DataSynchronizer.get_existing_event(
-                        goal['UserId'], goal['id'], EventType.GoalCreate)
-                    if existing_event is not None:
-                        existing_event_count += 1
-                    else:
-                        new_event = GoalEventsSynchronizer.add_analytics_goal_create_event(goal)
-                        if new_event:
-                            synched_event_count += 1
-                        else:
-                            event_not_synched.append(goal)
-                print(f"Existing Event Count: {existing_event_count}")
-                print(f"Synched Event Count: {synched_event_count}")
-                print(f"Event Not Synched: {event_not_synched}")
-            else:
-                print(f"No User Goal Create Events found.")
-        except Exception as error:
-            print(f"Error syncing User Goal Create Events: {error}")
-
-    #endregion
-
-    #region Update nutrition events
-
-    @staticmethod
-    def get_reancare_goal_update_events(filters: DataSyncSearchFilter):
-        try:
-            selection_condition = f"AND goal.UpdatedAt between '{filters.StartDate}' AND '{filters.EndDate}'" if filters is not None else ''
-            rean_db_connector = get_reancare_db_connector()
-            query = f"""
+GOAL_UPDATE_EVENTS = EventSyncSpec(
+    name="User Goal Update Events",
+    query="""
             SELECT
                 goal.id,
                 goal.PatientUserId as UserId,
@@ -172,102 +94,35 @@ class GoalEventsSynchronizer:
                 AND
                 goal.CreatedAt <> goal.UpdatedAt
                 {selection_condition}
-            """
-            rows = rean_db_connector.execute_read_query(query)
-            return rows
-        except Exception as error:
-            print("Error retrieving User Goal Update Events:", error)
-            return None
+            """,
+    timestamp_column="goal.UpdatedAt",
+    event_type=EventType.GoalUpdate,
+    event_category=EventCategory.Goals,
+    event_subject=EventSubject.Goal,
+    resource_type="goal",
+    action_type="User-Action",
+    action_statement="User updated a goal.",
+    attributes={
+        "PatientUserId": "UserId",
+        "GoalAchieved": "GoalAchieved",
+        "GoalAbandoned": "GoalAbandoned",
+        "ProviderEnrollmentId": "ProviderEnrollmentId",
+        "Provider": "Provider",
+        "ProviderCareplanName": "ProviderCareplanName",
+        "ProviderCareplanCode": "ProviderCareplanCode",
+        "ProviderGoalCode": "ProviderGoalCode",
+        "Title": "Title",
+        "Sequence": "Sequence",
+        "HealthPriorityId": "HealthPriorityId",
+        "StartedAt": "StartedAt",
+        "CompletedAt": "CompletedAt",
+        "ScheduledEndDate": "ScheduledEndDate",
+    },
+)
 
-    @staticmethod
-    def add_analytics_goal_update_event(goal):
-        try:
-            event_name = EventType.GoalUpdate.value
-            event_category = EventCategory.Goals.value
-            event_subject = EventSubject.Goal.value
-            # user = DataSynchronizer.get_user(medication['UserId'])
-            # if not user:
-            #     print(f"User not found for the event: {medication}")
-            #     return None
-            attributes = {
-                'PatientUserId': goal['UserId'],
-                'GoalAchieved': goal['GoalAchieved'],
-                'GoalAbandoned': goal['GoalAbandoned'],
-                'ProviderEnrollmentId': goal['ProviderEnrollmentId'],
-                'Provider': goal['Provider'],
-                'ProviderCareplanName': goal['ProviderCareplanName'],
-                'ProviderCareplanCode': goal['ProviderCareplanCode'],
-                'ProviderGoalCode': goal['ProviderGoalCode'],
-                'Title': goal['Title'],
-                'Sequence': goal['Sequence'],
-                'HealthPriorityId': goal['HealthPriorityId'],
-                'StartedAt': goal['StartedAt'],
-                'CompletedAt': goal['CompletedAt'],
-                'ScheduledEndDate': goal['ScheduledEndDate']
-             }
-            goal = {
-                'UserId': goal['UserId'],
-                'TenantId': goal['TenantId'],
-                'SessionId': None,
-                'ResourceId': goal['id'],
-                'ResourceType': "goal",
-                'SourceName': "ReanCare",
-                'SourceVersion': "Unknown",
-                'EventName': event_name,
-                'EventSubject': event_subject,
-                'EventCategory': event_category,
-                'ActionType': "User-Action",
-                'ActionStatement': "User updated a goal.",
-                'Attributes': str(attributes),
-                'Timestamp': goal['UpdatedAt'],
-                'UserRegistrationDate': goal['UserRegistrationDate']
-            }
-            new_event_added = DataSynchronizer.add_event(goal)
-            if not new_event_added:
-                print(f"Not inserted data.")
-                return None
-            else:
-                # print(f"Inserted row into the user_medication_create_events table.")
-                return new_event_added
-        except mysql.connector.Error as error:
-            print(f"Failed to insert records: {error}")
-            return None
-
-    @staticmethod
-    def sync_goal_update_events(filters: DataSyncSearchFilter):
-        try:
-            existing_event_count = 0
-            synched_event_count = 0
-            event_not_synched = []
-            goals = GoalEventsSynchronizer.get_reancare_goal_update_events(filters)
-            if goals:
-                for goal in goals:
-                    existing_event = DataSynchronizer.get_existing_event(
-                        goal['UserId'], goal['id'], EventType.GoalUpdate)
-                    if existing_event is not None:
-                        existing_event_count += 1
-                    else:
-                        new_event = GoalEventsSynchronizer.add_analytics_goal_update_event(goal)
-                        if new_event:
-                            synched_event_count += 1
-                        else:
-                            event_not_synched.append(goal)
-                print(f"Existing Event Count: {existing_event_count}")
-                print(f"Synched Event Count: {synched_event_count}")
-                print(f"Event Not Synched: {event_not_synched}")
-            else:
-                print(f"No User Goal Update Events found.")
-        except Exception as error:
-            print(f"Error syncing User Goal Update Events: {error}")
-
-    #endregion
-
-    @staticmethod
-    def get_reancare_goal_start_events(filters: DataSyncSearchFilter):
-        try:
-            selection_condition = f"AND goal.StartedAt between '{filters.StartDate}' AND '{filters.EndDate}'" if filters is not None else ''
-            rean_db_connector = get_reancare_db_connector()
-            query = f"""
+GOAL_START_EVENTS = EventSyncSpec(
+    name="User Goal Start Events",
+    query="""
             SELECT
                 goal.id,
                 goal.PatientUserId as UserId,
@@ -297,102 +152,35 @@ class GoalEventsSynchronizer:
                 AND
                 goal.StartedAt IS NOT null
                 {selection_condition}
-            """
-            rows = rean_db_connector.execute_read_query(query)
-            return rows
-        except Exception as error:
-            print("Error retrieving User Goal Start Events:", error)
-            return None
-
-    @staticmethod
-    def add_analytics_goal_start_event(goal):
-        try:
-            event_name = EventType.GoalStart.value
-            event_category = EventCategory.Goals.value
-            event_subject = EventSubject.Goal.value
-            # user = DataSynchronizer.get_user(medication['UserId'])
-            # if not user:
-            #     print(f"User not found for the event: {medication}")
-            #     return None
-            attributes = {
-                'PatientUserId': goal['UserId'],
-                'GoalAchieved': goal['GoalAchieved'],
-                'GoalAbandoned': goal['GoalAbandoned'],
-                'ProviderEnrollmentId': goal['ProviderEnrollmentId'],
-                'Provider': goal['Provider'],
-                'ProviderCareplanName': goal['ProviderCareplanName'],
-                'ProviderCareplanCode': goal['ProviderCareplanCode'],
-                'ProviderGoalCode': goal['ProviderGoalCode'],
-                'Title': goal['Title'],
-                'Sequence': goal['Sequence'],
-                'HealthPriorityId': goal['HealthPriorityId'],
-                'StartedAt': goal['StartedAt'],
-                'CompletedAt': goal['CompletedAt'],
-                'ScheduledEndDate': goal['ScheduledEndDate']
-             }
-            goal = {
-                'UserId': goal['UserId'],
-                'TenantId': goal['TenantId'],
-                'SessionId': None,
-                'ResourceId': goal['id'],
-                'ResourceType': "goal",
-                'SourceName': "ReanCare",
-                'SourceVersion': "Unknown",
-                'EventName': event_name,
-                'EventSubject': event_subject,
-                'EventCategory': event_category,
-                'ActionType': "User-Action",
-                'ActionStatement': "User started a goal.",
-                'Attributes': str(attributes),
-                'Timestamp': goal['StartedAt'],
-                'UserRegistrationDate': goal['UserRegistrationDate']
-            }
-            new_event_added = DataSynchronizer.add_event(goal)
-            if not new_event_added:
-                print(f"Not inserted data.")
-                return None
-            else:
-                # print(f"Inserted row into the user_medication_create_events table.")
-                return new_event_added
-        except mysql.connector.Error as error:
-            print(f"Failed to insert records: {error}")
-            return None
-
-    @staticmethod
-    def sync_goal_start_events(filters: DataSyncSearchFilter):
-        try:
-            existing_event_count = 0
-            synched_event_count = 0
-            event_not_synched = []
-            goals = GoalEventsSynchronizer.get_reancare_goal_start_events(filters)
-            if goals:
-                for goal in goals:
-                    existing_event = DataSynchronizer.get_existing_event(
-                        goal['UserId'], goal['id'], EventType.GoalStart)
-                    if existing_event is not None:
-                        existing_event_count += 1
-                    else:
-                        new_event = GoalEventsSynchronizer.add_analytics_goal_start_event(goal)
-                        if new_event:
-                            synched_event_count += 1
-                        else:
-                            event_not_synched.append(goal)
-                print(f"Existing Event Count: {existing_event_count}")
-                print(f"Synched Event Count: {synched_event_count}")
-                print(f"Event Not Synched: {event_not_synched}")
-            else:
-                print(f"No User Goal Start Events found.")
-        except Exception as error:
-            print(f"Error syncing User Goal Start Events: {error}")
+            """,
+    timestamp_column="goal.StartedAt",
+    event_type=EventType.GoalStart,
+    event_category=EventCategory.Goals,
+    event_subject=EventSubject.Goal,
+    resource_type="goal",
+    action_type="User-Action",
+    action_statement="User started a goal.",
+    attributes={
+        "PatientUserId": "UserId",
+        "GoalAchieved": "GoalAchieved",
+        "GoalAbandoned": "GoalAbandoned",
+        "ProviderEnrollmentId": "ProviderEnrollmentId",
+        "Provider": "Provider",
+        "ProviderCareplanName": "ProviderCareplanName",
+        "ProviderCareplanCode": "ProviderCareplanCode",
+        "ProviderGoalCode": "ProviderGoalCode",
+        "Title": "Title",
+        "Sequence": "Sequence",
+        "HealthPriorityId": "HealthPriorityId",
+        "StartedAt": "StartedAt",
+        "CompletedAt": "CompletedAt",
+        "ScheduledEndDate": "ScheduledEndDate",
+    },
+)
 
-    #endregion
-
-    @staticmethod
-    def get_reancare_goal_complete_events(filters: DataSyncSearchFilter):
-        try:
-            selection_condition = f"AND goal.CompletedAt between '{filters.StartDate}' AND '{filters.EndDate}'" if filters is not None else ''
-            rean_db_connector = get_reancare_db_connector()
-            query = f"""
+GOAL_COMPLETE_EVENTS = EventSyncSpec(
+    name="User Goal Complete Events",
+    query="""
             SELECT
                 goal.id,
                 goal.PatientUserId as UserId,
@@ -422,102 +210,34 @@ class GoalEventsSynchronizer:
                 AND
                 goal.CompletedAt IS NOT null
                 {selection_condition}
-            """
-            rows = rean_db_connector.execute_read_query(query)
-            return rows
-        except Exception as error:
-            print("Error retrieving User Goal Complete Events:", error)
-            return None
-
-    @staticmethod
-    def add_analytics_goal_complete_event(goal):
-        try:
-            event_name = EventType.GoalComplete.value
-            event_category = EventCategory.Goals.value
-            event_subject = EventSubject.Goal.value
-            # user = DataSynchronizer.get_user(medication['UserId'])
-            # if not user:
-            #     print(f"User not found for the event: {medication}")
-            #     return None
-            attributes = {
-                'PatientUserId': goal['UserId'],
-                'GoalAchieved': goal['GoalAchieved'],
-                'GoalAbandoned': goal['GoalAbandoned'],
-                'ProviderEnrollmentId': goal['ProviderEnrollmentId'],
-                'Provider': goal['Provider'],
-                'ProviderCareplanName': goal['ProviderCareplanName'],
-                'ProviderCareplanCode': goal['ProviderCareplanCode'],
-                'ProviderGoalCode': goal['ProviderGoalCode'],
-                'Title': goal['Title'],
-                'Sequence': goal['Sequence'],
-                'HealthPriorityId': goal['HealthPriorityId'],
-                'StartedAt': goal['StartedAt'],
-                'CompletedAt': goal['CompletedAt'],
-                'ScheduledEndDate': goal['ScheduledEndDate']
-             }
-            goal = {
-                'UserId': goal['UserId'],
-                'TenantId': goal['TenantId'],
-                'SessionId': None,
-                'ResourceId': goal['id'],
-                'ResourceType': "goal",
-                'SourceName': "ReanCare",
-                'SourceVersion': "Unknown",
-                'EventName': event_name,
-                'EventSubject': event_subject,
-                'EventCategory': event_category,
-                'ActionType': "user-action",
-                'ActionStatement': "User completed a goal.",
-                'Attributes': str(attributes),
-                'Timestamp': goal['CompletedAt'],
-                'UserRegistrationDate': goal['UserRegistrationDate']
-            }
-            new_event_added = DataSynchronizer.add_event(goal)
-            if not new_event_added:
-                print(f"Not inserted data.")
-                return None
-            else:
-                # print(f"Inserted row into the user_medication_create_events table.")
-                return new_event_added
-        except mysql.connector.Error as error:
-            print(f"Failed to insert records: {error}")
-            return None
+            """,
+    timestamp_column="goal.CompletedAt",
+    event_type=EventType.GoalComplete,
+    event_category=EventCategory.Goals,
+    event_subject=EventSubject.Goal,
+    resource_type="goal",
+    action_statement="User completed a goal.",
+    attributes={
+        "PatientUserId": "UserId",
+        "GoalAchieved": "GoalAchieved",
+        "GoalAbandoned": "GoalAbandoned",
+        "ProviderEnrollmentId": "ProviderEnrollmentId",
+        "Provider": "Provider",
+        "ProviderCareplanName": "ProviderCareplanName",
+        "ProviderCareplanCode": "ProviderCareplanCode",
+        "ProviderGoalCode": "ProviderGoalCode",
+        "Title": "Title",
+        "Sequence": "Sequence",
+        "HealthPriorityId": "HealthPriorityId",
+        "StartedAt": "StartedAt",
+        "CompletedAt": "CompletedAt",
+        "ScheduledEndDate": "ScheduledEndDate",
+    },
+)
 
-    @staticmethod
-    def sync_goal_complete_events(filters: DataSyncSearchFilter):
-        try:
-            existing_event_count = 0
-            synched_event_count = 0
-            event_not_synched = []
-            goals = GoalEventsSynchronizer.get_reancare_goal_complete_events(filters)
-            if goals:
-                for goal in goals:
-                    existing_event = DataSynchronizer.get_existing_event(
-                        goal['UserId'], goal['id'], EventType.GoalComplete)
-                    if existing_event is not None:
-                        existing_event_count += 1
-                    else:
-                        new_event = GoalEventsSynchronizer.add_analytics_goal_complete_event(goal)
-                        if new_event:
-                            synched_event_count += 1
-                        else:
-                            event_not_synched.append(goal)
-                print(f"Existing Event Count: {existing_event_count}")
-                print(f"Synched Event Count: {synched_event_count}")
-                print(f"Event Not Synched: {event_not_synched}")
-            else:
-                print(f"No User Goal Complete Events found.")
-        except Exception as error:
-            print(f"Error syncing User Goal Complete Events: {error}")
-
-    #endregion
-
-    @staticmethod
-    def get_reancare_goal_cancel_events(filters: DataSyncSearchFilter):
-        try:
-            selection_condition = f"AND goal.DeletedAt between '{filters.StartDate}' AND '{filters.EndDate}'" if filters is not None else ''
-            rean_db_connector = get_reancare_db_connector()
-            query = f"""
+GOAL_CANCEL_EVENTS = EventSyncSpec(
+    name="User Goal Cancel Events",
+    query="""
             SELECT
                 goal.id,
                 goal.PatientUserId as UserId,
@@ -547,92 +267,66 @@ class GoalEventsSynchronizer:
                 AND
                 goal.DeletedAt IS NOT null
                 {selection_condition}
-            """
-            rows = rean_db_connector.execute_read_query(query)
-            return rows
-        except Exception as error:
-            print("Error retrieving User Goal Cancel Events:", error)
-            return None
+            """,
+    timestamp_column="goal.DeletedAt",
+    event_type=EventType.GoalCancel,
+    event_category=EventCategory.Goals,
+    event_subject=EventSubject.Goal,
+    resource_type="goal",
+    action_type="User-Action",
+    action_statement="User deleted a goal.",
+    attributes={
+        "PatientUserId": "UserId",
+        "GoalAchieved": "GoalAchieved",
+        "GoalAbandoned": "GoalAbandoned",
+        "ProviderEnrollmentId": "ProviderEnrollmentId",
+        "Provider": "Provider",
+        "ProviderCareplanName": "ProviderCareplanName",
+        "ProviderCareplanCode": "ProviderCareplanCode",
+        "ProviderGoalCode": "ProviderGoalCode",
+        "Title": "Title",
+        "Sequence": "Sequence",
+        "HealthPriorityId": "HealthPriorityId",
+        "StartedAt": "StartedAt",
+        "CompletedAt": "CompletedAt",
+        "ScheduledEndDate": "ScheduledEndDate",
+    },
+)
+
+############################################################
+
+class GoalEventsSynchronizer:
+
+    #region Add Symptom events
 
     @staticmethod
-    def add_analytics_goal_cancel_event(goal):
-        try:
-            event_name = EventType.GoalCancel.value
-            event_category = EventCategory.Goals.value
-            event_subject = EventSubject.Goal.value
-            # user = DataSynchronizer.get_user(medication['UserId'])
-            # if not user:
-            #     print(f"User not found for the event: {medication}")
-            #     return None
-            attributes = {
-                'PatientUserId': goal['UserId'],
-                'GoalAchieved': goal['GoalAchieved'],
-                'GoalAbandoned': goal['GoalAbandoned'],
-                'ProviderEnrollmentId': goal['ProviderEnrollmentId'],
-                'Provider': goal['Provider'],
-                'ProviderCareplanName': goal['ProviderCareplanName'],
-                'ProviderCareplanCode': goal['ProviderCareplanCode'],
-                'ProviderGoalCode': goal['ProviderGoalCode'],
-                'Title': goal['Title'],
-                'Sequence': goal['Sequence'],
-                'HealthPriorityId': goal['HealthPriorityId'],
-                'StartedAt': goal['StartedAt'],
-                'CompletedAt': goal['CompletedAt'],
-                'ScheduledEndDate': goal['ScheduledEndDate']
-             }
-            goal = {
-                'UserId': goal['UserId'],
-                'TenantId': goal['TenantId'],
-                'SessionId': None,
-                'ResourceId': goal['id'],
-                'ResourceType': "goal",
-                'SourceName': "ReanCare",
-                'SourceVersion': "Unknown",
-                'EventName': event_name,
-                'EventSubject': event_subject,
-                'EventCategory': event_category,
-                'ActionType': "User-Action",
-                'ActionStatement': "User deleted a goal.",
-                'Attributes': str(attributes),
-                'Timestamp': goal['DeletedAt'],
-                'UserRegistrationDate': goal['UserRegistrationDate']
-            }
-            new_event_added = DataSynchronizer.add_event(goal)
-            if not new_event_added:
-                print(f"Not inserted data.")
-                return None
-            else:
-                # print(f"Inserted row into the user_medication_create_events table.")
-                return new_event_added
-        except mysql.connector.Error as error:
-            print(f"Failed to insert records: {error}")
-            return None
+    def sync_goal_create_events(filters: DataSyncSearchFilter):
+        return SyncEngine.sync(GOAL_CREATE_EVENTS, filters)
+
+    #endregion
+
+    #region Update nutrition events
+
+    @staticmethod
+    def sync_goal_update_events(filters: DataSyncSearchFilter):
+        return SyncEngine.sync(GOAL_UPDATE_EVENTS, filters)
+
+    #endregion
+
+    @staticmethod
+    def sync_goal_start_events(filters: DataSyncSearchFilter):
+        return SyncEngine.sync(GOAL_START_EVENTS, filters)
+
+    #endregion
+
+    @staticmethod
+    def sync_goal_complete_events(filters: DataSyncSearchFilter):
+        return SyncEngine.sync(GOAL_COMPLETE_EVENTS, filters)
+
+    #endregion
 
     @staticmethod
     def sync_goal_cancel_events(filters: DataSyncSearchFilter):
-        try:
-            existing_event_count = 0
-            synched_event_count = 0
-            event_not_synched = []
-            goals = GoalEventsSynchronizer.get_reancare_goal_cancel_events(filters)
-            if goals:
-                for goal in goals:
-                    existing_event = DataSynchronizer.get_existing_event(
-                        goal['UserId'], goal['id'], EventType.GoalCancel)
-                    if existing_event is not None:
-                        existing_event_count += 1
-                    else:
-                        new_event = GoalEventsSynchronizer.add_analytics_goal_cancel_event(goal)
-                        if new_event:
-                            synched_event_count += 1
-                        else:
-                            event_not_synched.append(goal)
-                print(f"Existing Event Count: {existing_event_count}")
-                print(f"Synched Event Count: {synched_event_count}")
-                print(f"Event Not Synched: {event_not_synched}")
-            else:
-                print(f"No User Goal Cancel Events found.")
-        except Exception as error:
-            print(f"Error syncing User Goal Cancel Events: {error}")
+        return SyncEngine.sync(GOAL_CANCEL_EVENTS, filters)
 
     #endregion
@@ -0,0 +1,81 @@
+import threading
+from datetime import timedelta
+from app.config.config import get_settings
+from app.domain_types.schemas.data_sync import IncrementalSyncFilter
+from app.modules.data_sync.sync_orchestrator import SyncOrchestrator, get_sync_key
+from app.modules.data_sync.sync_runs import SyncRunStore
+from app.modules.data_sync.sync_state import (
+    SyncStateStore,
+    record_sync_error,
+    start_sync_run,
+    stop_sync_run,
+    utc_now,
+)
+
+############################################################
+
+settings = get_settings()
+
+def get_sync_cutoff():
+    """
+    Upper bound of an incremental window. Rows newer than the lag are left for
+    the next run so late-committed rows (and replica lag) are not skipped.
+    """
+    lag_seconds = settings.SYNC_INCREMENTAL_LAG_SECONDS
+    if settings.REANCARE_DB_REPLICA_HOSTS:
+        lag_seconds = max(lag_seconds, settings.DB_REPLICA_MAX_LAG_SECONDS)
+    return utc_now() - timedelta(seconds=lag_seconds)
+
+class IncrementalSynchronizer:
+    """
+    Runs every synchronizer over the rows past its watermark (see sync_state)
+    and advances the watermark to the window's cutoff once a run completed
+    without errors. Inserts are idempotent, so a run that failed half-way is
+    simply repeated. Synchronizers run in parallel, in dependency order, on
+    the SyncOrchestrator pool.
+    """
+
+    _lock = threading.Lock()
+
+    @staticmethod
+    def sync_all():
+        if not IncrementalSynchronizer._lock.acquire(blocking=False):
+            print("Incremental sync is already running.")
+            return None
+        try:
+            cutoff = get_sync_cutoff()
+            summary = SyncOrchestrator.run(lambda domain, task: IncrementalSynchronizer.sync(task, cutoff))
+            print(f"Incremental sync up to {cutoff} completed.")
+            return summary
+        finally:
+            IncrementalSynchronizer._lock.release()
+
+    @staticmethod
+    def sync(task, cutoff) -> bool:
+        sync_key = get_sync_key(task)
+        state = SyncStateStore.get_or_create_state(sync_key)
+        if state is None:
+            print(f"Sync state not available for {sync_key}, skipped.")
+            return False
+        watermark_at = state['WatermarkAt']
+        if watermark_at is not None and watermark_at >= cutoff:
+            return True
+        filters = IncrementalSyncFilter(
+            SyncKey=sync_key,
+            WatermarkAt=watermark_at,
+            LastId=state['LastId'],
+            Cutoff=cutoff)
+        run = start_sync_run(sync_key)
+        try:
+            task(filters)
+        except Exception as error:
+            record_sync_error(error)
+        finally:
+            stop_sync_run()
+        SyncRunStore.record(run)
+        if run.failed:
+            error = "; ".join(run.errors) if len(run.errors) > 0 else f"{run.query_failures} queries failed"
+            print(f"Incremental sync of {sync_key} failed, watermark kept: {error}")
+            SyncStateStore.record_failure(sync_key, error)
+            return False
+        return SyncStateStore.advance(sync_key, cutoff)
@@ -0,0 +1,141 @@
+import itertools
+import re
+import time
+from app.config.config import get_settings
+from app.database.db_connector import DatabaseConnector
+from app.modules.data_sync.data_synchronizer import DataSynchronizer
+from app.modules.data_sync.sync_state import checkpoint_sync_run, record_sync_extract, record_sync_load
+
+############################################################
+
+settings = get_settings()
+
+_SELECT_RE = re.compile(r"\bSELECT\b", re.IGNORECASE)
+
+############################################################
+
+class KeysetPager:
+    """
+    Reads an extraction query page by page on the (`column`, id) keyset, e.g.
+    ("pulse.CreatedAt", "pulse.id"), so no single statement returns more than
+    `page_size` rows or holds its read for long. The query must end with its
+    WHERE clause; the keyset condition, ORDER BY and LIMIT are appended.
+
+    `pages()` yields the pages lazily, so callers transform and load one page
+    before the next is read: events added with DataSynchronizer.add_event
+    while a page is processed are written as one batch when the caller moves
+    on (the outcome adds up in `rows_inserted`, `rows_skipped` and
+    `rows_failed`), and an incremental sync run is checkpointed there. Truthiness reads
+    the first page, so the usual `if rows:` check still works. A failed page
+    read raises. Page reads count as the extract phase of the current sync
+    run, and the time until the caller moves on (including the batch write)
+    as its load phase.
+
+    With `stream`, the pages after the first are cut from one streamed read
+    of the rest of the result (DatabaseConnector.iter_read_query) instead of
+    a query per page; meant for full pulls of large tables, where each page
+    query would seek further into the index.
+    """
+
+    def __init__(
+            self,
+            connector: DatabaseConnector,
+            query: str,
+            column: str,
+            page_size: int | None = None,
+            stream: bool = False):
+        self.connector = connector
+        self.query = query
+        self.column = column
+        self.id_column = f"{column.split('.')[0]}.id"
+        self.page_size = max(1, page_size or settings.SYNC_EXTRACT_PAGE_SIZE)
+        self.stream = stream
+        # Outcome of the batched event writes of the pages loaded so far
+        self.rows_inserted = 0
+        self.rows_skipped = 0
+        self.rows_failed = 0
+        self._first_page = None
+
+    def __bool__(self):
+        if self._first_page is None:
+            self._first_page = self._read_page(None)
+        return len(self._first_page) > 0
+
+    def __iter__(self):
+        for page in self.pages():
+            yield from page
+
+    def pages(self):
+        page = self._first_page if self._first_page is not None else self._read_page(None)
+        self._first_page = None
+        while len(page) > 0:
+            after = yield from self._load_page(page)
+            if len(page) < self.page_size:
+                return
+            if self.stream:
+                yield from self._stream_pages(after)
+                return
+            page = self._read_page(after)
+
+    def _load_page(self, page):
+        token = DataSynchronizer.start_event_batch()
+        started = time.monotonic()
+        try:
+            yield page
+        finally:
+            inserted, skipped, failed = DataSynchronizer.end_event_batch(token)
+            self.rows_inserted += inserted
+            self.rows_skipped += skipped
+            self.rows_failed += failed
+            record_sync_load(time.monotonic() - started)
+        last = page[-1]
+        after = (last['KeysetAt'], last['KeysetId'])
+        checkpoint_sync_run(*after)
+        return after
+
+    def _stream_pages(self, after):
+        query, params = self._page_query(after, limit=False)
+        rows = self.connector.iter_read_query(query, params, chunk_size=self.page_size)
+        try:
+            while True:
+                started = time.monotonic()
+                page = list(itertools.islice(rows, self.page_size))
+                record_sync_extract(len(page), time.monotonic() - started)
+                if len(page) == 0:
+                    return
+                yield from self._load_page(page)
+                if len(page) < self.page_size:
+                    return
+        finally:
+            rows.close()
+
+    def _read_page(self, after):
+        query, params = self._page_query(after)
+        started = time.monotonic()
+        rows = self.connector.execute_read_query(query, params)
+        if rows is None:
+            raise Exception(f"Failed to read a page of rows keyed on {self.column}.")
+        record_sync_extract(len(rows), time.monotonic() - started)
+        return rows
+
+    def _page_query(self, after, limit=True):
+        column = self.column
+        id_column = self.id_column
+        query = _SELECT_RE.sub(
+            f"SELECT\n                {column} as KeysetAt,\n                {id_column} as KeysetId,",
+            self.query.rstrip(), count=1)
+        params = None
+        if after is not None:
+            after_at, after_id = after
+            if after_at is None:
+                # NULLs sort first
+                query += f"\n                AND (({column} IS NULL AND {id_column} > %s) OR {column} IS NOT NULL)"
+                params = (after_id,)
+            else:
+                query += f"\n                AND ({column} > %s OR ({column} = %s AND {id_column} > %s))"
+                params = (after_at, after_at, after_id)
+        nulls_first = " NULLS FIRST" if self.connector.is_postgres else ""
+        query += f"\n            ORDER BY {column}{nulls_first}, {id_column}\n"
+        if limit:
+            query += f"            LIMIT {self.page_size}\n"
+        return query, params
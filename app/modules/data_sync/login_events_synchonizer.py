@@ -4,15 +4,58 @@ from app.domain_types.enums.event_types import EventType
 from app.domain_types.schemas.data_sync import DataSyncSearchFilter
 from app.modules.data_sync.connectors import get_reancare_db_connector
 from app.modules.data_sync.data_synchronizer import DataSynchronizer
+from app.modules.data_sync.keyset_pager import KeysetPager
+from app.modules.data_sync.sync_engine import EventSyncSpec, SyncEngine
+from app.modules.data_sync.sync_state import record_sync_error, record_sync_rows
 import mysql.connector
 
+
+############################################################
+
+GENERATE_OTP_EVENTS = EventSyncSpec(
+    name="User Generate Otp Events",
+    query="""
+            SELECT
+                otp.id, 
+                otp.UserId,
+                otp.Purpose,
+                otp.ValidFrom,
+                otp.ValidTill,
+                otp.CreatedAt,
+                otp.UpdatedAt,
+                otp.DeletedAt,
+                user.id as UserId,
+                user.TenantId as TenantId,
+                user.CreatedAt as UserRegistrationDate
+            FROM otp as otp
+            JOIN users user ON user.id = otp.UserId
+            WHERE
+                user.IsTestUser = FALSE
+                AND
+                otp.Purpose = 'Login'
+                {selection_condition}
+            """,
+    timestamp_column="otp.CreatedAt",
+    event_type=EventType.UserGenerateOtp,
+    event_category=EventCategory.LoginSession,
+    event_subject=EventSubject.LoginSession,
+    resource_type="User-Login-Session",
+    action_statement="Otp generated.",
+    attributes=[
+        "Purpose",
+        "ValidFrom",
+        "ValidTill",
+    ],
+)
+
 ############################################################
 
 class LoginEventsSynchronizer:
 
     @staticmethod
-    def get_reancare_user_login_sessions():
+    def get_reancare_user_login_sessions(filters: DataSyncSearchFilter | None = None):
         try:
+            selection_condition = DataSynchronizer.get_selection_condition(filters, "session.CreatedAt")
             rean_db_connector = get_reancare_db_connector()
             query = f"""
             SELECT
@@ -31,8 +74,12 @@ class LoginEventsSynchronizer:
                 user.IsTestUser = FALSE
                 AND
                 session.DeletedAt IS NULL
+                {selection_condition}
             """
-            rows = rean_db_connector.execute_read_query(query)
+            # This table is usually synced without a date filter, so page it;
+            # a full pull streams the pages from one read
+            full_pull = len(selection_condition) == 0
+            rows = KeysetPager(rean_db_connector, query, "session.CreatedAt", stream=full_pull)
             return rows
         except mysql.connector.Error as error:
             print("Error retrieving User Login Sessions:", error)
@@ -76,145 +123,49 @@ class LoginEventsSynchronizer:
             return None
 
     @staticmethod
-    def sync_user_login_events():
+    def get_login_event_type(session) -> EventType:
+        return EventType.UserLoginWithOtp if session['RoleId'] == 2 else EventType.UserLoginWithPassword
+
+    @staticmethod
+    def sync_user_login_events(filters: DataSyncSearchFilter | None = None):
         try:
-            existing_session_count = 0
-            synched_session_count = 0
             session_not_synched = []
-            sessions = LoginEventsSynchronizer.get_reancare_user_login_sessions()
+            sessions = LoginEventsSynchronizer.get_reancare_user_login_sessions(filters)
             if sessions is None:
                 print("No user login sessions found.")
                 return None
-            for session in sessions:
-                event_type: EventType = EventType.UserLoginWithOtp if session['RoleId'] == 2 else EventType.UserLoginWithPassword
-                existing_event = DataSynchronizer.get_existing_event(session['UserId'], session['id'], event_type)
-                if existing_event is not None:
-                    existing_session_count += 1
-                    continue
-                user = DataSynchronizer.get_user(session['UserId'])
-                if user is not None:
-                    LoginEventsSynchronizer.add_login_session_events(session)
-                    synched_session_count += 1
-                else:
-                    session_not_synched.append(session['id'])
-                    print(f"User login session {session['id']} not synced.")
+            session_count = 0
+            for batch in sessions.pages():
+                DataSynchronizer.preload_users([session['UserId'] for session in batch])
+                for session in batch:
+                    session_count += 1
+                    user = DataSynchronizer.get_user(session['UserId'])
+                    if user is not None:
+                        # Queued; the page's batch write records the outcome
+                        LoginEventsSynchronizer.add_login_session_events(session)
+                    else:
+                        session_not_synched.append(session['id'])
+                        print(f"User login session {session['id']} not synced.")
 
-            print(f"Total user login sessions: {len(sessions)}")
-            print(f"Existing user login sessions: {existing_session_count}")
-            print(f"Synched user login sessions: {synched_session_count}")
-            print(f"User login sessions not synched: {len(session_not_synched)}")
+            record_sync_rows(failed=len(session_not_synched))
+            print(f"Total user login sessions: {session_count}")
+            print(f"Existing user login sessions: {sessions.rows_skipped}")
+            print(f"Synched user login sessions: {sessions.rows_inserted}")
+            print(f"User login sessions not synched: {len(session_not_synched) + sessions.rows_failed}")
             return session_not_synched
         except Exception as error:
+            record_sync_error(error)
             print("Error syncing user login sessions:", error)
             return None
 
-    @staticmethod
-    def get_reancare_generate_otp_events(filters: DataSyncSearchFilter):
-        try:
-            selection_condition = f"AND otp.CreatedAt between '{filters.StartDate}' AND '{filters.EndDate}'" if filters is not None else ''
-            rean_db_connector = get_reancare_db_connector()
-            query = f"""
-            SELECT
-                otp.id, 
-                otp.UserId,
-                otp.Purpose,
-                otp.ValidFrom,
-                otp.ValidTill,
-                otp.CreatedAt,
-                otp.UpdatedAt,
-                otp.DeletedAt,
-                user.id as UserId,
-                user.TenantId as TenantId,
-                user.CreatedAt as UserRegistrationDate
-            FROM otp as otp
-            JOIN users user ON user.id = otp.UserId
-            WHERE
-                user.IsTestUser = FALSE
-                AND
-                otp.Purpose = 'Login'
-                {selection_condition}
-            """
-            rows = rean_db_connector.execute_read_query(query)
-            print(rows)
-            return rows
-        except Exception as error:
-            print("Error retrieving User Medication Delete Events:", error)
-            return None
-        
-    @staticmethod
-    def add_analytics_otp_generate_event(otp):
-        try:
-            event_name = EventType.UserGenerateOtp.value
-            event_category = EventCategory.LoginSession.value
-            event_subject = EventSubject.LoginSession.value
-
-            # user = DataSynchronizer.get_user(medication['UserId'])
-            # if not user:
-            #     print(f"User not found for the event: {medication}")
-            #     return None
-            attributes = {
-                'Purpose': otp['Purpose'],
-                'ValidFrom': otp['ValidFrom'],
-                'ValidTill': otp['ValidTill'],
-            }
-            otp = {
-                'UserId': otp['UserId'],
-                'TenantId': otp['TenantId'],
-                'SessionId': None,
-                'ResourceId': otp['id'],
-                'ResourceType': "User-Login-Session",
-                'SourceName': "ReanCare",
-                'SourceVersion': "Unknown",
-                'EventName': event_name,
-                'EventSubject': event_subject,
-                'EventCategory': event_category,
-                'ActionType': "user-action",
-                'ActionStatement': "Otp generated.",
-                'Attributes': str(attributes),
-                'Timestamp': otp['CreatedAt'],
-                'UserRegistrationDate': otp['UserRegistrationDate']
-            }
-            new_event_added = DataSynchronizer.add_event(otp)
-            if not new_event_added:
-                print(f"Not inserted data.")
-                return None
-            else:
-               return new_event_added
-        except mysql.connector.Error as error:
-            print(f"Failed to insert event: {error}")
-            return None
-
     @staticmethod
     def sync_generate_otp_events(filters: DataSyncSearchFilter):
-        try:
-            existing_event_count = 0
-            synched_event_count = 0
-            event_not_synched = []
-            otps = LoginEventsSynchronizer.get_reancare_generate_otp_events(filters)
-            if otps:
-                for otp in otps:
-                    existing_event = DataSynchronizer.get_existing_event(
-                        otp['UserId'], otp['id'], EventType.UserGenerateOtp)
-                    if existing_event is not None:
-                        existing_event_count += 1
-                    else:
-                        new_event = LoginEventsSynchronizer.add_analytics_otp_generate_event(otp)
-                        if new_event:
-                            synched_event_count += 1
-                        else:
-                            event_not_synched.append(otp)
-                print(f"Existing Event Count: {existing_event_count}")
-                print(f"Synched Event Count: {synched_event_count}")
-                print(f"Event Not Synched: {event_not_synched}")
-            else:
-                print(f"No User Generate Otp Events found.")
-        except Exception as error:
-            print(f"Error syncing User Generate Otp Events: {error}")
+        return SyncEngine.sync(GENERATE_OTP_EVENTS, filters)
 
     @staticmethod
     def get_reancare_user_logout_sessions(filters: DataSyncSearchFilter):
         try:
-            selection_condition = f"AND userDeviceDetail.DeletedAt between '{filters.StartDate}' AND '{filters.EndDate}'" if filters is not None else ''
+            selection_condition = DataSynchronizer.get_selection_condition(filters, "userDeviceDetail.DeletedAt")
             rean_db_connector = get_reancare_db_connector()
             query = f"""
             SELECT
@@ -239,7 +190,7 @@ class LoginEventsSynchronizer:
                 userDeviceDetail.DeletedAt IS NOT null
                 {selection_condition}
             """
-            rows = rean_db_connector.execute_read_query(query)
+            rows = KeysetPager(rean_db_connector, query, "userDeviceDetail.DeletedAt")
             return rows
         except Exception as error:
             print("Error retrieving User Logout Sessions:", error)
@@ -282,32 +233,32 @@ class LoginEventsSynchronizer:
     def sync_user_logout_events(filters: DataSyncSearchFilter):
         
         try:
-            existing_session_count = 0
-            synched_session_count = 0
             session_not_synched = []
             sessions = LoginEventsSynchronizer.get_reancare_user_logout_sessions(filters)
             if sessions is None:
                 print("No user login sessions found.")
                 return None
-            for session in sessions:
-                existing_event = DataSynchronizer.get_existing_event(session['UserId'], session['id'], EventType.UserLogout)
-                if existing_event is not None:
-                    existing_session_count += 1
-                    continue
-                user = DataSynchronizer.get_user(session['UserId'])
-                if user is not None:
-                    LoginEventsSynchronizer.add_logout_session_events(session)
-                    synched_session_count += 1
-                else:
-                    session_not_synched.append(session['id'])
-                    print(f"User logout session {session['id']} not synced.")
+            session_count = 0
+            for page in sessions.pages():
+                session_count += len(page)
+                DataSynchronizer.preload_users([session['UserId'] for session in page])
+                for session in page:
+                    user = DataSynchronizer.get_user(session['UserId'])
+                    if user is not None:
+                        # Queued; the page's batch write records the outcome
+                        LoginEventsSynchronizer.add_logout_session_events(session)
+                    else:
+                        session_not_synched.append(session['id'])
+                        print(f"User logout session {session['id']} not synced.")
 
-            print(f"Total user logout sessions: {len(sessions)}")
-            print(f"Existing user logout sessions: {existing_session_count}")
-            print(f"Synched user logout sessions: {synched_session_count}")
-            print(f"User logout sessions not synched: {len(session_not_synched)}")
+            record_sync_rows(failed=len(session_not_synched))
+            print(f"Total user logout sessions: {session_count}")
+            print(f"Existing user logout sessions: {sessions.rows_skipped}")
+            print(f"Synched user logout sessions: {sessions.rows_inserted}")
+            print(f"User logout sessions not synched: {len(session_not_synched) + sessions.rows_failed}")
             return session_not_synched
         except Exception as error:
+            record_sync_error(error)
             print("Error syncing user logout sessions:", error)
             return None
         
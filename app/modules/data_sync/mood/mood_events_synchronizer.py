@@ -1,23 +1,14 @@
 from app.domain_types.enums.event_categories import EventCategory
-from app.domain_types.enums.event_subjects import EventSubject
 from app.domain_types.enums.event_types import EventType
 from app.domain_types.schemas.data_sync import DataSyncSearchFilter
-from app.modules.data_sync.connectors import get_reancare_db_connector
-from app.modules.data_sync.data_synchronizer import DataSynchronizer
-import mysql.connector
+from app.modules.data_sync.sync_engine import EventSyncSpec, SyncEngine
 
-############################################################
-
-class MoodEventsSynchronizer:
 
-    #region Add Mood events
+############################################################
 
-    @staticmethod
-    def get_reancare_mood_create_events(filters: DataSyncSearchFilter):
-        try:
-            selection_condition = f"AND mood.CreatedAt between '{filters.StartDate}' AND '{filters.EndDate}'" if filters is not None else ''
-            rean_db_connector = get_reancare_db_connector()
-            query = f"""
+MOOD_CREATE_EVENTS = EventSyncSpec(
+    name="User Mood Create Events",
+    query="""
             SELECT
                 mood.id,
                 mood.EhrId,
@@ -37,96 +28,27 @@ class MoodEventsSynchronizer:
             WHERE
                 user.IsTestUser = FALSE
                 {selection_condition}
-            """
-            rows = rean_db_connector.execute_read_query(query)
-            return rows
-        except Exception as error:
-            print("Error retrieving User Mood Create Events:", error)
-            return None
-
-    @staticmethod
-    def add_analytics_mood_create_event(mood):
-        try:
-            event_name = EventType.SymptomAdd.value
-            event_category = EventCategory.Symptoms.value
-            event_subject = mood['Feeling']
-            # user = DataSynchronizer.get_user(medication['UserId'])
-            # if not user:
-            #     print(f"User not found for the event: {medication}")
-            #     return None
-            attributes = {
-                'EhrId': mood['EhrId'],
-                'PatientUserId': mood['UserId'],
-                'Feeling': mood['Feeling'],
-                'Mood': mood['Mood'], 
-                'EnergyLevels': mood['EnergyLevels'],
-                'RecordDate': mood['RecordDate']           
-             }
-            mood = {
-                'UserId': mood['UserId'],
-                'TenantId': mood['TenantId'],
-                'SessionId': None,
-                'ResourceId': mood['id'],
-                'ResourceType': "symptom-how-do-you-feel",
-                'SourceName': "ReanCare",
-                'SourceVersion': "Unknown",
-                'EventName': event_name,
-                'EventSubject': event_subject,
-                'EventCategory': event_category,
-                'ActionType': "User-Action",
-                'ActionStatement': "User added mood record.",
-                'Attributes': str(attributes),
-                'Timestamp': mood['CreatedAt'],
-                'UserRegistrationDate': mood['UserRegistrationDate']
-            }
-            new_event_added = DataSynchronizer.add_event(mood)
-            if not new_event_added:
-                print(f"Not inserted data.")
-                return None
-            else:
-                # print(f"Inserted row into the user_medication_create_events table.")
-                return new_event_added
-        except mysql.connector.Error as error:
-            print(f"Failed to insert records: {error}")
-            return None
-
-    @staticmethod
-    def sync_mood_create_events(filters: DataSyncSearchFilter):
-        try:
-            existing_event_count = 0
-            synched_event_count = 0
-            event_not_synched = []
-            moods = MoodEventsSynchronizer.get_reancare_mood_create_events(filters)
-            if moods:
-                for mood in moods:
-                    existing_event = DataSynchronizer.get_existing_event(
-                        mood['UserId'], mood['id'], EventType.SymptomAdd)
-                    if existing_event is not None:
-                        existing_event_count += 1
-                    else:
-                        new_event = MoodEventsSynchronizer.add_analytics_mood_create_event(mood)
-                        if new_event:
-                            synched_event_count += 1
-                        else:
-                            event_not_synched.append(mood)
-                print(f"Existing Event Count: {existing_event_count}")
-                print(f"Synched Event Count: {synched_event_count}")
-                print(f"Event Not Synched: {event_not_synched}")
-            else:
-                print(f"No User Mood Create Events found.")
-        except Exception as error:
-            print(f"Error syncing User Mood Create Events: {error}")
-    
-    #endregion
-
-    #region Update Mood events
+            """,
+    timestamp_column="mood.CreatedAt",
+    event_type=EventType.SymptomAdd,
+    event_category=EventCategory.Symptoms,
+    event_subject=lambda row: row['Feeling'],
+    resource_type="symptom-how-do-you-feel",
+    action_type="User-Action",
+    action_statement="User added mood record.",
+    attributes={
+        "EhrId": "EhrId",
+        "PatientUserId": "UserId",
+        "Feeling": "Feeling",
+        "Mood": "Mood",
+        "EnergyLevels": "EnergyLevels",
+        "RecordDate": "RecordDate",
+    },
+)
 
-    @staticmethod
-    def get_reancare_mood_update_events(filters: DataSyncSearchFilter):
-        try:
-            selection_condition = f"AND mood.UpdatedAt between '{filters.StartDate}' AND '{filters.EndDate}'" if filters is not None else ''
-            rean_db_connector = get_reancare_db_connector()
-            query = f"""
+MOOD_UPDATE_EVENTS = EventSyncSpec(
+    name="User Mood Update Events",
+    query="""
             SELECT
                 mood.id,
                 mood.EhrId,
@@ -148,96 +70,27 @@ class MoodEventsSynchronizer:
                 AND
                 user.IsTestUser = FALSE
                 {selection_condition}
-            """
-            rows = rean_db_connector.execute_read_query(query)
-            return rows
-        except Exception as error:
-            print("Error retrieving User Mood Update Events:", error)
-            return None
-
-    @staticmethod
-    def add_analytics_mood_update_event(mood):
-        try:
-            event_name = EventType.SymptomUpdate.value
-            event_category = EventCategory.Symptoms.value
-            event_subject = mood['Feeling']
-            # user = DataSynchronizer.get_user(medication['UserId'])
-            # if not user:
-            #     print(f"User not found for the event: {medication}")
-            #     return None
-            attributes = {
-                'EhrId': mood['EhrId'],
-                'PatientUserId': mood['UserId'],
-                'Feeling': mood['Feeling'],
-                'Mood': mood['Mood'], 
-                'EnergyLevels': mood['EnergyLevels'],
-                'RecordDate': mood['RecordDate']           
-             }
-            mood = {
-                'UserId': mood['UserId'],
-                'TenantId': mood['TenantId'],
-                'SessionId': None,
-                'ResourceId': mood['id'],
-                'ResourceType': "symptom-how-do-you-feel",
-                'SourceName': "ReanCare",
-                'SourceVersion': "Unknown",
-                'EventName': event_name,
-                'EventSubject': event_subject,
-                'EventCategory': event_category,
-                'ActionType': "User-Action",
-                'ActionStatement': "User updated mood record.",
-                'Attributes': str(attributes),
-                'Timestamp': mood['UpdatedAt'],
-                'UserRegistrationDate': mood['UserRegistrationDate']
-            }
-            new_event_added = DataSynchronizer.add_event(mood)
-            if not new_event_added:
-                print(f"Not inserted data.")
-                return None
-            else:
-                # print(f"Inserted row into the user_medication_create_events table.")
-                return new_event_added
-        except mysql.connector.Error as error:
-            print(f"Failed to insert records: {error}")
-            return None
-
-    @staticmethod
-    def sync_mood_update_events(filters: DataSyncSearchFilter):
-        try:
-            existing_event_count = 0
-            synched_event_count = 0
-            event_not_synched = []
-            moods = MoodEventsSynchronizer.get_reancare_mood_update_events(filters)
-            if moods:
-                for mood in moods:
-                    existing_event = DataSynchronizer.get_existing_event(
-                        mood['UserId'], mood['id'], EventType.SymptomUpdate)
-                    if existing_event is not None:
-                        existing_event_count += 1
-                    else:
-                        new_event = MoodEventsSynchronizer.add_analytics_mood_update_event(mood)
-                        if new_event:
-                            synched_event_count += 1
-                        else:
-                            event_not_synched.append(mood)
-                print(f"Existing Event Count: {existing_event_count}")
-                print(f"Synched Event Count: {synched_event_count}")
-                print(f"Event Not Synched: {event_not_synched}")
-            else:
-                print(f"No User Mood Update Events found.")
-        except Exception as error:
-            print(f"Error syncing User Mood Update Events: {error}")
-    
-    #endregion
-
-    #region Delete Mood events
+            """,
+    timestamp_column="mood.UpdatedAt",
+    event_type=EventType.SymptomUpdate,
+    event_category=EventCategory.Symptoms,
+    event_subject=lambda row: row['Feeling'],
+    resource_type="symptom-how-do-you-feel",
+    action_type="User-Action",
+    action_statement="User updated mood record.",
+    attributes={
+        "EhrId": "EhrId",
+        "PatientUserId": "UserId",
+        "Feeling": "Feeling",
+        "Mood": "Mood",
+        "EnergyLevels": "EnergyLevels",
+        "RecordDate": "RecordDate",
+    },
+)
 
-    @staticmethod
-    def get_reancare_mood_delete_events(filters: DataSyncSearchFilter):
-        try:
-            selection_condition = f"AND mood.DeletedAt between '{filters.StartDate}' AND '{filters.EndDate}'" if filters is not None else ''
-            rean_db_connector = get_reancare_db_connector()
-            query = f"""
+MOOD_DELETE_EVENTS = EventSyncSpec(
+    name="User Mood Delete Events",
+    query="""
             SELECT
                 mood.id,
                 mood.EhrId,
@@ -259,84 +112,48 @@ class MoodEventsSynchronizer:
                 AND
                 user.IsTestUser = FALSE
                 {selection_condition}
-            """
-            rows = rean_db_connector.execute_read_query(query)
-            return rows
-        except Exception as error:
-            print("Error retrieving User Mood Delete Events:", error)
-            return None
+            """,
+    timestamp_column="mood.DeletedAt",
+    event_type=EventType.SymptomDelete,
+    event_category=EventCategory.Symptoms,
+    event_subject=lambda row: row['Feeling'],
+    resource_type="symptom-how-do-you-feel",
+    action_type="User-Action",
+    action_statement="User deleted mood record.",
+    attributes={
+        "EhrId": "EhrId",
+        "PatientUserId": "UserId",
+        "Feeling": "Feeling",
+        "Mood": "Mood",
+        "EnergyLevels": "EnergyLevels",
+        "RecordDate": "RecordDate",
+    },
+)
+
+############################################################
+
+class MoodEventsSynchronizer:
+
+    #region Add Mood events
+
+    @staticmethod
+    def sync_mood_create_events(filters: DataSyncSearchFilter):
+        return SyncEngine.sync(MOOD_CREATE_EVENTS, filters)
+    
+    #endregion
+
+    #region Update Mood events
 
     @staticmethod
-    def add_analytics_mood_delete_event(mood):
-        try:
-            event_name = EventType.SymptomDelete.value
-            event_category = EventCategory.Symptoms.value
-            event_subject = mood['Feeling']
-            # user = DataSynchronizer.get_user(medication['UserId'])
-            # if not user:
-            #     print(f"User not found for the event: {medication}")
-            #     return None
-            attributes = {
-                'EhrId': mood['EhrId'],
-                'PatientUserId': mood['UserId'],
-                'Feeling': mood['Feeling'],
-                'Mood': mood['Mood'], 
-                'EnergyLevels': mood['EnergyLevels'],
-                'RecordDate': mood['RecordDate']           
-             }
-            mood = {
-                'UserId': mood['UserId'],
-                'TenantId': mood['TenantId'],
-                'SessionId': None,
-                'ResourceId': mood['id'],
-                'ResourceType': "symptom-how-do-you-feel",
-                'SourceName': "ReanCare",
-                'SourceVersion': "Unknown",
-                'EventName': event_name,
-                'EventSubject': event_subject,
-                'EventCategory': event_category,
-                'ActionType': "User-Action",
-                'ActionStatement': "User deleted mood record.",
-                'Attributes': str(attributes),
-                'Timestamp': mood['DeletedAt'],
-                'UserRegistrationDate': mood['UserRegistrationDate']
-            }
-            new_event_added = DataSynchronizer.add_event(mood)
-            if not new_event_added:
-                print(f"Not inserted data.")
-                return None
-            else:
-                # print(f"Inserted row into the user_medication_create_events table.")
-                return new_event_added
-        except mysql.connector.Error as error:
-            print(f"Failed to insert records: {error}")
-            return None
+    def sync_mood_update_events(filters: DataSyncSearchFilter):
+        return SyncEngine.sync(MOOD_UPDATE_EVENTS, filters)
+    
+    #endregion
+
+    #region Delete Mood events
 
     @staticmethod
     def sync_mood_delete_events(filters: DataSyncSearchFilter):
-        try:
-            existing_event_count = 0
-            synched_event_count = 0
-            event_not_synched = []
-            moods = MoodEventsSynchronizer.get_reancare_mood_delete_events(filters)
-            if moods:
-                for mood in moods:
-                    existing_event = DataSynchronizer.get_existing_event(
-                        mood['UserId'], mood['id'], EventType.SymptomDelete)
-                    if existing_event is not None:
-                        existing_event_count += 1
-                    else:
-                        new_event = MoodEventsSynchronizer.add_analytics_mood_delete_event(mood)
-                        if new_event:
-                            synched_event_count += 1
-                        else:
-                            event_not_synched.append(mood)
-                print(f"Existing Event Count: {existing_event_count}")
-                print(f"Synched Event Count: {synched_event_count}")
-                print(f"Event Not Synched: {event_not_synched}")
-            else:
-                print(f"No User Mood Delete Events found.")
-        except Exception as error:
-            print(f"Error syncing User Mood Delete Events: {error}")
+        return SyncEngine.sync(MOOD_DELETE_EVENTS, filters)
     
     #endregion
@@ -0,0 +1,138 @@
+import time
+from enum import Enum
+from app.config.config import get_settings
+from app.domain_types.schemas.data_sync import DataSyncSearchFilter
+from app.modules.data_sync.connectors import get_reancare_db_connector
+from app.modules.data_sync.data_synchronizer import DataSynchronizer
+from app.modules.data_sync.keyset_pager import KeysetPager
+from app.modules.data_sync.sync_state import record_sync_error
+
+############################################################
+
+settings = get_settings()
+
+_sync_events_counter = None
+if settings.METRICS_ENABLED:
+    from app.telemetry.metrics import sync_events_counter as _sync_events_counter
+
+SELECTION_CONDITION = "{selection_condition}"
+
+############################################################
+
+class EventSyncSpec:
+    """
+    Declarative description of how one kind of ReanCare row becomes an
+    analytics event, executed by SyncEngine.
+
+    `query` selects the rows (with `id`, `UserId`, `TenantId` and
+    `UserRegistrationDate` columns) and ends with its WHERE clause, where
+    `{selection_condition}` is replaced by the date-range or watermark
+    condition on `timestamp_column` (e.g. "pulse.CreatedAt"). The event
+    Timestamp is that column unless `timestamp_field` names another.
+
+    `event_subject` and `action_statement` are constants or functions of the
+    row. `attributes` lists the row fields copied into the event attributes,
+    or maps attribute names to row fields.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            query: str,
+            timestamp_column: str,
+            event_type,
+            event_category,
+            event_subject,
+            resource_type: str,
+            action_statement,
+            attributes: list | dict,
+            timestamp_field: str | None = None,
+            action_type: str = "user-action"):
+        self.name = name
+        self.query = query
+        self.timestamp_column = timestamp_column
+        self.timestamp_field = timestamp_field or timestamp_column.split('.')[-1]
+        self.event_type = event_type
+        self.event_category = event_category
+        self.event_subject = event_subject
+        self.resource_type = resource_type
+        self.action_type = action_type
+        self.action_statement = action_statement
+        if isinstance(attributes, dict):
+            self.attributes = list(attributes.items())
+        else:
+            self.attributes = [(field, field) for field in attributes]
+
+    def extract(self, filters: DataSyncSearchFilter | None) -> KeysetPager:
+        selection_condition = DataSynchronizer.get_selection_condition(filters, self.timestamp_column)
+        query = self.query.replace(SELECTION_CONDITION, selection_condition)
+        return KeysetPager(get_reancare_db_connector(), query, self.timestamp_column)
+
+    def transform(self, row) -> dict:
+        attributes = {name: row[field] for name, field in self.attributes}
+        return {
+            'UserId': row['UserId'],
+            'TenantId': row['TenantId'],
+            'SessionId': None,
+            'ResourceId': row['id'],
+            'ResourceType': self.resource_type,
+            'SourceName': "ReanCare",
+            'SourceVersion': "Unknown",
+            'EventName': _resolve(self.event_type, row),
+            'EventSubject': _resolve(self.event_subject, row),
+            'EventCategory': _resolve(self.event_category, row),
+            'ActionType': self.action_type,
+            'ActionStatement': _resolve(self.action_statement, row),
+            'Attributes': str(attributes),
+            'Timestamp': row[self.timestamp_field],
+            'UserRegistrationDate': row['UserRegistrationDate']
+        }
+
+def _resolve(value, row):
+    if callable(value):
+        value = value(row)
+    return value.value if isinstance(value, Enum) else value
+
+############################################################
+
+class SyncEngine:
+    """
+    Extract-transform-load loop shared by every EventSyncSpec: rows are read
+    in keyset pages and the events of a page are written as one batched
+    insert, which skips the events already synced (see the unique event key
+    in migrations/event_keys.py).
+    """
+
+    @staticmethod
+    def sync(spec: EventSyncSpec, filters: DataSyncSearchFilter | None):
+        try:
+            started = time.monotonic()
+            event_not_synched = []
+            rows = spec.extract(filters)
+            if not rows:
+                print(f"No {spec.name} found.")
+                return
+            for page in rows.pages():
+                for row in page:
+                    # Queued for the page's batch write, whose outcome the
+                    # pager adds up (and records in the sync run)
+                    if not DataSynchronizer.add_event(spec.transform(row)):
+                        event_not_synched.append(row['id'])
+            failed = rows.rows_failed + len(event_not_synched)
+            SyncEngine._record(spec, rows.rows_skipped, rows.rows_inserted, failed)
+            print(f"{spec.name}: existing {rows.rows_skipped}, synched {rows.rows_inserted}, "
+                  f"not synched {failed} in {time.monotonic() - started:.1f}s")
+            if len(event_not_synched) > 0:
+                print(f"Event Not Synched: {event_not_synched}")
+        except Exception as error:
+            record_sync_error(error)
+            print(f"Error syncing {spec.name}: {error}")
+
+    @staticmethod
+    def _record(spec: EventSyncSpec, existing: int, synched: int, failed: int):
+        if _sync_events_counter is None:
+            return
+        event_type = _resolve(spec.event_type, None)
+        for outcome, count in (("existing", existing), ("synched", synched), ("failed", failed)):
+            if count > 0:
+                _sync_events_counter.add(count, {"event.type": event_type, "outcome": outcome})
@@ -0,0 +1,307 @@
+import contextvars
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from app.config.config import get_settings
+from app.database.connection_budget import start_connection_budget
+from app.domain_types.schemas.data_sync import DataSyncSearchFilter
+from app.modules.data_sync.assessments.assessment_events_synchronizer import AssessmentEventsSynchronizer
+from app.modules.data_sync.careplans.careplan_events_synchronizer import CareplanEventsSynchronizer
+from app.modules.data_sync.data_synchronizer import DataSynchronizer
+from app.modules.data_sync.exercises.exercise_events_synchronizer import ExerciseEventsSynchronizer
+from app.modules.data_sync.goals.goal_events_synchronizer import GoalEventsSynchronizer
+from app.modules.data_sync.lab_records.lab_record_events_synchonizer import LabRecordEventsSynchronizer
+from app.modules.data_sync.login_events_synchonizer import LoginEventsSynchronizer
+from app.modules.data_sync.medications.medication_events_synchronizer import MedicationEventsSynchronizer
+from app.modules.data_sync.meditations.meditation_events_synchronizer import MeditationEventsSynchronizer
+from app.modules.data_sync.mood.mood_events_synchronizer import MoodEventsSynchronizer
+from app.modules.data_sync.nutrition.nutrition_events_synchronizer import NutritionEventsSynchronizer
+from app.modules.data_sync.sleep.sleep_events_synchronizer import SleepEventsSynchronizer
+from app.modules.data_sync.stand.stand_events_synchronizer import StandEventsSynchronizer
+from app.modules.data_sync.steps.step_events_synchronizer import StepEventsSynchronizer
+from app.modules.data_sync.symptoms.symptom_events_synchronizer import SymptomEventsSynchronizer
+from app.modules.data_sync.user_accounts.user_account_events_synchronizer import UserAccountEventSynchronizer
+from app.modules.data_sync.user_tasks.user_task_events_synchronizer import UserTaskEventsSynchronizer
+from app.modules.data_sync.vitals.blood_glucose_events_synchronizer import BloodGlucoseEventsSynchronizer
+from app.modules.data_sync.vitals.blood_pressure_events_synchronizer import BloodPressureEventsSynchronizer
+from app.modules.data_sync.vitals.body_height_events_synchronizer import BodyHeightEventsSynchronizer
+from app.modules.data_sync.vitals.body_temperature_events_synchronizer import BodyTemperatureEventsSynchronizer
+from app.modules.data_sync.vitals.body_weight_events_synchronizer import BodyWeightEventsSynchronizer
+from app.modules.data_sync.vitals.cholesterol_events_synchronizer import CholesterolEventsSynchronizer
+from app.modules.data_sync.vitals.oxygen_saturation_events_synchronizer import OxygenSaturationEventsSynchronizer
+from app.modules.data_sync.vitals.pulse_events_synchronizer import PulseEventsSynchronizer
+from app.modules.data_sync.sync_runs import SyncRunStore
+from app.modules.data_sync.sync_state import SyncRunMode, record_sync_error, start_sync_run, stop_sync_run
+
+############################################################
+
+settings = get_settings()
+
+class SyncDomain:
+    """
+    A group of synchronizers (named after its /sync endpoint) that runs once
+    every domain in `depends_on` has finished. `full_sync` domains ignore the
+    date range of a /sync/all run, as the events of every other domain need
+    their users (and tenants) to exist whatever their registration date.
+    """
+
+    def __init__(self, name: str, tasks: list, depends_on: list | None = None, full_sync: bool = False):
+        self.name = name
+        self.tasks = tasks
+        self.depends_on = depends_on or []
+        self.full_sync = full_sync
+
+# Every synchronizer, grouped by domain: tenants -> users -> everything else
+SYNC_DOMAINS = [
+    SyncDomain("tenants", [
+        DataSynchronizer.sync_tenants,
+    ], full_sync=True),
+    SyncDomain("users", [
+        DataSynchronizer.sync_users,
+    ], depends_on=["tenants"], full_sync=True),
+    SyncDomain("user-accounts", [
+        UserAccountEventSynchronizer.sync_user_create_events,
+        UserAccountEventSynchronizer.sync_user_delete_events,
+        UserAccountEventSynchronizer.sync_user_password_reset_code_events,
+    ], depends_on=["users"]),
+    SyncDomain("logins", [
+        LoginEventsSynchronizer.sync_user_login_events,
+        LoginEventsSynchronizer.sync_generate_otp_events,
+        LoginEventsSynchronizer.sync_user_logout_events,
+    ], depends_on=["users"]),
+    SyncDomain("medications", [
+        MedicationEventsSynchronizer.sync_medication_create_events,
+        MedicationEventsSynchronizer.sync_medication_delete_events,
+        MedicationEventsSynchronizer.sync_medication_schedule_taken_events,
+        MedicationEventsSynchronizer.sync_medication_schedule_missed_events,
+    ], depends_on=["users"]),
+    SyncDomain("symptoms", [
+        SymptomEventsSynchronizer.sync_symptom_create_events,
+        SymptomEventsSynchronizer.sync_symptom_delete_events,
+    ], depends_on=["users"]),
+    SyncDomain("lab-records", [
+        LabRecordEventsSynchronizer.sync_lab_record_create_events,
+        LabRecordEventsSynchronizer.sync_lab_record_delete_events,
+    ], depends_on=["users"]),
+    SyncDomain("biometrics", [
+        PulseEventsSynchronizer.sync_pulse_create_events,
+        PulseEventsSynchronizer.sync_pulse_delete_events,
+        BodyWeightEventsSynchronizer.sync_body_weight_create_events,
+        BodyWeightEventsSynchronizer.sync_body_weight_delete_events,
+        BodyTemperatureEventsSynchronizer.sync_body_temperature_create_events,
+        BodyTemperatureEventsSynchronizer.sync_body_temperature_delete_events,
+        BodyHeightEventsSynchronizer.sync_body_height_create_events,
+        BodyHeightEventsSynchronizer.sync_body_height_delete_events,
+        BloodPressureEventsSynchronizer.sync_blood_pressure_create_events,
+        BloodPressureEventsSynchronizer.sync_blood_pressure_delete_events,
+        OxygenSaturationEventsSynchronizer.sync_oxygen_saturation_create_events,
+        OxygenSaturationEventsSynchronizer.sync_oxygen_saturation_delete_events,
+        BloodGlucoseEventsSynchronizer.sync_blood_glucose_create_events,
+        BloodGlucoseEventsSynchronizer.sync_blood_glucose_delete_events,
+        CholesterolEventsSynchronizer.sync_cholesterol_create_events,
+        CholesterolEventsSynchronizer.sync_cholesterol_delete_events,
+    ], depends_on=["users"]),
+    SyncDomain("assessments", [
+        AssessmentEventsSynchronizer.sync_assessment_delete_events,
+        AssessmentEventsSynchronizer.sync_assessment_start_events,
+        AssessmentEventsSynchronizer.sync_assessment_complete_events,
+        AssessmentEventsSynchronizer.sync_assessment_question_answered_events,
+    ], depends_on=["users"]),
+    SyncDomain("careplans", [
+        CareplanEventsSynchronizer.sync_careplan_enroll_events,
+        CareplanEventsSynchronizer.sync_careplan_stop_events,
+    ], depends_on=["users"]),
+    SyncDomain("user-tasks", [
+        UserTaskEventsSynchronizer.sync_user_task_start_events,
+        UserTaskEventsSynchronizer.sync_user_task_complete_events,
+        UserTaskEventsSynchronizer.sync_user_task_cancel_events,
+    ], depends_on=["users"]),
+    SyncDomain("steps", [
+        StepEventsSynchronizer.sync_step_create_events,
+    ], depends_on=["users"]),
+    SyncDomain("sleeps", [
+        SleepEventsSynchronizer.sync_sleep_create_events,
+    ], depends_on=["users"]),
+    SyncDomain("nutritions", [
+        NutritionEventsSynchronizer.sync_nutrition_start_events,
+        NutritionEventsSynchronizer.sync_nutrition_complete_events,
+        NutritionEventsSynchronizer.sync_nutrition_cancel_events,
+        NutritionEventsSynchronizer.sync_water_intake_create_events,
+        NutritionEventsSynchronizer.sync_water_intake_delete_events,
+    ], depends_on=["users"]),
+    SyncDomain("stands", [
+        StandEventsSynchronizer.sync_stand_create_events,
+    ], depends_on=["users"]),
+    SyncDomain("moods", [
+        MoodEventsSynchronizer.sync_mood_create_events,
+        MoodEventsSynchronizer.sync_mood_delete_events,
+    ], depends_on=["users"]),
+    SyncDomain("meditations", [
+        MeditationEventsSynchronizer.sync_meditation_start_events,
+        MeditationEventsSynchronizer.sync_meditation_complete_events,
+    ], depends_on=["users"]),
+    SyncDomain("goals", [
+        GoalEventsSynchronizer.sync_goal_create_events,
+        GoalEventsSynchronizer.sync_goal_start_events,
+        GoalEventsSynchronizer.sync_goal_complete_events,
+        GoalEventsSynchronizer.sync_goal_cancel_events,
+    ], depends_on=["users"]),
+    SyncDomain("exercises", [
+        ExerciseEventsSynchronizer.sync_exercise_start_events,
+        ExerciseEventsSynchronizer.sync_exercise_complete_events,
+        ExerciseEventsSynchronizer.sync_exercise_cancel_events,
+    ], depends_on=["users"]),
+]
+
+############################################################
+
+def get_sync_key(task) -> str:
+    return task.__qualname__
+
+def get_connection_limits() -> dict:
+    limits = {settings.REANCARE_DB_NAME: settings.SYNC_REANCARE_DB_MAX_CONNECTIONS}
+    analytics_limit = settings.SYNC_ANALYTICS_DB_MAX_CONNECTIONS
+    if settings.DB_NAME in limits:
+        # Both databases share a name (e.g. on separate servers); use the tighter limit
+        analytics_limit = min(analytics_limit, limits[settings.DB_NAME])
+    limits[settings.DB_NAME] = analytics_limit
+    return limits
+
+def run_sync_task(domain: SyncDomain, task, filters: DataSyncSearchFilter | None) -> bool:
+    """
+    Runs one synchronizer of `domain` over `filters` (in full for a
+    `full_sync` domain); see `record_sync_task`.
+    """
+    return record_sync_task(task, None if domain.full_sync else filters)
+
+def record_sync_task(task, filters: DataSyncSearchFilter | None) -> bool:
+    """
+    Runs one synchronizer over `filters`, records the run in the sync history
+    and returns whether it completed without errors or failed queries.
+    """
+    mode = SyncRunMode.Full if filters is None else SyncRunMode.Range
+    run = start_sync_run(get_sync_key(task), checkpoint=False, mode=mode)
+    try:
+        task(filters)
+    except Exception as error:
+        record_sync_error(error)
+    finally:
+        stop_sync_run()
+    SyncRunStore.record(run)
+    if run.failed:
+        error = "; ".join(run.errors) if len(run.errors) > 0 else f"{run.query_failures} queries failed"
+        print(f"Sync of {get_sync_key(task)} failed: {error}")
+    return not run.failed
+
+class SyncOrchestrator:
+    """
+    Runs the synchronizers of SYNC_DOMAINS concurrently on a bounded worker
+    pool (SYNC_MAX_WORKERS), starting a domain once the domains it depends on
+    have finished. A dependency that failed does not hold its dependents back:
+    inserts are idempotent and the failure shows in the summary. The workers
+    share a connection budget per database (SYNC_*_DB_MAX_CONNECTIONS), so the
+    parallel run never holds more connections than that on either database.
+    """
+
+    _lock = threading.Lock()
+    last_summary = None
+
+    @staticmethod
+    def sync_all(filters: DataSyncSearchFilter | None = None):
+        """
+        Full or date-range sync of every domain. `full_sync` domains are
+        always synced in full.
+        """
+        if not SyncOrchestrator._lock.acquire(blocking=False):
+            print("Full sync is already running.")
+            return None
+        try:
+            summary = SyncOrchestrator.run(lambda domain, task: run_sync_task(domain, task, filters))
+            SyncOrchestrator.last_summary = summary
+            return summary
+        finally:
+            SyncOrchestrator._lock.release()
+
+    @staticmethod
+    def run(run_task, domains: list | None = None) -> dict:
+        """
+        Runs `run_task(domain, task)` for every synchronizer of `domains` in
+        dependency order and returns the per-domain summary. `run_task` returns
+        whether the synchronizer succeeded.
+        """
+        domains = domains if domains is not None else SYNC_DOMAINS
+        names = {domain.name for domain in domains}
+        waiting = {
+            domain.name: {name for name in domain.depends_on if name in names}
+            for domain in domains
+        }
+        remaining = {domain.name: len(domain.tasks) for domain in domains}
+        summary = {
+            domain.name: {
+                "Synchronizers": len(domain.tasks),
+                "Succeeded"    : 0,
+                "Failed"       : [],
+                "Seconds"      : 0.0,
+            }
+            for domain in domains
+        }
+        started_at = {}
+        started = time.monotonic()
+        budget_context = contextvars.copy_context()
+        budget_context.run(start_connection_budget, get_connection_limits())
+
+        with ThreadPoolExecutor(
+                max_workers=max(1, settings.SYNC_MAX_WORKERS),
+                thread_name_prefix="sync") as executor:
+            futures = {}
+
+            def finish_domain(name):
+                summary[name]["Seconds"] = round(time.monotonic() - started_at[name], 3)
+                for pending in waiting.values():
+                    pending.discard(name)
+
+            def submit_ready():
+                ready = [
+                    domain for domain in domains
+                    if domain.name not in started_at and len(waiting[domain.name]) == 0
+                ]
+                for domain in ready:
+                    started_at[domain.name] = time.monotonic()
+                    if len(domain.tasks) == 0:
+                        finish_domain(domain.name)
+                    for task in domain.tasks:
+                        # Each worker gets its own copy of the budget context,
+                        # so per-run state (sync run, event batch) stays apart
+                        context = budget_context.copy()
+                        future = executor.submit(context.run, run_task, domain, task)
+                        futures[future] = (domain, task)
+                if any(len(domain.tasks) == 0 for domain in ready):
+                    submit_ready()
+
+            submit_ready()
+            while len(futures) > 0:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    domain, task = futures.pop(future)
+                    try:
+                        succeeded = future.result()
+                    except Exception as error:
+                        print(f"Error running {get_sync_key(task)}:", error)
+                        succeeded = False
+                    if succeeded:
+                        summary[domain.name]["Succeeded"] += 1
+                    else:
+                        summary[domain.name]["Failed"].append(get_sync_key(task))
+                    remaining[domain.name] -= 1
+                    if remaining[domain.name] == 0:
+                        finish_domain(domain.name)
+                submit_ready()
+
+        elapsed = time.monotonic() - started
+        for name, result in summary.items():
+            status = "ok" if len(result["Failed"]) == 0 else f"{len(result['Failed'])} failed"
+            print(f"Sync [{name}]: {result['Succeeded']}/{result['Synchronizers']} synchronizers succeeded "
+                  f"({status}) in {result['Seconds']}s")
+        failed = sum(len(result["Failed"]) for result in summary.values())
+        print(f"Sync of {len(summary)} domains completed in {elapsed:.1f}s with {failed} failed synchronizers.")
+        return summary
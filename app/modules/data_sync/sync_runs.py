@@ -0,0 +1,142 @@
+from app.common.utils import generate_uuid4
+from app.config.config import get_settings
+from app.modules.data_sync.connectors import get_analytics_db_connector
+from app.modules.data_sync.sync_state import SyncRun
+
+############################################################
+
+settings = get_settings()
+
+_duration_histogram = None
+_rows_counter = None
+_throughput_histogram = None
+if settings.METRICS_ENABLED:
+    from app.telemetry.metrics import (
+        sync_run_duration_histogram as _duration_histogram,
+        sync_run_rows_counter as _rows_counter,
+        sync_run_throughput_histogram as _throughput_histogram,
+    )
+
+class SyncRunStatus:
+    Completed = "Completed"
+    Failed    = "Failed"
+
+def rows_per_second(rows: int, seconds: float) -> float | None:
+    return round(rows / seconds, 2) if seconds > 0 else None
+
+############################################################
+
+class SyncRunStore:
+    """
+    History of synchronizer runs in the sync_runs table: row counts and the
+    throughput of their extract and load phases, so sync regressions show
+    over time. Also exported as sync.run.* metrics when METRICS_ENABLED.
+    """
+
+    @staticmethod
+    def record(run: SyncRun) -> str | None:
+        row = SyncRunStore.get_run_row(run)
+        SyncRunStore.export_metrics(run, row)
+        try:
+            analytics_db_connector = get_analytics_db_connector()
+            query = """
+            INSERT INTO sync_runs (
+                id, SyncKey, Mode, Status, StartedAt, CompletedAt, DurationSeconds,
+                RowsExtracted, RowsInserted, RowsSkipped, RowsFailed,
+                ExtractSeconds, LoadSeconds, ExtractRowsPerSecond, LoadRowsPerSecond, Error
+            ) VALUES (
+                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+            )
+            """
+            result = analytics_db_connector.execute_write_query(query, tuple(row.values()))
+            if result is None:
+                print(f"Failed to record the sync run of {run.sync_key}.")
+                return None
+            return row['id']
+        except Exception as error:
+            print("Error recording sync run:", error)
+            return None
+
+    @staticmethod
+    def get_run_row(run: SyncRun) -> dict:
+        duration = (run.completed_at - run.started_at).total_seconds() if run.completed_at else 0.0
+        loaded = run.rows_inserted + run.rows_skipped + run.rows_failed
+        error = None
+        if run.failed:
+            error = "; ".join(run.errors) if len(run.errors) > 0 else f"{run.query_failures} queries failed"
+        return {
+            'id'                  : generate_uuid4(),
+            'SyncKey'             : run.sync_key,
+            'Mode'                : run.mode,
+            'Status'              : SyncRunStatus.Failed if run.failed else SyncRunStatus.Completed,
+            'StartedAt'           : run.started_at,
+            'CompletedAt'         : run.completed_at,
+            'DurationSeconds'     : round(duration, 3),
+            'RowsExtracted'       : run.rows_extracted,
+            'RowsInserted'        : run.rows_inserted,
+            'RowsSkipped'         : run.rows_skipped,
+            'RowsFailed'          : run.rows_failed,
+            'ExtractSeconds'      : round(run.extract_seconds, 3),
+            'LoadSeconds'         : round(run.load_seconds, 3),
+            'ExtractRowsPerSecond': rows_per_second(run.rows_extracted, run.extract_seconds),
+            'LoadRowsPerSecond'   : rows_per_second(loaded, run.load_seconds),
+            'Error'               : error[:4000] if error else None,
+        }
+
+    @staticmethod
+    def export_metrics(run: SyncRun, row: dict):
+        if _duration_histogram is None:
+            return
+        attributes = {"sync.key": run.sync_key, "sync.mode": run.mode}
+        _duration_histogram.record(row['DurationSeconds'], {**attributes, "status": row['Status']})
+        for outcome, column in (
+                ("extracted", 'RowsExtracted'),
+                ("inserted", 'RowsInserted'),
+                ("skipped", 'RowsSkipped'),
+                ("failed", 'RowsFailed')):
+            if row[column] > 0:
+                _rows_counter.add(row[column], {**attributes, "outcome": outcome})
+        for phase, column in (("extract", 'ExtractRowsPerSecond'), ("load", 'LoadRowsPerSecond')):
+            if row[column] is not None:
+                _throughput_histogram.record(row[column], {**attributes, "phase": phase})
+
+    @staticmethod
+    def get_runs(sync_key: str | None = None, status: str | None = None, limit: int = 100):
+        try:
+            analytics_db_connector = get_analytics_db_connector()
+            conditions = []
+            params = []
+            if sync_key is not None:
+                conditions.append("SyncKey = %s")
+                params.append(sync_key)
+            if status is not None:
+                conditions.append("Status = %s")
+                params.append(status)
+            where = f"WHERE {' AND '.join(conditions)}" if len(conditions) > 0 else ""
+            query = f"""
+            SELECT * from sync_runs
+            {where}
+            ORDER BY StartedAt DESC
+            LIMIT {int(limit)}
+            """
+            return analytics_db_connector.execute_read_query(query, tuple(params) if len(params) > 0 else None)
+        except Exception as error:
+            print("Error retrieving sync runs:", error)
+            return None
+
+    @staticmethod
+    def get_run(run_id: str):
+        try:
+            analytics_db_connector = get_analytics_db_connector()
+            query = """
+            SELECT * from sync_runs
+            WHERE
+                id = %s
+            """
+            rows = analytics_db_connector.execute_read_query(query, (run_id,))
+            if rows is not None and len(rows) > 0:
+                return rows[0]
+            return None
+        except Exception as error:
+            print("Error retrieving sync run:", error)
+            return None
@@ -0,0 +1,211 @@
+import contextvars
+from datetime import datetime, timezone
+from app.common.utils import generate_uuid4
+from app.database.query_stats import start_failure_counter, stop_failure_counter
+from app.modules.data_sync.connectors import get_analytics_db_connector
+
+############################################################
+
+_current_run = contextvars.ContextVar("sync_run", default=None)
+
+############################################################
+
+class SyncRunMode:
+    Full        = "Full"
+    Range       = "Range"
+    Incremental = "Incremental"
+
+class SyncRun:
+    """
+    Outcome of one run of a synchronizer. The sync_* methods log and swallow
+    their errors, so they report them here (`record_sync_error`) and failed
+    queries are counted while the run is active; a run with either must not
+    advance the watermark. Runs that are not incremental (e.g. a date-range
+    /sync/all) only collect the outcome and never checkpoint.
+
+    Row counts and the time spent reading (extract) and transforming and
+    writing (load) pages are collected too, for the run history (see
+    sync_runs).
+    """
+
+    def __init__(self, sync_key: str, checkpoint: bool = True, mode: str = SyncRunMode.Incremental):
+        self.sync_key = sync_key
+        self.checkpoint = checkpoint
+        self.mode = mode
+        self.errors = []
+        self.started_at = utc_now()
+        self.completed_at = None
+        self.rows_extracted = 0
+        self.rows_inserted = 0
+        self.rows_skipped = 0
+        self.rows_failed = 0
+        self.extract_seconds = 0.0
+        self.load_seconds = 0.0
+        self._query_failures = None
+
+    @property
+    def query_failures(self) -> int:
+        return self._query_failures.failures if self._query_failures is not None else 0
+
+    @property
+    def failed(self) -> bool:
+        return len(self.errors) > 0 or self.query_failures > 0
+
+def start_sync_run(sync_key: str, checkpoint: bool = True, mode: str = SyncRunMode.Incremental) -> SyncRun:
+    run = SyncRun(sync_key, checkpoint, mode)
+    run._query_failures = start_failure_counter()
+    _current_run.set(run)
+    return run
+
+def stop_sync_run():
+    run = _current_run.get()
+    if run is not None:
+        run.completed_at = utc_now()
+    stop_failure_counter()
+    _current_run.set(None)
+
+def record_sync_error(error):
+    run = _current_run.get()
+    if run is not None:
+        run.errors.append(str(error))
+
+def record_sync_extract(rows: int, seconds: float):
+    run = _current_run.get()
+    if run is not None:
+        run.rows_extracted += rows
+        run.extract_seconds += seconds
+
+def record_sync_load(seconds: float):
+    run = _current_run.get()
+    if run is not None:
+        run.load_seconds += seconds
+
+def record_sync_rows(inserted: int = 0, skipped: int = 0, failed: int = 0):
+    """
+    Outcome of extracted rows: inserted (as events or records), skipped as
+    already synced, or failed.
+    """
+    run = _current_run.get()
+    if run is not None:
+        run.rows_inserted += inserted
+        run.rows_skipped += skipped
+        run.rows_failed += failed
+
+def checkpoint_sync_run(watermark_at, last_id):
+    """
+    Advances the watermark of the current run to a keyset position whose rows
+    are loaded, so a run that fails later resumes from there.
+    """
+    run = _current_run.get()
+    if run is None or not run.checkpoint or run.failed or watermark_at is None:
+        return
+    SyncStateStore.advance(run.sync_key, watermark_at, str(last_id), completed=False)
+
+def utc_now() -> datetime:
+    # ReanCare timestamps are naive UTC
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+############################################################
+
+class SyncStateStore:
+    """
+    Per-synchronizer high-water marks in the sync_state table.
+    """
+
+    @staticmethod
+    def get_state(sync_key: str):
+        try:
+            analytics_db_connector = get_analytics_db_connector()
+            query = """
+            SELECT * from sync_state
+            WHERE
+                SyncKey = %s
+            """
+            rows = analytics_db_connector.execute_read_query(query, (sync_key,))
+            if rows is not None and len(rows) > 0:
+                return rows[0]
+            return None
+        except Exception as error:
+            print("Error retrieving sync state:", error)
+            return None
+
+    @staticmethod
+    def get_states():
+        try:
+            analytics_db_connector = get_analytics_db_connector()
+            query = """
+            SELECT * from sync_state
+            ORDER BY SyncKey
+            """
+            return analytics_db_connector.execute_read_query(query)
+        except Exception as error:
+            print("Error retrieving sync states:", error)
+            return None
+
+    @staticmethod
+    def get_or_create_state(sync_key: str):
+        state = SyncStateStore.get_state(sync_key)
+        if state is not None:
+            return state
+        try:
+            analytics_db_connector = get_analytics_db_connector()
+            query = """
+            INSERT INTO sync_state (
+                id, SyncKey, RunCount, FailureCount
+            ) VALUES (
+                %s, %s, 0, 0
+            )
+            """
+            # A concurrent run may have created it; read back either way
+            analytics_db_connector.execute_write_query(query, (generate_uuid4(), sync_key))
+        except Exception as error:
+            print("Error creating sync state:", error)
+        return SyncStateStore.get_state(sync_key)
+
+    @staticmethod
+    def advance(sync_key: str, watermark_at: datetime, last_id: str | None = None, completed: bool = True) -> bool:
+        """
+        Moves the watermark forward, at the end of a successful run or (with
+        `completed=False`) at a page checkpoint. Done in a single conditional
+        UPDATE so overlapping runs can never move it backwards.
+        """
+        try:
+            analytics_db_connector = get_analytics_db_connector()
+            now = utc_now()
+            run_columns = """,
+                LastRunAt = %s,
+                LastSuccessAt = %s,
+                LastError = NULL,
+                RunCount = RunCount + 1""" if completed else ""
+            query = f"""
+            UPDATE sync_state SET
+                WatermarkAt = %s,
+                LastId = %s{run_columns}
+            WHERE
+                SyncKey = %s
+                AND
+                (WatermarkAt IS NULL OR WatermarkAt <= %s)
+            """
+            params = (watermark_at, last_id) + ((now, now) if completed else ()) + (sync_key, watermark_at)
+            row_count = analytics_db_connector.execute_write_query(query, params)
+            return row_count is not None
+        except Exception as error:
+            print("Error advancing sync state:", error)
+            return False
+
+    @staticmethod
+    def record_failure(sync_key: str, error: str):
+        try:
+            analytics_db_connector = get_analytics_db_connector()
+            query = """
+            UPDATE sync_state SET
+                LastRunAt = %s,
+                LastError = %s,
+                RunCount = RunCount + 1,
+                FailureCount = FailureCount + 1
+            WHERE
+                SyncKey = %s
+            """
+            analytics_db_connector.execute_write_query(query, (utc_now(), error[:4000], sync_key))
+        except Exception as error:
+            print("Error recording sync failure:", error)
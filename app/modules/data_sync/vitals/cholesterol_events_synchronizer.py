@@ -2,22 +2,14 @@ from app.domain_types.enums.event_categories import EventCategory
 from app.domain_types.enums.event_subjects import EventSubject
 from app.domain_types.enums.event_types import EventType
 from app.domain_types.schemas.data_sync import DataSyncSearchFilter
-from app.modules.data_sync.connectors import get_reancare_db_connector
-from app.modules.data_sync.data_synchronizer import DataSynchronizer
-import mysql.connector
+from app.modules.data_sync.sync_engine import EventSyncSpec, SyncEngine
 
-############################################################
-
-class CholesterolEventsSynchronizer:
 
-    #region Create Blood Cholesterol events
+############################################################
 
-    @staticmethod
-    def get_reancare_cholesterol_create_events(filters: DataSyncSearchFilter):
-        try:
-            selection_condition = f"AND cholesterol.CreatedAt between '{filters.StartDate}' AND '{filters.EndDate}'" if filters is not None else ''
-            rean_db_connector = get_reancare_db_connector()
-            query = f"""
+CHOLESTEROL_CREATE_EVENTS = EventSyncSpec(
+    name="User Blood Cholesterol Create Events",
+    query="""
             SELECT
                 cholesterol.id,
                 cholesterol.PatientUserId as UserId,
@@ -42,99 +34,30 @@ class CholesterolEventsSynchronizer:
             WHERE
                 user.IsTestUser = FALSE
                 {selection_condition}
-            """
-            rows = rean_db_connector.execute_read_query(query)
-            return rows
-        except Exception as error:
-            print("Error retrieving User Blood Cholesterol Create Events:", error)
-            return None
-
-    @staticmethod
-    def add_analytics_cholesterol_create_event(cholesterol):
-        try:
-            event_name = EventType.VitalsAdd.value
-            event_category = EventCategory.Vitals.value
-            event_subject = EventSubject.VitalsCholesterol.value
-            # user = DataSynchronizer.get_user(medication['UserId'])
-            # if not user:
-            #     print(f"User not found for the event: {medication}")
-            #     return None
-            attributes = {
-                'EhrId': cholesterol['EhrId'],
-                'TotalCholesterol': cholesterol['TotalCholesterol'],
-                'HDL': cholesterol['HDL'],
-                'LDL': cholesterol['LDL'],
-                'TriglycerideLevel': cholesterol['TriglycerideLevel'],
-                'Ratio': cholesterol['Ratio'],
-                'A1CLevel': cholesterol['A1CLevel'],
-                'Unit': cholesterol['Unit'],
-                'RecordDate': cholesterol['RecordDate'],
-                'RecordedByUserId': cholesterol['RecordedByUserId'],
-            }
-            cholesterol = {
-                'UserId': cholesterol['UserId'],
-                'TenantId': cholesterol['TenantId'],
-                'SessionId': None,
-                'ResourceId': cholesterol['id'],
-                'ResourceType': "biometric",
-                'SourceName': "ReanCare",
-                'SourceVersion': "Unknown",
-                'EventName': event_name,
-                'EventSubject': event_subject,
-                'EventCategory': event_category,
-                'ActionType': "user-action",
-                'ActionStatement': "User added a blood cholesterol.",
-                'Attributes': str(attributes),
-                'Timestamp': cholesterol['CreatedAt'],
-                'UserRegistrationDate': cholesterol['UserRegistrationDate']
-            }
-            new_event_added = DataSynchronizer.add_event(cholesterol)
-            if not new_event_added:
-                print(f"Not inserted data.")
-                return None
-            else:
-                return new_event_added
-        except mysql.connector.Error as error:
-            print(f"Failed to insert records: {error}")
-            return None
-
-    @staticmethod
-    def sync_cholesterol_create_events(filters: DataSyncSearchFilter):
-        try:
-            existing_event_count = 0
-            synched_event_count = 0
-            event_not_synched = []
-            cholesterol_records = CholesterolEventsSynchronizer.get_reancare_cholesterol_create_events(filters)
-            if cholesterol_records:
-                for cholesterol in cholesterol_records:
-                    existing_event = DataSynchronizer.get_existing_event(
-                        cholesterol['UserId'], cholesterol['id'], EventType.VitalsAdd)
-                    if existing_event is not None:
-                        existing_event_count += 1
-                    else:
-                        new_event = CholesterolEventsSynchronizer.add_analytics_cholesterol_create_event(cholesterol)
-                        if new_event:
-                            synched_event_count += 1
-                        else:
-                            event_not_synched.append(cholesterol)
-                print(f"Existing Event Count: {existing_event_count}")
-                print(f"Synched Event Count: {synched_event_count}")
-                print(f"Event Not Synched: {event_not_synched}")
-            else:
-                print(f"No User Blood Cholesterol Create Events found.")
-        except Exception as error:
-            print(f"Error syncing User Blood Cholesterol Create Events: {error}")
+            """,
+    timestamp_column="cholesterol.CreatedAt",
+    event_type=EventType.VitalsAdd,
+    event_category=EventCategory.Vitals,
+    event_subject=EventSubject.VitalsCholesterol,
+    resource_type="biometric",
+    action_statement="User added a blood cholesterol.",
+    attributes=[
+        "EhrId",
+        "TotalCholesterol",
+        "HDL",
+        "LDL",
+        "TriglycerideLevel",
+        "Ratio",
+        "A1CLevel",
+        "Unit",
+        "RecordDate",
+        "RecordedByUserId",
+    ],
+)
 
-    #endregion
-
-    #region Delete Blood Cholesterol events
-
-    @staticmethod
-    def get_reancare_cholesterol_delete_events(filters: DataSyncSearchFilter):
-        try:
-            selection_condition = f"AND cholesterol.DeletedAt between '{filters.StartDate}' AND '{filters.EndDate}'" if filters is not None else ''
-            rean_db_connector = get_reancare_db_connector()
-            query = f"""
+CHOLESTEROL_DELETE_EVENTS = EventSyncSpec(
+    name="Blood Cholesterol Delete Events",
+    query="""
              SELECT
                 cholesterol.id,
                 cholesterol.PatientUserId as UserId,
@@ -161,88 +84,44 @@ class CholesterolEventsSynchronizer:
                 AND
                 cholesterol.DeletedAt IS NOT NULL
                 {selection_condition}
-            """
-            rows = rean_db_connector.execute_read_query(query)
-            return rows
-        except Exception as error:
-            print("Error retrieving User Blood Cholesterol Delete Events:", error)
-            return None
+            """,
+    timestamp_column="cholesterol.DeletedAt",
+    event_type=EventType.VitalsDelete,
+    event_category=EventCategory.Vitals,
+    event_subject=EventSubject.VitalsCholesterol,
+    resource_type="biometric",
+    action_statement="User deleted a blood cholesterol.",
+    attributes=[
+        "EhrId",
+        "TotalCholesterol",
+        "HDL",
+        "LDL",
+        "TriglycerideLevel",
+        "Ratio",
+        "A1CLevel",
+        "Unit",
+        "RecordDate",
+        "RecordedByUserId",
+    ],
+)
+
+############################################################
+
+class CholesterolEventsSynchronizer:
+
+    #region Create Blood Cholesterol events
 
     @staticmethod
-    def add_analytics_cholesterol_delete_event(cholesterol):
-        try:
-            event_name = EventType.VitalsDelete.value
-            event_category = EventCategory.Vitals.value
-            event_subject = EventSubject.VitalsCholesterol.value
-            # user = DataSynchronizer.get_user(medication['UserId'])
-            # if not user:
-            #     print(f"User not found for the event: {medication}")
-            #     return None
-            attributes = {
-                'EhrId': cholesterol['EhrId'],
-                'TotalCholesterol': cholesterol['TotalCholesterol'],
-                'HDL': cholesterol['HDL'],
-                'LDL': cholesterol['LDL'],
-                'TriglycerideLevel': cholesterol['TriglycerideLevel'],
-                'Ratio': cholesterol['Ratio'],
-                'A1CLevel': cholesterol['A1CLevel'],
-                'Unit': cholesterol['Unit'],
-                'RecordDate': cholesterol['RecordDate'],
-                'RecordedByUserId': cholesterol['RecordedByUserId'],
-            }
-            cholesterol = {
-                'UserId': cholesterol['UserId'],
-                'TenantId': cholesterol['TenantId'],
-                'SessionId': None,
-                'ResourceId': cholesterol['id'],
-                'ResourceType': "biometric",
-                'SourceName': "ReanCare",
-                'SourceVersion': "Unknown",
-                'EventName': event_name,
-                'EventSubject': event_subject,
-                'EventCategory': event_category,
-                'ActionType': "user-action",
-                'ActionStatement': "User deleted a blood cholesterol.",
-                'Attributes': str(attributes),
-                'Timestamp': cholesterol['DeletedAt'],
-                'UserRegistrationDate': cholesterol['UserRegistrationDate']
-            }
-            new_event_added = DataSynchronizer.add_event(cholesterol)
-            if not new_event_added:
-                print(f"Not inserted data.")
-                return None
-            else:
-                return new_event_added
-        except mysql.connector.Error as error:
-            print(f"Failed to insert event: {error}")
-            return None
+    def sync_cholesterol_create_events(filters: DataSyncSearchFilter):
+        return SyncEngine.sync(CHOLESTEROL_CREATE_EVENTS, filters)
+
+    #endregion
+
+    #region Delete Blood Cholesterol events
 
     @staticmethod
     def sync_cholesterol_delete_events(filters: DataSyncSearchFilter):
-        try:
-            existing_event_count = 0
-            synched_event_count = 0
-            event_not_synched = []
-            cholesterol_records = CholesterolEventsSynchronizer.get_reancare_cholesterol_delete_events(filters)
-            if cholesterol_records:
-                for cholesterol in cholesterol_records:
-                    existing_event = DataSynchronizer.get_existing_event(
-                        cholesterol['UserId'], cholesterol['id'], EventType.VitalsDelete)
-                    if existing_event is not None:
-                        existing_event_count += 1
-                    else:
-                        new_event = CholesterolEventsSynchronizer.add_analytics_cholesterol_delete_event(cholesterol)
-                        if new_event:
-                            synched_event_count += 1
-                        else:
-                            event_not_synched.append(cholesterol)
-                print(f"Existing Event Count: {existing_event_count}")
-                print(f"Synched Event Count: {synched_event_count}")
-                print(f"Event Not Synched: {event_not_synched}")
-            else:
-                print(f"No User Blood Cholesterol Delete Events found.")
-        except Exception as error:
-            print(f"Error syncing Blood Cholesterol Delete Events: {error}")
+        return SyncEngine.sync(CHOLESTEROL_DELETE_EVENTS, filters)
 
     #endregion
 
@@ -2,22 +2,14 @@ from app.domain_types.enums.event_categories import EventCategory
 from app.domain_types.enums.event_subjects import EventSubject
 from app.domain_types.enums.event_types import EventType
 from app.domain_types.schemas.data_sync import DataSyncSearchFilter
-from app.modules.data_sync.connectors import get_reancare_db_connector
-from app.modules.data_sync.data_synchronizer import DataSynchronizer
-import mysql.connector
+from app.modules.data_sync.sync_engine import EventSyncSpec, SyncEngine
 
-############################################################
-
-class OxygenSaturationEventsSynchronizer:
 
-    #region Create Blood Oxygen Saturation events
+############################################################
 
-    @staticmethod
-    def get_reancare_oxygen_saturation_create_events(filters: DataSyncSearchFilter):
-        try:
-            selection_condition = f"AND oxygenSaturation.CreatedAt between '{filters.StartDate}' AND '{filters.EndDate}'" if filters is not None else ''
-            rean_db_connector = get_reancare_db_connector()
-            query = f"""
+OXYGEN_SATURATION_CREATE_EVENTS = EventSyncSpec(
+    name="User Blood Oxygen Saturation Create Events",
+    query="""
             SELECT
                 oxygenSaturation.id,
                 oxygenSaturation.PatientUserId as UserId,
@@ -39,96 +31,27 @@ class OxygenSaturationEventsSynchronizer:
             WHERE
                 user.IsTestUser = FALSE
                 {selection_condition}
-            """
-            rows = rean_db_connector.execute_read_query(query)
-            return rows
-        except Exception as error:
-            print("Error retrieving User Oxygen Saturation Create Events:", error)
-            return None
-
-    @staticmethod
-    def add_analytics_oxygen_saturation_create_event(oxygen_saturation):
-        try:
-            event_name = EventType.VitalsAdd.value
-            event_category = EventCategory.Vitals.value
-            event_subject = EventSubject.VitalsBloodOxygenSaturation.value
-            # user = DataSynchronizer.get_user(medication['UserId'])
-            # if not user:
-            #     print(f"User not found for the event: {medication}")
-            #     return None
-            attributes = {
-                'EhrId': oxygen_saturation['EhrId'],
-                'Provider': oxygen_saturation['Provider'],
-                'TerraSummaryId': oxygen_saturation['TerraSummaryId'],
-                'BloodOxygenSaturation': oxygen_saturation['BloodOxygenSaturation'],
-                'Unit': oxygen_saturation['Unit'],
-                'RecordDate': oxygen_saturation['RecordDate'],
-                'RecordedByUserId': oxygen_saturation['RecordedByUserId'],
-            }
-            oxygen_saturation = {
-                'UserId': oxygen_saturation['UserId'],
-                'TenantId': oxygen_saturation['TenantId'],
-                'SessionId': None,
-                'ResourceId': oxygen_saturation['id'],
-                'ResourceType': "biometric",
-                'SourceName': "ReanCare",
-                'SourceVersion': "Unknown",
-                'EventName': event_name,
-                'EventSubject': event_subject,
-                'EventCategory': event_category,
-                'ActionType': "user-action",
-                'ActionStatement': "User added a blood oxygen saturation.",
-                'Attributes': str(attributes),
-                'Timestamp': oxygen_saturation['CreatedAt'],
-                'UserRegistrationDate': oxygen_saturation['UserRegistrationDate']
-            }
-            new_event_added = DataSynchronizer.add_event(oxygen_saturation)
-            if not new_event_added:
-                print(f"Not inserted data.")
-                return None
-            else:
-                return new_event_added
-        except mysql.connector.Error as error:
-            print(f"Failed to insert records: {error}")
-            return None
-
-    @staticmethod
-    def sync_oxygen_saturation_create_events(filters: DataSyncSearchFilter):
-        try:
-            existing_event_count = 0
-            synched_event_count = 0
-            event_not_synched = []
-            oxygen_saturation_records = OxygenSaturationEventsSynchronizer.get_reancare_oxygen_saturation_create_events(filters)
-            if oxygen_saturation_records:
-                for oxygen_saturation in oxygen_saturation_records:
-                    existing_event = DataSynchronizer.get_existing_event(
-                        oxygen_saturation['UserId'], oxygen_saturation['id'], EventType.VitalsAdd)
-                    if existing_event is not None:
-                        existing_event_count += 1
-                    else:
-                        new_event = OxygenSaturationEventsSynchronizer.add_analytics_oxygen_saturation_create_event(oxygen_saturation)
-                        if new_event:
-                            synched_event_count += 1
-                        else:
-                            event_not_synched.append(oxygen_saturation)
-                print(f"Existing Event Count: {existing_event_count}")
-                print(f"Synched Event Count: {synched_event_count}")
-                print(f"Event Not Synched: {event_not_synched}")
-            else:
-                print(f"No User Blood Oxygen Saturation Create Events found.")
-        except Exception as error:
-            print(f"Error syncing User Blood Oxygen Saturation Create Events: {error}")
+            """,
+    timestamp_column="oxygenSaturation.CreatedAt",
+    event_type=EventType.VitalsAdd,
+    event_category=EventCategory.Vitals,
+    event_subject=EventSubject.VitalsBloodOxygenSaturation,
+    resource_type="biometric",
+    action_statement="User added a blood oxygen saturation.",
+    attributes=[
+        "EhrId",
+        "Provider",
+        "TerraSummaryId",
+        "BloodOxygenSaturation",
+        "Unit",
+        "RecordDate",
+        "RecordedByUserId",
+    ],
+)
 
-    #endregion
-
-    #region Delete Blood Oxygen Saturation events
-
-    @staticmethod
-    def get_reancare_oxygen_saturation_delete_events(filters: DataSyncSearchFilter):
-        try:
-            selection_condition = f"AND oxygenSaturation.DeletedAt between '{filters.StartDate}' AND '{filters.EndDate}'" if filters is not None else ''
-            rean_db_connector = get_reancare_db_connector()
-            query = f"""
+OXYGEN_SATURATION_DELETE_EVENTS = EventSyncSpec(
+    name="Blood Oxygen Saturation Delete Events",
+    query="""
              SELECT
                 oxygenSaturation.id,
                 oxygenSaturation.PatientUserId as UserId,
@@ -152,85 +75,41 @@ class OxygenSaturationEventsSynchronizer:
                 AND
                 oxygenSaturation.DeletedAt IS NOT NULL
                 {selection_condition}
-            """
-            rows = rean_db_connector.execute_read_query(query)
-            return rows
-        except Exception as error:
-            print("Error retrieving User Blood Oxygen Saturation Delete Events:", error)
-            return None
+            """,
+    timestamp_column="oxygenSaturation.DeletedAt",
+    event_type=EventType.VitalsDelete,
+    event_category=EventCategory.Vitals,
+    event_subject=EventSubject.VitalsBloodOxygenSaturation,
+    resource_type="biometric",
+    action_statement="User deleted a blood oxygen saturation.",
+    attributes=[
+        "EhrId",
+        "Provider",
+        "TerraSummaryId",
+        "BloodOxygenSaturation",
+        "Unit",
+        "RecordDate",
+        "RecordedByUserId",
+    ],
+)
+
+############################################################
+
+class OxygenSaturationEventsSynchronizer:
+
+    #region Create Blood Oxygen Saturation events
 
     @staticmethod
-    def add_analytics_oxygen_saturation_delete_event(oxygen_saturation):
-        try:
-            event_name = EventType.VitalsDelete.value
-            event_category = EventCategory.Vitals.value
-            event_subject = EventSubject.VitalsBloodOxygenSaturation.value
-            # user = DataSynchronizer.get_user(medication['UserId'])
-            # if not user:
-            #     print(f"User not found for the event: {medication}")
-            #     return None
-            attributes = {
-           'EhrId': oxygen_saturation['EhrId'],
-                'Provider': oxygen_saturation['Provider'],
-                'TerraSummaryId': oxygen_saturation['TerraSummaryId'],
-                'BloodOxygenSaturation': oxygen_saturation['BloodOxygenSaturation'],
-                'Unit': oxygen_saturation['Unit'],
-                'RecordDate': oxygen_saturation['RecordDate'],
-                'RecordedByUserId': oxygen_saturation['RecordedByUserId'],
-            }
-            oxygen_saturation = {
-                 'UserId': oxygen_saturation['UserId'],
-                'TenantId': oxygen_saturation['TenantId'],
-                'SessionId': None,
-                'ResourceId': oxygen_saturation['id'],
-                'ResourceType': "biometric",
-                'SourceName': "ReanCare",
-                'SourceVersion': "Unknown",
-                'EventName': event_name,
-                'EventSubject': event_subject,
-                'EventCategory': event_category,
-                'ActionType': "user-action",
-                'ActionStatement': "User deleted a blood oxygen saturation.",
-                'Attributes': str(attributes),
-                'Timestamp': oxygen_saturation['DeletedAt'],
-                'UserRegistrationDate': oxygen_saturation['UserRegistrationDate']
-            }
-            new_event_added = DataSynchronizer.add_event(oxygen_saturation)
-            if not new_event_added:
-                print(f"Not inserted data.")
-                return None
-            else:
-                return new_event_added
-        except mysql.connector.Error as error:
-            print(f"Failed to insert event: {error}")
-            return None
+    def sync_oxygen_saturation_create_events(filters: DataSyncSearchFilter):
+        return SyncEngine.sync(OXYGEN_SATURATION_CREATE_EVENTS, filters)
+
+    #endregion
+
+    #region Delete Blood Oxygen Saturation events
 
     @staticmethod
     def sync_oxygen_saturation_delete_events(filters: DataSyncSearchFilter):
-        try:
-            existing_event_count = 0
-            synched_event_count = 0
-            event_not_synched = []
-            oxygen_saturation_records = OxygenSaturationEventsSynchronizer.get_reancare_oxygen_saturation_delete_events(filters)
-            if oxygen_saturation_records:
-                for oxygen_saturation in oxygen_saturation_records:
-                    existing_event = DataSynchronizer.get_existing_event(
-                        oxygen_saturation['UserId'], oxygen_saturation['id'], EventType.VitalsDelete)
-                    if existing_event is not None:
-                        existing_event_count += 1
-                    else:
-                        new_event = OxygenSaturationEventsSynchronizer.add_analytics_oxygen_saturation_delete_event(oxygen_saturation)
-                        if new_event:
-                            synched_event_count += 1
-                        else:
-                            event_not_synched.append(oxygen_saturation)
-                print(f"Existing Event Count: {existing_event_count}")
-                print(f"Synched Event Count: {synched_event_count}")
-                print(f"Event Not Synched: {event_not_synched}")
-            else:
-                print(f"No User Blood Oxygen Saturation Delete Events found.")
-        except Exception as error:
-            print(f"Error syncing Blood Oxygen Saturation Delete Events: {error}")
+        return SyncEngine.sync(OXYGEN_SATURATION_DELETE_EVENTS, filters)
 
     #endregion
 
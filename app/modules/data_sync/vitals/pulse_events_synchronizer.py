@@ -2,22 +2,14 @@ from app.domain_types.enums.event_categories import EventCategory
 from app.domain_types.enums.event_subjects import EventSubject
 from app.domain_types.enums.event_types import EventType
 from app.domain_types.schemas.data_sync import DataSyncSearchFilter
-from app.modules.data_sync.connectors import get_reancare_db_connector
-from app.modules.data_sync.data_synchronizer import DataSynchronizer
-import mysql.connector
+from app.modules.data_sync.sync_engine import EventSyncSpec, SyncEngine
 
-############################################################
-
-class PulseEventsSynchronizer:
 
-    #region Create Pulse events
+############################################################
 
-    @staticmethod
-    def get_reancare_pulse_create_events(filters: DataSyncSearchFilter):
-        try:
-            selection_condition = f"AND pulse.CreatedAt between '{filters.StartDate}' AND '{filters.EndDate}'" if filters is not None else ''
-            rean_db_connector = get_reancare_db_connector()
-            query = f"""
+PULSE_CREATE_EVENTS = EventSyncSpec(
+    name="User Pulse Create Events",
+    query="""
             SELECT
                 pulse.id,
                 pulse.PatientUserId as UserId,
@@ -39,96 +31,27 @@ class PulseEventsSynchronizer:
             WHERE
                 user.IsTestUser = FALSE
                 {selection_condition}
-            """
-            rows = rean_db_connector.execute_read_query(query)
-            return rows
-        except Exception as error:
-            print("Error retrieving User Biometrics-Pulse Create Events:", error)
-            return None
-
-    @staticmethod
-    def add_analytics_pulse_create_event(pulse):
-        try:
-            event_name = EventType.VitalsAdd.value
-            event_category = EventCategory.Vitals.value
-            event_subject = EventSubject.VitalsPulse.value
-            # user = DataSynchronizer.get_user(medication['UserId'])
-            # if not user:
-            #     print(f"User not found for the event: {medication}")
-            #     return None
-            attributes = {
-                'EhrId': pulse['EhrId'],
-                'Provider': pulse['Provider'],
-                'TerraSummaryId': pulse['TerraSummaryId'],
-                'Pulse': pulse['Pulse'],
-                'Unit': pulse['Unit'],
-                'RecordDate': pulse['RecordDate'],
-                'RecordedByUserId': pulse['RecordedByUserId'],
-            }
-            pulse = {
-                'UserId': pulse['UserId'],
-                'TenantId': pulse['TenantId'],
-                'SessionId': None,
-                'ResourceId': pulse['id'],
-                'ResourceType': "biometric",
-                'SourceName': "ReanCare",
-                'SourceVersion': "Unknown",
-                'EventName': event_name,
-                'EventSubject': event_subject,
-                'EventCategory': event_category,
-                'ActionType': "user-action",
-                'ActionStatement': "User added a biometric pulse.",
-                'Attributes': str(attributes),
-                'Timestamp': pulse['CreatedAt'],
-                'UserRegistrationDate': pulse['UserRegistrationDate']
-            }
-            new_event_added = DataSynchronizer.add_event(pulse)
-            if not new_event_added:
-                print(f"Not inserted data.")
-                return None
-            else:
-                return new_event_added
-        except mysql.connector.Error as error:
-            print(f"Failed to insert records: {error}")
-            return None
-
-    @staticmethod
-    def sync_pulse_create_events(filters: DataSyncSearchFilter):
-        try:
-            existing_event_count = 0
-            synched_event_count = 0
-            event_not_synched = []
-            pulses = PulseEventsSynchronizer.get_reancare_pulse_create_events(filters)
-            if pulses:
-                for pulse in pulses:
-                    existing_event = DataSynchronizer.get_existing_event(
-                        pulse['UserId'], pulse['id'], EventType.VitalsAdd)
-                    if existing_event is not None:
-                        existing_event_count += 1
-                    else:
-                        new_event = PulseEventsSynchronizer.add_analytics_pulse_create_event(pulse)
-                        if new_event:
-                            synched_event_count += 1
-                        else:
-                            event_not_synched.append(pulse)
-                print(f"Existing Event Count: {existing_event_count}")
-                print(f"Synched Event Count: {synched_event_count}")
-                print(f"Event Not Synched: {event_not_synched}")
-            else:
-                print(f"No User Pulse Create Events found.")
-        except Exception as error:
-            print(f"Error syncing User Pulse Create Events: {error}")
+            """,
+    timestamp_column="pulse.CreatedAt",
+    event_type=EventType.VitalsAdd,
+    event_category=EventCategory.Vitals,
+    event_subject=EventSubject.VitalsPulse,
+    resource_type="biometric",
+    action_statement="User added a biometric pulse.",
+    attributes=[
+        "EhrId",
+        "Provider",
+        "TerraSummaryId",
+        "Pulse",
+        "Unit",
+        "RecordDate",
+        "RecordedByUserId",
+    ],
+)
 
-    #endregion
-
-    #region Delete Pulse events
-
-    @staticmethod
-    def get_reancare_pulse_delete_events(filters: DataSyncSearchFilter):
-        try:
-            selection_condition = f"AND pulse.DeletedAt between '{filters.StartDate}' AND '{filters.EndDate}'" if filters is not None else ''
-            rean_db_connector = get_reancare_db_connector()
-            query = f"""
+PULSE_DELETE_EVENTS = EventSyncSpec(
+    name="User Pulse Delete Events",
+    query="""
             SELECT
                 pulse.id,
                 pulse.PatientUserId as UserId,
@@ -152,85 +75,41 @@ class PulseEventsSynchronizer:
                 AND
                 pulse.DeletedAt IS NOT NULL
                 {selection_condition}
-            """
-            rows = rean_db_connector.execute_read_query(query)
-            return rows
-        except Exception as error:
-            print("Error retrieving User Pulse Delete Events:", error)
-            return None
+            """,
+    timestamp_column="pulse.DeletedAt",
+    event_type=EventType.VitalsDelete,
+    event_category=EventCategory.Vitals,
+    event_subject=EventSubject.VitalsPulse,
+    resource_type="biometric",
+    action_statement="User deleted a biometric pulse.",
+    attributes=[
+        "EhrId",
+        "Provider",
+        "TerraSummaryId",
+        "Pulse",
+        "Unit",
+        "RecordDate",
+        "RecordedByUserId",
+    ],
+)
+
+############################################################
+
+class PulseEventsSynchronizer:
+
+    #region Create Pulse events
 
     @staticmethod
-    def add_analytics_pulse_delete_event(pulse):
-        try:
-            event_name = EventType.VitalsDelete.value
-            event_category = EventCategory.Vitals.value
-            event_subject = EventSubject.VitalsPulse.value
-            # user = DataSynchronizer.get_user(medication['UserId'])
-            # if not user:
-            #     print(f"User not found for the event: {medication}")
-            #     return None
-            attributes = {
-                'EhrId': pulse['EhrId'],
-                'Provider': pulse['Provider'],
-                'TerraSummaryId': pulse['TerraSummaryId'],
-                'Pulse': pulse['Pulse'],
-                'Unit': pulse['Unit'],
-                'RecordDate': pulse['RecordDate'],
-                'RecordedByUserId': pulse['RecordedByUserId'],
-            }
-            pulse = {
-                'UserId': pulse['UserId'],
-                'TenantId': pulse['TenantId'],
-                'SessionId': None,
-                'ResourceId': pulse['id'],
-                'ResourceType': "biometric",
-                'SourceName': "ReanCare",
-                'SourceVersion': "Unknown",
-                'EventName': event_name,
-                'EventSubject': event_subject,
-                'EventCategory': event_category,
-                'ActionType': "user-action",
-                'ActionStatement': "User deleted a biometric pulse.",
-                'Attributes': str(attributes),
-                'Timestamp': pulse['DeletedAt'],
-                'UserRegistrationDate': pulse['UserRegistrationDate']
-            }
-            new_event_added = DataSynchronizer.add_event(pulse)
-            if not new_event_added:
-                print(f"Not inserted data.")
-                return None
-            else:
-                return new_event_added
-        except mysql.connector.Error as error:
-            print(f"Failed to insert event: {error}")
-            return None
+    def sync_pulse_create_events(filters: DataSyncSearchFilter):
+        return SyncEngine.sync(PULSE_CREATE_EVENTS, filters)
+
+    #endregion
+
+    #region Delete Pulse events
 
     @staticmethod
     def sync_pulse_delete_events(filters: DataSyncSearchFilter):
-        try:
-            existing_event_count = 0
-            synched_event_count = 0
-            event_not_synched = []
-            deleted_pulses = PulseEventsSynchronizer.get_reancare_pulse_delete_events(filters)
-            if deleted_pulses:
-                for pulse in deleted_pulses:
-                    existing_event = DataSynchronizer.get_existing_event(
-                        pulse['UserId'], pulse['id'], EventType.VitalsDelete)
-                    if existing_event is not None:
-                        existing_event_count += 1
-                    else:
-                        new_event = PulseEventsSynchronizer.add_analytics_pulse_delete_event(pulse)
-                        if new_event:
-                            synched_event_count += 1
-                        else:
-                            event_not_synched.append(pulse)
-                print(f"Existing Event Count: {existing_event_count}")
-                print(f"Synched Event Count: {synched_event_count}")
-                print(f"Event Not Synched: {event_not_synched}")
-            else:
-                print(f"No User Pulse Delete Events found.")
-        except Exception as error:
-            print(f"Error syncing User Pulse Delete Events: {error}")
+        return SyncEngine.sync(PULSE_DELETE_EVENTS, filters)
 
     #endregion
 
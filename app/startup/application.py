@@ -1,7 +1,10 @@
+import multiprocessing
 import threading
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.database.migrations import run_migrations_on_startup
+from app.database.services.event_service import start_event_ingestion, stop_event_ingestion
 from app.domain_types.miscellaneous.exceptions import add_exception_handlers
 from app.modules.data_sync.data_synchronizer import DataSynchronizer
 from app.startup.client_auth_middleware import ClientAuthMiddleware
@@ -30,8 +33,16 @@ def start():
     server.add_middleware(ClientAuthMiddleware)
     server.include_router(router)
 
-    scheduler_thread = threading.Thread(target=JobScheduler.start_scheduler)
-    scheduler_thread.start()
+    # Migrations first: ingestion writes the columns they add
+    server.add_event_handler("startup", run_migrations_on_startup)
+    server.add_event_handler("startup", start_event_ingestion)
+    server.add_event_handler("shutdown", stop_event_ingestion)
+
+    # Spawned worker processes (backfill slices) may import this module again
+    # when the server was started with `python main.py`; only the server runs jobs
+    if multiprocessing.parent_process() is None:
+        scheduler_thread = threading.Thread(target=JobScheduler.start_scheduler)
+        scheduler_thread.start()
 
     return server
 
@@ -1,8 +1,11 @@
 from apscheduler.schedulers.background import BackgroundScheduler
-from app.startup.scheduler.tasks import cleanup_old_files, daily_analytics
+from app.config.config import get_settings
+from app.startup.scheduler.tasks import cleanup_old_files, daily_analytics, incremental_sync
 
 ###############################################################################
 
+settings = get_settings()
+
 class JobScheduler:
 
     _scheduler: BackgroundScheduler = BackgroundScheduler()
@@ -20,6 +23,13 @@ class JobScheduler:
             JobScheduler._scheduler.add_job(cleanup_old_files, 'cron', hour=14, minute=0)
 
             # Intervals based tasks
+            # Incremental sync of ReanCare data past each synchronizer's watermark
+            if settings.SYNC_INCREMENTAL_ENABLED:
+                JobScheduler._scheduler.add_job(
+                    incremental_sync, 'interval',
+                    minutes=settings.SYNC_INCREMENTAL_INTERVAL_MINUTES,
+                    max_instances=1, coalesce=True)
+
             # To run the task every 5 minute (for testing):
             # JobScheduler._scheduler.add_job(daily_analytics, 'interval', minutes=1)
 
@@ -4,6 +4,7 @@ import shutil
 import time
 from app.database.services.analytics.analysis_service import generate_daily_analytics
 from app.database.services.analytics.common import get_report_folder_path
+from app.modules.data_sync.incremental_sync import IncrementalSynchronizer
 
 ############################################################
 
@@ -14,6 +15,13 @@ def daily_analytics():
 
 ############################################################
 
+def incremental_sync():
+    print("Incremental sync job running")
+    IncrementalSynchronizer.sync_all()
+    print("Incremental sync job completed")
+
+############################################################
+
 # Remove old files and folders from the reports directory (older than 2 days)
 
 def cleanup_old_files():
@@ -20,3 +20,47 @@ metrics_provider = MeterProvider(resource=resource, metric_readers=[metric_reade
 metrics.set_meter_provider(metrics_provider)
 meter = metrics.get_meter(meter_name)
 
+
+########################################################################
+
+# Raw SQL (DatabaseConnector) instruments, see app/database/query_stats.py
+
+db_query_duration_histogram = meter.create_histogram(
+    name="db.client.query.duration",
+    unit="ms",
+    description="Duration of raw SQL queries executed through DatabaseConnector",
+)
+
+db_query_rows_histogram = meter.create_histogram(
+    name="db.client.query.rows",
+    unit="{row}",
+    description="Rows returned or affected by raw SQL queries",
+)
+
+# Data sync instruments, see app/modules/data_sync/sync_engine.py
+
+sync_events_counter = meter.create_counter(
+    name="sync.events",
+    unit="{event}",
+    description="ReanCare rows processed by the event sync engine, by event type and outcome",
+)
+
+# Sync run history instruments, see app/modules/data_sync/sync_runs.py
+
+sync_run_duration_histogram = meter.create_histogram(
+    name="sync.run.duration",
+    unit="s",
+    description="Duration of synchronizer runs, by sync key, mode and status",
+)
+
+sync_run_rows_counter = meter.create_counter(
+    name="sync.run.rows",
+    unit="{row}",
+    description="Rows extracted, inserted, skipped and failed by synchronizer runs",
+)
+
+sync_run_throughput_histogram = meter.create_histogram(
+    name="sync.run.throughput",
+    unit="{row}/s",
+    description="Rows per second of the extract and load phases of synchronizer runs",
+)
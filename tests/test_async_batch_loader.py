@@ -0,0 +1,77 @@
+import asyncio
+import threading
+
+from app.common.cache import AsyncBatchLoader
+
+###############################################################################
+
+class _Source:
+    """Loads keys once the test releases it, caching what it loaded."""
+
+    def __init__(self):
+        self.cache = {}
+        self.calls = []
+        self.release = threading.Event()
+
+    def get_cached(self, key):
+        if key in self.cache:
+            return True, self.cache[key]
+        return False, None
+
+    def load(self, keys):
+        self.calls.append(list(keys))
+        self.release.wait(5)
+        values = {key: key.upper() for key in keys if key != "missing"}
+        self.cache.update(values)
+        return values
+
+###############################################################################
+
+def test_cached_keys_are_not_loaded():
+    source = _Source()
+    source.cache["a"] = "cached"
+    source.release.set()
+    loader = AsyncBatchLoader(source.get_cached, source.load)
+    assert asyncio.run(loader.get_many(["a", "b", "b"])) == {"a": "cached", "b": "B"}
+    assert source.calls == [["b"]]
+
+def test_missing_keys_map_to_none():
+    source = _Source()
+    source.release.set()
+    loader = AsyncBatchLoader(source.get_cached, source.load)
+    assert asyncio.run(loader.get_many(["missing"])) == {"missing": None}
+
+def test_concurrent_calls_share_the_load_in_flight():
+    source = _Source()
+    loader = AsyncBatchLoader(source.get_cached, source.load)
+
+    async def run():
+        first = asyncio.create_task(loader.get_many(["a", "b"]))
+        await asyncio.sleep(0.05)
+        second = asyncio.create_task(loader.get_many(["b", "c"]))
+        await asyncio.sleep(0.05)
+        source.release.set()
+        return await first, await second
+
+    first, second = asyncio.run(run())
+    assert first == {"a": "A", "b": "B"}
+    assert second == {"b": "B", "c": "C"}
+    assert source.calls == [["a", "b"], ["c"]]
+    assert loader._in_flight == {}
+
+def test_cancelling_one_caller_does_not_cancel_the_shared_load():
+    source = _Source()
+    loader = AsyncBatchLoader(source.get_cached, source.load)
+
+    async def run():
+        first = asyncio.create_task(loader.get_many(["a"]))
+        await asyncio.sleep(0.05)
+        second = asyncio.create_task(loader.get_many(["a"]))
+        await asyncio.sleep(0.05)
+        first.cancel()
+        await asyncio.sleep(0.05)
+        source.release.set()
+        return first.cancelled(), await second
+
+    assert asyncio.run(run()) == (True, {"a": "A"})
+    assert source.calls == [["a"]]
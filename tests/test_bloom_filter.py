@@ -0,0 +1,35 @@
+from app.common.bloom_filter import BloomFilter, RotatingBloomFilter
+
+###############################################################################
+
+def test_no_false_negatives():
+    bloom = BloomFilter(1000, 0.01)
+    keys = [f"user:{i}" for i in range(1000)]
+    for key in keys:
+        bloom.add(key)
+    assert all(key in bloom for key in keys)
+    assert bloom.count == 1000
+
+def test_false_positive_rate_at_capacity():
+    bloom = BloomFilter(5000, 0.01)
+    for i in range(5000):
+        bloom.add(f"in:{i}")
+    false_positives = sum(f"out:{i}" in bloom for i in range(20000))
+    # Expected about 200; allow for the variance of the hashes
+    assert false_positives < 400
+
+def test_rotation_keeps_the_previous_generation():
+    bloom = RotatingBloomFilter(100, 0.001)
+    for i in range(150):
+        bloom.add(f"k:{i}")
+    assert bloom.rotations == 1
+    assert all(f"k:{i}" in bloom for i in range(150))
+
+def test_keys_older_than_two_generations_are_forgotten():
+    bloom = RotatingBloomFilter(100, 0.001)
+    for i in range(250):
+        bloom.add(f"k:{i}")
+    assert bloom.rotations == 2
+    assert all(f"k:{i}" in bloom for i in range(100, 250))
+    forgotten = sum(f"k:{i}" in bloom for i in range(100))
+    assert forgotten < 5
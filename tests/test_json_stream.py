@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from app.common.json_stream import JsonStreamError, JsonStreamTooLarge, iter_json_array_items, iter_ndjson_items
+
+###############################################################################
+
+async def _chunks(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+def _collect(iterator):
+    async def collect():
+        return [item async for item in iterator]
+    return asyncio.run(collect())
+
+###############################################################################
+
+@pytest.mark.parametrize("size", [1, 3, 1024])
+def test_array_items_split_across_chunks(size):
+    body = '[{"a": 1}, {"b": "x,]"} , [2, 3], "é"]'.encode("utf-8")
+    assert _collect(iter_json_array_items(_chunks(body, size))) == [{"a": 1}, {"b": "x,]"}, [2, 3], "é"]
+
+def test_empty_array():
+    assert _collect(iter_json_array_items(_chunks(b" [ ] ", 2))) == []
+
+@pytest.mark.parametrize("body, message", [
+    (b'{"a": 1}', "must be a JSON array"),
+    (b'[1 2]', "Expected ','"),
+    (b'[1, 2', "not terminated"),
+    (b'[1, {"a": ]', "Malformed JSON item"),
+    (b'[1] 2', "Unexpected content"),
+])
+def test_malformed_array(body, message):
+    with pytest.raises(JsonStreamError, match=message):
+        _collect(iter_json_array_items(_chunks(body, 4)))
+
+def test_items_before_an_error_are_yielded():
+    items = []
+    async def collect():
+        async for item in iter_json_array_items(_chunks(b'[1, 2 3]', 2)):
+            items.append(item)
+    with pytest.raises(JsonStreamError):
+        asyncio.run(collect())
+    assert items == [1, 2]
+
+@pytest.mark.parametrize("size", [1, 5, 1024])
+def test_ndjson_lines(size):
+    body = '{"a": 1}\n\n  {"b": "é"}\r\n[1]'.encode("utf-8")
+    assert _collect(iter_ndjson_items(_chunks(body, size))) == [({"a": 1}, None), ({"b": "é"}, None), ([1], None)]
+
+def test_ndjson_invalid_line_does_not_stop_the_stream():
+    items = _collect(iter_ndjson_items(_chunks(b'{"a": 1}\nnot json\n{"b": 2}\n', 3)))
+    assert items[0] == ({"a": 1}, None)
+    assert items[1][0] is None and items[1][1] is not None
+    assert items[2] == ({"b": 2}, None)
+
+@pytest.mark.parametrize("size", [1, 2, 1024])
+def test_array_numbers_split_across_chunks(size):
+    body = b'[12345, -1.5e3, 0.25, true]'
+    assert _collect(iter_json_array_items(_chunks(body, size))) == [12345, -1.5e3, 0.25, True]
+
+def test_array_item_larger_than_the_limit():
+    body = b'[{"a": 1}, {"b": "' + b"x" * 100 + b'"}, {"c": 3}]'
+    items = []
+    async def collect():
+        async for item in iter_json_array_items(_chunks(body, 8), max_item_bytes=64):
+            items.append(item)
+    with pytest.raises(JsonStreamTooLarge):
+        asyncio.run(collect())
+    assert items == [{"a": 1}]
+
+def test_array_many_small_items_within_the_item_limit():
+    body = ("[" + ", ".join('{"a": %d}' % i for i in range(100)) + "]").encode("utf-8")
+    assert len(_collect(iter_json_array_items(_chunks(body, 4096), max_item_bytes=16))) == 100
+
+def test_array_item_that_cannot_start_a_value_fails_before_the_body_ends():
+    async def chunks():
+        yield b'[1, }'
+        raise AssertionError("The body was read past the malformed item")
+    with pytest.raises(JsonStreamError, match="unexpected '}'"):
+        _collect(iter_json_array_items(chunks()))
+
+@pytest.mark.parametrize("parse", [iter_json_array_items, iter_ndjson_items])
+def test_body_larger_than_the_limit(parse):
+    body = b'[' + b'1, ' * 100 + b'1]' if parse is iter_json_array_items else b'1\n' * 100
+    with pytest.raises(JsonStreamTooLarge):
+        _collect(parse(_chunks(body, 16), max_body_bytes=64))
+
+def test_ndjson_line_larger_than_the_limit():
+    body = b'{"a": 1}\n' + b'x' * 100 + b'\n'
+    with pytest.raises(JsonStreamTooLarge):
+        _collect(iter_ndjson_items(_chunks(body, 8), max_item_bytes=64))
@@ -0,0 +1,92 @@
+import os
+
+import pytest
+
+from app.common.write_ahead_log import WalFsyncPolicy, WriteAheadLog, WriteAheadLogClosed, WriteAheadLogFull
+
+###############################################################################
+
+def _read_all(wal: WriteAheadLog) -> list:
+    records = []
+    for path in wal.sealed_segments():
+        records.extend(WriteAheadLog.read_segment(path))
+    return records
+
+###############################################################################
+
+def test_records_are_read_back_in_order(tmp_path):
+    wal = WriteAheadLog(str(tmp_path), "events", segment_max_bytes=20)
+    for i in range(10):
+        wal.append(f"record-{i}")
+    wal.seal()
+    assert len(wal.sealed_segments()) > 1
+    assert _read_all(wal) == [f"record-{i}" for i in range(10)]
+
+def test_newlines_do_not_split_a_record(tmp_path):
+    wal = WriteAheadLog(str(tmp_path), "events", segment_max_bytes=1024)
+    wal.append("line one\nline two")
+    wal.seal()
+    assert _read_all(wal) == ["line one line two"]
+
+def test_active_segment_is_not_sealed(tmp_path):
+    wal = WriteAheadLog(str(tmp_path), "events", segment_max_bytes=1024, fsync_policy=WalFsyncPolicy.Never)
+    wal.append("a")
+    assert wal.sealed_segments() == []
+    wal.seal()
+    assert len(wal.sealed_segments()) == 1
+
+def test_torn_record_is_skipped(tmp_path):
+    wal = WriteAheadLog(str(tmp_path), "events", segment_max_bytes=1024)
+    wal.append('{"id": 1}')
+    wal.seal()
+    path = wal.sealed_segments()[0]
+    # A crash in the middle of the next append
+    with open(path, "ab") as file:
+        file.write(b'{"id": 2, "ev')
+    assert WriteAheadLog.read_segment(path) == ['{"id": 1}']
+
+def test_segments_of_a_previous_run_are_replayed(tmp_path):
+    wal = WriteAheadLog(str(tmp_path), "events", segment_max_bytes=1024)
+    wal.append("a")
+    wal.append("b")
+    # No close: the process died with the segment still active
+
+    restarted = WriteAheadLog(str(tmp_path), "events", segment_max_bytes=1024)
+    assert _read_all(restarted) == ["a", "b"]
+    assert restarted.size_bytes == 4
+    restarted.append("c")
+    restarted.seal()
+    assert _read_all(restarted) == ["a", "b", "c"]
+
+def test_removed_segments_free_their_bytes(tmp_path):
+    wal = WriteAheadLog(str(tmp_path), "events", segment_max_bytes=1024)
+    wal.append("abc")
+    wal.seal()
+    for path in wal.sealed_segments():
+        wal.remove(path)
+    assert wal.size_bytes == 0
+    assert os.listdir(tmp_path) == []
+
+def test_other_logs_in_the_directory_are_ignored(tmp_path):
+    other = WriteAheadLog(str(tmp_path), "users", segment_max_bytes=1024)
+    other.append("user")
+    other.seal()
+    wal = WriteAheadLog(str(tmp_path), "events", segment_max_bytes=1024)
+    assert wal.sealed_segments() == []
+
+def test_append_fails_when_full(tmp_path):
+    wal = WriteAheadLog(str(tmp_path), "events", segment_max_bytes=1024, max_bytes=10)
+    wal.append("12345678")
+    with pytest.raises(WriteAheadLogFull):
+        wal.append("1")
+    wal.seal()
+    wal.remove(wal.sealed_segments()[0])
+    wal.append("1")
+
+def test_append_fails_once_closed(tmp_path):
+    wal = WriteAheadLog(str(tmp_path), "events", segment_max_bytes=1024)
+    wal.append("a")
+    wal.close()
+    with pytest.raises(WriteAheadLogClosed):
+        wal.append("b")
+    assert _read_all(wal) == ["a"]